@@ -51,11 +51,46 @@ def create_app(config_overrides=None):
     # app.config["JWT_CSRF_IN_COOKIES"] = True
     
     app.config["JWT_ACCESS_TOKEN_EXPIRES"] = timedelta(days=7)
+
+    # --- JSON E COMPRESSÃO DAS RESPOSTAS ---
+    # JSON_PROVIDER: 'auto' (orjson se instalado), 'orjson' ou 'default'
+    app.config["JSON_PROVIDER"] = os.getenv("JSON_PROVIDER", "auto")
+    # gzip/brotli para respostas a partir deste tamanho (0 desativa)
+    app.config["RESPONSE_COMPRESSION_MIN_SIZE"] = int(os.getenv("RESPONSE_COMPRESSION_MIN_SIZE", 1024))
+    app.config["RESPONSE_COMPRESSION_GZIP_LEVEL"] = int(os.getenv("RESPONSE_COMPRESSION_GZIP_LEVEL", 6))
+    app.config["RESPONSE_COMPRESSION_BROTLI_QUALITY"] = int(os.getenv("RESPONSE_COMPRESSION_BROTLI_QUALITY", 5))
+
+    # --- CACHE DE RESPOSTAS (rotas públicas de notícias) ---
+    # RESPONSE_CACHE_TTL=0 desativa; RESPONSE_CACHE_URL (Redis) compartilha entre instâncias
+    app.config["RESPONSE_CACHE_TTL"] = int(os.getenv("RESPONSE_CACHE_TTL", 3600))
+    app.config["RESPONSE_CACHE_MAX_ENTRIES"] = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", 512))
+    app.config["RESPONSE_CACHE_VERSION_TTL"] = float(os.getenv("RESPONSE_CACHE_VERSION_TTL", 15))
+    app.config["RESPONSE_CACHE_URL"] = os.getenv("RESPONSE_CACHE_URL")
+
+    # --- ESTADO DO RANKING "FOR YOU" (por processo) ---
+    # FEED_RANKING_STATE_TTL=0 desativa (todo feed é rankeado no banco)
+    app.config["FEED_RANKING_STATE_TTL"] = float(os.getenv("FEED_RANKING_STATE_TTL", 600))
+    app.config["FEED_RANKING_MAX_ENTRIES"] = int(os.getenv("FEED_RANKING_MAX_ENTRIES", 300))
+    app.config["FEED_RANKING_MAX_USERS"] = int(os.getenv("FEED_RANKING_MAX_USERS", 1000))
+
+    # --- ÍNDICE DE BUSCA EM MEMÓRIA (só sem PostgreSQL) ---
+    # SEARCH_INDEX_REBUILD_INTERVAL=0 refaz o índice a cada busca
+    app.config["SEARCH_INDEX_REBUILD_INTERVAL"] = float(os.getenv("SEARCH_INDEX_REBUILD_INTERVAL", 3600))
+
+    # --- BUFFER DO HISTÓRICO DE LEITURA (por processo) ---
+    # READ_HISTORY_BUFFER_SIZE=0 desativa (cada leitura é gravada na requisição)
+    app.config["READ_HISTORY_BUFFER_SIZE"] = int(os.getenv("READ_HISTORY_BUFFER_SIZE", 0))
+    app.config["READ_HISTORY_FLUSH_INTERVAL"] = float(os.getenv("READ_HISTORY_FLUSH_INTERVAL", 5))
     
     
     if config_overrides:
         app.config.update(config_overrides)
 
+    from app.utils.json_provider import create_json_provider
+    from app.utils.response_compression import init_response_compression
+    app.json = create_json_provider(app)
+    init_response_compression(app)
+
     # --- SWAGGER ---
     SWAGGER_URL = '/api/docs' 
     API_URL = '/static/openapi.yaml'  
@@ -67,12 +102,40 @@ def create_app(config_overrides=None):
     app.register_blueprint(swaggerui_blueprint)
 
     # --- BANCO DE DADOS ---
-    from app.extensions import db
+    from app.extensions import db, migrate
     db.init_app(app)
+    # Migrações do esquema em backend/migrations (aplicadas pelo init_db.py)
+    migrate.init_app(app, db, directory=os.path.join(os.path.dirname(os.path.dirname(__file__)), "migrations"))
     jwt = JWTManager(app)
 
     # Importa entidades para o SQLAlchemy registrar
-    from app.entities import (custom_topic_entity, news_entity, news_source_entity, topic_entity, user_entity, user_preferred_custom_topics, user_preferred_news_sources_entity, user_saved_news_entity, user_read_history_entity)
+    from app.entities import (custom_topic_entity, news_entity, news_source_entity, topic_entity, user_entity, user_preferred_custom_topics, user_preferred_news_sources_entity, user_saved_news_entity, user_read_history_entity, scraping_blacklist_entity, scraping_domain_health_entity, scraping_domain_profile_entity, collection_run_entity, collection_run_topic_entity, collection_run_article_entity, news_fingerprint_entity, news_body_entity, compression_dictionary_entity)
+
+    # Dicionários de compressão do corpo das notícias, lidos do banco (ver CompressedText)
+    from app.utils.text_compression import text_compressor
+    with app.app_context():
+        text_compressor.preload()
+
+    # Cache de respostas invalidado a cada coleta finalizada (ver NewsService)
+    from app.utils.response_cache import create_response_cache
+    from app.repositories.collection_run_repository import CollectionRunRepository
+    app.extensions["response_cache"] = create_response_cache(
+        app.config, version_loader=lambda: CollectionRunRepository().latest_finished_at()
+    )
+
+    # Ranking "For You" por usuário, atualizado por sinais (ver app/utils/events.py)
+    from app.services.feed_ranking_service import create_feed_ranking
+    app.extensions["feed_ranking"] = create_feed_ranking(
+        app.config, version_loader=app.extensions["response_cache"].version
+    )
+
+    # Busca textual sem PostgreSQL: índice invertido em memória (ver NewsService.search_news)
+    from app.services.search_index_service import create_search_index
+    app.extensions["search_index"] = create_search_index(app.config)
+
+    # Histórico de leitura gravado em lote (write-behind), se configurado
+    from app.services.read_history_buffer import create_read_history_buffer
+    app.extensions["read_history_buffer"] = create_read_history_buffer(app)
 
     # NOTA: O db.create_all() foi removido daqui e movido para o init_db.py
     # para evitar conflitos de workers no Gunicorn.
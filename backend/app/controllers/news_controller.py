@@ -2,10 +2,13 @@ from flask import request, jsonify
 import logging
 from app.services.user_service import UserService
 from app.services.news_service import NewsService
-from app.models.exceptions import NewsNotFoundError, NewsSourceAlreadyAttachedError
+from app.models.exceptions import NewsNotFoundError, NewsSourceAlreadyAttachedError, SearchValidationError, SearchUnavailableError
 from typing import Optional
 
 class NewsController:
+    TOPIC_PAGE_SIZE = 10
+    SEARCH_MAX_PAGE_SIZE = 50
+
     def __init__(self):
         self.user_service = UserService()
         self.news_service = NewsService()
@@ -63,11 +66,20 @@ class NewsController:
                 "data": None,
                 "error": str(e)
             }), 404
+
+    def get_by_id_etag(self, user_id: Optional[int], news_id: int) -> Optional[str]:
+        """ETag do detalhe da notícia (usado pelo GET condicional da rota)."""
+        return self.news_service.get_news_etag(user_id, news_id)
+
+    def get_by_topic_etag(self, user_id: Optional[int], topic_id: int) -> str:
+        """ETag da página do tópico (usado pelo GET condicional da rota)."""
+        page = request.args.get('page', 1, type=int)
+        return self.news_service.get_topic_etag(topic_id, page, self.TOPIC_PAGE_SIZE, user_id)
     
     def get_by_topic(self, user_id: Optional[int], topic_id: int):
         try:
             page = request.args.get('page', 1, type=int)
-            per_page = 10
+            per_page = self.TOPIC_PAGE_SIZE
 
             result = self.news_service.get_news_by_topic(topic_id, page, per_page, user_id)
 
@@ -86,6 +98,12 @@ class NewsController:
                 "error": "Ocorreu um erro inesperado."
             }), 500
 
+    def get_for_you_etag(self, user_id: int) -> str:
+        """ETag da página do feed "For You" (usado pelo GET condicional da rota)."""
+        page = request.args.get('page', 1, type=int)
+        per_page = request.args.get('per_page', 10, type=int)
+        return self.news_service.get_for_you_etag(user_id, page, per_page)
+
     def get_for_you_news(self, user_id: int):
         try:
             page = request.args.get('page', 1, type=int)
@@ -108,6 +126,59 @@ class NewsController:
                 "error": str(e)
             }), 500
 
+    def _search_args(self) -> dict:
+        """Parâmetros da busca lidos da query string."""
+        per_page = request.args.get('per_page', 20, type=int)
+        if per_page < 1 or per_page > self.SEARCH_MAX_PAGE_SIZE:
+            per_page = 20
+        return {
+            "query": request.args.get('q', ''),
+            "language": request.args.get('lang') or None,
+            "cursor": request.args.get('cursor') or None,
+            "per_page": per_page,
+        }
+
+    def search_etag(self, user_id: Optional[int]) -> Optional[str]:
+        """ETag da página da busca (usado pelo GET condicional da rota)."""
+        return self.news_service.get_search_etag(**self._search_args(), user_id=user_id)
+
+    def search(self, user_id: Optional[int]):
+        try:
+            result = self.news_service.search_news(**self._search_args(), user_id=user_id)
+
+            return jsonify({
+                "success": True,
+                "message": "Busca realizada com sucesso.",
+                "data": result,
+                "error": None
+            }), 200
+        except SearchValidationError as e:
+            return jsonify({
+                "success": False,
+                "message": str(e),
+                "data": None,
+                "error": "Bad Request"
+            }), 400
+        except SearchUnavailableError as e:
+            return jsonify({
+                "success": False,
+                "message": "Busca indisponível.",
+                "data": None,
+                "error": str(e)
+            }), 503
+        except Exception as e:
+            logging.error(f"Erro inesperado na busca de notícias: {e}", exc_info=True)
+            return jsonify({
+                "success": False,
+                "message": "Erro ao buscar notícias.",
+                "data": None,
+                "error": "Ocorreu um erro inesperado."
+            }), 500
+
+    def get_favorite_etag(self, user_id: int) -> str:
+        """ETag da página de favoritas (usado pelo GET condicional da rota)."""
+        return self.news_service.get_favorite_etag(user_id)
+
     def get_favorite_news(self, user_id: int):
         try:
             news_data = self.news_service.get_favorite_news(user_id)
@@ -132,15 +203,25 @@ class NewsController:
         except Exception as e:
              return jsonify({"success": False, "message": "Erro salvar acesso a noticia.", "data": None, "error": str(e)}), 500
 
+    def _history_page_args(self) -> tuple[int, int]:
+        """Página e tamanho da página do histórico, normalizados."""
+        page = request.args.get('page', 1, type=int)
+        per_page = request.args.get('per_page', 10, type=int)
+
+        if page < 1:
+            page = 1
+        if per_page < 1 or per_page > 100:
+            per_page = 10
+        return page, per_page
+
+    def get_history_etag(self, user_id: int) -> str:
+        """ETag da página do histórico (usado pelo GET condicional da rota)."""
+        page, per_page = self._history_page_args()
+        return self.news_service.get_history_etag(user_id, page, per_page)
+
     def get_history_news(self, user_id: int):
         try:
-            page = request.args.get('page', 1, type=int)
-            per_page = request.args.get('per_page', 10, type=int)
-            
-            if page < 1:
-                page = 1
-            if per_page < 1 or per_page > 100:
-                per_page = 10
+            page, per_page = self._history_page_args()
             
             result = self.news_service.get_history_news(user_id, page, per_page)
             
@@ -0,0 +1,19 @@
+from datetime import datetime, timezone
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import ForeignKey, Text
+from app.extensions import db
+
+class CollectionRunArticleEntity(db.Model):
+    __tablename__ = "collection_run_articles"
+
+    run_id: Mapped[int] = mapped_column(ForeignKey("collection_runs.id", ondelete="CASCADE"), primary_key=True)
+    # URL normalizada do artigo
+    url: Mapped[str] = mapped_column(db.String(500), primary_key=True)
+    topic_id: Mapped[int] = mapped_column(nullable=False)
+    stage: Mapped[str] = mapped_column(db.String(20), nullable=False)
+    reason: Mapped[str] = mapped_column(Text, nullable=True)
+
+    updated_at: Mapped[datetime] = mapped_column(db.DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+
+    def __repr__(self):
+        return f"<CollectionRunArticleEntity run_id={self.run_id} url='{self.url}' stage='{self.stage}'>"
@@ -0,0 +1,19 @@
+from datetime import datetime, timezone
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Text
+from app.extensions import db
+
+class CollectionRunEntity(db.Model):
+    __tablename__ = "collection_runs"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    status: Mapped[str] = mapped_column(db.String(20), nullable=False, default="running")
+    new_articles_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    new_sources_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    error: Mapped[str] = mapped_column(Text, nullable=True)
+
+    started_at: Mapped[datetime] = mapped_column(db.DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+    finished_at: Mapped[datetime] = mapped_column(db.DateTime(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return f"<CollectionRunEntity id={self.id} status='{self.status}'>"
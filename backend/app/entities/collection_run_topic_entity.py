@@ -0,0 +1,17 @@
+from datetime import datetime, timezone
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import ForeignKey, Text
+from app.extensions import db
+
+class CollectionRunTopicEntity(db.Model):
+    __tablename__ = "collection_run_topics"
+
+    run_id: Mapped[int] = mapped_column(ForeignKey("collection_runs.id", ondelete="CASCADE"), primary_key=True)
+    topic_id: Mapped[int] = mapped_column(primary_key=True)
+    # Metadados dos artigos retornados pelo GNews (JSON), para não repetir a chamada ao retomar
+    articles_json: Mapped[str] = mapped_column(Text, nullable=False)
+
+    fetched_at: Mapped[datetime] = mapped_column(db.DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+
+    def __repr__(self):
+        return f"<CollectionRunTopicEntity run_id={self.run_id} topic_id={self.topic_id}>"
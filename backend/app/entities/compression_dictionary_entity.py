@@ -0,0 +1,18 @@
+from datetime import datetime
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import LargeBinary, func
+from app.extensions import db
+
+class CompressionDictionaryEntity(db.Model):
+    """Dicionário zlib de uma coluna CompressedText (ver app/utils/text_compression.py)."""
+    __tablename__ = "compression_dictionaries"
+
+    # Atribuído por TextCompressor.save_dictionary (maior ID + 1); gravado no cabeçalho de cada valor
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    name: Mapped[str] = mapped_column(db.String(50), nullable=False)
+    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(db.DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    def __repr__(self):
+        return f"<CompressionDictionaryEntity id={self.id} name='{self.name}'>"
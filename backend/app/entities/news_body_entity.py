@@ -0,0 +1,18 @@
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import ForeignKey
+from app.extensions import db
+from app.utils.text_compression import CompressedText
+
+class NewsBodyEntity(db.Model):
+    """Corpo da notícia (texto e HTML), separado dos metadados da tabela 'news'."""
+    __tablename__ = "news_bodies"
+
+    news_id: Mapped[int] = mapped_column(ForeignKey("news.id", ondelete="CASCADE"), primary_key=True)
+    # Gravados comprimidos (zlib + dicionário por coluna); ver app/utils/text_compression.py
+    content: Mapped[str] = mapped_column(CompressedText("content"), nullable=False)
+    html: Mapped[str] = mapped_column(CompressedText("html"), nullable=False)
+
+    news = relationship("NewsEntity", back_populates="body")
+
+    def __repr__(self):
+        return f"<NewsBodyEntity news_id={self.news_id}>"
@@ -1,19 +1,34 @@
 from datetime import datetime, timezone
-from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import ForeignKey, Text
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
+from sqlalchemy import ForeignKey, Index, Text, inspect
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from app.extensions import db
+from app.entities.news_body_entity import NewsBodyEntity
+from app.utils.title_normalizer import normalize_title
+from app.utils.news_ranking import base_score
+
+
+def _default_base_score(context) -> float:
+    """base_score com qualidade neutra; o NewsRepository grava a qualidade real da fonte."""
+    return base_score(context.get_current_parameters()["published_at"])
+
 
 class NewsEntity(db.Model):
     __tablename__ = "news"
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     title: Mapped[str] = mapped_column(Text, nullable=False)
+    # Título normalizado (normalize_title), usado na deduplicação por título
+    title_key: Mapped[str] = mapped_column(Text, nullable=False, index=True)
     description: Mapped[str] = mapped_column(Text, nullable=True)
     url: Mapped[str] = mapped_column(db.String(500), unique=True, nullable=False)
     image_url: Mapped[str] = mapped_column(db.String(500), nullable=True)
-    content: Mapped[str] = mapped_column(Text, nullable=False)
-    html: Mapped[str] = mapped_column(Text, nullable=False)
     published_at: Mapped[datetime] = mapped_column(db.DateTime(timezone=True), nullable=False)
+    # Score base do ranking (data de publicação + qualidade da fonte); ver app/utils/news_ranking.py
+    base_score: Mapped[float] = mapped_column(db.Float, nullable=False, default=_default_base_score)
+    # Idioma do texto ('pt'/'en') e, no PostgreSQL, o tsvector da busca; ver app/utils/news_search.py
+    language: Mapped[str] = mapped_column(db.String(2), nullable=False, default="pt", server_default="pt")
+    search_vector: Mapped[str] = mapped_column(Text().with_variant(TSVECTOR(), "postgresql"), nullable=True, deferred=True)
     
     source_id: Mapped[int] = mapped_column(ForeignKey("news_sources.id", ondelete="CASCADE"), nullable=False)
     topic_id: Mapped[int] = mapped_column(ForeignKey("topics.id", ondelete="SET NULL"), nullable=True)
@@ -23,6 +38,17 @@ class NewsEntity(db.Model):
     source = relationship("NewsSourceEntity", lazy="select")
     topic = relationship("TopicEntity", lazy="select")
 
+    # Texto e HTML ficam em 'news_bodies' (1:1) e só são carregados quando
+    # pedidos (ex: options(joinedload(NewsEntity.body)))
+    body = relationship(
+        "NewsBodyEntity",
+        back_populates="news",
+        uselist=False,
+        lazy="select",
+        cascade="all, delete-orphan",
+        passive_deletes=True
+    )
+
     saved_by_users = relationship(
         "UserEntity",
         secondary="user_saved_news",
@@ -33,4 +59,53 @@ class NewsEntity(db.Model):
         "UserReadHistoryEntity", 
         back_populates="news", 
         cascade="all, delete-orphan"
-    )
\ No newline at end of file
+    )
+
+    __table_args__ = (
+        # Listagem geral: ORDER BY published_at DESC, id DESC
+        Index("ix_news_published_at_id", "published_at", "id"),
+        # Listagem e contagem por tópico
+        Index("ix_news_topic_published_at", "topic_id", "published_at", "id"),
+        # Join com news_sources e score de fonte preferida
+        Index("ix_news_source_id", "source_id"),
+        # Busca textual (/news/search); GIN no PostgreSQL
+        Index("ix_news_search_vector", "search_vector", postgresql_using="gin"),
+    )
+
+    @validates("title")
+    def _sync_title_key(self, key, value):
+        self.title_key = normalize_title(value)
+        return value
+
+    def _get_body(self) -> NewsBodyEntity:
+        if self.body is None:
+            self.body = NewsBodyEntity()
+        return self.body
+
+    @property
+    def content(self) -> str | None:
+        return self.body.content if self.body else None
+
+    @content.setter
+    def content(self, value: str):
+        self._get_body().content = value
+
+    @property
+    def html(self) -> str | None:
+        return self.body.html if self.body else None
+
+    @html.setter
+    def html(self, value: str):
+        self._get_body().html = value
+
+    def loaded_body_fields(self) -> dict:
+        """
+        Campos do corpo (content, html) que já estão carregados.
+
+        Não dispara consultas: se o corpo não foi carregado junto com a
+        notícia, retorna um dicionário vazio.
+        """
+        if "body" in inspect(self).unloaded or self.body is None:
+            return {}
+        unloaded = inspect(self.body).unloaded
+        return {field: getattr(self.body, field) for field in ("content", "html") if field not in unloaded}
@@ -0,0 +1,21 @@
+from datetime import datetime, timezone
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import ForeignKey, BigInteger
+from app.extensions import db
+
+class NewsFingerprintEntity(db.Model):
+    __tablename__ = "news_fingerprints"
+
+    news_id: Mapped[int] = mapped_column(ForeignKey("news.id", ondelete="CASCADE"), primary_key=True)
+    # SimHash de 64 bits do conteúdo, gravado com sinal (BIGINT)
+    fingerprint: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    # Bandas de 16 bits do fingerprint, indexadas para a busca de candidatos (LSH)
+    band_0: Mapped[int] = mapped_column(nullable=False, index=True)
+    band_1: Mapped[int] = mapped_column(nullable=False, index=True)
+    band_2: Mapped[int] = mapped_column(nullable=False, index=True)
+    band_3: Mapped[int] = mapped_column(nullable=False, index=True)
+
+    created_at: Mapped[datetime] = mapped_column(db.DateTime(timezone=True), nullable=False, index=True, default=lambda: datetime.now(timezone.utc))
+
+    def __repr__(self):
+        return f"<NewsFingerprintEntity news_id={self.news_id} fingerprint={self.fingerprint}>"
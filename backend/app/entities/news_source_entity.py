@@ -9,6 +9,8 @@ class NewsSourceEntity(db.Model):
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(db.String(255), unique=True, nullable=False)
     url: Mapped[str] = mapped_column(db.String(255), unique=True, nullable=False)
+    # Peso da fonte no ranking do feed (1.0 = neutra), usado no base_score das notícias
+    quality: Mapped[float] = mapped_column(db.Float, nullable=False, default=1.0, server_default="1")
     created_at: Mapped[datetime] = mapped_column(
         db.DateTime(timezone=True), 
         nullable=False, 
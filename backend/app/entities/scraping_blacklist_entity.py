@@ -0,0 +1,21 @@
+from datetime import datetime, timezone
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Text
+from app.extensions import db
+
+class ScrapingBlacklistEntity(db.Model):
+    __tablename__ = "scraping_blacklist"
+
+    domain: Mapped[str] = mapped_column(db.String(255), primary_key=True)
+    error_type: Mapped[str] = mapped_column(db.String(255), nullable=False)
+    error_count: Mapped[int] = mapped_column(nullable=False, default=1)
+    reason: Mapped[str] = mapped_column(Text, nullable=True)
+    last_url: Mapped[str] = mapped_column(Text, nullable=True)
+    last_error_type: Mapped[str] = mapped_column(db.String(255), nullable=True)
+    last_error_message: Mapped[str] = mapped_column(Text, nullable=True)
+
+    blocked_at: Mapped[datetime] = mapped_column(db.DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+    updated_at: Mapped[datetime] = mapped_column(db.DateTime(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return f"<ScrapingBlacklistEntity domain='{self.domain}' error_count={self.error_count}>"
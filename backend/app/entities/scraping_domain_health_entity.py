@@ -0,0 +1,20 @@
+from datetime import datetime
+from sqlalchemy.orm import Mapped, mapped_column
+from app.extensions import db
+
+class ScrapingDomainHealthEntity(db.Model):
+    __tablename__ = "scraping_domain_health"
+
+    domain: Mapped[str] = mapped_column(db.String(255), primary_key=True)
+    state: Mapped[str] = mapped_column(db.String(20), nullable=False, default="closed")
+    success_score: Mapped[float] = mapped_column(db.Float, nullable=False, default=0.0)
+    failure_score: Mapped[float] = mapped_column(db.Float, nullable=False, default=0.0)
+    open_count: Mapped[int] = mapped_column(nullable=False, default=0)
+    last_error_type: Mapped[str] = mapped_column(db.String(255), nullable=True)
+
+    opened_at: Mapped[datetime] = mapped_column(db.DateTime(timezone=True), nullable=True)
+    next_probe_at: Mapped[datetime] = mapped_column(db.DateTime(timezone=True), nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(db.DateTime(timezone=True), nullable=False)
+
+    def __repr__(self):
+        return f"<ScrapingDomainHealthEntity domain='{self.domain}' state='{self.state}'>"
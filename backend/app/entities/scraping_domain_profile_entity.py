@@ -0,0 +1,20 @@
+from datetime import datetime
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Text
+from app.extensions import db
+
+class ScrapingDomainProfileEntity(db.Model):
+    __tablename__ = "scraping_domain_profiles"
+
+    domain: Mapped[str] = mapped_column(db.String(255), primary_key=True)
+    container_selector: Mapped[str] = mapped_column(Text, nullable=False)
+    boilerplate_selectors: Mapped[list] = mapped_column(db.JSON, nullable=False, default=list)
+    trim_selector: Mapped[str] = mapped_column(Text, nullable=True)
+    hits: Mapped[int] = mapped_column(nullable=False, default=0)
+    consecutive_misses: Mapped[int] = mapped_column(nullable=False, default=0)
+
+    learned_at: Mapped[datetime] = mapped_column(db.DateTime(timezone=True), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(db.DateTime(timezone=True), nullable=False)
+
+    def __repr__(self):
+        return f"<ScrapingDomainProfileEntity domain='{self.domain}' container_selector='{self.container_selector}'>"
@@ -13,6 +13,8 @@ class UserEntity(db.Model):
     password_hash: Mapped[str] = mapped_column(db.String(200), nullable=True)
     newsletter: Mapped[bool] = mapped_column(db.Boolean, nullable=False, default=False)
     created_at: Mapped[datetime] = mapped_column(db.DateTime(timezone=True), nullable=False, server_default=db.func.now())
+    # Incrementado a cada mudança de fontes ou custom topics preferidos (estado do feed em memória)
+    preferences_version: Mapped[int] = mapped_column(db.Integer, nullable=False, default=0, server_default="0")
 
     saved_news = relationship(
         "NewsEntity",
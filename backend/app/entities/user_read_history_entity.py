@@ -1,18 +1,43 @@
-from datetime import datetime
-from sqlalchemy import ForeignKey
+from datetime import date, datetime, timezone
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 from app.extensions import db
 
+
+def read_day_of(read_at: datetime) -> date:
+    """
+    Dia da leitura: a data de read_at em UTC (a mesma da migração 0008).
+
+    read_at sem fuso é tratado como hora local, como o PostgreSQL faz ao
+    gravar em timestamptz com o fuso da sessão igual ao do servidor.
+    """
+    return read_at.astimezone(timezone.utc).date()
+
+
+def _read_day(context) -> date:
+    """Dia da leitura (a partir de read_at, quando informado)."""
+    read_at = context.get_current_parameters().get("read_at")
+    return read_day_of(read_at or datetime.now(timezone.utc))
+
+
 class UserReadHistoryEntity(db.Model):
     __tablename__ = 'user_read_history'
     
+    # Uma leitura por notícia e dia: a chave é o alvo do INSERT ... ON CONFLICT
+    # do repositório, que atualiza read_at (por isso read_at fica fora dela)
     user_id: Mapped[int] = mapped_column(ForeignKey('users.id', ondelete="CASCADE"), primary_key=True)
     news_id: Mapped[int] = mapped_column(ForeignKey('news.id', ondelete="CASCADE"), primary_key=True)
-    read_at: Mapped[datetime] = mapped_column(db.DateTime(timezone=True), primary_key=True, server_default=func.now())
+    read_day: Mapped[date] = mapped_column(db.Date, primary_key=True, default=_read_day)
+    read_at: Mapped[datetime] = mapped_column(db.DateTime(timezone=True), nullable=False, server_default=func.now())
     
     user = relationship("UserEntity", back_populates="read_history")
     news = relationship("NewsEntity", back_populates="read_by_users")
 
+    __table_args__ = (
+        # Histórico do usuário: WHERE user_id = ? ORDER BY read_at DESC
+        Index("ix_user_read_history_user_read_at", "user_id", "read_at"),
+    )
+
     def __repr__(self):
         return f"<UserReadHistoryEntity user_id={self.user_id} news_id={self.news_id} read_at='{self.read_at}'>"
@@ -1,6 +1,6 @@
 from datetime import datetime
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import ForeignKey, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, UniqueConstraint, text
 from app.extensions import db
 
 class UserSavedNewsEntity(db.Model):
@@ -16,4 +16,11 @@ class UserSavedNewsEntity(db.Model):
 
     __table_args__ = (
         UniqueConstraint("user_id", "news_id", name="uq_user_saved_news_user_news"),
+        # Índice parcial só com os favoritos: subconsulta EXISTS das listagens
+        # e lista de favoritos do usuário
+        Index(
+            "ix_user_saved_news_favorites", "user_id", "news_id",
+            postgresql_where=text("is_favorite"),
+            sqlite_where=text("is_favorite = 1"),
+        ),
     )
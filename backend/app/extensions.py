@@ -1,4 +1,5 @@
+from flask_migrate import Migrate
 from flask_sqlalchemy import SQLAlchemy
 
 db = SQLAlchemy()
-
+migrate = Migrate()
@@ -11,7 +11,7 @@ logging.basicConfig(
     stream=sys.stdout  
 )
 
-def run_collection_job():
+def run_collection_job(resume: bool = False):
     """
     Executa o job de coleta simplificada de notícias.
 
@@ -20,20 +20,34 @@ def run_collection_job():
     - 2 chamadas GNews por tópico (top-headlines + search com keywords IA)
     - Salva notícias associadas ao topic_id correto
     - Lógica simples e eficiente sem complexidade desnecessária
+
+    O motor é escolhido pela variável COLLECTION_ENGINE: 'sync' (padrão) usa o
+    NewsCollectService; 'async' usa o AsyncNewsCollectService, com downloads
+    concorrentes via asyncio.
+
+    Args:
+        resume: Se True (flag --resume, só para recuperação manual), continua a
+            última execução interrompida
     """
     from app import create_app
-    from app.services.news_collect_service import NewsCollectService
+
+    engine = os.getenv('COLLECTION_ENGINE', 'sync').strip().lower()
+    if engine == 'async':
+        from app.services.async_news_collect_service import AsyncNewsCollectService as NewsCollectService
+    else:
+        from app.services.news_collect_service import NewsCollectService
 
     app = create_app()
     with app.app_context():
         logging.info("=" * 80)
-        logging.info("JOB DE COLETA SIMPLIFICADA INICIADO")
+        logging.info("JOB DE COLETA SIMPLIFICADA INICIADO" + (" (RETOMADA)" if resume else ""))
+        logging.info(f"Motor de coleta: {engine}")
         logging.info("=" * 80)
 
         try:
             news_collect_service = NewsCollectService()
 
-            new_articles_count, new_sources_count = news_collect_service.collect_news_simple()
+            new_articles_count, new_sources_count = news_collect_service.collect_news_simple(resume=resume)
 
             logging.info("=" * 80)
             logging.info("JOB FINALIZADO COM SUCESSO")
@@ -48,4 +62,4 @@ def run_collection_job():
             raise  
 
 if __name__ == "__main__":
-    run_collection_job()
\ No newline at end of file
+    run_collection_job(resume='--resume' in sys.argv[1:])
\ No newline at end of file
@@ -40,10 +40,17 @@ def send_newsletter_job():
             success_count = 0
             fail_count = 0
 
+            # Ranking de todos os usuários em lote; se falhar, cada envio busca as suas notícias
+            try:
+                news_by_user = newsletter_service.get_news_for_users([user.id for user in users])
+            except Exception as e:
+                logging.warning(f"Ranking em lote falhou, buscando notícias por usuário: {e}", exc_info=True)
+                news_by_user = {}
+
             for user in users:
                 logging.info(f"--- Processando: {user.full_name} <{user.email}> ---")
 
-                result = newsletter_service.send_newsletter_to_user(user)
+                result = newsletter_service.send_newsletter_to_user(user, news_data=news_by_user.get(user.id))
 
                 if result['success']:
                     success_count += 1
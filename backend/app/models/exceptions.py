@@ -45,6 +45,14 @@ class NewsAlreadyFavoritedError(DomainError):
 class NewsNotFavoritedError(DomainError):
     """Lançado quando se tenta desfavoritar uma notícia que não é favorita."""
     pass
+
+class SearchValidationError(ValidationError):
+    """Lançado quando um parâmetro da busca de notícias é inválido."""
+    pass
+
+class SearchUnavailableError(DomainError):
+    """Lançado quando o banco em uso não oferece a busca textual."""
+    pass
  
 # --- News Source Exceptions ---
  
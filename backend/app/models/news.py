@@ -36,6 +36,8 @@ class News:
         self.source_name = source_name
         self.topic_name = topic_name
         self.scrapping_status = scrapping_status
+        # Preenchido pelos repositórios conforme o usuário da consulta
+        self.is_favorited = False
 
     @property
     def title(self) -> str:
@@ -132,14 +134,17 @@ class News:
         if hasattr(entity, 'topic') and entity.topic:
             topic_name = entity.topic.name
 
+        # Corpo (content/html) só é lido se foi carregado junto com a notícia
+        body = entity.loaded_body_fields()
+
         return cls(
             id=entity.id,
             title=entity.title,
             description=entity.description,
             url=entity.url,
             image_url=entity.image_url,
-            content=entity.content,
-            html=entity.html,
+            content=body.get('content'),
+            html=body.get('html'),
             published_at=entity.published_at,
             source_id=entity.source_id,
             topic_id=entity.topic_id,
@@ -0,0 +1,85 @@
+from datetime import datetime
+from app.entities.news_entity import NewsEntity
+
+
+class NewsView:
+    """
+    Notícia somente leitura, montada a partir de dados já gravados no banco.
+
+    Diferente de News, não valida nem normaliza os campos (título, URLs,
+    IDs): os dados foram validados na gravação, pelo NewsCollectService.
+    Usa __slots__, sem __dict__ por instância, para reduzir o custo de
+    hidratação nas consultas que devolvem muitas linhas.
+    """
+
+    __slots__ = (
+        "id", "title", "description", "url", "image_url", "content", "html",
+        "published_at", "source_id", "topic_id", "created_at", "source_name",
+        "topic_name", "is_favorited", "source_score", "topic_score", "total_score",
+    )
+
+    def __init__(
+        self,
+        id: int,
+        title: str,
+        url: str,
+        published_at: datetime,
+        source_id: int,
+        topic_id: int | None = None,
+        description: str | None = None,
+        image_url: str | None = None,
+        content: str | None = None,
+        html: str | None = None,
+        created_at: datetime | None = None,
+        source_name: str | None = None,
+        topic_name: str | None = None,
+        is_favorited: bool = False,
+    ):
+        self.id = id
+        self.title = title
+        self.description = description
+        self.url = url
+        self.image_url = image_url
+        self.content = content
+        self.html = html
+        self.published_at = published_at
+        self.source_id = source_id
+        self.topic_id = topic_id
+        self.created_at = created_at
+        self.source_name = source_name
+        self.topic_name = topic_name
+        self.is_favorited = is_favorited
+        # Preenchidos apenas pelas consultas de ranking
+        self.source_score = None
+        self.topic_score = None
+        self.total_score = None
+
+    @classmethod
+    def from_entity(cls, entity: NewsEntity, is_favorited: bool = False) -> "NewsView":
+        if not entity:
+            return None
+
+        source = entity.source
+        topic = entity.topic
+        # Corpo (content/html) só é lido se foi carregado junto com a notícia
+        body = entity.loaded_body_fields()
+
+        return cls(
+            id=entity.id,
+            title=entity.title,
+            url=entity.url,
+            published_at=entity.published_at,
+            source_id=entity.source_id,
+            topic_id=entity.topic_id,
+            description=entity.description,
+            image_url=entity.image_url,
+            content=body.get("content"),
+            html=body.get("html"),
+            created_at=entity.created_at,
+            source_name=source.name if source else None,
+            topic_name=topic.name if topic else None,
+            is_favorited=bool(is_favorited),
+        )
+
+    def __repr__(self) -> str:
+        return f"<NewsView id={self.id} title={self.title!r}>"
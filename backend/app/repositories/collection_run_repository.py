@@ -0,0 +1,142 @@
+import json
+import logging
+from datetime import datetime, timezone
+from sqlalchemy import select, func
+from sqlalchemy.exc import SQLAlchemyError
+from app.extensions import db
+from app.entities.collection_run_entity import CollectionRunEntity
+from app.entities.collection_run_topic_entity import CollectionRunTopicEntity
+from app.entities.collection_run_article_entity import CollectionRunArticleEntity
+from app.utils.db_dialect import dialect_insert
+
+class CollectionRunRepository:
+    STATUS_RUNNING = "running"
+    STATUS_COMPLETED = "completed"
+    STATUS_FAILED = "failed"
+
+    def __init__(self, session=None):
+        self.session = session or db.session
+
+    def create_run(self) -> int:
+        """Cria uma nova execução do job de coleta e retorna seu ID."""
+        try:
+            entity = CollectionRunEntity(status=self.STATUS_RUNNING)
+            self.session.add(entity)
+            self.session.commit()
+            return entity.id
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao criar execução de coleta: {e}", exc_info=True)
+            self.session.rollback()
+            raise
+
+    def find_latest_unfinished(self) -> int | None:
+        """Retorna o ID da execução mais recente que não foi concluída (interrompida ou com erro)."""
+        try:
+            latest = self.session.execute(
+                select(CollectionRunEntity).order_by(CollectionRunEntity.id.desc()).limit(1)
+            ).scalar_one_or_none()
+            if latest and latest.status != self.STATUS_COMPLETED:
+                return latest.id
+            return None
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao buscar execução de coleta interrompida: {e}", exc_info=True)
+            raise
+
+    def latest_finished_at(self) -> datetime | None:
+        """
+        Retorna o horário de término da execução finalizada mais recente.
+
+        Usado como versão do conteúdo: muda sempre que uma coleta termina,
+        inclusive quando uma execução retomada reaproveita o mesmo ID.
+        """
+        try:
+            return self.session.execute(select(func.max(CollectionRunEntity.finished_at))).scalar()
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao buscar término da última coleta: {e}", exc_info=True)
+            raise
+
+    def finish_run(self, run_id: int, status: str, new_articles: int = 0, new_sources: int = 0, error: str | None = None) -> None:
+        """Marca a execução como concluída ou com erro, somando os contadores desta tentativa."""
+        try:
+            entity = self.session.get(CollectionRunEntity, run_id)
+            entity.status = status
+            entity.new_articles_count += new_articles
+            entity.new_sources_count += new_sources
+            entity.error = error[:2000] if error else None
+            entity.finished_at = datetime.now(timezone.utc)
+            self.session.commit()
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao finalizar execução de coleta: {e}", exc_info=True)
+            self.session.rollback()
+            raise
+
+    def get_fetched_topics(self, run_id: int) -> dict[int, list[dict]]:
+        """Retorna os artigos já buscados no GNews nesta execução, por tópico."""
+        try:
+            stmt = select(CollectionRunTopicEntity).where(CollectionRunTopicEntity.run_id == run_id)
+            entities = self.session.execute(stmt).scalars().all()
+            return {entity.topic_id: json.loads(entity.articles_json) for entity in entities}
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao buscar progresso por tópico: {e}", exc_info=True)
+            raise
+
+    def save_fetched_topic(self, run_id: int, topic_id: int, articles: list[dict]) -> None:
+        """Registra o checkpoint de um tópico buscado no GNews."""
+        try:
+            self.session.merge(CollectionRunTopicEntity(
+                run_id=run_id,
+                topic_id=topic_id,
+                articles_json=json.dumps(articles, ensure_ascii=False)
+            ))
+            self.session.commit()
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao gravar progresso do tópico: {e}", exc_info=True)
+            self.session.rollback()
+            raise
+
+    def get_article_stages(self, run_id: int) -> dict[str, str]:
+        """Retorna o estágio de cada artigo (por URL normalizada) nesta execução."""
+        try:
+            stmt = (
+                select(CollectionRunArticleEntity.url, CollectionRunArticleEntity.stage)
+                .where(CollectionRunArticleEntity.run_id == run_id)
+            )
+            return {url: stage for url, stage in self.session.execute(stmt).all()}
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao buscar progresso dos artigos: {e}", exc_info=True)
+            raise
+
+    def upsert_article_stages(self, run_id: int, entries: list[dict]) -> None:
+        """
+        Grava em lote o estágio de vários artigos.
+
+        Args:
+            run_id: ID da execução
+            entries: Registros com 'url', 'topic_id', 'stage' e 'reason'
+        """
+        if not entries:
+            return
+
+        now = datetime.now(timezone.utc)
+        rows = [{**entry, "run_id": run_id, "updated_at": now} for entry in entries]
+        try:
+            insert = dialect_insert(self.session)
+            if insert is None:
+                for row in rows:
+                    self.session.merge(CollectionRunArticleEntity(**row))
+            else:
+                stmt = insert(CollectionRunArticleEntity)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["run_id", "url"],
+                    set_={
+                        "stage": stmt.excluded.stage,
+                        "reason": stmt.excluded.reason,
+                        "updated_at": stmt.excluded.updated_at,
+                    }
+                )
+                self.session.execute(stmt, rows)
+            self.session.commit()
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao gravar progresso dos artigos: {e}", exc_info=True)
+            self.session.rollback()
+            raise
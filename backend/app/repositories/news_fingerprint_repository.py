@@ -0,0 +1,75 @@
+import logging
+from datetime import datetime, timezone
+from sqlalchemy import select, or_
+from sqlalchemy.exc import SQLAlchemyError
+from app.extensions import db
+from app.entities.news_fingerprint_entity import NewsFingerprintEntity
+from app.utils.db_dialect import dialect_insert
+from app.utils.simhash import split_bands, to_signed, to_unsigned
+
+class NewsFingerprintRepository:
+    def __init__(self, session=None):
+        self.session = session or db.session
+
+    def find_candidates(self, fingerprint: int, since: datetime | None = None) -> list[tuple[int, int]]:
+        """
+        Busca notícias que compartilham pelo menos uma banda do fingerprint (candidatas a quase duplicadas).
+
+        Args:
+            fingerprint: SimHash sem sinal de 64 bits
+            since: Considera apenas fingerprints gravados a partir desta data
+
+        Returns:
+            Lista de tuplas (news_id, fingerprint sem sinal)
+        """
+        bands = split_bands(fingerprint)
+        try:
+            stmt = select(NewsFingerprintEntity.news_id, NewsFingerprintEntity.fingerprint).where(or_(
+                NewsFingerprintEntity.band_0 == bands[0],
+                NewsFingerprintEntity.band_1 == bands[1],
+                NewsFingerprintEntity.band_2 == bands[2],
+                NewsFingerprintEntity.band_3 == bands[3],
+            ))
+            if since is not None:
+                stmt = stmt.where(NewsFingerprintEntity.created_at >= since)
+            return [(news_id, to_unsigned(value)) for news_id, value in self.session.execute(stmt).all()]
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao buscar fingerprints candidatos: {e}", exc_info=True)
+            raise
+
+    def bulk_create(self, fingerprints: dict[int, int]) -> None:
+        """
+        Grava os fingerprints de várias notícias, ignorando as que já possuem fingerprint.
+
+        Args:
+            fingerprints: Dicionário {news_id: fingerprint sem sinal}
+        """
+        if not fingerprints:
+            return
+
+        now = datetime.now(timezone.utc)
+        rows = []
+        for news_id, fingerprint in fingerprints.items():
+            bands = split_bands(fingerprint)
+            rows.append({
+                "news_id": news_id,
+                "fingerprint": to_signed(fingerprint),
+                "band_0": bands[0],
+                "band_1": bands[1],
+                "band_2": bands[2],
+                "band_3": bands[3],
+                "created_at": now,
+            })
+
+        try:
+            insert = dialect_insert(self.session)
+            if insert is None:
+                for row in rows:
+                    self.session.merge(NewsFingerprintEntity(**row))
+            else:
+                self.session.execute(insert(NewsFingerprintEntity).on_conflict_do_nothing(), rows)
+            self.session.commit()
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao gravar fingerprints de notícias: {e}", exc_info=True)
+            self.session.rollback()
+            raise
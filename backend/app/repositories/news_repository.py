@@ -1,13 +1,22 @@
 import logging
-from datetime import datetime, timedelta
-from sqlalchemy import select, func, literal, case, text
-from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import joinedload
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import select, func, literal, case, text, update, bindparam
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+from sqlalchemy.orm import joinedload, selectinload
 from app.extensions import db
 from app.entities.news_entity import NewsEntity
+from app.entities.news_body_entity import NewsBodyEntity
 from app.entities.news_source_entity import NewsSourceEntity
+from app.entities.topic_entity import TopicEntity
+from app.entities.custom_topic_entity import CustomTopicEntity
+from app.entities.user_preferred_custom_topics import UserPreferredCustomTopicEntity
 from app.entities.user_saved_news_entity import UserSavedNewsEntity
 from app.models.news import News
+from app.models.news_view import NewsView
+from app.utils.url_normalizer import normalize_url
+from app.utils.title_normalizer import normalize_title
+from app.utils.db_dialect import dialect_insert
+from app.utils import news_ranking, news_search
 from typing import Optional
 
 class NewsRepository:
@@ -17,7 +26,12 @@ class NewsRepository:
     def create(self, model: News) -> News:
         try:
             entity = model.to_orm()
+            quality = self._source_qualities([model.source_id]).get(model.source_id)
+            entity.base_score = news_ranking.base_score(model.published_at, quality)
+            entity.language = news_search.news_language(model.title, model.description, model.content)
             self.session.add(entity)
+            self.session.flush()
+            self._update_search_vectors([(entity.id, model, entity.language)])
             self.session.commit()
             self.session.refresh(entity)
             return News.from_entity(entity)
@@ -26,10 +40,164 @@ class NewsRepository:
             self.session.rollback()
             raise
 
+    def bulk_create_ignore_conflicts(self, models: list[News]) -> list[int]:
+        """
+        Insere várias notícias com um único INSERT ... ON CONFLICT DO NOTHING.
+
+        Notícias cuja URL já existe são ignoradas.
+
+        Returns:
+            IDs das notícias efetivamente inseridas
+        """
+        if not models:
+            return []
+
+        try:
+            qualities = self._source_qualities({model.source_id for model in models})
+            insert = dialect_insert(self.session)
+            if insert is None:
+                return self._create_each_ignoring_conflicts(models, qualities)
+
+            rows = [self._to_row(model, qualities.get(model.source_id)) for model in models]
+            stmt = insert(NewsEntity).on_conflict_do_nothing().returning(NewsEntity.id, NewsEntity.url)
+            inserted = self.session.execute(stmt, rows).all()
+
+            # Corpos só das notícias efetivamente inseridas, na mesma transação
+            models_by_url = {model.url: model for model in models}
+            bodies = [self._to_body_row(news_id, models_by_url[url]) for news_id, url in inserted]
+            if bodies:
+                self.session.execute(insert(NewsBodyEntity), bodies)
+            languages = {row["url"]: row["language"] for row in rows}
+            self._update_search_vectors([(news_id, models_by_url[url], languages[url]) for news_id, url in inserted])
+            self.session.commit()
+            return [news_id for news_id, _ in inserted]
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao criar notícias em lote: {e}", exc_info=True)
+            self.session.rollback()
+            raise
+
+    def _source_qualities(self, source_ids) -> dict[int, float]:
+        """Qualidade das fontes (news_sources.quality) por ID, para o base_score do ranking."""
+        stmt = select(NewsSourceEntity.id, NewsSourceEntity.quality).where(NewsSourceEntity.id.in_(list(source_ids)))
+        return dict(self.session.execute(stmt).all())
+
+    def _to_row(self, model: News, source_quality: Optional[float] = None) -> dict:
+        """Converte o modelo em um dicionário de colunas de 'news' para inserts em lote."""
+        return {
+            "title": model.title,
+            "title_key": normalize_title(model.title),
+            "description": model.description,
+            "url": model.url,
+            "image_url": model.image_url,
+            "published_at": model.published_at,
+            "base_score": news_ranking.base_score(model.published_at, source_quality),
+            "language": news_search.news_language(model.title, model.description, model.content),
+            "source_id": model.source_id,
+            "topic_id": model.topic_id,
+            "created_at": model.created_at or datetime.now(timezone.utc),
+        }
+
+    def _update_search_vectors(self, items: list[tuple[int, News, str]]) -> None:
+        """
+        Grava o tsvector da busca (PostgreSQL) das notícias recém-inseridas, em
+        um único UPDATE em lote. Em outros bancos não faz nada.
+
+        Args:
+            items: Tuplas (news_id, modelo com o texto em claro, idioma)
+        """
+        if not items or self.session.get_bind().dialect.name != "postgresql":
+            return
+        news = NewsEntity.__table__
+        stmt = (
+            update(news)
+            .where(news.c.id == bindparam("news_id"))
+            .values(search_vector=news_search.search_vector_expression())
+        )
+        self.session.execute(stmt, [
+            {"news_id": news_id, **news_search.search_document(model.title, model.description, model.content, language)}
+            for news_id, model, language in items
+        ])
+
+    def _to_body_row(self, news_id: int, model: News) -> dict:
+        """Converte o corpo do modelo em um dicionário de colunas de 'news_bodies'."""
+        return {"news_id": news_id, "content": model.content, "html": model.html}
+
+    def _create_each_ignoring_conflicts(self, models: list[News], qualities: dict[int, float]) -> list[int]:
+        """Fallback para dialetos sem ON CONFLICT: insere uma a uma em savepoints."""
+        ids = []
+        for model in models:
+            try:
+                with self.session.begin_nested():
+                    row = self._to_row(model, qualities.get(model.source_id))
+                    entity = NewsEntity(**row, content=model.content, html=model.html)
+                    self.session.add(entity)
+                ids.append(entity.id)
+            except IntegrityError:
+                continue
+        self.session.commit()
+        return ids
+
+    def list_normalized_urls(self) -> set[str]:
+        """Retorna o conjunto das URLs normalizadas de todas as notícias (deduplicação em lote)."""
+        try:
+            urls = self.session.execute(select(NewsEntity.url)).scalars().all()
+            return {normalize_url(url) for url in urls}
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao listar URLs de notícias: {e}", exc_info=True)
+            raise
+
+    def find_ids_by_urls(self, urls: list[str]) -> dict[str, int]:
+        """Retorna, em uma única consulta, o ID das notícias com as URLs informadas (URL exata)."""
+        if not urls:
+            return {}
+        try:
+            stmt = select(NewsEntity.url, NewsEntity.id).where(NewsEntity.url.in_(set(urls)))
+            return {url: news_id for url, news_id in self.session.execute(stmt).all()}
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao buscar IDs de notícias por URL: {e}", exc_info=True)
+            raise
+
+    def find_existing_titles(self, titles: list[str]) -> set[str]:
+        """
+        Verifica, em uma única consulta, quais títulos já existem.
+
+        A comparação usa a chave normalizada (normalize_title) pela coluna
+        indexada 'title_key'.
+
+        Returns:
+            Conjunto das chaves normalizadas dos títulos existentes
+        """
+        keys = {normalize_title(title) for title in titles if title}
+        keys.discard('')
+        if not keys:
+            return set()
+
+        try:
+            stmt = select(NewsEntity.title_key).where(NewsEntity.title_key.in_(keys)).distinct()
+            return set(self.session.execute(stmt).scalars().all())
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao buscar títulos existentes: {e}", exc_info=True)
+            raise
+
+    def find_favorited_ids(self, user_id: int, news_ids: list[int]) -> set[int]:
+        """Retorna, em uma única consulta, quais das notícias informadas o usuário favoritou."""
+        if not news_ids:
+            return set()
+        try:
+            stmt = select(UserSavedNewsEntity.news_id).where(
+                UserSavedNewsEntity.user_id == user_id,
+                UserSavedNewsEntity.news_id.in_(set(news_ids)),
+                UserSavedNewsEntity.is_favorite == True,
+            )
+            return set(self.session.execute(stmt).scalars().all())
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao buscar favoritos do usuário: {e}", exc_info=True)
+            raise
+
     def _enrich_with_favorite_status(self, stmt, user_id: Optional[int]):
         """Adiciona uma subconsulta para verificar o status de favorito."""
         if user_id is None:
-            return stmt.add_columns(literal(False).label("is_favorite"))
+            return stmt.add_columns(literal(False).label("is_favorited"))
 
         favorite_subquery = (
             select(literal(True))
@@ -43,55 +211,151 @@ class NewsRepository:
 
         return stmt.add_columns(favorite_subquery)
 
-    def _map_result_to_model(self, result_row) -> News:
-        """Mapeia uma linha do resultado (entidade, is_favorited) para o modelo."""
+    def _map_result_to_model(self, result_row) -> NewsView:
+        """Mapeia uma linha do resultado (entidade, is_favorited) para a view de leitura."""
         news_entity, is_favorited = result_row
-        news_model = News.from_entity(news_entity)
-        news_model.is_favorited = is_favorited or False
-        return news_model
+        return NewsView.from_entity(news_entity, is_favorited)
+
+    def _card_select(self, user_id: Optional[int], favorites_only: bool = False):
+        """
+        Consulta das colunas do card da notícia (sem corpo), com nome da fonte
+        e do tópico por JOIN e o status de favorito, ordenada por data.
+
+        As linhas (Row) são serializadas diretamente, sem montar modelos News.
+
+        Args:
+            user_id: Usuário para o status de favorito (None = False)
+            favorites_only: Restringe às favoritas de user_id
+        """
+        stmt = (
+            select(
+                NewsEntity.id,
+                NewsEntity.title,
+                NewsEntity.description,
+                NewsEntity.url,
+                NewsEntity.image_url,
+                NewsEntity.published_at,
+                NewsEntity.source_id,
+                NewsEntity.topic_id,
+                NewsEntity.created_at,
+                NewsSourceEntity.name.label("source_name"),
+                TopicEntity.name.label("topic_name"),
+            )
+            .join(NewsSourceEntity, NewsEntity.source_id == NewsSourceEntity.id)
+            .outerjoin(TopicEntity, NewsEntity.topic_id == TopicEntity.id)
+            .order_by(NewsEntity.published_at.desc(), NewsEntity.id.desc())
+        )
+        if favorites_only:
+            return (
+                stmt.join(UserSavedNewsEntity, NewsEntity.id == UserSavedNewsEntity.news_id)
+                .where(UserSavedNewsEntity.user_id == user_id, UserSavedNewsEntity.is_favorite == True)
+                .add_columns(literal(True).label("is_favorited"))
+            )
+        return self._enrich_with_favorite_status(stmt, user_id)
 
-    def find_by_id(self, news_id: int, user_id: Optional[int] = None) -> News | None:
+    def list_all_cards(self, page: int = 1, per_page: int = 20, user_id: Optional[int] = None) -> list:
+        """Lista paginada de todas as notícias, como linhas de card."""
         try:
-            stmt = select(NewsEntity).where(NewsEntity.id == news_id)
-            enriched_stmt = self._enrich_with_favorite_status(stmt, user_id)
-            result = self.session.execute(enriched_stmt).first()
-            return self._map_result_to_model(result) if result else None
+            stmt = self._card_select(user_id).offset((page - 1) * per_page).limit(per_page)
+            return self.session.execute(stmt).all()
         except SQLAlchemyError as e:
-            logging.error(f"Erro de banco ao buscar notícia por ID: {e}", exc_info=True)
+            logging.error(f"Erro de banco ao listar notícias: {e}", exc_info=True)
             raise
 
-    def _normalize_url(self, url: str) -> str:
-        if not url:
-            return url
+    def find_cards_by_topic(self, topic_id: int, page: int = 1, per_page: int = 10, user_id: Optional[int] = None) -> list:
+        """Página de notícias de um tópico, como linhas de card."""
+        try:
+            stmt = (
+                self._card_select(user_id)
+                .where(NewsEntity.topic_id == topic_id)
+                .offset((page - 1) * per_page)
+                .limit(per_page)
+            )
+            return self.session.execute(stmt).all()
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao buscar notícias por tópico: {e}", exc_info=True)
+            raise
 
+    def find_cards_by_ids(self, news_ids: list[int], user_id: Optional[int] = None) -> list:
+        """Cards (Rows) das notícias informadas, em qualquer ordem; IDs inexistentes são ignorados."""
+        if not news_ids:
+            return []
         try:
-            from urllib.parse import urlparse, urlunparse
+            stmt = self._card_select(user_id).where(NewsEntity.id.in_(news_ids))
+            return self.session.execute(stmt).all()
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao buscar cards por ID: {e}", exc_info=True)
+            raise
 
-            parsed = urlparse(url.lower().strip())
+    def list_favorite_cards(self, user_id: int, page: int = 1, per_page: int = 20) -> list:
+        """Página de notícias favoritas do usuário, como linhas de card."""
+        try:
+            stmt = (
+                self._card_select(user_id, favorites_only=True)
+                .offset((page - 1) * per_page)
+                .limit(per_page)
+            )
+            return self.session.execute(stmt).all()
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao listar notícias favoritas: {e}", exc_info=True)
+            raise
 
-            normalized = urlunparse((
-                parsed.scheme,
-                parsed.netloc.replace('www.', ''),  # Remove www
-                parsed.path.rstrip('/'),            # Remove trailing slash
-                '',  # params
-                '',  # query - remove query parameters
-                ''   # fragment
-            ))
+    def find_favorite_ids(self, user_id: int, page: int = 1, per_page: int = 20) -> list[int]:
+        """
+        Retorna apenas os IDs da página de favoritas do usuário, na mesma ordem
+        de list_favorite_cards (sem JOIN com fonte e tópico).
+        """
+        try:
+            stmt = (
+                select(NewsEntity.id)
+                .join(UserSavedNewsEntity, NewsEntity.id == UserSavedNewsEntity.news_id)
+                .where(UserSavedNewsEntity.user_id == user_id, UserSavedNewsEntity.is_favorite == True)
+                .order_by(NewsEntity.published_at.desc(), NewsEntity.id.desc())
+                .offset((page - 1) * per_page)
+                .limit(per_page)
+            )
+            return list(self.session.execute(stmt).scalars().all())
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao buscar IDs de notícias favoritas: {e}", exc_info=True)
+            raise
 
-            return normalized
+    def count_favorites_by_user(self, user_id: int) -> int:
+        """Conta as notícias favoritas do usuário."""
+        try:
+            stmt = select(func.count()).select_from(UserSavedNewsEntity).where(
+                UserSavedNewsEntity.user_id == user_id,
+                UserSavedNewsEntity.is_favorite == True,
+            )
+            return self.session.execute(stmt).scalar() or 0
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao contar notícias favoritas: {e}", exc_info=True)
+            raise
+
+    def find_by_id(self, news_id: int, user_id: Optional[int] = None) -> NewsView | None:
+        try:
+            stmt = (
+                select(NewsEntity)
+                .where(NewsEntity.id == news_id)
+                .options(joinedload(NewsEntity.body))
+            )
+            enriched_stmt = self._enrich_with_favorite_status(stmt, user_id)
+            result = self.session.execute(enriched_stmt).first()
+            return self._map_result_to_model(result) if result else None
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao buscar notícia por ID: {e}", exc_info=True)
+            raise
 
-        except Exception as e:
-            logging.warning(f"Erro ao normalizar URL '{url}': {e}")
-            return url.lower().strip()
+    def _normalize_url(self, url: str) -> str:
+        return normalize_url(url)
 
-    def find_by_url(self, url: str) -> News | None:
+    def find_by_url(self, url: str) -> NewsView | None:
         try:
             # Tentar busca exata primeiro (para compatibilidade)
             stmt = select(NewsEntity).where(NewsEntity.url == url)
             entity = self.session.execute(stmt).scalar_one_or_none()
 
             if entity:
-                return News.from_entity(entity)
+                return NewsView.from_entity(entity)
 
             # Se não encontrou, tentar com URL normalizada
             normalized_url = self._normalize_url(url)
@@ -100,14 +364,14 @@ class NewsRepository:
                 entity = self.session.execute(stmt).scalar_one_or_none()
 
                 if entity:
-                    return News.from_entity(entity)
+                    return NewsView.from_entity(entity)
 
                 stmt = select(NewsEntity)
                 entities = self.session.execute(stmt).scalars().all()
 
                 for existing_entity in entities:
                     if self._normalize_url(existing_entity.url) == normalized_url:
-                        return News.from_entity(existing_entity)
+                        return NewsView.from_entity(existing_entity)
 
             return None
 
@@ -115,12 +379,12 @@ class NewsRepository:
             logging.error(f"Erro de banco ao buscar notícia por URL: {e}", exc_info=True)
             raise
 
-    def find_by_title(self, title: str) -> News | None:
-        """Busca uma notícia pelo título (case-insensitive)."""
+    def find_by_title(self, title: str) -> NewsView | None:
+        """Busca uma notícia pelo título normalizado (normalize_title)."""
         try:
-            stmt = select(NewsEntity).where(func.lower(NewsEntity.title) == title.lower())
-            entity = self.session.execute(stmt).scalar_one_or_none()
-            return News.from_entity(entity) if entity else None
+            stmt = select(NewsEntity).where(NewsEntity.title_key == normalize_title(title)).limit(1)
+            entity = self.session.execute(stmt).scalars().first()
+            return NewsView.from_entity(entity) if entity else None
         except SQLAlchemyError as e:
             logging.error(f"Erro de banco ao buscar notícia por título: {e}", exc_info=True)
             raise
@@ -135,38 +399,31 @@ class NewsRepository:
             logging.error(f"Erro de banco ao contar notícias: {e}", exc_info=True)
             raise
 
-    def list_all(self, page: int = 1, per_page: int = 20, user_id: Optional[int] = None) -> list[News]:
+    def find_ids_by_topic(self, topic_id: int, page: int = 1, per_page: int = 10) -> list[int]:
+        """
+        Retorna apenas os IDs da página de notícias do tópico, na mesma ordem
+        de find_cards_by_topic (consulta coberta pelo índice de tópico/data).
+        """
         try:
             stmt = (
-                select(NewsEntity)
-                .join(NewsEntity.source)
-                .options(joinedload(NewsEntity.source))
+                select(NewsEntity.id)
+                .where(NewsEntity.topic_id == topic_id)
                 .order_by(NewsEntity.published_at.desc(), NewsEntity.id.desc())
+                .offset((page - 1) * per_page)
+                .limit(per_page)
             )
-            enriched_stmt = self._enrich_with_favorite_status(stmt, user_id)
-            paginated_stmt = enriched_stmt.offset((page - 1) * per_page).limit(per_page)
-            results = self.session.execute(paginated_stmt).all()
-            return [self._map_result_to_model(row) for row in results]
+            return list(self.session.execute(stmt).scalars().all())
         except SQLAlchemyError as e:
-            logging.error(f"Erro de banco ao listar notícias: {e}", exc_info=True)
+            logging.error(f"Erro de banco ao buscar IDs de notícias por tópico: {e}", exc_info=True)
             raise
 
-    def find_by_topic(self, topic_id: int, page: int = 1, per_page: int = 10, user_id: Optional[int] = None) -> list[News]:
-        """Busca notícias paginadas por um ID de tópico específico."""
+    def exists(self, news_id: int) -> bool:
+        """Verifica se a notícia existe, sem carregar a linha."""
         try:
-            stmt = (
-                select(NewsEntity)
-                .where(NewsEntity.topic_id == topic_id)
-                .options(joinedload(NewsEntity.source))
-                .order_by(NewsEntity.published_at.desc(), NewsEntity.id.desc())
-            )
-            enriched_stmt = self._enrich_with_favorite_status(stmt, user_id)
-            paginated_stmt = enriched_stmt.offset((page - 1) * per_page).limit(per_page)
-            
-            results = self.session.execute(paginated_stmt).all()
-            return [self._map_result_to_model(row) for row in results]
+            stmt = select(NewsEntity.id).where(NewsEntity.id == news_id)
+            return self.session.execute(stmt).first() is not None
         except SQLAlchemyError as e:
-            logging.error(f"Erro de banco ao buscar notícias por tópico: {e}", exc_info=True)
+            logging.error(f"Erro de banco ao verificar notícia {news_id}: {e}", exc_info=True)
             raise
 
     def count_by_topic(self, topic_id: int) -> int:
@@ -182,101 +439,253 @@ class NewsRepository:
             logging.error(f"Erro ao contar notícias por tópico: {e}", exc_info=True)
             raise
 
-    def list_favorites_by_user(self, user_id: int, page: int = 1, per_page: int = 20) -> list[News]:
+    def _custom_topic_matches(self, user_id: Optional[int]):
+        """
+        Subconsulta correlacionada: quantos custom topics do usuário aparecem
+        no título ou na descrição da notícia.
+
+        O corpo (news_bodies) é gravado comprimido e não pode ser pesquisado
+        no banco; por isso o match usa só título e descrição.
+
+        O nome do tópico é escapado no LIKE ('%', '_' e a barra invertida são
+        literais), como o `in` do Python no ranking em memória.
+        """
+        if user_id is None:
+            return literal(0)
+
+        searchable = func.lower(NewsEntity.title + " " + func.coalesce(NewsEntity.description, ""))
+        topic_name = func.lower(CustomTopicEntity.name)
+        for char in ("\\", "%", "_"):
+            topic_name = func.replace(topic_name, char, "\\" + char)
+        return (
+            select(func.count())
+            .select_from(UserPreferredCustomTopicEntity)
+            .join(CustomTopicEntity, CustomTopicEntity.id == UserPreferredCustomTopicEntity.topic_id)
+            .where(
+                UserPreferredCustomTopicEntity.user_id == user_id,
+                searchable.contains(topic_name, escape="\\"),
+            )
+            .correlate(NewsEntity)
+            .scalar_subquery()
+        )
+
+    def _ranking_columns(self, user_id: Optional[int], preferred_source_ids: list[int]):
+        """Expressões (source_boost, topic_boost, rank) do ranking "For You" de um usuário."""
+        source_boost = case(
+            (NewsEntity.source_id.in_(preferred_source_ids) if preferred_source_ids else False,
+             news_ranking.PREFERRED_SOURCE_BOOST),
+            else_=0.0
+        )
+        topic_boost = self._custom_topic_matches(user_id) * news_ranking.CUSTOM_TOPIC_BOOST
+        rank = (NewsEntity.base_score + source_boost + topic_boost).label("rank")
+        return source_boost, topic_boost, rank
+
+    def rank_ids_for_user(
+        self,
+        user_id: Optional[int],
+        preferred_source_ids: list[int],
+        days_limit: int = 15,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> list:
+        """
+        Ranking "For You" só com IDs (base do estado do feed em FeedRankingService
+        e do ETag da página do feed).
+
+        Returns:
+            Rows (id, published_at, rank) na ordem do feed
+        """
         try:
+            cutoff_date = datetime.now() - timedelta(days=days_limit)
+            _, _, rank = self._ranking_columns(user_id, preferred_source_ids)
             stmt = (
-                select(NewsEntity)
-                .join(UserSavedNewsEntity, NewsEntity.id == UserSavedNewsEntity.news_id)
-                .where(UserSavedNewsEntity.user_id == user_id)
-                .where(UserSavedNewsEntity.is_favorite == True)
-                .options(joinedload(NewsEntity.source))
-                .order_by(NewsEntity.published_at.desc(), NewsEntity.id.desc())
+                select(NewsEntity.id, NewsEntity.published_at, rank)
+                .where(NewsEntity.published_at >= cutoff_date)
+                .order_by(rank.desc(), NewsEntity.published_at.desc(), NewsEntity.id.desc())
+                .offset(offset)
+                .limit(limit)
             )
-            paginated_stmt = stmt.offset((page - 1) * per_page).limit(per_page)
-            results = self.session.execute(paginated_stmt).scalars().all()
-            return [News.from_entity(row) for row in results]
+            return self.session.execute(stmt).all()
         except SQLAlchemyError as e:
-            logging.error(f"Erro de banco ao listar notícias favoritas: {e}", exc_info=True)
+            logging.error(f"Erro de banco ao rankear notícias do usuário {user_id}: {e}", exc_info=True)
             raise
 
-    def get_recent_news_with_base_score(self, user_id: int, preferred_source_ids: list[int], days_limit: int = 15) -> list[News]:
+    def max_id(self) -> int:
+        """Maior ID de notícia gravado (0 se não houver notícias)."""
+        try:
+            return self.session.execute(select(func.max(NewsEntity.id))).scalar() or 0
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao buscar o último ID de notícia: {e}", exc_info=True)
+            raise
+
+    def get_recent_news_with_base_score(
+        self,
+        user_id: Optional[int],
+        preferred_source_ids: list[int],
+        days_limit: int = 15,
+        page: Optional[int] = None,
+        per_page: int = 10
+    ) -> list[NewsView]:
         """
-        Busca notícias dos últimos X dias com scores pré-calculados.
+        Busca notícias dos últimos X dias rankeadas pelo score do feed "For You".
+
+        O rank é calculado no banco a partir do base_score gravado na ingestão
+        (data de publicação + qualidade da fonte), somado aos boosts do
+        usuário (ver app/utils/news_ranking.py):
+        - Fonte preferida: PREFERRED_SOURCE_BOOST
+        - Custom topics no título/descrição (JOIN com os tópicos preferidos):
+          CUSTOM_TOPIC_BOOST por match
 
-        Calcula no banco:
-        - Score temporal baseado na data de publicação
-        - Score de fonte preferida baseado nas preferências do usuário
+        A ordenação e a paginação (LIMIT/OFFSET) usam o rank; o score exibido
+        (total_score), com o decaimento até agora, é calculado só para as
+        linhas retornadas.
 
         Args:
-            user_id: ID do usuário para status de favorited
+            user_id: ID do usuário (favoritos e custom topics); None para anônimo
             preferred_source_ids: Lista de IDs das fontes preferidas
             days_limit: Número de dias para filtrar (padrão: 15)
+            page: Página a buscar (começa em 1); None retorna todas as notícias
+            per_page: Quantidade de itens por página
 
         Returns:
-            Lista de notícias com campos time_score e source_score
+            Lista de notícias com campos source_score, topic_score (boosts) e
+            total_score, ordenada por score e published_at (decrescentes)
         """
         try:
             # Data limite para filtrar notícias
             cutoff_date = datetime.now() - timedelta(days=days_limit)
-
-            # Score temporal usando CASE WHEN
-            time_score_case = case(
-                (NewsEntity.published_at >= datetime.now() - timedelta(days=1), 300),  # Últimas 24h
-                (NewsEntity.published_at >= datetime.now() - timedelta(days=2), 150),  # 1-2 dias
-                (NewsEntity.published_at >= datetime.now() - timedelta(days=5), 75),   # 2-5 dias
-                else_=25  # 5+ dias
-            ).label("time_score")
-
-            # Score de fonte preferida usando CASE WHEN
-            source_score_case = case(
-                (NewsEntity.source_id.in_(preferred_source_ids) if preferred_source_ids else False, 100),
-                else_=0
-            ).label("source_score")
+            source_boost, topic_boost, rank = self._ranking_columns(user_id, preferred_source_ids)
 
             # Query principal com joins e scores
             stmt = (
-                select(NewsEntity, time_score_case, source_score_case)
+                select(
+                    NewsEntity,
+                    source_boost.label("source_score"),
+                    topic_boost.label("topic_score"),
+                    rank,
+                )
                 .join(NewsEntity.source)
-                .options(joinedload(NewsEntity.source))
+                .options(
+                    joinedload(NewsEntity.source),
+                    # Texto para o resumo da newsletter (sem o HTML)
+                    selectinload(NewsEntity.body).load_only(NewsBodyEntity.content)
+                )
                 .where(NewsEntity.published_at >= cutoff_date)
-                .order_by(NewsEntity.published_at.desc())
+                .order_by(rank.desc(), NewsEntity.published_at.desc(), NewsEntity.id.desc())
             )
+            if page is not None:
+                stmt = stmt.offset((page - 1) * per_page).limit(per_page)
 
             # Adicionar status de favorited
-            enriched_stmt = self._enrich_with_favorite_status_for_scoring(stmt, user_id)
+            enriched_stmt = self._enrich_with_favorite_status(stmt, user_id)
 
             results = self.session.execute(enriched_stmt).all()
-            return [self._map_scoring_result_to_model(row) for row in results]
+            now = datetime.now(timezone.utc)
+            return [self._map_scoring_result_to_model(row, now) for row in results]
 
         except SQLAlchemyError as e:
             logging.error(f"Erro de banco ao buscar notícias com score base: {e}", exc_info=True)
             raise
 
-    def _enrich_with_favorite_status_for_scoring(self, stmt, user_id: Optional[int]):
-        """Versão especializada do _enrich_with_favorite_status para queries com scores."""
-        if user_id is None:
-            return stmt.add_columns(literal(False).label("is_favorited"))
+    def count_recent(self, days_limit: int = 15) -> int:
+        """Conta as notícias dos últimos X dias (total do feed "For You")."""
+        try:
+            cutoff_date = datetime.now() - timedelta(days=days_limit)
+            stmt = select(func.count(NewsEntity.id)).where(NewsEntity.published_at >= cutoff_date)
+            return self.session.execute(stmt).scalar_one()
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao contar notícias recentes: {e}", exc_info=True)
+            raise
 
-        favorite_subquery = (
-            select(literal(True))
-            .where(
-                UserSavedNewsEntity.user_id == user_id,
-                UserSavedNewsEntity.news_id == NewsEntity.id,
-                UserSavedNewsEntity.is_favorite == True,
+    def list_recent_for_ranking(self, days_limit: int = 15, after_id: Optional[int] = None) -> list:
+        """
+        Colunas usadas no ranking fora do banco (newsletter, estado do feed) das
+        notícias dos últimos X dias.
+
+        Args:
+            days_limit: Número de dias para filtrar
+            after_id: Se informado, só notícias com ID maior (novas desde então)
+
+        Returns:
+            Rows (id, title, description, source_id, base_score, published_at),
+            ordenadas por published_at e id (decrescentes), o mesmo desempate do feed
+        """
+        try:
+            cutoff_date = datetime.now() - timedelta(days=days_limit)
+            stmt = (
+                select(
+                    NewsEntity.id, NewsEntity.title, NewsEntity.description,
+                    NewsEntity.source_id, NewsEntity.base_score, NewsEntity.published_at
+                )
+                .where(NewsEntity.published_at >= cutoff_date)
+                .order_by(NewsEntity.published_at.desc(), NewsEntity.id.desc())
             )
-            .exists()
-        ).label("is_favorited")
+            if after_id is not None:
+                stmt = stmt.where(NewsEntity.id > after_id)
+            return self.session.execute(stmt).all()
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao listar notícias para o ranking: {e}", exc_info=True)
+            raise
 
-        return stmt.add_columns(favorite_subquery)
+    def list_for_search_index(self, after_id: int = 0, limit: int = 500) -> list:
+        """
+        Texto das notícias para o índice de busca em memória, em lotes por ID.
+
+        Args:
+            after_id: Só notícias com ID maior (continua de onde o lote anterior parou)
+            limit: Tamanho do lote
+
+        Returns:
+            Rows (id, title, description, language, content), ordenadas por ID
+        """
+        try:
+            stmt = (
+                select(
+                    NewsEntity.id, NewsEntity.title, NewsEntity.description,
+                    NewsEntity.language, NewsBodyEntity.content
+                )
+                .outerjoin(NewsBodyEntity, NewsBodyEntity.news_id == NewsEntity.id)
+                .where(NewsEntity.id > after_id)
+                .order_by(NewsEntity.id)
+                .limit(limit)
+            )
+            return self.session.execute(stmt).all()
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao listar notícias para o índice de busca: {e}", exc_info=True)
+            raise
+
+    def find_for_email_by_ids(self, news_ids: list[int]) -> dict[int, NewsView]:
+        """
+        Busca as notícias escolhidas para a newsletter, com fonte, tópico e texto do corpo.
+
+        Returns:
+            Dicionário {news_id: NewsView}
+        """
+        if not news_ids:
+            return {}
+        try:
+            stmt = (
+                select(NewsEntity)
+                .options(
+                    joinedload(NewsEntity.source),
+                    joinedload(NewsEntity.topic),
+                    selectinload(NewsEntity.body).load_only(NewsBodyEntity.content)
+                )
+                .where(NewsEntity.id.in_(news_ids))
+            )
+            entities = self.session.execute(stmt).scalars().all()
+            return {entity.id: NewsView.from_entity(entity) for entity in entities}
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao buscar notícias da newsletter: {e}", exc_info=True)
+            raise
 
-    def _map_scoring_result_to_model(self, result_row) -> News:
-        """Mapeia resultado com scores (entidade, time_score, source_score, is_favorited) para o modelo."""
-        news_entity, time_score, source_score, is_favorited = result_row
-        news_model = News.from_entity(news_entity)
-        news_model.is_favorited = is_favorited or False
+    def _map_scoring_result_to_model(self, result_row, now: datetime) -> NewsView:
+        """Mapeia resultado com scores (entidade, source_score, topic_score, rank, is_favorited) para a view de leitura."""
+        news_entity, source_score, topic_score, rank, is_favorited = result_row
+        news_model = NewsView.from_entity(news_entity, is_favorited)
 
-        # Adicionar scores como atributos temporários
-        news_model.time_score = time_score
         news_model.source_score = source_score
+        news_model.topic_score = topic_score
+        news_model.total_score = news_ranking.decayed_score(rank, now)
 
         return news_model
\ No newline at end of file
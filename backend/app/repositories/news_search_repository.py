@@ -0,0 +1,64 @@
+import logging
+from typing import Optional
+from sqlalchemy import select, tuple_
+from sqlalchemy.exc import SQLAlchemyError
+from app.extensions import db
+from app.entities.news_entity import NewsEntity
+from app.models.exceptions import SearchUnavailableError
+from app.utils import news_search
+
+
+class NewsSearchRepository:
+    """
+    Busca textual de notícias no PostgreSQL: news.search_vector (GIN) com
+    ts_rank e paginação por keyset em (rank, id).
+    """
+
+    def __init__(self, session=None):
+        self.session = session or db.session
+
+    @property
+    def available(self) -> bool:
+        return self.session.get_bind().dialect.name == "postgresql"
+
+    def search_statement(self, query: str, language: Optional[str] = None, limit: int = 20, after: Optional[tuple[float, int]] = None):
+        """Consulta da busca (separada de search() para inspeção com EXPLAIN)."""
+        tsquery = news_search.search_query_expression(query, language)
+        rank = news_search.search_rank_expression(NewsEntity.search_vector, tsquery).label("rank")
+        stmt = (
+            select(NewsEntity.id, rank)
+            .where(NewsEntity.search_vector.bool_op("@@")(tsquery))
+            .order_by(rank.desc(), NewsEntity.id.desc())
+            .limit(limit)
+        )
+        if language in news_search.TEXT_SEARCH_CONFIGS:
+            stmt = stmt.where(NewsEntity.language == language)
+        if after is not None:
+            after_rank, after_id = after
+            stmt = stmt.where(tuple_(rank, NewsEntity.id) < tuple_(news_search.search_cursor_rank(after_rank), after_id))
+        return stmt
+
+    def search(self, query: str, language: Optional[str] = None, limit: int = 20, after: Optional[tuple[float, int]] = None) -> list[tuple[int, float]]:
+        """
+        IDs das notícias que casam com a busca, da mais relevante para a menos.
+
+        Args:
+            query: Texto da busca (sintaxe de websearch_to_tsquery)
+            language: 'pt' ou 'en' restringe ao idioma; None busca em todos
+            limit: Quantidade máxima de resultados
+            after: (rank, id) do último resultado da página anterior
+
+        Returns:
+            Lista de (news_id, rank)
+
+        Raises:
+            SearchUnavailableError: Banco sem full-text search (não PostgreSQL)
+        """
+        if not self.available:
+            raise SearchUnavailableError("Busca textual disponível apenas com PostgreSQL.")
+        try:
+            rows = self.session.execute(self.search_statement(query, language, limit, after)).all()
+            return [(news_id, rank) for news_id, rank in rows]
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao buscar notícias por '{query}': {e}", exc_info=True)
+            raise
@@ -1,10 +1,15 @@
 import logging
-from sqlalchemy import func, select
-from sqlalchemy.exc import SQLAlchemyError
+from datetime import datetime, timezone
+from sqlalchemy import func, select, update
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from app.extensions import db
+from app.entities.news_entity import NewsEntity
 from app.entities.news_source_entity import NewsSourceEntity
+from app.models.exceptions import NewsSourceNotFoundError, NewsSourceValidationError
 from app.models.news_source import NewsSource
 from app.entities.user_preferred_news_sources_entity import UserPreferredNewsSourceEntity
+from app.utils import news_ranking
+from app.utils.db_dialect import dialect_insert
 
 class NewsSourceRepository:
     def __init__(self, session=None):
@@ -85,3 +90,84 @@ class NewsSourceRepository:
         except SQLAlchemyError as e:
             logging.error(f"Erro de banco ao listar fontes não associadas ao usuário: {e}", exc_info=True)
             raise
+
+    def update_quality(self, source_id: int, quality: float) -> int:
+        """
+        Altera a qualidade da fonte e recalcula o base_score das notícias dela,
+        na mesma transação.
+
+        Como base_score = log2(qualidade) + termo de tempo, as notícias só são
+        deslocadas pela diferença entre os log2 das qualidades, com um único
+        UPDATE (sem reler as datas de publicação).
+
+        Returns:
+            Número de notícias com o base_score recalculado
+
+        Raises:
+            NewsSourceValidationError: Qualidade não positiva
+            NewsSourceNotFoundError: Fonte inexistente
+        """
+        if quality <= 0:
+            raise NewsSourceValidationError("quality", "A qualidade da fonte deve ser maior que zero.")
+        try:
+            entity = self.session.get(NewsSourceEntity, source_id)
+            if entity is None:
+                raise NewsSourceNotFoundError(f"Fonte com ID {source_id} não encontrada.")
+
+            delta = news_ranking.quality_score(quality) - news_ranking.quality_score(entity.quality)
+            entity.quality = quality
+            updated = 0
+            if delta:
+                updated = self.session.execute(
+                    update(NewsEntity)
+                    .where(NewsEntity.source_id == source_id)
+                    .values(base_score=NewsEntity.base_score + delta)
+                ).rowcount
+            self.session.commit()
+            return updated
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao alterar a qualidade da fonte {source_id}: {e}", exc_info=True)
+            self.session.rollback()
+            raise
+
+    def bulk_create_ignore_conflicts(self, models: list[NewsSource]) -> list[NewsSource]:
+        """
+        Insere várias fontes com um único INSERT ... ON CONFLICT DO NOTHING.
+
+        Fontes que já existem (mesmo nome ou URL) são ignoradas.
+
+        Returns:
+            Apenas as fontes efetivamente inseridas, com ID preenchido
+        """
+        if not models:
+            return []
+
+        try:
+            insert = dialect_insert(self.session)
+            if insert is None:
+                return self._create_each_ignoring_conflicts(models)
+
+            rows = [{"name": m.name, "url": m.url, "created_at": m.created_at or datetime.now(timezone.utc)} for m in models]
+            stmt = insert(NewsSourceEntity).on_conflict_do_nothing().returning(NewsSourceEntity)
+            entities = self.session.scalars(stmt, rows).all()
+            created = [NewsSource.from_entity(e) for e in entities]
+            self.session.commit()
+            return created
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao criar fontes em lote: {e}", exc_info=True)
+            self.session.rollback()
+            raise
+
+    def _create_each_ignoring_conflicts(self, models: list[NewsSource]) -> list[NewsSource]:
+        """Fallback para dialetos sem ON CONFLICT: insere uma a uma em savepoints."""
+        created = []
+        for model in models:
+            try:
+                with self.session.begin_nested():
+                    entity = model.to_orm()
+                    self.session.add(entity)
+                created.append(NewsSource.from_entity(entity))
+            except IntegrityError:
+                continue
+        self.session.commit()
+        return created
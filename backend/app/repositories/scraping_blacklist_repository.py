@@ -0,0 +1,104 @@
+import logging
+from sqlalchemy import select, delete
+from sqlalchemy.exc import SQLAlchemyError
+from app.extensions import db
+from app.entities.scraping_blacklist_entity import ScrapingBlacklistEntity
+from app.utils.db_dialect import dialect_insert
+
+class ScrapingBlacklistRepository:
+    def __init__(self, session=None):
+        self.session = session or db.session
+
+    def _to_dict(self, entity: ScrapingBlacklistEntity) -> dict:
+        """Converte a entidade para o formato de registro da blacklist (mesmo do antigo JSON)."""
+        return {
+            "blocked_at": entity.blocked_at.isoformat() if entity.blocked_at else None,
+            "updated_at": entity.updated_at.isoformat() if entity.updated_at else None,
+            "error_type": entity.error_type,
+            "error_count": entity.error_count,
+            "last_url": entity.last_url,
+            "last_error_type": entity.last_error_type,
+            "last_error_message": entity.last_error_message,
+            "reason": entity.reason,
+        }
+
+    def find_all(self) -> dict[str, dict]:
+        """Retorna todos os domínios bloqueados, indexados pelo domínio."""
+        try:
+            entities = self.session.execute(select(ScrapingBlacklistEntity)).scalars().all()
+            return {entity.domain: self._to_dict(entity) for entity in entities}
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao listar blacklist de scraping: {e}", exc_info=True)
+            raise
+
+    def upsert_many(self, entries: list[dict], accumulate: bool = True) -> None:
+        """
+        Insere ou atualiza vários domínios em uma única transação.
+
+        Cada domínio é gravado com um INSERT ... ON CONFLICT atômico, de forma que
+        vários workers possam registrar erros do mesmo domínio ao mesmo tempo.
+
+        Args:
+            entries: Registros com as colunas de ScrapingBlacklistEntity (incluindo 'domain')
+            accumulate: Se True, soma error_count ao valor existente e mantém os dados
+                        do primeiro bloqueio; se False, substitui o registro (importação)
+        """
+        if not entries:
+            return
+
+        try:
+            insert = dialect_insert(self.session)
+            if insert is None:
+                self._merge_many(entries, accumulate)
+            else:
+                stmt = insert(ScrapingBlacklistEntity)
+                table = ScrapingBlacklistEntity.__table__
+                if accumulate:
+                    set_ = {
+                        "error_count": table.c.error_count + stmt.excluded.error_count,
+                        "last_url": stmt.excluded.last_url,
+                        "last_error_type": stmt.excluded.last_error_type,
+                        "last_error_message": stmt.excluded.last_error_message,
+                        "updated_at": stmt.excluded.updated_at,
+                    }
+                else:
+                    set_ = {
+                        column.name: stmt.excluded[column.name]
+                        for column in table.columns if column.name != "domain"
+                    }
+                stmt = stmt.on_conflict_do_update(index_elements=["domain"], set_=set_)
+                self.session.execute(stmt, entries)
+            self.session.commit()
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao gravar blacklist de scraping: {e}", exc_info=True)
+            self.session.rollback()
+            raise
+
+    def delete(self, domain: str) -> bool:
+        """Remove um domínio da blacklist. Retorna True se havia registro."""
+        try:
+            result = self.session.execute(
+                delete(ScrapingBlacklistEntity).where(ScrapingBlacklistEntity.domain == domain)
+            )
+            self.session.commit()
+            return result.rowcount > 0
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao remover domínio da blacklist: {e}", exc_info=True)
+            self.session.rollback()
+            raise
+
+    def _merge_many(self, entries: list[dict], accumulate: bool) -> None:
+        """Fallback para dialetos sem ON CONFLICT: lê e atualiza cada domínio na mesma transação."""
+        for entry in entries:
+            entity = self.session.get(ScrapingBlacklistEntity, entry["domain"], with_for_update=True)
+            if entity is None:
+                self.session.add(ScrapingBlacklistEntity(**entry))
+            elif accumulate:
+                entity.error_count += entry["error_count"]
+                entity.last_url = entry.get("last_url")
+                entity.last_error_type = entry.get("last_error_type")
+                entity.last_error_message = entry.get("last_error_message")
+                entity.updated_at = entry.get("updated_at")
+            else:
+                for key, value in entry.items():
+                    setattr(entity, key, value)
@@ -0,0 +1,55 @@
+import logging
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from app.extensions import db
+from app.entities.scraping_domain_health_entity import ScrapingDomainHealthEntity
+from app.utils.db_dialect import dialect_insert
+
+class ScrapingDomainHealthRepository:
+    COLUMNS = (
+        "state", "success_score", "failure_score", "open_count",
+        "last_error_type", "opened_at", "next_probe_at", "updated_at",
+    )
+
+    def __init__(self, session=None):
+        self.session = session or db.session
+
+    def find_all(self) -> dict[str, dict]:
+        """Retorna o estado de saúde de todos os domínios, indexado pelo domínio."""
+        try:
+            entities = self.session.execute(select(ScrapingDomainHealthEntity)).scalars().all()
+            return {
+                entity.domain: {column: getattr(entity, column) for column in self.COLUMNS}
+                for entity in entities
+            }
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao listar saúde dos domínios: {e}", exc_info=True)
+            raise
+
+    def upsert_many(self, entries: list[dict]) -> None:
+        """
+        Insere ou substitui o estado de saúde de vários domínios em uma única transação.
+
+        Args:
+            entries: Registros com as colunas de ScrapingDomainHealthEntity (incluindo 'domain')
+        """
+        if not entries:
+            return
+
+        try:
+            insert = dialect_insert(self.session)
+            if insert is None:
+                for entry in entries:
+                    self.session.merge(ScrapingDomainHealthEntity(**entry))
+            else:
+                stmt = insert(ScrapingDomainHealthEntity)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["domain"],
+                    set_={column: stmt.excluded[column] for column in self.COLUMNS}
+                )
+                self.session.execute(stmt, entries)
+            self.session.commit()
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao gravar saúde dos domínios: {e}", exc_info=True)
+            self.session.rollback()
+            raise
@@ -0,0 +1,71 @@
+import logging
+from sqlalchemy import select, delete
+from sqlalchemy.exc import SQLAlchemyError
+from app.extensions import db
+from app.entities.scraping_domain_profile_entity import ScrapingDomainProfileEntity
+from app.utils.db_dialect import dialect_insert
+
+class ScrapingDomainProfileRepository:
+    COLUMNS = (
+        "container_selector", "boilerplate_selectors", "trim_selector",
+        "hits", "consecutive_misses", "learned_at", "updated_at",
+    )
+
+    def __init__(self, session=None):
+        self.session = session or db.session
+
+    def find_all(self) -> dict[str, dict]:
+        """Retorna os perfis de extração de todos os domínios, indexados pelo domínio."""
+        try:
+            entities = self.session.execute(select(ScrapingDomainProfileEntity)).scalars().all()
+            return {
+                entity.domain: {column: getattr(entity, column) for column in self.COLUMNS}
+                for entity in entities
+            }
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao listar perfis de domínio: {e}", exc_info=True)
+            raise
+
+    def upsert_many(self, entries: list[dict]) -> None:
+        """
+        Insere ou substitui os perfis de vários domínios em uma única transação.
+
+        Args:
+            entries: Registros com as colunas de ScrapingDomainProfileEntity (incluindo 'domain')
+        """
+        if not entries:
+            return
+
+        try:
+            insert = dialect_insert(self.session)
+            if insert is None:
+                for entry in entries:
+                    self.session.merge(ScrapingDomainProfileEntity(**entry))
+            else:
+                stmt = insert(ScrapingDomainProfileEntity)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["domain"],
+                    set_={column: stmt.excluded[column] for column in self.COLUMNS}
+                )
+                self.session.execute(stmt, entries)
+            self.session.commit()
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao gravar perfis de domínio: {e}", exc_info=True)
+            self.session.rollback()
+            raise
+
+    def delete_many(self, domains: list[str]) -> int:
+        """Remove os perfis dos domínios informados. Retorna quantos existiam."""
+        if not domains:
+            return 0
+
+        try:
+            result = self.session.execute(
+                delete(ScrapingDomainProfileEntity).where(ScrapingDomainProfileEntity.domain.in_(domains))
+            )
+            self.session.commit()
+            return result.rowcount
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao remover perfis de domínio: {e}", exc_info=True)
+            self.session.rollback()
+            raise
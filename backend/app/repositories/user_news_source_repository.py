@@ -4,6 +4,7 @@ from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from app.extensions import db
 from app.entities.user_preferred_news_sources_entity import UserPreferredNewsSourceEntity
 from app.models.exceptions import NewsSourceAlreadyAttachedError, NewsSourceNotAttachedError
+from app.repositories.user_repository import UserRepository
 
 class UserNewsSourceRepository:
     def __init__(self, session=None):
@@ -20,6 +21,7 @@ class UserNewsSourceRepository:
             new_attachment = UserPreferredNewsSourceEntity(user_id=user_id, source_id=source_id)
 
             self.session.add(new_attachment)
+            UserRepository(self.session).bump_preferences_version(user_id)
             self.session.commit()
         except IntegrityError: # Caso a fonte ou usuário não exista, ou race condition
             self.session.rollback()
@@ -34,6 +36,8 @@ class UserNewsSourceRepository:
         try:
             stmt = delete(UserPreferredNewsSourceEntity).where(UserPreferredNewsSourceEntity.user_id == user_id, UserPreferredNewsSourceEntity.source_id == source_id)
             result = self.session.execute(stmt)
+            if result.rowcount:
+                UserRepository(self.session).bump_preferences_version(user_id)
             self.session.commit()
             if result.rowcount == 0:
                 raise NewsSourceNotAttachedError("Associação não encontrada para ser removida.") # Lança exceção se nada foi deletado
@@ -61,4 +65,25 @@ class UserNewsSourceRepository:
             return source_ids
         except SQLAlchemyError as e:
             logging.error(f"Erro de banco ao buscar fontes preferidas do usuário {user_id}: {e}", exc_info=True)
-            raise
\ No newline at end of file
+            raise
+
+    def get_preferred_source_ids_by_users(self, user_ids: list[int]) -> dict[int, list[int]]:
+        """
+        Fontes preferidas de vários usuários em uma consulta.
+
+        Returns:
+            Dicionário {user_id: [source_id, ...]}; usuários sem fontes ficam de fora
+        """
+        if not user_ids:
+            return {}
+        try:
+            stmt = select(UserPreferredNewsSourceEntity.user_id, UserPreferredNewsSourceEntity.source_id).where(
+                UserPreferredNewsSourceEntity.user_id.in_(user_ids)
+            )
+            source_ids_by_user: dict[int, list[int]] = {}
+            for user_id, source_id in self.session.execute(stmt):
+                source_ids_by_user.setdefault(user_id, []).append(source_id)
+            return source_ids_by_user
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao buscar fontes preferidas dos usuários: {e}", exc_info=True)
+            raise
@@ -2,6 +2,8 @@ from sqlalchemy import select, delete
 from sqlalchemy.exc import SQLAlchemyError
 from app.extensions import db
 from app.entities.user_preferred_custom_topics import UserPreferredCustomTopicEntity
+from app.entities.custom_topic_entity import CustomTopicEntity
+from app.repositories.user_repository import UserRepository
 
 class UserPreferredCustomTopicRepository:
     def __init__(self, session=None):
@@ -16,6 +18,7 @@ class UserPreferredCustomTopicRepository:
                 return False
             rel = UserPreferredCustomTopicEntity(user_id=user_id, topic_id=topic_id)
             self.session.add(rel)
+            UserRepository(self.session).bump_preferences_version(user_id)
             self.session.commit()
             return True
         except SQLAlchemyError:
@@ -27,6 +30,8 @@ class UserPreferredCustomTopicRepository:
             res = self.session.execute(
                 delete(UserPreferredCustomTopicEntity).filter_by(user_id=user_id, topic_id=topic_id)
             )
+            if res.rowcount:
+                UserRepository(self.session).bump_preferences_version(user_id)
             self.session.commit()
             return res.rowcount > 0
         except SQLAlchemyError:
@@ -38,6 +43,20 @@ class UserPreferredCustomTopicRepository:
             select(UserPreferredCustomTopicEntity.topic_id).filter_by(user_id=user_id)
         ).scalars().all()
 
+    def list_topic_names_by_users(self, user_ids: list[int]) -> dict[int, list[str]]:
+        """Nomes dos custom topics de vários usuários: {user_id: [nome, ...]} (usuários sem tópicos ficam de fora)."""
+        if not user_ids:
+            return {}
+        rows = self.session.execute(
+            select(UserPreferredCustomTopicEntity.user_id, CustomTopicEntity.name)
+            .join(CustomTopicEntity, CustomTopicEntity.id == UserPreferredCustomTopicEntity.topic_id)
+            .where(UserPreferredCustomTopicEntity.user_id.in_(user_ids))
+        )
+        names_by_user: dict[int, list[str]] = {}
+        for user_id, name in rows:
+            names_by_user.setdefault(user_id, []).append(name)
+        return names_by_user
+
     def count_by_user(self, user_id: int) -> int:
         """Conta quantos tópicos um usuário tem associado."""
         try:
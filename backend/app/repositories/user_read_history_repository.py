@@ -1,109 +1,131 @@
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from sqlalchemy.orm import joinedload
-from sqlalchemy import func, select, and_, desc
-from datetime import datetime, timedelta, time 
+from sqlalchemy import bindparam, func, insert, select, desc, true, update
+from datetime import datetime, timezone
 import logging
 
 from app.extensions import db
 from app.entities.user_entity import UserEntity
 from app.entities.news_entity import NewsEntity
-from app.entities.user_read_history_entity import UserReadHistoryEntity
+from app.entities.user_read_history_entity import UserReadHistoryEntity, read_day_of
 from app.models.exceptions import UserNotFoundError, NewsNotFoundError
+from app.utils.db_dialect import dialect_insert
 
 class UserReadHistoryRepository:
     def __init__(self, session=None):
         self.session = session or db.session
 
-    def create(self, user_id: int, news_id: int) -> tuple[UserReadHistoryEntity, bool]:
+    def create(self, user_id: int, news_id: int) -> None:
+        """
+        Registra a leitura da notícia pelo usuário (uma por notícia e dia).
+
+        Um único INSERT ... ON CONFLICT: a primeira leitura do dia insere a
+        linha e as seguintes só atualizam read_at. Usuário e notícia são
+        verificados no próprio INSERT ... SELECT; só quando nada é gravado
+        uma consulta descobre qual dos dois não existe.
+
+        Raises:
+            UserNotFoundError: Usuário inexistente
+            NewsNotFoundError: Notícia inexistente
+        """
         try:
-            existing_history = self.find_today_read(user_id, news_id)
-            
-            if existing_history:
-                logging.info(f"Registro de leitura já existe hoje (user_id={user_id}, news_id={news_id}). Atualizando read_at.")
-                updated_history = self.update_read_at(existing_history)
-                return updated_history, False
-            
-            user_exists = self.session.query(
-                self.session.query(UserEntity).filter_by(id=user_id).exists()
-            ).scalar()
-            
-            if not user_exists:
+            written = self.upsert_many([(user_id, news_id, datetime.now(timezone.utc))])
+            if written:
+                return
+
+            if not self.session.query(self.session.query(UserEntity).filter_by(id=user_id).exists()).scalar():
                 raise UserNotFoundError(f"Usuário com ID {user_id} não encontrado.")
-            
-            news_exists = self.session.query(
-                self.session.query(NewsEntity).filter_by(id=news_id).exists()
-            ).scalar()
-            
-            if not news_exists:
+            if not self.session.query(self.session.query(NewsEntity).filter_by(id=news_id).exists()).scalar():
                 raise NewsNotFoundError(f"Notícia com ID {news_id} não encontrada.")
-            
-            history_entity = UserReadHistoryEntity(
-                user_id=user_id,
-                news_id=news_id,
-                read_at=datetime.now()
-            )
-            
-            self.session.add(history_entity)
-            self.session.commit()
-            self.session.refresh(history_entity)
-            
-            logging.info(f"Histórico de leitura criado: user_id={user_id}, news_id={news_id}, read_at={history_entity.read_at}")
-            
-            return history_entity, True
-            
         except (UserNotFoundError, NewsNotFoundError):
             self.session.rollback()
             raise
+
+    def upsert_many(self, reads: list[tuple[int, int, datetime]]) -> int:
+        """
+        Grava leituras em lote, (user_id, news_id, read_at), com uma transação.
+
+        Leituras de usuários ou notícias inexistentes são ignoradas; uma
+        leitura mais antiga que a já gravada no dia não altera read_at.
+
+        Returns:
+            Quantidade de leituras inseridas ou atualizadas
+        """
+        if not reads:
+            return 0
+
+        try:
+            params = [
+                {"user_id": user_id, "news_id": news_id, "read_at": read_at, "read_day": read_day_of(read_at)}
+                for user_id, news_id, read_at in reads
+            ]
+            insert = dialect_insert(self.session)
+            if insert is None:
+                written = self._upsert_each(params)
+            else:
+                written = self.session.execute(self._upsert_statement(insert), params).rowcount
+            self.session.commit()
+            logging.info(f"Histórico de leitura gravado: {written} de {len(reads)} leituras")
+            return written
         except IntegrityError as e:
             self.session.rollback()
-            logging.error(f"Erro de integridade ao criar histórico: {e}", exc_info=True)
+            logging.error(f"Erro de integridade ao gravar histórico: {e}", exc_info=True)
             raise Exception("Erro de integridade ao salvar histórico de leitura.")
         except SQLAlchemyError as e:
             self.session.rollback()
-            logging.error(f"Erro de banco ao criar histórico: {e}", exc_info=True)
+            logging.error(f"Erro de banco ao gravar histórico: {e}", exc_info=True)
             raise Exception("Erro ao salvar histórico de leitura no banco de dados.")
-        
-    def update_read_at(self, history_entity: UserReadHistoryEntity) -> UserReadHistoryEntity:
-        try:
-            history_entity.read_at = datetime.now()
-            self.session.commit()
-            self.session.refresh(history_entity)
-            
-            logging.info(f"Histórico atualizado: user_id={history_entity.user_id}, news_id={history_entity.news_id}, read_at={history_entity.read_at}")
-            
-            return history_entity
-            
-        except SQLAlchemyError as e:
-            self.session.rollback()
-            logging.error(f"Erro ao atualizar histórico: {e}", exc_info=True)
-            raise Exception("Erro ao atualizar histórico de leitura.")
-        
-    def find_today_read(self, user_id: int, news_id: int) -> UserReadHistoryEntity | None:
-        try:
-            today_start = datetime.combine(datetime.today(), time.min)
-            today_end = datetime.combine(datetime.today(), time.max)
-            
-            stmt = (
-                select(UserReadHistoryEntity)
-                .where(
-                    and_(
-                        UserReadHistoryEntity.user_id == user_id,
-                        UserReadHistoryEntity.news_id == news_id,
-                        UserReadHistoryEntity.read_at >= today_start,
-                        UserReadHistoryEntity.read_at <= today_end
-                    )
-                )
-                .order_by(desc(UserReadHistoryEntity.read_at))
+
+    def _source_select(self):
+        """Linha a gravar, só se o usuário e a notícia existirem (JOIN ON true: no máximo uma linha de cada)."""
+        return (
+            select(
+                UserEntity.id,
+                NewsEntity.id,
+                bindparam("read_at", type_=UserReadHistoryEntity.read_at.type),
+                bindparam("read_day", type_=UserReadHistoryEntity.read_day.type),
             )
-            
-            result = self.session.execute(stmt).scalar_one_or_none()
-            return result
-            
-        except SQLAlchemyError as e:
-            logging.error(f"Erro ao buscar histórico do dia: {e}", exc_info=True)
-            raise Exception("Erro ao verificar histórico do dia.")
+            .select_from(UserEntity)
+            .join(NewsEntity, true())
+            .where(UserEntity.id == bindparam("user_id"), NewsEntity.id == bindparam("news_id"))
+        )
+
+    def _upsert_statement(self, insert):
+        """INSERT ... SELECT (só com usuário e notícia existentes) ... ON CONFLICT (user_id, news_id, read_day)."""
+        stmt = insert(UserReadHistoryEntity.__table__).from_select(
+            ["user_id", "news_id", "read_at", "read_day"], self._source_select()
+        )
+        return stmt.on_conflict_do_update(
+            index_elements=["user_id", "news_id", "read_day"],
+            set_={"read_at": stmt.excluded.read_at},
+            where=UserReadHistoryEntity.read_at < stmt.excluded.read_at,
+        )
+
+    def _upsert_each(self, params: list[dict]) -> int:
+        """Fallback para dialetos sem ON CONFLICT: UPDATE da leitura do dia ou INSERT ... SELECT."""
+        update_stmt = (
+            update(UserReadHistoryEntity)
+            .where(
+                UserReadHistoryEntity.user_id == bindparam("b_user_id"),
+                UserReadHistoryEntity.news_id == bindparam("b_news_id"),
+                UserReadHistoryEntity.read_day == bindparam("b_read_day"),
+                UserReadHistoryEntity.read_at < bindparam("b_read_at"),
+            )
+            .values(read_at=bindparam("b_read_at"))
+        )
+        insert_stmt = insert(UserReadHistoryEntity.__table__).from_select(
+            ["user_id", "news_id", "read_at", "read_day"], self._source_select()
+        )
+        written = 0
+        for param in params:
+            try:
+                with self.session.begin_nested():
+                    written += self.session.execute(insert_stmt, param).rowcount
+            except IntegrityError:
+                # Nomes de colunas são reservados no SET do UPDATE
+                written += self.session.execute(update_stmt, {f"b_{key}": value for key, value in param.items()}).rowcount
+        return written
 
-   
     def get_user_history(
             self, 
             user_id: int, 
@@ -138,6 +160,24 @@ class UserReadHistoryRepository:
             logging.error(f"Erro ao buscar histórico do usuário: {e}", exc_info=True)
             raise Exception("Erro ao buscar histórico de leitura.")
 
+    def get_user_history_ids(self, user_id: int, page: int = 1, per_page: int = 10) -> list[tuple[int, datetime]]:
+        """
+        Retorna só (news_id, read_at) da página do histórico, na mesma ordem
+        de get_user_history (sem JOIN com as notícias).
+        """
+        try:
+            stmt = (
+                select(UserReadHistoryEntity.news_id, UserReadHistoryEntity.read_at)
+                .where(UserReadHistoryEntity.user_id == user_id)
+                .order_by(desc(UserReadHistoryEntity.read_at))
+                .offset((page - 1) * per_page)
+                .limit(per_page)
+            )
+            return [tuple(row) for row in self.session.execute(stmt).all()]
+        except SQLAlchemyError as e:
+            logging.error(f"Erro ao buscar IDs do histórico do usuário: {e}", exc_info=True)
+            raise Exception("Erro ao buscar histórico de leitura.")
+
     def count_user_history(self, user_id: int) -> int:
         try:
             stmt = (
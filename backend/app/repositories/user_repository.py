@@ -1,4 +1,4 @@
-from sqlalchemy import func, select
+from sqlalchemy import func, select, update
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 import logging
 
@@ -60,6 +60,26 @@ class UserRepository:
         
         return [User.from_entity(entity) for entity in entities]
 
+    def bump_preferences_version(self, user_id: int) -> None:
+        """
+        Incrementa users.preferences_version sem commit: chamado pelos
+        repositórios de preferências na mesma transação da mudança.
+        """
+        self.session.execute(
+            update(UserEntity)
+            .where(UserEntity.id == user_id)
+            .values(preferences_version=UserEntity.preferences_version + 1)
+        )
+
+    def get_preferences_version(self, user_id: int) -> int:
+        """Versão das preferências do usuário (0 se ele não existir)."""
+        try:
+            stmt = select(UserEntity.preferences_version).where(UserEntity.id == user_id)
+            return self.session.execute(stmt).scalar() or 0
+        except SQLAlchemyError as e:
+            logging.error(f"Erro de banco ao buscar a versão das preferências do usuário {user_id}: {e}", exc_info=True)
+            raise
+
     def add_favorite_news(self, user_id: int, news_id: int):
         """Adiciona uma notícia à lista de favoritos de um usuário."""
         try:
@@ -3,6 +3,7 @@ from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity, unset_access_cookies
 from app.controllers.news_controller import NewsController
 from app.routes.user_routes import get_user_id_from_token, get_optional_user_id_from_token
+from app.utils.conditional_get import conditional_get
 
 news_bp = Blueprint("news", __name__)
 news_controller = NewsController()
@@ -10,6 +11,7 @@ news_controller = NewsController()
 @news_bp.route("/<int:news_id>", methods=["GET"])
 @jwt_required(optional=True)
 @get_optional_user_id_from_token
+@conditional_get(news_controller.get_by_id_etag)
 def get_news_by_id(user_id, news_id: int):
     return news_controller.get_by_id(user_id, news_id)
 
@@ -22,6 +24,7 @@ def save_history_news(user_id: int, news_id: int):
 @news_bp.route("/history", methods=["GET"])
 @jwt_required()
 @get_user_id_from_token
+@conditional_get(news_controller.get_history_etag)
 def get_history_news(user_id: int):
     return news_controller.get_history_news(user_id)
 
@@ -41,18 +44,29 @@ def unfavorite_news(user_id, news_id):
 @news_bp.route("/topic/<int:topic_id>", methods=["GET"])
 @jwt_required(optional=True)
 @get_optional_user_id_from_token
+@conditional_get(news_controller.get_by_topic_etag)
 def get_news_by_topic(user_id, topic_id: int):
     return news_controller.get_by_topic(user_id, topic_id)
 
 
+@news_bp.route("/search", methods=["GET"])
+@jwt_required(optional=True)
+@get_optional_user_id_from_token
+@conditional_get(news_controller.search_etag)
+def search_news(user_id):
+    return news_controller.search(user_id)
+
+
 @news_bp.route("/for-you", methods=["GET"])
 @jwt_required()
 @get_user_id_from_token
+@conditional_get(news_controller.get_for_you_etag)
 def get_for_you_news(user_id: int):
     return news_controller.get_for_you_news(user_id)
 
 @news_bp.route("/saved", methods=["GET"])
 @jwt_required()
 @get_user_id_from_token
+@conditional_get(news_controller.get_favorite_etag)
 def get_favorite_news(user_id):
     return news_controller.get_favorite_news(user_id)
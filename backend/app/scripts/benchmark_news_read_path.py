@@ -0,0 +1,167 @@
+"""
+Micro-benchmark do caminho de leitura das listagens de notícias.
+
+Hidratação: News.from_entity (construtor com validação) x NewsView.from_entity
+(somente leitura, __slots__, sem validação) sobre entidades em memória.
+
+Serialização: montagem dos dicionários campo a campo (como o NewsService
+fazia em cada método) x NewsSerializer, sobre modelos News e sobre linhas
+(Row) do SQLAlchemy lidas de um SQLite em memória.
+
+Uso:
+    python -m app.scripts.benchmark_news_read_path [--rows 1000] [--repeat 20]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, project_root)
+
+import sqlalchemy as sa
+
+from app.models.news import News
+from app.models.news_view import NewsView
+from app.utils.news_serializer import CARD
+
+
+def legacy_card(news) -> dict:
+    """Dicionário do card montado campo a campo, como nos loops antigos do NewsService."""
+    news_dict = {
+        "id": news.id,
+        "title": news.title,
+        "description": news.description,
+        "url": news.url,
+        "image_url": news.image_url,
+        "published_at": news.published_at.isoformat() if news.published_at else None,
+        "source_id": news.source_id,
+        "topic_id": news.topic_id,
+        "created_at": news.created_at.isoformat() if news.created_at else None,
+        "is_favorited": news.is_favorited,
+    }
+    if news.source_name:
+        news_dict["source_name"] = news.source_name
+    if news.topic_name:
+        news_dict["topic_name"] = news.topic_name
+    return news_dict
+
+
+def _sample_values(count: int) -> List[dict]:
+    now = datetime(2025, 10, 21, 12, 0)
+    return [
+        {
+            "id": i,
+            "title": f"Notícia de teste número {i}",
+            "description": "Descrição curta da notícia para o card.",
+            "url": f"https://fonte.com.br/noticias/{i}",
+            "image_url": f"https://fonte.com.br/imagens/{i}.jpg",
+            "published_at": now - timedelta(minutes=i),
+            "source_id": 1 + i % 20,
+            "topic_id": 1 + i % 8,
+            "created_at": now,
+            "source_name": "Fonte",
+            "topic_name": "Tecnologia",
+            "is_favorited": False,
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def build_models(values: List[dict]) -> List[News]:
+    models = []
+    for value in values:
+        fields = {k: v for k, v in value.items() if k != "is_favorited"}
+        model = News(content=None, html=None, **fields)
+        model.is_favorited = value["is_favorited"]
+        models.append(model)
+    return models
+
+
+def build_rows(values: List[dict]) -> list:
+    """Linhas Row reais, lidas de uma tabela SQLite em memória."""
+    engine = sa.create_engine("sqlite://")
+    metadata = sa.MetaData()
+    table = sa.Table(
+        "cards", metadata,
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("title", sa.Text), sa.Column("description", sa.Text),
+        sa.Column("url", sa.Text), sa.Column("image_url", sa.Text),
+        sa.Column("published_at", sa.DateTime), sa.Column("source_id", sa.Integer),
+        sa.Column("topic_id", sa.Integer), sa.Column("created_at", sa.DateTime),
+        sa.Column("source_name", sa.Text), sa.Column("topic_name", sa.Text),
+        sa.Column("is_favorited", sa.Boolean),
+    )
+    metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(table.insert(), values)
+        return connection.execute(sa.select(table).order_by(table.c.id)).all()
+
+
+def build_entities(values: List[dict]) -> list:
+    """Entidades NewsEntity em memória, com fonte, tópico e corpo carregados."""
+    from app import create_app
+    from app.entities.news_entity import NewsEntity
+    from app.entities.news_source_entity import NewsSourceEntity
+    from app.entities.topic_entity import TopicEntity
+
+    # Registra todas as entidades no mapeamento do SQLAlchemy
+    create_app(config_overrides={"SQLALCHEMY_DATABASE_URI": "sqlite://"})
+
+    source = NewsSourceEntity(id=1, name="Fonte", url="https://fonte.com.br")
+    topic = TopicEntity(id=1, name="tecnologia")
+    entities = []
+    for value in values:
+        fields = {k: v for k, v in value.items() if k not in ("is_favorited", "source_name", "topic_name")}
+        entity = NewsEntity(content="Texto da notícia.", html="<p>Texto da notícia.</p>", **fields)
+        entity.source = source
+        entity.topic = topic
+        entities.append(entity)
+    return entities
+
+
+def run(rows: int = 1000, repeat: int = 20) -> Dict[str, float]:
+    """
+    Executa os cenários e retorna o melhor tempo, em milissegundos, para
+    hidratar ou serializar 'rows' notícias.
+    """
+    values = _sample_values(rows)
+    models = build_models(values)
+    row_objects = build_rows(values)
+    entities = build_entities(values)
+
+    scenarios: Dict[str, Callable[[], object]] = {
+        "hidratação News.from_entity": lambda: [News.from_entity(entity) for entity in entities],
+        "hidratação NewsView.from_entity": lambda: [NewsView.from_entity(entity) for entity in entities],
+        "loop campo a campo (News)": lambda: [legacy_card(news) for news in models],
+        "NewsSerializer (News)": lambda: CARD.serialize_many(models),
+        "NewsSerializer (Row)": lambda: CARD.serialize_many(row_objects),
+    }
+    return {
+        name: min(timeit.repeat(func, number=1, repeat=repeat)) * 1000
+        for name, func in scenarios.items()
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark da hidratação e serialização das listagens de notícias.")
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    results = run(args.rows, args.repeat)
+    print(f"{args.rows} notícias (melhor de {args.repeat}):")
+    hydration = {name: ms for name, ms in results.items() if name.startswith("hidratação")}
+    serialization = {name: ms for name, ms in results.items() if name not in hydration}
+    for group in (hydration, serialization):
+        # Cada grupo é comparado com o seu primeiro cenário (o caminho antigo)
+        baseline = next(iter(group.values()))
+        for name, elapsed in group.items():
+            print(f"  {name:<34} {elapsed:8.2f} ms  ({baseline / elapsed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""
+Manutenção da compressão do corpo das notícias (tabela news_bodies).
+
+Comandos:
+    train       Treina dicionários (content e html) sobre as notícias mais recentes
+    recompress  Comprime em lotes as linhas sem compressão ou com dicionário antigo
+    report      Mostra o tamanho gravado e o original de cada coluna
+
+Uso:
+    python -m app.scripts.compress_bodies train [--sample 500]
+    python -m app.scripts.compress_bodies recompress [--batch-size 500]
+    python -m app.scripts.compress_bodies report
+
+O train grava os dicionários na tabela compression_dictionaries, lida por
+todos os processos (API e coleta); em seguida, rode o recompress.
+"""
+
+import argparse
+import logging
+import os
+import sys
+from typing import Dict, List, Optional
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, project_root)
+
+import sqlalchemy as sa
+
+from app.utils.text_compression import TextCompressor, text_compressor, train_dictionary
+
+COLUMNS = ('content', 'html')
+
+# Colunas lidas como bytes, sem passar pelo CompressedText
+news_bodies = sa.table(
+    'news_bodies',
+    sa.column('news_id', sa.Integer),
+    *(sa.column(column, sa.LargeBinary) for column in COLUMNS),
+)
+
+
+def _iter_batches(session, batch_size: int):
+    """Percorre news_bodies em lotes ordenados por news_id."""
+    last_id = 0
+    while True:
+        rows = session.execute(
+            sa.select(news_bodies)
+            .where(news_bodies.c.news_id > last_id)
+            .order_by(news_bodies.c.news_id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1].news_id
+
+
+def train(session, sample_size: int = 500, compressor: TextCompressor = text_compressor) -> Dict[str, int]:
+    """
+    Treina e grava um dicionário por coluna com as notícias mais recentes.
+
+    Returns:
+        {coluna: ID do novo dicionário}
+    """
+    rows = session.execute(
+        sa.select(news_bodies).order_by(news_bodies.c.news_id.desc()).limit(sample_size)
+    ).all()
+    if not rows:
+        logging.warning("Nenhuma notícia para treinar os dicionários.")
+        return {}
+
+    trained = {}
+    for column in COLUMNS:
+        samples = [compressor.decompress(row._mapping[column]) for row in rows]
+        trained[column] = compressor.save_dictionary(column, train_dictionary(samples))
+    return trained
+
+
+def recompress(session, batch_size: int = 500, compressor: TextCompressor = text_compressor) -> int:
+    """
+    Comprime as linhas sem compressão ou com dicionário diferente do atual.
+
+    Cada lote é gravado e confirmado separadamente, então o comando pode ser
+    interrompido e executado de novo.
+
+    Returns:
+        Número de linhas regravadas
+    """
+    current = {column: compressor.current_dictionary_id(column) for column in COLUMNS}
+    updated = 0
+
+    for rows in _iter_batches(session, batch_size):
+        changes = []
+        for row in rows:
+            values = {}
+            for column in COLUMNS:
+                stored = row._mapping[column]
+                if compressor.header(stored) != (True, current[column]):
+                    values[column] = compressor.compress(compressor.decompress(stored), column)
+            if values:
+                changes.append((row.news_id, values))
+
+        for news_id, values in changes:
+            session.execute(news_bodies.update().where(news_bodies.c.news_id == news_id).values(**values))
+        session.commit()
+
+        updated += len(changes)
+        logging.info(f"Recompressão: {updated} linhas regravadas até news_id={rows[-1].news_id}")
+
+    return updated
+
+
+def size_report(session, batch_size: int = 500, compressor: TextCompressor = text_compressor) -> Dict:
+    """
+    Calcula o tamanho gravado e o original (UTF-8) de cada coluna.
+
+    Returns:
+        {'rows', 'columns': {coluna: {'stored_bytes', 'original_bytes', 'ratio',
+        'uncompressed_rows', 'by_dictionary'}}, 'table_bytes' (só PostgreSQL)}
+    """
+    report = {
+        'rows': 0,
+        'columns': {
+            column: {'stored_bytes': 0, 'original_bytes': 0, 'uncompressed_rows': 0, 'by_dictionary': {}}
+            for column in COLUMNS
+        }
+    }
+
+    for rows in _iter_batches(session, batch_size):
+        report['rows'] += len(rows)
+        for row in rows:
+            for column in COLUMNS:
+                stats = report['columns'][column]
+                stored = bytes(row._mapping[column])
+                stats['stored_bytes'] += len(stored)
+                stats['original_bytes'] += len(compressor.decompress(stored).encode('utf-8'))
+                compressed, dict_id = compressor.header(stored)
+                if not compressed:
+                    stats['uncompressed_rows'] += 1
+                else:
+                    stats['by_dictionary'][dict_id] = stats['by_dictionary'].get(dict_id, 0) + 1
+
+    for stats in report['columns'].values():
+        stats['ratio'] = round(stats['stored_bytes'] / stats['original_bytes'], 3) if stats['original_bytes'] else None
+
+    if session.get_bind().dialect.name == 'postgresql':
+        report['table_bytes'] = session.execute(sa.text("SELECT pg_total_relation_size('news_bodies')")).scalar()
+    return report
+
+
+def _print_report(report: Dict) -> None:
+    print(f"Notícias: {report['rows']}")
+    for column, stats in report['columns'].items():
+        saved = stats['original_bytes'] - stats['stored_bytes']
+        print(
+            f"  {column}: original {stats['original_bytes']:,} B, gravado {stats['stored_bytes']:,} B "
+            f"(razão {stats['ratio']}, economia {saved:,} B), sem compressão: {stats['uncompressed_rows']}, "
+            f"por dicionário: {stats['by_dictionary']}"
+        )
+    if 'table_bytes' in report:
+        print(f"  Tabela news_bodies (com TOAST e índices): {report['table_bytes']:,} B")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s', stream=sys.stdout)
+
+    parser = argparse.ArgumentParser(description='Compressão do corpo das notícias.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    train_parser = subparsers.add_parser('train', help='Treina os dicionários de compressão')
+    train_parser.add_argument('--sample', type=int, default=500, help='Número de notícias recentes na amostra')
+    recompress_parser = subparsers.add_parser('recompress', help='Comprime as linhas existentes em lotes')
+    recompress_parser.add_argument('--batch-size', type=int, default=500)
+    subparsers.add_parser('report', help='Relatório de tamanho das colunas')
+    args = parser.parse_args(argv)
+
+    from app import create_app
+    from app.extensions import db
+
+    app = create_app()
+    with app.app_context():
+        if args.command == 'train':
+            for column, dict_id in train(db.session, args.sample).items():
+                print(f"Dicionário '{column}' treinado: ID {dict_id}")
+        elif args.command == 'recompress':
+            print(f"Linhas regravadas: {recompress(db.session, args.batch_size)}")
+        else:
+            _print_report(size_report(db.session))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,160 @@
+"""
+Imprime o plano de execução (EXPLAIN ANALYZE) das consultas dos repositórios.
+
+As consultas não são reescritas aqui: cada método de leitura dos repositórios
+é executado normalmente e o SQL enviado ao banco (com os mesmos parâmetros) é
+capturado e explicado. No PostgreSQL usa EXPLAIN (ANALYZE, BUFFERS); no
+SQLite, EXPLAIN QUERY PLAN.
+
+Uso:
+    python -m app.scripts.explain_queries [--user-id N] [--topic-id N] [--only NOME]
+"""
+
+import argparse
+import os
+import sys
+from typing import Callable, Dict, List, Optional, Tuple
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, project_root)
+
+from sqlalchemy import event, select
+
+
+def _repository_queries(user_id: int, topic_id: int, title: str) -> Dict[str, Callable]:
+    """Métodos de leitura dos repositórios nas rotas e jobs mais frequentes."""
+    from app.repositories.news_repository import NewsRepository
+    from app.repositories.news_search_repository import NewsSearchRepository
+    from app.repositories.user_read_history_repository import UserReadHistoryRepository
+
+    news_repo = NewsRepository()
+    search_repo = NewsSearchRepository()
+    history_repo = UserReadHistoryRepository()
+
+    queries = {
+        'news.list_all_cards': lambda: news_repo.list_all_cards(page=1, per_page=20, user_id=user_id),
+        'news.find_cards_by_topic': lambda: news_repo.find_cards_by_topic(topic_id, page=1, per_page=10, user_id=user_id),
+        'news.find_ids_by_topic': lambda: news_repo.find_ids_by_topic(topic_id, page=1, per_page=10),
+        'news.count_by_topic': lambda: news_repo.count_by_topic(topic_id),
+        'news.list_favorite_cards': lambda: news_repo.list_favorite_cards(user_id),
+        'news.count_favorites_by_user': lambda: news_repo.count_favorites_by_user(user_id),
+        'news.get_recent_news_with_base_score': lambda: news_repo.get_recent_news_with_base_score(
+            user_id=user_id, preferred_source_ids=[1], days_limit=15, page=1, per_page=10
+        ),
+        'news.count_recent': lambda: news_repo.count_recent(days_limit=15),
+        'news.find_by_title': lambda: news_repo.find_by_title(title),
+        'news.find_existing_titles': lambda: news_repo.find_existing_titles([title]),
+        'read_history.get_user_history': lambda: history_repo.get_user_history(user_id, page=1, per_page=10),
+    }
+    # Busca textual: só no PostgreSQL (tsvector + GIN)
+    if search_repo.available:
+        queries['news_search.search'] = lambda: search_repo.search(title, limit=20)
+    return queries
+
+
+def capture_statements(engine, func: Callable) -> List[Tuple[str, object]]:
+    """
+    Executa a função e captura as consultas SELECT enviadas ao banco.
+
+    Returns:
+        Lista de (sql, parâmetros) no formato do driver (DBAPI)
+    """
+    captured = []
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith('SELECT'):
+            captured.append((statement, parameters))
+
+    event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+    try:
+        func()
+    finally:
+        event.remove(engine, 'before_cursor_execute', _before_cursor_execute)
+    return captured
+
+
+def explain_statement(connection, statement: str, parameters) -> List[str]:
+    """Retorna as linhas do plano de execução de uma consulta."""
+    if connection.dialect.name == 'postgresql':
+        rows = connection.exec_driver_sql(f'EXPLAIN (ANALYZE, BUFFERS) {statement}', parameters)
+        return [row[0] for row in rows]
+    if connection.dialect.name == 'sqlite':
+        rows = connection.exec_driver_sql(f'EXPLAIN QUERY PLAN {statement}', parameters)
+        return [row[-1] for row in rows]
+    rows = connection.exec_driver_sql(f'EXPLAIN {statement}', parameters)
+    return [' | '.join(str(value) for value in row) for row in rows]
+
+
+def explain_repository_queries(
+    user_id: Optional[int] = None,
+    topic_id: Optional[int] = None,
+    only: Optional[str] = None
+) -> List[Dict]:
+    """
+    Explica as consultas dos repositórios no banco da aplicação atual.
+
+    Deve ser chamada dentro de um app context. Sem user_id/topic_id, usa o
+    primeiro usuário e o primeiro tópico do banco (ou 1).
+
+    Args:
+        user_id: Usuário usado nas consultas personalizadas
+        topic_id: Tópico usado nas consultas por tópico
+        only: Executa apenas as consultas cujo nome contém este texto
+
+    Returns:
+        Lista de {'name', 'sql', 'plan'} (uma entrada por SELECT emitido)
+    """
+    from app.extensions import db
+    from app.entities.news_entity import NewsEntity
+    from app.entities.topic_entity import TopicEntity
+    from app.entities.user_entity import UserEntity
+
+    if user_id is None:
+        user_id = db.session.scalar(select(UserEntity.id).order_by(UserEntity.id).limit(1)) or 1
+    if topic_id is None:
+        topic_id = db.session.scalar(select(TopicEntity.id).order_by(TopicEntity.id).limit(1)) or 1
+    title = db.session.scalar(select(NewsEntity.title).order_by(NewsEntity.id.desc()).limit(1)) or 'título'
+
+    results = []
+    for name, func in _repository_queries(user_id, topic_id, title).items():
+        if only and only not in name:
+            continue
+
+        statements = capture_statements(db.engine, func)
+        db.session.rollback()
+
+        with db.engine.connect() as connection:
+            for statement, parameters in statements:
+                results.append({
+                    'name': name,
+                    'sql': statement,
+                    'plan': explain_statement(connection, statement, parameters)
+                })
+            # EXPLAIN ANALYZE executa a consulta: nada deve ser persistido
+            connection.rollback()
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description='Plano de execução das consultas dos repositórios.')
+    parser.add_argument('--user-id', type=int, help='Usuário usado nas consultas personalizadas')
+    parser.add_argument('--topic-id', type=int, help='Tópico usado nas consultas por tópico')
+    parser.add_argument('--only', help='Explica apenas as consultas cujo nome contém este texto')
+    args = parser.parse_args(argv)
+
+    from app import create_app
+
+    app = create_app()
+    with app.app_context():
+        for result in explain_repository_queries(args.user_id, args.topic_id, args.only):
+            print('=' * 80)
+            print(result['name'])
+            print('-' * 80)
+            print(result['sql'])
+            print('-' * 80)
+            print('\n'.join(result['plan']))
+        print('=' * 80)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Qualidade das fontes de notícias (news_sources.quality), usada no ranking.
+
+A qualidade multiplica o score das notícias da fonte (1.0 = neutra, 2.0 =
+dobro, 0.5 = metade). Alterá-la recalcula o base_score das notícias já
+gravadas da fonte na mesma transação (NewsSourceRepository.update_quality).
+
+Comandos:
+    list   Lista as fontes com a qualidade atual
+    set    Altera a qualidade de uma fonte
+
+Uso:
+    python -m app.scripts.source_quality list
+    python -m app.scripts.source_quality set <source_id> <qualidade>
+"""
+
+import argparse
+import os
+import sys
+from typing import List, Optional
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, project_root)
+
+from sqlalchemy import select
+
+
+def list_qualities(session) -> List[tuple]:
+    """Fontes como (id, nome, qualidade), da maior qualidade para a menor."""
+    from app.entities.news_source_entity import NewsSourceEntity
+
+    stmt = select(NewsSourceEntity.id, NewsSourceEntity.name, NewsSourceEntity.quality).order_by(
+        NewsSourceEntity.quality.desc(), NewsSourceEntity.name
+    )
+    return [tuple(row) for row in session.execute(stmt).all()]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description='Qualidade das fontes de notícias.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('list', help='Lista as fontes com a qualidade atual')
+    set_parser = subparsers.add_parser('set', help='Altera a qualidade de uma fonte')
+    set_parser.add_argument('source_id', type=int)
+    set_parser.add_argument('quality', type=float, help='Multiplicador do score (1.0 = neutro)')
+    args = parser.parse_args(argv)
+
+    from app import create_app
+    from app.extensions import db
+    from app.repositories.news_source_repository import NewsSourceRepository
+
+    app = create_app()
+    with app.app_context():
+        if args.command == 'list':
+            for source_id, name, quality in list_qualities(db.session):
+                print(f"{source_id:>6}  {quality:>6.2f}  {name}")
+        else:
+            updated = NewsSourceRepository(db.session).update_quality(args.source_id, args.quality)
+            print(f"Fonte {args.source_id}: qualidade {args.quality}, base_score recalculado em {updated} notícias")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,457 @@
+import os
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+from flask import current_app
+
+from app.services.news_collect_service import NewsCollectService
+from app.utils.url_normalizer import normalize_url
+from app.utils.title_normalizer import normalize_title
+from app.utils.collection_checkpoint import CollectionCheckpoint
+
+
+class AsyncNewsCollectService(NewsCollectService):
+    """
+    Motor de coleta com asyncio, alternativo ao fluxo síncrono do NewsCollectService.
+
+    As chamadas ao GNews, os downloads dos artigos e as verificações de imagem
+    rodam de forma concorrente, limitadas por semáforos, sobre uma única sessão
+    HTTP com pool de conexões. O parse e a limpeza do HTML rodam em um executor
+    separado. Checkpoints, deduplicação e gravação em lote são os mesmos do
+    fluxo síncrono e ficam na thread do event loop.
+    """
+
+    # Chamadas simultâneas ao GNews (o plano da API limita a taxa de requisições)
+    GNEWS_CONCURRENCY = 2
+    # Intervalo mantido após cada chamada ao GNews, ainda dentro do semáforo
+    GNEWS_DELAY = 2
+    # Downloads de artigos simultâneos
+    DOWNLOAD_CONCURRENCY = 8
+    # Downloads simultâneos no mesmo domínio
+    DOMAIN_CONCURRENCY = 1
+    # Verificações de imagem (HEAD) simultâneas
+    IMAGE_CONCURRENCY = 8
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        pool_size = max(self.DOWNLOAD_CONCURRENCY, self.IMAGE_CONCURRENCY)
+        self.http_session = self._build_http_session(pool_size)
+        self.scrape_service.set_http_session(self.http_session)
+        self.cpu_workers = int(os.getenv('COLLECTION_CPU_WORKERS', os.cpu_count() or 1))
+
+    def _build_http_session(self, pool_size: int) -> requests.Session:
+        """Cria uma sessão HTTP que reaproveita conexões entre requisições ao mesmo host."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def _collect_news(self):
+        """Executa os passos da coleta no event loop do asyncio."""
+        try:
+            return asyncio.run(self._collect_news_async())
+        finally:
+            self.http_session.close()
+
+    async def _collect_news_async(self):
+        logging.info("=" * 80)
+        logging.info("INICIANDO COLETA ASSÍNCRONA DE NOTÍCIAS")
+        logging.info("=" * 80)
+
+        app = current_app._get_current_object()
+        self._gnews_semaphore = asyncio.Semaphore(self.GNEWS_CONCURRENCY)
+        self._download_semaphore = asyncio.Semaphore(self.DOWNLOAD_CONCURRENCY)
+        self._image_semaphore = asyncio.Semaphore(self.IMAGE_CONCURRENCY)
+        self._domain_semaphores = {}
+
+        io_workers = self.DOWNLOAD_CONCURRENCY + self.IMAGE_CONCURRENCY + self.GNEWS_CONCURRENCY
+        with ThreadPoolExecutor(max_workers=io_workers, thread_name_prefix='collect-io') as io_executor, \
+             ThreadPoolExecutor(max_workers=self.cpu_workers, thread_name_prefix='collect-cpu') as cpu_executor:
+            self._io_executor = io_executor
+            self._cpu_executor = cpu_executor
+            self._app = app
+            return await self._run_steps()
+
+    async def _run_steps(self):
+        self.scrape_cache.prune()
+
+        # PASSO 1: Buscar tópicos ativos do banco de dados
+        logging.info("[1/3] Buscando tópicos ativos do banco de dados...")
+        active_topics = self.topic_repo.list_all()
+
+        if not active_topics:
+            logging.warning("Nenhum tópico ativo encontrado no banco de dados!")
+            return (0, 0)
+
+        logging.info(f"Encontrados {len(active_topics)} tópicos ativos: {[t.name for t in active_topics]}")
+
+        # PASSO 2: Buscas no GNews em paralelo
+        logging.info(f"[2/3] Coletando notícias para {len(active_topics)} tópicos...")
+        topic_articles_map, total_gnews_calls = await self._fetch_topics(active_topics)
+        total_articles_collected = sum(len(articles) for articles in topic_articles_map.values())
+
+        logging.info(f"Total de artigos coletados: {total_articles_collected}")
+        logging.info(f"Total de chamadas GNews: {total_gnews_calls}")
+
+        # PASSO 3: Scraping em paralelo e gravação em lote
+        logging.info("[3/3] Processando e salvando notícias...")
+        new_articles_count, new_sources_count = await self._process_articles(topic_articles_map)
+
+        # Persistir contadores dos perfis de extração, erros pendentes da blacklist e saúde dos domínios
+        self.profile_store.save()
+        self.blacklist.flush()
+        self.domain_health.flush()
+        health_stats = self.scrape_service.get_statistics()['domain_health']
+
+        logging.info("=" * 80)
+        logging.info("COLETA ASSÍNCRONA FINALIZADA!")
+        logging.info(f"RESUMO:")
+        logging.info(f"  - Tópicos processados: {len(active_topics)} (do banco de dados)")
+        logging.info(f"  - Chamadas GNews: {total_gnews_calls}")
+        logging.info(f"  - Artigos coletados: {total_articles_collected}")
+        logging.info(f"  - Novos artigos salvos: {new_articles_count}")
+        logging.info(f"  - Novas fontes: {new_sources_count}")
+        logging.info(
+            f"  - Domínios com circuito aberto/half-open: "
+            f"{health_stats['by_state']['open']}/{health_stats['by_state']['half_open']}"
+        )
+        logging.info("=" * 80)
+
+        return (new_articles_count, new_sources_count)
+
+    async def _run_io(self, func, *args, **kwargs):
+        """Executa uma chamada bloqueante de rede no executor de I/O."""
+        return await self._run_in(self._io_executor, func, *args, **kwargs)
+
+    async def _run_cpu(self, func, *args, **kwargs):
+        """Executa uma etapa pesada de CPU (parse e limpeza de HTML) no executor de CPU."""
+        return await self._run_in(self._cpu_executor, func, *args, **kwargs)
+
+    async def _run_in(self, executor, func, *args, **kwargs):
+        # Cada chamada roda com seu próprio contexto da aplicação: a blacklist pode
+        # gravar no banco ao atingir o limite de pendências, e a sessão do
+        # Flask-SQLAlchemy é separada por contexto.
+        app = self._app
+
+        def call():
+            with app.app_context():
+                return func(*args, **kwargs)
+
+        return await asyncio.get_running_loop().run_in_executor(executor, call)
+
+    async def _fetch_topics(self, active_topics) -> tuple:
+        """
+        Gera as keywords e busca no GNews todos os tópicos ainda não buscados nesta execução.
+
+        Returns:
+            Tupla ({topic_id: [artigos]}, número de chamadas ao GNews)
+        """
+        topic_articles_map = {}
+        topics_to_fetch = []
+        for topic in active_topics:
+            fetched_articles = self.checkpoint.get_fetched_articles(topic.id)
+            if fetched_articles is None:
+                topics_to_fetch.append(topic)
+            else:
+                topic_articles_map[topic.id] = fetched_articles
+                logging.info(f"    Tópico '{topic.name}' já buscado nesta execução ({len(fetched_articles)} artigos).")
+
+        if not topics_to_fetch:
+            return topic_articles_map, 0
+
+        logging.info("    Gerando keywords para todos os tópicos em batch...")
+        keyword_results = {}
+        try:
+            with self.metrics.timer('keywords'):
+                keyword_results = await self._run_io(
+                    self.keyword_service.generate_keywords_batch, [t.name for t in topics_to_fetch]
+                )
+            logging.info(f"    Keywords geradas para {len(keyword_results)} tópicos.")
+        except Exception as e:
+            logging.error(f"    Erro crítico ao gerar keywords em batch: {e}", exc_info=True)
+
+        searches = []
+        for topic in topics_to_fetch:
+            topic_data = keyword_results.get(topic.name.lower())
+            if not topic_data:
+                logging.warning(f"    Não foi possível obter keywords para '{topic.name}'. Pulando busca.")
+                continue
+
+            keywords = topic_data.get("keywords", [])
+            if not keywords:
+                logging.warning(f"    Nenhuma keyword gerada para '{topic.name}'. Pulando busca.")
+                continue
+
+            query = self.keyword_service.build_boolean_query(keywords)
+            logging.info(f"    Query para '{topic.name}': {query}")
+            searches.append((topic, self._search_articles_async(
+                query=query,
+                language=topic_data.get("language", "en"),
+                country=topic_data.get("country", "us"),
+                max_articles=10
+            )))
+
+        results = await asyncio.gather(*(search for _, search in searches))
+
+        for (topic, _), search_articles in zip(searches, results):
+            topic_articles_map[topic.id] = search_articles
+            logging.info(f"    Search para '{topic.name}' encontrou: {len(search_articles)} artigos")
+
+            # Resultado vazio pode ser erro da API: não grava checkpoint para tentar de novo
+            if search_articles:
+                self.checkpoint.mark_topic_fetched(topic.id, search_articles)
+
+        return topic_articles_map, len(searches)
+
+    async def _search_articles_async(self, query: str, language='pt', country='br', max_articles=10) -> list:
+        """Versão assíncrona de search_articles_via_gnews, com as mesmas regras de retry."""
+        params = {
+            'q': query,
+            'lang': language,
+            'country': country,
+            'apikey': self.gnews_api_key,
+            'max': max_articles
+        }
+
+        max_retries = 2
+        async with self._gnews_semaphore:
+            for attempt in range(max_retries):
+                try:
+                    logging.info(f"GNews Search: query=\"{query}\", lang={language}, country={country}")
+                    with self.metrics.timer('gnews_request'):
+                        response = await self._run_io(self.http_session.get, self.api_endpoint_search, params=params)
+
+                    # Se erro 429, aguardar e tentar novamente
+                    if response.status_code == 429:
+                        if attempt < max_retries - 1:
+                            logging.warning("Erro 429 (Too Many Requests). Aguardando 5s antes de tentar novamente...")
+                            await self._sleep_async(5)
+                            continue
+                        logging.error("Erro 429: limite de tentativas atingido")
+                        return []
+
+                    response.raise_for_status()
+                    articles = response.json().get('articles', [])
+                    logging.info(f"GNews retornou {len(articles)} artigos")
+
+                    # Delay entre chamadas
+                    await self._sleep_async(self.GNEWS_DELAY)
+                    return articles
+
+                except requests.exceptions.RequestException as e:
+                    if attempt < max_retries - 1:
+                        logging.warning(f"Erro ao chamar GNews (tentativa {attempt + 1}/{max_retries}): {e}")
+                        await self._sleep_async(5)
+                    else:
+                        logging.error(f"Erro ao chamar GNews Search API: {e}", exc_info=True)
+                        return []
+
+        return []
+
+    async def _sleep_async(self, seconds: float):
+        """Pausa entre chamadas ao GNews, contabilizada na etapa gnews_sleep."""
+        with self.metrics.timer('gnews_sleep'):
+            await asyncio.sleep(seconds)
+
+    async def _process_articles(self, topic_articles_map: dict) -> tuple:
+        """
+        Seleciona os artigos novos, faz o scraping em paralelo e grava em lote
+        à medida que os resultados chegam.
+
+        Returns:
+            Tupla (new_articles_count, new_sources_count)
+        """
+        with self.metrics.timer('db_read'):
+            self._load_source_map()
+            known_urls = self.news_repo.list_normalized_urls()
+        seen_titles = set()
+        candidates = []
+
+        for topic_id, articles_metadata in topic_articles_map.items():
+            with self.metrics.timer('db_read'):
+                existing_titles = self.news_repo.find_existing_titles(
+                    [a.get('title') for a in articles_metadata]
+                )
+            for article_meta in articles_metadata:
+                candidate = self._select_candidate(topic_id, article_meta, known_urls, existing_titles, seen_titles)
+                if candidate:
+                    candidates.append(candidate)
+        self.checkpoint.flush()
+
+        logging.info(f"  {len(candidates)} artigos novos para scraping.")
+
+        new_articles_count = 0
+        new_sources_count = 0
+        pending_articles = []
+
+        tasks = [asyncio.ensure_future(self._scrape_candidate(candidate)) for candidate in candidates]
+        for future in asyncio.as_completed(tasks):
+            candidate, article_scrap, image_ok = await future
+            pending = self._validate_candidate(candidate, article_scrap, image_ok)
+            if not pending:
+                continue
+
+            pending_articles.append(pending)
+            if len(pending_articles) >= self.SAVE_BATCH_SIZE:
+                articles_saved, sources_saved = self._flush_pending(pending_articles)
+                new_articles_count += articles_saved
+                new_sources_count += sources_saved
+                pending_articles = []
+
+        articles_saved, sources_saved = self._flush_pending(pending_articles)
+        return new_articles_count + articles_saved, new_sources_count + sources_saved
+
+    def _select_candidate(self, topic_id, article_meta, known_urls, existing_titles, seen_titles):
+        """
+        Aplica as verificações baratas (checkpoint, URL, título, fonte e data) antes do scraping.
+
+        A URL e o título são reservados na seleção: a primeira ocorrência de
+        uma duplicata dentro da execução é a única enviada para scraping.
+
+        Returns:
+            Dicionário do candidato ou None se o artigo deve ser pulado
+        """
+        title = article_meta.get('title', 'Título não disponível')
+        article_url = article_meta.get('url')
+
+        if not article_url:
+            logging.warning("    Artigo sem URL. Pulando.")
+            return None
+
+        # Artigo já finalizado em uma tentativa anterior desta execução
+        if self.checkpoint.is_finished(article_url):
+            logging.debug(f"    Artigo já processado nesta execução: {article_url}")
+            return None
+
+        normalized_url = normalize_url(article_url)
+        if normalized_url in known_urls:
+            logging.debug(f"    Artigo já existe (URL): {article_url}")
+            self._mark(article_url, topic_id, CollectionCheckpoint.STAGE_SKIPPED, 'URL duplicada')
+            return None
+
+        title_key = normalize_title(title)
+        if title_key in existing_titles or title_key in seen_titles:
+            logging.debug(f"    Artigo já existe (Título): '{title}'")
+            self._mark(article_url, topic_id, CollectionCheckpoint.STAGE_SKIPPED, 'Título duplicado')
+            return None
+
+        source_name = article_meta.get('source', {}).get('name')
+        source_url = article_meta.get('source', {}).get('url')
+        if not source_name or not source_url:
+            logging.warning(f"    Artigo sem dados de fonte. Pulando: {article_url}")
+            self._mark(article_url, topic_id, CollectionCheckpoint.STAGE_SKIPPED, 'Sem dados de fonte')
+            return None
+
+        try:
+            published_at_str = article_meta.get('publishedAt')
+            if published_at_str and published_at_str.endswith('Z'):
+                published_at_str = published_at_str[:-1] + '+00:00'
+            published_at_dt = datetime.fromisoformat(published_at_str)
+        except Exception as e:
+            logging.error(f"    Erro ao preparar artigo '{title}': {e}")
+            self._mark(article_url, topic_id, CollectionCheckpoint.STAGE_SKIPPED, str(e))
+            return None
+
+        known_urls.add(normalized_url)
+        seen_titles.add(title_key)
+        return {
+            'topic_id': topic_id,
+            'meta': article_meta,
+            'title': title,
+            'url': article_url,
+            'source_name': source_name,
+            'source_url': source_url,
+            'published_at': published_at_dt,
+        }
+
+    async def _scrape_candidate(self, candidate: dict) -> tuple:
+        """
+        Baixa e processa o artigo e verifica a imagem ao mesmo tempo.
+
+        Returns:
+            Tupla (candidato, resultado do scraping ou None, imagem acessível)
+        """
+        article_scrap, image_ok = await asyncio.gather(
+            self._scrape_article(candidate['url']),
+            self._check_image(candidate['meta'].get('image'))
+        )
+        return candidate, article_scrap, image_ok
+
+    async def _scrape_article(self, url: str):
+        domain = self.domain_health.get_domain(url)
+        domain_semaphore = self._domain_semaphores.setdefault(domain, asyncio.Semaphore(self.DOMAIN_CONCURRENCY))
+
+        try:
+            # Um download por domínio por vez: evita sobrecarregar o site e mantém
+            # sequenciais as atualizações de blacklist e saúde de um mesmo domínio
+            async with domain_semaphore:
+                async with self._download_semaphore:
+                    page = await self._run_io(self.scrape_service.fetch_page, url)
+                if page is None:
+                    return None
+                return await self._run_cpu(self.scrape_service.parse_page, url, page)
+        except Exception as e:
+            logging.error(f"    Erro inesperado no scraping de {url}: {e}", exc_info=True)
+            return None
+
+    async def _check_image(self, image_url) -> bool:
+        if not image_url:
+            return True
+
+        async with self._image_semaphore:
+            return await self._run_io(self._validate_image, image_url, session=self.http_session)
+
+    def _validate_candidate(self, candidate: dict, article_scrap, image_ok: bool):
+        """
+        Registra o resultado do scraping no checkpoint e monta o artigo pendente de gravação.
+
+        Returns:
+            Dicionário {'source': NewsSource, 'fields': {...}} ou None se o artigo foi pulado
+        """
+        topic_id = candidate['topic_id']
+        article_url = candidate['url']
+        title = candidate['title']
+
+        if not article_scrap:
+            logging.warning(f"    Falha no scraping (artigo ignorado): {article_url}")
+            self._mark(article_url, topic_id, CollectionCheckpoint.STAGE_SKIPPED, 'Falha no scraping')
+            return None
+        self._mark(article_url, topic_id, CollectionCheckpoint.STAGE_SCRAPED)
+
+        news_source_model = self._resolve_source(candidate['source_name'], candidate['source_url'])
+        if not news_source_model:
+            logging.error(f"    Não foi possível obter fonte para {candidate['source_name']}")
+            self._mark(article_url, topic_id, CollectionCheckpoint.STAGE_SKIPPED, 'Fonte inválida')
+            return None
+
+        image_url = candidate['meta'].get('image')
+        if not image_ok:
+            logging.warning(
+                f"    Imagem não acessível para artigo '{title[:50]}...': {image_url}. "
+                f"Pulando artigo."
+            )
+            self._mark(article_url, topic_id, CollectionCheckpoint.STAGE_SKIPPED, 'Imagem não acessível')
+            return None
+
+        self.near_duplicates.add(article_url, article_scrap.get('fingerprint'))
+        self._mark(article_url, topic_id, CollectionCheckpoint.STAGE_VALIDATED)
+        logging.info(f"    Notícia validada: '{title[:50]}...' (tópico ID={topic_id})")
+        return {
+            'source': news_source_model,
+            'fields': {
+                'title': title,
+                'url': article_url,
+                'description': candidate['meta'].get('description'),
+                'content': article_scrap.get('text'),
+                'image_url': image_url,
+                'html': article_scrap.get('html'),
+                'published_at': candidate['published_at'],
+                'topic_id': topic_id
+            }
+        }
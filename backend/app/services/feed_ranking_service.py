@@ -0,0 +1,261 @@
+import logging
+import threading
+import time
+from bisect import insort
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+from app.repositories.news_repository import NewsRepository
+from app.repositories.user_news_source_repository import UserNewsSourceRepository
+from app.repositories.user_preferred_custom_topic_repository import UserPreferredCustomTopicRepository
+from app.repositories.user_repository import UserRepository
+from app.utils import news_ranking
+
+
+class _UserRanking:
+    """Ranking "For You" de um usuário: chaves (-rank, -horas de publicação, -id) em ordem crescente."""
+
+    __slots__ = (
+        "entries", "ids", "source_ids", "topic_names", "last_news_id", "truncated", "dirty",
+        "preferences_version", "built_at",
+    )
+
+    def __init__(self, entries: list, source_ids, topic_names, last_news_id: int, truncated: bool, preferences_version: int = 0):
+        self.entries = entries
+        self.ids = {-key[2] for key in entries}
+        self.source_ids = frozenset(source_ids)
+        self.topic_names = tuple({name.lower() for name in topic_names if name})
+        self.last_news_id = last_news_id
+        self.truncated = truncated
+        self.dirty = False
+        self.preferences_version = preferences_version
+        self.built_at = time.monotonic()
+
+
+class FeedRankingService:
+    """
+    Estado do ranking "For You" por usuário, mantido em memória.
+
+    O rank de uma notícia (base_score + boosts do usuário, ver
+    app/utils/news_ranking.py) não depende do horário da consulta, então a
+    lista ordenada de cada usuário continua válida com o passar do tempo:
+
+    - Mudança de preferências: cada página compara users.preferences_version
+      (incrementada pelos repositórios de preferências) com a do estado e o
+      recalcula quando ela muda, em qualquer worker. No worker que atendeu a
+      mudança, o sinal preferences_changed também marca o estado como sujo.
+    - Coleta finalizada (sinal collection_finished ou nova versão do
+      conteúdo): só as notícias novas são rankeadas e intercaladas no estado
+      de cada usuário ativo, sem refazer a consulta de ranking.
+    - Notícias que saem da janela de days_limit são descartadas na leitura.
+
+    Cada processo tem o seu estado; as coletas de outros processos chegam pela
+    versão do conteúdo.
+
+    Args:
+        max_entries: Notícias guardadas por usuário; páginas além disso vão ao banco
+        state_ttl: Segundos desde o cálculo até o estado do usuário ser refeito (0 desativa)
+        max_users: Estados mantidos (os menos usados recentemente saem primeiro)
+        version_loader: Versão do conteúdo (ex: ResponseCache.version); mudou, há notícias novas
+    """
+
+    def __init__(
+        self,
+        news_repo: NewsRepository | None = None,
+        user_news_source_repo: UserNewsSourceRepository | None = None,
+        custom_topic_repo: UserPreferredCustomTopicRepository | None = None,
+        user_repo: UserRepository | None = None,
+        days_limit: int = 15,
+        max_entries: int = 300,
+        state_ttl: float = 600.0,
+        max_users: int = 1000,
+        version_loader: Optional[Callable[[], str]] = None
+    ):
+        self.news_repo = news_repo or NewsRepository()
+        self.user_news_source_repo = user_news_source_repo or UserNewsSourceRepository()
+        self.custom_topic_repo = custom_topic_repo or UserPreferredCustomTopicRepository()
+        self.user_repo = user_repo or UserRepository()
+        self.days_limit = days_limit
+        self.max_entries = max_entries
+        self.state_ttl = state_ttl
+        self.max_users = max_users
+        self.version_loader = version_loader
+        self._version = None
+        self._states: OrderedDict[int, _UserRanking] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.state_ttl > 0 and self.max_entries > 0
+
+    def get_page(self, user_id: int, page: int = 1, per_page: int = 10) -> Optional[list[tuple[int, float]]]:
+        """
+        Página do feed do usuário a partir do estado em memória.
+
+        Returns:
+            Lista de (news_id, rank) na ordem do feed, ou None quando a página
+            passa do que o estado guarda (o chamador consulta o banco)
+        """
+        self._merge_if_content_changed()
+        preferences_version = self.user_repo.get_preferences_version(user_id)
+
+        with self._lock:
+            state = self._states.get(user_id)
+            if state is not None and (
+                state.dirty or self._expired(state) or state.preferences_version != preferences_version
+            ):
+                state = None
+            elif state is not None:
+                self._states.move_to_end(user_id)
+        if state is None:
+            state = self._build(user_id, preferences_version)
+
+        cutoff = -news_ranking.hours_since_epoch(datetime.now() - timedelta(days=self.days_limit))
+        start = (page - 1) * per_page
+        with self._lock:
+            # Notícias que saíram da janela (ordem por rank, não por data)
+            if any(key[1] > cutoff for key in state.entries):
+                state.entries = [key for key in state.entries if key[1] <= cutoff]
+                state.ids = {-key[2] for key in state.entries}
+            if start + per_page > len(state.entries) and state.truncated:
+                return None
+            return [(-key[2], -key[0]) for key in state.entries[start:start + per_page]]
+
+    def mark_dirty(self, user_id: int) -> None:
+        """Marca o estado do usuário para ser recalculado na próxima requisição."""
+        with self._lock:
+            state = self._states.get(user_id)
+            if state is not None:
+                state.dirty = True
+
+    def on_preferences_changed(self, user_id: int, **kwargs) -> None:
+        """Receptor do sinal preferences_changed."""
+        self.mark_dirty(user_id)
+
+    def on_collection_finished(self, run_id=None, **kwargs) -> None:
+        """Receptor do sinal collection_finished: intercala as notícias novas agora."""
+        if self._states:
+            self.merge_new_articles()
+
+    def merge_new_articles(self) -> int:
+        """
+        Rankeia só as notícias gravadas depois de cada estado e as intercala,
+        para todos os usuários ativos.
+
+        Returns:
+            Quantidade de notícias novas lidas do banco
+        """
+        with self._lock:
+            self._evict_expired()
+            states = [state for state in self._states.values() if not state.dirty]
+        if not states:
+            return 0
+
+        rows = self.news_repo.list_recent_for_ranking(
+            days_limit=self.days_limit, after_id=min(state.last_news_id for state in states)
+        )
+        if not rows:
+            return 0
+
+        articles = [
+            (row.id, row.source_id, row.base_score, news_ranking.hours_since_epoch(row.published_at),
+             news_ranking.searchable_text(row.title, row.description))
+            for row in rows
+        ]
+        last_news_id = max(article[0] for article in articles)
+        with self._lock:
+            for state in states:
+                self._merge_into(state, articles)
+                state.last_news_id = max(state.last_news_id, last_news_id)
+        logging.info(f"Feed: {len(articles)} notícias novas intercaladas em {len(states)} rankings de usuários.")
+        return len(articles)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._states.clear()
+
+    def _merge_if_content_changed(self) -> None:
+        if self.version_loader is None:
+            return
+        version = self.version_loader()
+        if version == self._version:
+            return
+        first_check = self._version is None
+        self._version = version
+        if not first_check:
+            self.merge_new_articles()
+
+    def _merge_into(self, state: _UserRanking, articles: list) -> None:
+        for news_id, source_id, base_score, published_hours, text in articles:
+            if news_id <= state.last_news_id or news_id in state.ids:
+                continue
+            rank = base_score + news_ranking.user_boost(
+                source_id in state.source_ids, news_ranking.count_topic_matches(text, state.topic_names)
+            )
+            key = (-rank, -published_hours, -news_id)
+            # Estado truncado: abaixo da última chave guardada ficam notícias que
+            # nunca foram carregadas, então só entra quem ranqueia acima dela
+            if state.truncated and (not state.entries or key > state.entries[-1]):
+                continue
+            insort(state.entries, key)
+            state.ids.add(news_id)
+        if len(state.entries) > self.max_entries:
+            for key in state.entries[self.max_entries:]:
+                state.ids.discard(-key[2])
+            del state.entries[self.max_entries:]
+            state.truncated = True
+
+    def _build(self, user_id: int, preferences_version: int = 0) -> _UserRanking:
+        """Recalcula o ranking do usuário no banco (estado novo ou sujo)."""
+        # Lido antes do ranking: notícias gravadas no meio do caminho entram na próxima intercalação
+        last_news_id = self.news_repo.max_id()
+        source_ids = self.user_news_source_repo.get_user_preferred_source_ids(user_id)
+        topic_names = self.custom_topic_repo.list_topic_names_by_users([user_id]).get(user_id, [])
+        rows = self.news_repo.rank_ids_for_user(
+            user_id, source_ids, days_limit=self.days_limit, limit=self.max_entries + 1
+        )
+
+        entries = sorted(
+            (-row.rank, -news_ranking.hours_since_epoch(row.published_at), -row.id)
+            for row in rows[:self.max_entries]
+        )
+        state = _UserRanking(
+            entries, source_ids, topic_names, last_news_id,
+            truncated=len(rows) > self.max_entries, preferences_version=preferences_version
+        )
+        with self._lock:
+            self._states[user_id] = state
+            self._states.move_to_end(user_id)
+            while len(self._states) > self.max_users:
+                self._states.popitem(last=False)
+        return state
+
+    def _expired(self, state: _UserRanking) -> bool:
+        return time.monotonic() - state.built_at > self.state_ttl
+
+    def _evict_expired(self) -> None:
+        for user_id in [user_id for user_id, state in self._states.items() if self._expired(state)]:
+            del self._states[user_id]
+
+
+def create_feed_ranking(config, version_loader: Optional[Callable[[], str]] = None) -> FeedRankingService:
+    """
+    Cria o serviço a partir da configuração do app e o liga aos sinais de
+    app/utils/events.py.
+
+    Chaves usadas: FEED_RANKING_STATE_TTL, FEED_RANKING_MAX_ENTRIES e
+    FEED_RANKING_MAX_USERS.
+    """
+    from app.utils.events import collection_finished, preferences_changed
+
+    service = FeedRankingService(
+        max_entries=int(config.get("FEED_RANKING_MAX_ENTRIES", 300)),
+        state_ttl=float(config.get("FEED_RANKING_STATE_TTL", 600)),
+        max_users=int(config.get("FEED_RANKING_MAX_USERS", 1000)),
+        version_loader=version_loader,
+    )
+    # Referências fracas (padrão do blinker): o receptor some junto com o app
+    preferences_changed.connect(service.on_preferences_changed)
+    collection_finished.connect(service.on_collection_finished)
+    return service
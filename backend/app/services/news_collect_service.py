@@ -4,20 +4,31 @@ import logging
 import time
 from datetime import datetime
 
-from sqlalchemy.exc import IntegrityError
 from app.repositories.news_repository import NewsRepository
 from app.repositories.news_source_repository import NewsSourceRepository
 from app.repositories.topic_repository import TopicRepository
+from app.repositories.collection_run_repository import CollectionRunRepository
 from app.models.news import News
 from app.models.news_source import NewsSource
 
 from app.services.keyword_generation_service import KeywordGenerationService
 from app.services.ai_service import AIService
 from app.utils.scraping_blacklist import ScrapingBlacklist
+from app.utils.domain_health import DomainHealth
 from app.services.scrape_service import ScrapeService
+from app.utils.scrape_cache import ScrapeCache
+from app.utils.domain_profile_store import DomainProfileStore
 from app.utils.image_url_validator import ImageUrlValidator
+from app.utils.url_normalizer import normalize_url
+from app.utils.title_normalizer import normalize_title
+from app.utils.collection_checkpoint import CollectionCheckpoint
+from app.utils.collection_metrics import CollectionMetrics
+from app.utils.near_duplicate_index import NearDuplicateIndex
 
 class NewsCollectService():
+    # Número de artigos validados acumulados antes de cada insert em lote
+    SAVE_BATCH_SIZE = 20
+
     def __init__(
         self,
         news_repo: NewsRepository | None = None,
@@ -30,19 +41,68 @@ class NewsCollectService():
 
         self.ai_service = AIService()
         self.keyword_service = KeywordGenerationService()
-        self.blacklist = ScrapingBlacklist('/tmp/scraping_blacklist.json')
+        self.blacklist = ScrapingBlacklist()
         self.blacklist.load()
+        self._import_legacy_blacklist()
         
         # Injetar a instância da blacklist no ScrapeService
         # para garantir que ambos usem o mesmo objeto em memória.
         self.scrape_service = ScrapeService()
         self.scrape_service.set_blacklist(self.blacklist)
 
+        # Saúde dos domínios (circuit breaker para falhas temporárias)
+        self.domain_health = DomainHealth()
+        self.domain_health.load()
+        self.scrape_service.set_domain_health(self.domain_health)
+
+        # Cache em disco dos resultados de scraping (HTML bruto, ETag/Last-Modified e resultado)
+        self.scrape_cache = ScrapeCache(os.getenv('SCRAPE_CACHE_DIR', '/tmp/scrape_cache'))
+        self.scrape_service.set_scrape_cache(self.scrape_cache)
+
+        # Checkpoints da execução do job (retomada após interrupção)
+        self.checkpoint = CollectionCheckpoint()
+
+        # Métricas por etapa da execução (resumo em JSON e arquivo do Prometheus)
+        self.metrics = CollectionMetrics()
+        self.scrape_service.set_metrics(self.metrics)
+
+        # SimHash dos artigos recentes (cópias da mesma matéria em vários veículos)
+        self.near_duplicates = NearDuplicateIndex()
+        self.scrape_service.set_near_duplicate_index(self.near_duplicates)
+
+        # Perfis de extração aprendidos por domínio (caminho rápido do scraping)
+        self.profile_store = DomainProfileStore()
+        self.profile_store.load()
+        self._import_legacy_domain_profiles()
+        self.scrape_service.set_profile_store(self.profile_store)
+
         self.gnews_api_key = os.getenv('GNEWS_API_KEY')
         self.api_endpoint = "https://gnews.io/api/v4/top-headlines"
         self.api_endpoint_search = "https://gnews.io/api/v4/search"
 
 
+    def _import_legacy_blacklist(self):
+        """Importa o antigo arquivo JSON da blacklist enquanto a tabela estiver vazia."""
+        legacy_path = os.getenv('SCRAPING_BLACKLIST_JSON', '/tmp/scraping_blacklist.json')
+        if self.blacklist.blacklist_data or not os.path.exists(legacy_path):
+            return
+
+        try:
+            self.blacklist.import_json(legacy_path)
+        except Exception as e:
+            logging.error(f"Erro ao importar blacklist legada de '{legacy_path}': {e}", exc_info=True)
+
+    def _import_legacy_domain_profiles(self):
+        """Importa o antigo arquivo JSON de perfis de domínio enquanto a tabela estiver vazia."""
+        legacy_path = os.getenv('DOMAIN_PROFILES_FILE', '/tmp/domain_profiles.json')
+        if self.profile_store.profiles or not os.path.exists(legacy_path):
+            return
+
+        try:
+            self.profile_store.import_json(legacy_path)
+        except Exception as e:
+            logging.error(f"Erro ao importar perfis de domínio legados de '{legacy_path}': {e}", exc_info=True)
+
     def search_articles_via_gnews(self, query: str, language='pt', country='br', max_articles=10):
         params = {
             'q': query,
@@ -56,14 +116,15 @@ class NewsCollectService():
         for attempt in range(max_retries):
             try:
                 logging.info(f"GNews Search: query=\"{query}\", lang={language}, country={country}")
-                response = requests.get(self.api_endpoint_search, params=params)
+                with self.metrics.timer('gnews_request'):
+                    response = requests.get(self.api_endpoint_search, params=params)
 
                 # Se erro 429, aguardar e tentar novamente
                 if response.status_code == 429:
                     if attempt < max_retries - 1:
                         wait_time = 5
                         logging.warning(f"Erro 429 (Too Many Requests). Aguardando {wait_time}s antes de tentar novamente...")
-                        time.sleep(wait_time)
+                        self._sleep(wait_time)
                         continue
                     else:
                         logging.error("Erro 429: limite de tentativas atingido")
@@ -75,14 +136,14 @@ class NewsCollectService():
 
                 # Delay entre chamadas
                 delay = 2  
-                time.sleep(delay)
+                self._sleep(delay)
 
                 return articles
 
             except requests.exceptions.RequestException as e:
                 if attempt < max_retries - 1:
                     logging.warning(f"Erro ao chamar GNews (tentativa {attempt + 1}/{max_retries}): {e}")
-                    time.sleep(5)
+                    self._sleep(5)
                 else:
                     logging.error(f"Erro ao chamar GNews Search API: {e}", exc_info=True)
                     return []
@@ -102,14 +163,15 @@ class NewsCollectService():
         for attempt in range(max_retries):
             try:
                 logging.info(f"GNews Top-Headlines: category={category}, lang={language}, country={country}")
-                response = requests.get(self.api_endpoint, params=params)
+                with self.metrics.timer('gnews_request'):
+                    response = requests.get(self.api_endpoint, params=params)
 
                 # Se erro 429, aguardar e tentar novamente
                 if response.status_code == 429:
                     if attempt < max_retries - 1:
                         wait_time = 5
                         logging.warning(f"Erro 429 (Too Many Requests). Aguardando {wait_time}s antes de tentar novamente...")
-                        time.sleep(wait_time)
+                        self._sleep(wait_time)
                         continue
                     else:
                         logging.error("Erro 429: limite de tentativas atingido")
@@ -121,14 +183,14 @@ class NewsCollectService():
 
                 # Delay entre chamadas
                 delay = 2  
-                time.sleep(delay)
+                self._sleep(delay)
 
                 return articles
 
             except requests.exceptions.RequestException as e:
                 if attempt < max_retries - 1:
                     logging.warning(f"Erro ao chamar GNews (tentativa {attempt + 1}/{max_retries}): {e}")
-                    time.sleep(5)
+                    self._sleep(5)
                 else:
                     logging.error(f"Erro ao chamar GNews Top-Headlines API: {e}", exc_info=True)
                     return []
@@ -136,7 +198,7 @@ class NewsCollectService():
         return []
 
 
-    def collect_news_simple(self):
+    def collect_news_simple(self, resume: bool = False):
         """
         Método simplificado de coleta de notícias baseado em tópicos do banco de dados.
 
@@ -145,6 +207,13 @@ class NewsCollectService():
         2. Para cada tópico 1 chamada para search usando keywords geradas por IA:
         3. Salvar notícias associadas ao topic_id correto
 
+        O progresso é registrado nas tabelas de execução do job (collection_runs).
+        Ao final, o resumo das métricas é logado em JSON e, se configurados, gravado
+        em COLLECTION_METRICS_FILE (JSON) e COLLECTION_METRICS_PROM_FILE (Prometheus).
+
+        Args:
+            resume: Se True, retoma a última execução interrompida a partir do checkpoint
+
         Returns:
             Tupla (new_articles_count, new_sources_count)
         """
@@ -152,10 +221,61 @@ class NewsCollectService():
             logging.error("GNEWS_API_KEY não configurada")
             raise ValueError("GNEWS_API_KEY não configurada")
 
+        self.metrics.reset()
+        self.near_duplicates.reset()
+        self.checkpoint.start(resume=resume)
+        try:
+            with self.metrics.timer('total'):
+                new_articles_count, new_sources_count = self._collect_news()
+        except Exception as e:
+            self.checkpoint.fail(str(e))
+            self._emit_metrics(CollectionRunRepository.STATUS_FAILED)
+            raise
+
+        self.checkpoint.finish(new_articles_count, new_sources_count)
+        self._emit_metrics(
+            CollectionRunRepository.STATUS_COMPLETED,
+            new_articles=new_articles_count,
+            new_sources=new_sources_count
+        )
+        return (new_articles_count, new_sources_count)
+
+    def _emit_metrics(self, status: str, **extra):
+        """Publica as métricas da execução (log em JSON e arquivos configurados)."""
+        try:
+            self.metrics.emit(
+                json_path=os.getenv('COLLECTION_METRICS_FILE'),
+                prometheus_path=os.getenv('COLLECTION_METRICS_PROM_FILE'),
+                run_id=self.checkpoint.run_id,
+                status=status,
+                **extra
+            )
+        except Exception as e:
+            logging.error(f"Erro ao publicar métricas da coleta: {e}", exc_info=True)
+
+    def _mark(self, url: str, topic_id: int, stage: str, reason: str | None = None):
+        """Registra o estágio do artigo no checkpoint e no contador de artigos das métricas."""
+        self.checkpoint.mark(url, topic_id, stage, reason)
+        self.metrics.increment('articles', stage=stage, reason=reason)
+
+    def _sleep(self, seconds: float):
+        """Pausa entre chamadas ao GNews, contabilizada na etapa gnews_sleep."""
+        with self.metrics.timer('gnews_sleep'):
+            time.sleep(seconds)
+
+    def _validate_image(self, image_url: str, session=None) -> bool:
+        """Verifica se a imagem é acessível, contabilizando a etapa image_validation."""
+        with self.metrics.timer('image_validation'):
+            return ImageUrlValidator.validate_image_url_accessible(image_url, session=session)
+
+    def _collect_news(self):
+        """Executa os passos da coleta, registrando checkpoints em self.checkpoint."""
         logging.info("=" * 80)
         logging.info("INICIANDO COLETA SIMPLIFICADA DE NOTÍCIAS")
         logging.info("=" * 80)
 
+        self.scrape_cache.prune()
+
         # PASSO 1: Buscar tópicos ativos do banco de dados
         logging.info("[1/3] Buscando tópicos ativos do banco de dados...")
         active_topics = self.topic_repo.list_all()  # Busca todos os tópicos ativos
@@ -172,19 +292,31 @@ class NewsCollectService():
         total_articles_collected = 0
         total_gnews_calls = 0
 
+        # 2.1: Tópicos já buscados nesta execução (retomada) não repetem a chamada ao GNews
+        topics_to_fetch = []
+        for topic in active_topics:
+            fetched_articles = self.checkpoint.get_fetched_articles(topic.id)
+            if fetched_articles is None:
+                topics_to_fetch.append(topic)
+            else:
+                topic_articles_map[topic.id] = fetched_articles
+                logging.info(f"    Tópico '{topic.name}' já buscado nesta execução ({len(fetched_articles)} artigos).")
+
         # 2.2: Geração de keywords em batch para todos os tópicos
-        logging.info("    Gerando keywords para todos os tópicos em batch...")
-        topic_names = [t.name for t in active_topics]
-        try:
-            keyword_results = self.keyword_service.generate_keywords_batch(topic_names)
-            logging.info(f"    Keywords geradas para {len(keyword_results)} tópicos.")
-        except Exception as e:
-            logging.error(f"    Erro crítico ao gerar keywords em batch: {e}", exc_info=True)
-            keyword_results = {}
+        keyword_results = {}
+        if topics_to_fetch:
+            logging.info("    Gerando keywords para todos os tópicos em batch...")
+            topic_names = [t.name for t in topics_to_fetch]
+            try:
+                with self.metrics.timer('keywords'):
+                    keyword_results = self.keyword_service.generate_keywords_batch(topic_names)
+                logging.info(f"    Keywords geradas para {len(keyword_results)} tópicos.")
+            except Exception as e:
+                logging.error(f"    Erro crítico ao gerar keywords em batch: {e}", exc_info=True)
 
         # 2.3: Busca por keywords para cada tópico
-        for i, topic in enumerate(active_topics, 1):
-            logging.info(f"  [{i}/{len(active_topics)}] Buscando notícias para o tópico: '{topic.name}' (ID={topic.id})")
+        for i, topic in enumerate(topics_to_fetch, 1):
+            logging.info(f"  [{i}/{len(topics_to_fetch)}] Buscando notícias para o tópico: '{topic.name}' (ID={topic.id})")
             topic_lower = topic.name.lower()
 
             if topic_lower in keyword_results:
@@ -206,6 +338,10 @@ class NewsCollectService():
                     topic_articles_map[topic.id] = search_articles
                     total_gnews_calls += 1
                     logging.info(f"    Search encontrou: {len(search_articles)} artigos")
+
+                    # Resultado vazio pode ser erro da API: não grava checkpoint para tentar de novo
+                    if search_articles:
+                        self.checkpoint.mark_topic_fetched(topic.id, search_articles)
                 else:
                     logging.warning(f"    Nenhuma keyword gerada para '{topic.name}'. Pulando busca.")
             else:
@@ -223,10 +359,23 @@ class NewsCollectService():
         new_articles_count = 0
         new_sources_count = 0
 
+        # Fontes e URLs existentes carregadas uma única vez por execução
+        with self.metrics.timer('db_read'):
+            self._load_source_map()
+            known_urls = self.news_repo.list_normalized_urls()
+        seen_titles = set()
+        pending_articles = []
+
         for topic_id, articles_metadata in topic_articles_map.items():
             topic_name = next(t.name for t in active_topics if t.id == topic_id)
             logging.info(f"  Processando {len(articles_metadata)} artigos do tópico '{topic_name}'...")
 
+            # Uma consulta por tópico para os títulos já existentes
+            with self.metrics.timer('db_read'):
+                existing_titles = self.news_repo.find_existing_titles(
+                    [a.get('title') for a in articles_metadata]
+                )
+
             for i, article_meta in enumerate(articles_metadata, 1):
                 title = article_meta.get('title', 'Título não disponível')
                 article_url = article_meta.get('url')
@@ -235,13 +384,22 @@ class NewsCollectService():
                     logging.warning(f"    Artigo {i} sem URL. Pulando.")
                     continue
 
-                if self.news_repo.find_by_url(article_url):
+                # Artigo já finalizado em uma tentativa anterior desta execução
+                if self.checkpoint.is_finished(article_url):
+                    logging.debug(f"    Artigo {i} já processado nesta execução: {article_url}")
+                    continue
+
+                normalized_url = normalize_url(article_url)
+                if normalized_url in known_urls:
                     logging.debug(f"    Artigo {i} já existe (URL): {article_url}")
+                    self._mark(article_url, topic_id, CollectionCheckpoint.STAGE_SKIPPED, 'URL duplicada')
                     continue
 
                 # Verificar se já existe uma notícia com o mesmo título
-                if self.news_repo.find_by_title(title):
+                title_key = normalize_title(title)
+                if title_key in existing_titles or title_key in seen_titles:
                     logging.debug(f"    Artigo {i} já existe (Título): '{title}'")
+                    self._mark(article_url, topic_id, CollectionCheckpoint.STAGE_SKIPPED, 'Título duplicado')
                     continue
 
                 source_name = article_meta.get('source', {}).get('name')
@@ -249,27 +407,27 @@ class NewsCollectService():
 
                 if not source_name or not source_url:
                     logging.warning(f"    Artigo {i} sem dados de fonte. Pulando.")
+                    self._mark(article_url, topic_id, CollectionCheckpoint.STAGE_SKIPPED, 'Sem dados de fonte')
                     continue
 
                 # Scraping do conteúdo
                 article_scrap = self.scrape_service.scrape_article_content(article_url)
                 if not article_scrap:
                     logging.warning(f"    Falha no scraping (artigo ignorado): {article_url}")
+                    self._mark(article_url, topic_id, CollectionCheckpoint.STAGE_SKIPPED, 'Falha no scraping')
                     continue
+                self._mark(article_url, topic_id, CollectionCheckpoint.STAGE_SCRAPED)
 
                 article_html = article_scrap.get('html')
                 article_text = article_scrap.get('text')
 
-
-                # Buscar ou criar fonte
-                news_source_model = self._get_or_create_source(source_name, source_url)
+                # Buscar fonte no mapa em memória (ou registrar nova fonte pendente)
+                news_source_model = self._resolve_source(source_name, source_url)
                 if not news_source_model:
                     logging.error(f"    Não foi possível obter fonte para {source_name}")
+                    self._mark(article_url, topic_id, CollectionCheckpoint.STAGE_SKIPPED, 'Fonte inválida')
                     continue
 
-                if hasattr(news_source_model, '_is_new') and news_source_model._is_new:
-                    new_sources_count += 1
-
                 try:
                     published_at_str = article_meta.get('publishedAt')
                     if published_at_str and published_at_str.endswith('Z'):
@@ -278,33 +436,57 @@ class NewsCollectService():
 
                     # Validação de imagem
                     image_url = article_meta.get('image')
-                    if image_url and not ImageUrlValidator.validate_image_url_accessible(image_url):
+                    if image_url and not self._validate_image(image_url):
                         logging.warning(
                             f"    Imagem não acessível para artigo '{title[:50]}...': {image_url}. "
                             f"Pulando artigo."
                         )
+                        self._mark(article_url, topic_id, CollectionCheckpoint.STAGE_SKIPPED, 'Imagem não acessível')
                         continue
 
-                    article = News(
-                        title=title,
-                        url=article_url,
-                        description=article_meta.get('description'),
-                        content=article_text,
-                        image_url=image_url,
-                        html=article_html,
-                        published_at=published_at_dt,
-                        source_id=news_source_model.id,
-                        topic_id=topic_id
-                    )
-
-                    saved_article = self.news_repo.create(article)
-                    new_articles_count += 1
-                    logging.info(f"    Notícia salva: '{title[:50]}...' → tópico '{topic_name}' (ID={topic_id})")
-
                 except Exception as e:
-                    logging.error(f"    Erro ao salvar artigo '{title}': {e}")
+                    logging.error(f"    Erro ao preparar artigo '{title}': {e}")
+                    self._mark(article_url, topic_id, CollectionCheckpoint.STAGE_SKIPPED, str(e))
                     continue
 
+                pending_articles.append({
+                    'source': news_source_model,
+                    'fields': {
+                        'title': title,
+                        'url': article_url,
+                        'description': article_meta.get('description'),
+                        'content': article_text,
+                        'image_url': image_url,
+                        'html': article_html,
+                        'published_at': published_at_dt,
+                        'topic_id': topic_id
+                    }
+                })
+                known_urls.add(normalized_url)
+                seen_titles.add(title_key)
+                self.near_duplicates.add(article_url, article_scrap.get('fingerprint'))
+                self._mark(article_url, topic_id, CollectionCheckpoint.STAGE_VALIDATED)
+                logging.info(f"    Notícia validada: '{title[:50]}...' → tópico '{topic_name}' (ID={topic_id})")
+
+                if len(pending_articles) >= self.SAVE_BATCH_SIZE:
+                    articles_saved, sources_saved = self._flush_pending(pending_articles)
+                    new_articles_count += articles_saved
+                    new_sources_count += sources_saved
+                    pending_articles = []
+
+            # Checkpoint dos artigos pulados no tópico
+            self.checkpoint.flush()
+
+        articles_saved, sources_saved = self._flush_pending(pending_articles)
+        new_articles_count += articles_saved
+        new_sources_count += sources_saved
+
+        # Persistir contadores dos perfis de extração, erros pendentes da blacklist e saúde dos domínios
+        self.profile_store.save()
+        self.blacklist.flush()
+        self.domain_health.flush()
+        health_stats = self.scrape_service.get_statistics()['domain_health']
+
         logging.info("=" * 80)
         logging.info("COLETA SIMPLIFICADA FINALIZADA!")
         logging.info(f"RESUMO:")
@@ -314,34 +496,125 @@ class NewsCollectService():
         logging.info(f"  - Artigos coletados: {total_articles_collected}")
         logging.info(f"  - Novos artigos salvos: {new_articles_count}")
         logging.info(f"  - Novas fontes: {new_sources_count}")
+        logging.info(
+            f"  - Domínios com circuito aberto/half-open: "
+            f"{health_stats['by_state']['open']}/{health_stats['by_state']['half_open']}"
+        )
         logging.info("=" * 80)
 
         return (new_articles_count, new_sources_count)
 
 
-    def _get_or_create_source(self, source_name: str, source_url: str):
-        """Helper para buscar ou criar fonte de notícia"""
-        news_source_model = self.news_sources_repo.find_by_url(source_url)
+    def _load_source_map(self):
+        """Carrega todas as fontes em memória, indexadas por URL e por nome (minúsculo)."""
+        self._sources_by_url = {}
+        self._sources_by_name = {}
+        self._pending_sources = {}
+        for source in self.news_sources_repo.list_all():
+            self._sources_by_url[source.url] = source
+            self._sources_by_name[source.name.lower()] = source
+
+    def _resolve_source(self, source_name: str, source_url: str):
+        """
+        Busca a fonte no mapa em memória; se não existir, registra uma nova fonte
+        pendente (sem ID), que será inserida no próximo flush.
+        """
+        news_source_model = self._sources_by_url.get(source_url)
 
         if not news_source_model:
-            news_source_model = self.news_sources_repo.find_by_name(source_name)
-            if news_source_model:
+            news_source_model = self._sources_by_name.get(source_name.lower())
+            if news_source_model and news_source_model.id:
                 logging.info(f"Fonte '{source_name}' já existe com URL diferente (ID={news_source_model.id})")
 
         if not news_source_model:
             try:
-                logging.info(f"Criando nova fonte: '{source_name}'")
-                new_source = NewsSource(name=source_name, url=source_url)
-                news_source_model = self.news_sources_repo.create(new_source)
-                news_source_model._is_new = True  
-            except IntegrityError:
-                logging.warning(f"Race condition ao criar fonte '{source_name}'. Buscando novamente.")
-                news_source_model = self.news_sources_repo.find_by_url(source_url)
-                if not news_source_model:
-                    news_source_model = self.news_sources_repo.find_by_name(source_name)
+                news_source_model = NewsSource(name=source_name, url=source_url)
             except Exception as e:
                 logging.error(f"Erro ao criar fonte '{source_name}': {e}")
                 return None
+            logging.info(f"Nova fonte pendente: '{source_name}'")
+            self._pending_sources[source_url] = news_source_model
+            self._sources_by_url[source_url] = news_source_model
+            self._sources_by_name[news_source_model.name.lower()] = news_source_model
 
         return news_source_model
+
+    def _flush_pending_sources(self) -> int:
+        """
+        Insere as fontes pendentes em lote e preenche seus IDs.
+
+        Returns:
+            Número de fontes efetivamente criadas
+        """
+        if not self._pending_sources:
+            return 0
+
+        pending = list(self._pending_sources.values())
+        self._pending_sources = {}
+
+        try:
+            created = self.news_sources_repo.bulk_create_ignore_conflicts(pending)
+        except Exception as e:
+            logging.error(f"Erro ao criar fontes em lote: {e}")
+            created = []
+
+        created_by_url = {source.url: source for source in created}
+        for model in pending:
+            if model.url in created_by_url:
+                model.id = created_by_url[model.url].id
+                continue
+
+            # Conflito: a fonte foi criada por outro worker ou já existe com outro nome/URL
+            logging.warning(f"Fonte '{model.name}' já existente no banco. Buscando novamente.")
+            existing = self.news_sources_repo.find_by_url(model.url) or self.news_sources_repo.find_by_name(model.name)
+            if existing:
+                model.id = existing.id
+
+        return len(created)
+
+    def _flush_pending(self, pending_articles: list) -> tuple:
+        """
+        Grava um lote de artigos validados: primeiro as fontes pendentes,
+        depois as notícias com um único INSERT ... ON CONFLICT DO NOTHING.
+
+        Args:
+            pending_articles: Lista de dicts {'source': NewsSource, 'fields': {...}}
+
+        Returns:
+            Tupla (artigos_salvos, fontes_criadas)
+        """
+        with self.metrics.timer('db_write'):
+            new_sources = self._flush_pending_sources()
+        if not pending_articles:
+            self.checkpoint.flush()
+            return 0, new_sources
+
+        models = []
+        for pending in pending_articles:
+            fields = pending['fields']
+            try:
+                models.append(News(source_id=pending['source'].id, **fields))
+            except Exception as e:
+                logging.error(f"    Erro ao salvar artigo '{fields['title']}': {e}")
+                self._mark(fields['url'], fields['topic_id'], CollectionCheckpoint.STAGE_SKIPPED, str(e))
+
+        try:
+            with self.metrics.timer('db_write'):
+                saved_ids = self.news_repo.bulk_create_ignore_conflicts(models)
+        except Exception as e:
+            logging.error(f"    Erro ao salvar lote de {len(models)} artigos: {e}")
+            # Artigos continuam como 'validated' e serão reprocessados ao retomar
+            self.checkpoint.flush()
+            return 0, new_sources
+
+        # Conflitos de URL também são finais: a notícia já está no banco
+        for model in models:
+            self._mark(model.url, model.topic_id, CollectionCheckpoint.STAGE_SAVED)
+        self.checkpoint.flush()
+
+        with self.metrics.timer('db_write'):
+            self.near_duplicates.flush(self.news_repo.find_ids_by_urls)
+
+        logging.info(f"    Lote salvo: {len(saved_ids)}/{len(models)} notícias inseridas.")
+        return len(saved_ids), new_sources
     
\ No newline at end of file
@@ -3,59 +3,232 @@ from app.repositories.news_source_repository import NewsSourceRepository
 from app.repositories.topic_repository import TopicRepository
 from app.repositories.user_news_source_repository import UserNewsSourceRepository
 from app.repositories.user_read_history_repository import UserReadHistoryRepository
-from app.services.user_custom_topic_service import UserCustomTopicService
+from app.repositories.user_repository import UserRepository
 from app.models.exceptions import UserNotFoundError, NewsNotFoundError
 from app.repositories.user_preferred_custom_topic_repository import UserPreferredCustomTopicRepository
+from app.repositories.news_search_repository import NewsSearchRepository
 from app.models.news import News, NewsValidationError
+from app.models.news_view import NewsView
 from app.models.news_source import NewsSource, NewsSourceValidationError
-from app.models.exceptions import NewsNotFoundError
-from app.extensions import db
-from typing import Optional
+from app.models.exceptions import NewsNotFoundError, SearchValidationError, SearchUnavailableError
+from app.utils.response_cache import ResponseCache
+from app.services.feed_ranking_service import FeedRankingService
+from app.services.read_history_buffer import ReadHistoryBuffer
+from app.services.search_index_service import SearchIndexService
+from app.utils.news_ranking import decayed_score
+from app.utils import news_search
+from app.utils.conditional_get import make_etag
+from app.utils.news_serializer import CARD, DETAIL, EMAIL
+from flask import current_app, has_app_context, has_request_context, request
+from datetime import datetime, timezone
+from typing import Callable, Optional
 import logging
 import math
 
 
 class NewsService():
-   
+    # Janela do feed "For You" e da newsletter, em dias
+    FOR_YOU_DAYS_LIMIT = 15
+    SEARCH_MAX_QUERY_LENGTH = 200
+
     def __init__(
         self,
         news_repo: NewsRepository | None = None,
         topic_repo: TopicRepository | None = None,
         user_news_source_repo: UserNewsSourceRepository | None = None,
-        user_history_repo: UserReadHistoryRepository | None = None
+        user_history_repo: UserReadHistoryRepository | None = None,
+        response_cache: ResponseCache | None = None,
+        feed_ranking: FeedRankingService | None = None,
+        search_repo: NewsSearchRepository | None = None,
+        search_index: SearchIndexService | None = None,
+        history_buffer: ReadHistoryBuffer | None = None,
+        user_repo: UserRepository | None = None
     ):
         self.news_repo = news_repo or NewsRepository()
         self.topic_repo = topic_repo or TopicRepository()
         self.user_news_source_repo = user_news_source_repo or UserNewsSourceRepository()
-        self.user_custom_topic_service = UserCustomTopicService()
-        self.user_history_repo = UserReadHistoryRepository()
+        self.user_history_repo = user_history_repo or UserReadHistoryRepository()
+        self.response_cache = response_cache
+        self.feed_ranking = feed_ranking
+        self.search_repo = search_repo or NewsSearchRepository()
+        self.search_index = search_index
+        self.history_buffer = history_buffer
+        self.user_repo = user_repo or UserRepository()
+
+    def _cached(self, key: str, builder: Callable[[], dict]) -> dict:
+        """
+        Busca a resposta no cache de respostas do app (ou a monta com builder).
 
-    def get_news_by_id(self, user_id: Optional[int], news_id: int) -> dict:
-        news = self.news_repo.find_by_id(news_id, user_id=user_id)
-        if not news:
-            raise NewsNotFoundError(f"Notícia com ID {news_id} não encontrada.")
+        O cache é o informado no construtor ou, se não houver, o registrado
+        em app.extensions['response_cache']. Sem nenhum dos dois, apenas
+        chama builder().
+        """
+        cache = self._get_response_cache()
+        return cache.get_or_set(key, builder) if cache else builder()
+
+    def _get_response_cache(self) -> ResponseCache | None:
+        if self.response_cache is None and has_app_context():
+            return current_app.extensions.get('response_cache')
+        return self.response_cache
+
+    def _get_feed_ranking(self) -> FeedRankingService | None:
+        feed_ranking = self.feed_ranking
+        if feed_ranking is None and has_app_context():
+            feed_ranking = current_app.extensions.get('feed_ranking')
+        return feed_ranking if feed_ranking is not None and feed_ranking.enabled else None
+
+    def _get_history_buffer(self) -> ReadHistoryBuffer | None:
+        history_buffer = self.history_buffer
+        if history_buffer is None and has_app_context():
+            history_buffer = current_app.extensions.get('read_history_buffer')
+        return history_buffer if history_buffer is not None and history_buffer.enabled else None
+
+    def _get_search(self) -> NewsSearchRepository | SearchIndexService:
+        """Full-text do PostgreSQL ou, em outros bancos, o índice em memória do app."""
+        if self.search_repo.available:
+            return self.search_repo
+        search_index = self.search_index
+        if search_index is None and has_app_context():
+            search_index = current_app.extensions.get('search_index')
+        return search_index or self.search_repo
+
+    def _content_version(self) -> str:
+        """Versão do conteúdo (última coleta finalizada), reaproveitada pelo cache de respostas."""
+        cache = self._get_response_cache()
+        return cache.version() if cache else '0'
+
+    def _overlay_favorites(self, news_list: list[dict], user_id: Optional[int]) -> list[dict]:
+        """
+        Aplica o is_favorited do usuário sobre notícias vindas do cache.
 
-        news_dict = {
-            "id": news.id,
-            "title": news.title,
-            "description": news.description,
-            "url": news.url,
-            "image_url": news.image_url,
-            "content": news.content,
-            "html": news.html,
-            "published_at": news.published_at.isoformat() if news.published_at else None,
-            "source_id": news.source_id,
-            "created_at": news.created_at.isoformat() if news.created_at else None,
-            "is_favorited": news.is_favorited, 
-        }
+        As entradas em cache são compartilhadas entre usuários (sempre com
+        is_favorited=False), então são copiadas antes de alterar.
+        """
+        if user_id is None:
+            return news_list
+        favorited_ids = self.news_repo.find_favorited_ids(user_id, [news["id"] for news in news_list])
+        return [{**news, "is_favorited": news["id"] in favorited_ids} for news in news_list]
+
+    def get_news_etag(self, user_id: Optional[int], news_id: int) -> Optional[str]:
+        """
+        Calcula o ETag do detail da notícia sem montar a resposta.
 
-        if news.source_name:
-            news_dict["source_name"] = news.source_name
+        Returns:
+            ETag (versão do conteúdo + ID + favorito do usuário) ou None se a
+            notícia não existir (a rota segue e responde 404)
+        """
+        if not self.news_repo.exists(news_id):
+            return None
+        favorited = user_id is not None and news_id in self.news_repo.find_favorited_ids(user_id, [news_id])
+        return make_etag('news', self._content_version(), news_id, favorited)
+
+    def get_topic_etag(self, topic_id: int, page: int = 1, per_page: int = 10, user_id: Optional[int] = None) -> str:
+        """
+        Calcula o ETag da página do tópico a partir dos IDs da página, da
+        versão do conteúdo e dos favoritos do usuário entre esses IDs.
+        """
+        news_ids = self.news_repo.find_ids_by_topic(topic_id, page, per_page)
+        favorited_ids = self.news_repo.find_favorited_ids(user_id, news_ids) if user_id is not None else set()
+        return make_etag(
+            'topic', topic_id, page, per_page, self._content_version(),
+            ','.join(map(str, news_ids)), ','.join(map(str, sorted(favorited_ids)))
+        )
+
+    def get_for_you_etag(self, user_id: int, page: int = 1, per_page: int = 10) -> str:
+        """
+        Calcula o ETag da página do feed "For You" a partir dos IDs da página
+        (na ordem do ranking), do total, da versão do conteúdo, da versão das
+        preferências e dos favoritos do usuário entre esses IDs.
 
-        if news.topic_name:
-            news_dict["topic_name"] = news.topic_name
+        O score exibido decai com o tempo e fica de fora: só a ordem conta.
+        """
+        feed_ranking = self._get_feed_ranking()
+        ranked_ids = feed_ranking.get_page(user_id, page, per_page) if feed_ranking is not None else None
+        if ranked_ids is not None:
+            news_ids = [news_id for news_id, _ in ranked_ids]
+        else:
+            rows = self.news_repo.rank_ids_for_user(
+                user_id,
+                self.user_news_source_repo.get_user_preferred_source_ids(user_id),
+                days_limit=self.FOR_YOU_DAYS_LIMIT,
+                limit=per_page,
+                offset=(page - 1) * per_page
+            )
+            news_ids = [row.id for row in rows]
+        favorited_ids = self.news_repo.find_favorited_ids(user_id, news_ids)
+        return make_etag(
+            'for-you', user_id, page, per_page, self._content_version(),
+            self.user_repo.get_preferences_version(user_id),
+            self.news_repo.count_recent(days_limit=self.FOR_YOU_DAYS_LIMIT),
+            ','.join(map(str, news_ids)), ','.join(map(str, sorted(favorited_ids)))
+        )
+
+    def get_search_etag(
+        self,
+        query: str,
+        language: Optional[str] = None,
+        cursor: Optional[str] = None,
+        per_page: int = 20,
+        user_id: Optional[int] = None
+    ) -> Optional[str]:
+        """
+        Calcula o ETag da página da busca a partir dos IDs da página, do
+        próximo cursor, da versão do conteúdo e dos favoritos do usuário.
 
-        return news_dict
+        A busca feita aqui é reaproveitada por search_news na mesma requisição.
+
+        Returns:
+            ETag, ou None para busca inválida ou indisponível (a rota segue e
+            responde o erro)
+        """
+        try:
+            page, next_cursor = self._search_page(query, language, cursor, per_page)
+        except (SearchValidationError, SearchUnavailableError):
+            return None
+        news_ids = [news_id for news_id, _ in page]
+        favorited_ids = self.news_repo.find_favorited_ids(user_id, news_ids) if user_id is not None else set()
+        return make_etag(
+            'search', " ".join((query or "").split()), language, cursor, per_page, self._content_version(),
+            ','.join(map(str, news_ids)), next_cursor, ','.join(map(str, sorted(favorited_ids)))
+        )
+
+    def get_favorite_etag(self, user_id: int, page: int = 1, per_page: int = 20) -> str:
+        """
+        Calcula o ETag da página de favoritas a partir dos IDs da página, do
+        total e da versão do conteúdo.
+        """
+        news_ids = self.news_repo.find_favorite_ids(user_id, page, per_page)
+        return make_etag(
+            'saved', user_id, page, per_page, self._content_version(),
+            self.news_repo.count_favorites_by_user(user_id), ','.join(map(str, news_ids))
+        )
+
+    def get_history_etag(self, user_id: int, page: int = 1, per_page: int = 10) -> str:
+        """
+        Calcula o ETag da página do histórico a partir das leituras da página
+        (ID e read_at), do total, da versão do conteúdo e dos favoritos do
+        usuário entre essas notícias.
+        """
+        reads = self.user_history_repo.get_user_history_ids(user_id, page, per_page)
+        favorited_ids = self.news_repo.find_favorited_ids(user_id, [news_id for news_id, _ in reads])
+        return make_etag(
+            'history', user_id, page, per_page, self._content_version(),
+            self.user_history_repo.count_user_history(user_id),
+            ','.join(f"{news_id}@{read_at.isoformat()}" for news_id, read_at in reads),
+            ','.join(map(str, sorted(favorited_ids)))
+        )
+
+    def get_news_by_id(self, user_id: Optional[int], news_id: int) -> dict:
+        news_dict = self._cached(f"news:id:{news_id}", lambda: self._build_news_detail(news_id))
+        return self._overlay_favorites([news_dict], user_id)[0]
+
+    def _build_news_detail(self, news_id: int) -> dict:
+        """Monta o detalhe da notícia, sem dados do usuário."""
+        news = self.news_repo.find_by_id(news_id)
+        if not news:
+            raise NewsNotFoundError(f"Notícia com ID {news_id} não encontrada.")
+
+        return DETAIL.serialize(news)
 
     def get_all_news(self, user_id: Optional[int], page: int = 1, per_page: int = 10):
         """
@@ -70,33 +243,11 @@ class NewsService():
             Dict com notícias, paginação e metadados
         """
 
-        paginated_news = self.news_repo.list_all(page=page, per_page=per_page, user_id=user_id)
+        rows = self.news_repo.list_all_cards(page=page, per_page=per_page, user_id=user_id)
 
         total_count = self.news_repo.count_all()
 
-        news_list = []
-        for news in paginated_news:
-            news_dict = {
-                "id": news.id,
-                "title": news.title,
-                "description": news.description,
-                "url": news.url,
-                "image_url": news.image_url,
-                "content": news.content,
-                "html": news.html,
-                "published_at": news.published_at.isoformat() if news.published_at else None,
-                "source_id": news.source_id,
-                "created_at": news.created_at.isoformat() if news.created_at else None,
-                "is_favorited": news.is_favorited, # Adiciona o campo de favorito
-            }
-
-            if news.source_name:
-                news_dict["source_name"] = news.source_name
-
-            if news.topic_name:
-                news_dict["topic_name"] = news.topic_name
-
-            news_list.append(news_dict)
+        news_list = CARD.serialize_many(rows)
 
         total_pages = math.ceil(total_count / per_page) if total_count > 0 else 1
 
@@ -114,10 +265,14 @@ class NewsService():
         """
         Retorna feed personalizado "For You" com ranking baseado em preferências do usuário.
 
-        Sistema de scoring híbrido (últimos 15 dias):
-        - Score temporal: 300 (24h), 150 (1-2d), 75 (2-5d), 25 (5+d)
-        - Fonte preferida: +100 pontos
-        - Custom topic match: +200 pontos por match
+        Ranking dos últimos 15 dias (ver app/utils/news_ranking.py):
+        - Score base da notícia: decaimento contínuo (meia-vida de 24h) e qualidade da fonte
+        - Fonte preferida: x1.41
+        - Custom topic no título/descrição: x2 por match
+
+        A ordem vem do estado do ranking do usuário (FeedRankingService),
+        atualizado por mudança de preferências e por coleta; sem ele, ou
+        além do que o estado guarda, a ordenação e a paginação ficam no banco.
 
         Args:
             user_id: ID do usuário
@@ -128,60 +283,11 @@ class NewsService():
             Dict com notícias rankeadas por score, paginação e metadados
         """
         try:
-            preferred_source_ids = self.user_news_source_repo.get_user_preferred_source_ids(user_id)
-            custom_topics = self.user_custom_topic_service.get_user_preferred_topics(user_id)
-
-            recent_news = self.news_repo.get_recent_news_with_base_score(
-                user_id=user_id,
-                preferred_source_ids=preferred_source_ids,
-                days_limit=15
-            )
-
-            # Calcular score final adicionando score de custom topics
-            for news in recent_news:
-                base_score = (news.time_score or 0) + (news.source_score or 0)
-
-                topic_score = self._calculate_topic_score(news, custom_topics)
-
-                setattr(news, 'total_score', base_score + topic_score)
-
-            # Ordenar por score total (decrescente) e published_at (decrescente) como desempate
-            sorted_news = sorted(
-                recent_news,
-                key=lambda x: (getattr(x, 'total_score', 0), x.published_at),
-                reverse=True
-            )
-
-            # Paginação manual
-            total_count = len(sorted_news)
-            start_index = (page - 1) * per_page
-            end_index = start_index + per_page
-            paginated_news = sorted_news[start_index:end_index]
-
-            news_list = []
-            for news in paginated_news:
-                news_dict = {
-                    "id": news.id,
-                    "title": news.title,
-                    "description": news.description,
-                    "url": news.url,
-                    "image_url": news.image_url,
-                    "content": news.content,
-                    "html": news.html,
-                    "published_at": news.published_at.isoformat() if news.published_at else None,
-                    "source_id": news.source_id,
-                    "created_at": news.created_at.isoformat() if news.created_at else None,
-                    "is_favorited": news.is_favorited,
-                    "score": getattr(news, 'total_score', 0),  
-                }
-
-                if news.source_name:
-                    news_dict["source_name"] = news.source_name
-
-                if news.topic_name:
-                    news_dict["topic_name"] = news.topic_name
-
-                news_list.append(news_dict)
+            news_list = self._get_feed_page(user_id, page, per_page)
+            if news_list is None:
+                ranked_news = self._get_ranked_news(user_id, page, per_page)
+                news_list = [CARD.serialize(news, score=round(news.total_score, 2)) for news in ranked_news]
+            total_count = self.news_repo.count_recent(days_limit=self.FOR_YOU_DAYS_LIMIT)
 
             total_pages = math.ceil(total_count / per_page) if total_count > 0 else 1
 
@@ -199,59 +305,141 @@ class NewsService():
             print(f"Erro no feed personalizado: {e}")
             return self.get_all_news(user_id, page, per_page)
 
-    def _calculate_topic_score(self, news: News, custom_topics: list) -> int:
+    def _get_feed_page(self, user_id: int, page: int, per_page: int) -> Optional[list[dict]]:
         """
-        Calcula score baseado em matches de custom topics no conteúdo da notícia.
+        Página do feed a partir do estado do ranking do usuário.
+
+        Returns:
+            Cards serializados na ordem do ranking, ou None se o estado estiver
+            desativado ou não cobrir a página
+        """
+        feed_ranking = self._get_feed_ranking()
+        if feed_ranking is None:
+            return None
+        ranked_ids = feed_ranking.get_page(user_id, page, per_page)
+        if ranked_ids is None:
+            return None
+
+        rows = {row.id: row for row in self.news_repo.find_cards_by_ids([news_id for news_id, _ in ranked_ids], user_id)}
+        now = datetime.now(timezone.utc)
+        return [
+            CARD.serialize(rows[news_id], score=round(decayed_score(rank, now), 2))
+            for news_id, rank in ranked_ids if news_id in rows
+        ]
+
+    def _get_ranked_news(self, user_id: int, page: int, per_page: int) -> list:
+        """Página do ranking "For You" (scores, ordenação e LIMIT/OFFSET no banco)."""
+        preferred_source_ids = self.user_news_source_repo.get_user_preferred_source_ids(user_id)
+        return self.news_repo.get_recent_news_with_base_score(
+            user_id=user_id,
+            preferred_source_ids=preferred_source_ids,
+            days_limit=self.FOR_YOU_DAYS_LIMIT,
+            page=page,
+            per_page=per_page
+        )
+
+    def search_news(
+        self,
+        query: str,
+        language: Optional[str] = None,
+        cursor: Optional[str] = None,
+        per_page: int = 20,
+        user_id: Optional[int] = None
+    ) -> dict:
+        """
+        Busca textual em título, descrição e texto das notícias.
 
         Args:
-            news: Modelo de notícia
-            custom_topics: Lista de custom topics do usuário
+            query: Texto da busca ("frase exata", -excluir, OR)
+            language: 'pt' ou 'en' restringe ao idioma; None busca em todos
+            cursor: next_cursor da página anterior
+            per_page: Quantidade de itens por página
+            user_id: ID do usuário (status de favorito)
 
         Returns:
-            Score total baseado em matches (200 pontos por match)
+            Dict com notícias por relevância e o cursor da próxima página
+
+        Raises:
+            SearchValidationError: Busca, idioma ou cursor inválidos
+            SearchUnavailableError: Banco sem busca textual e sem índice em memória
+        """
+        page, next_cursor = self._search_page(query, language, cursor, per_page)
+
+        rows = {row.id: row for row in self.news_repo.find_cards_by_ids([news_id for news_id, _ in page], user_id)}
+        news_list = [
+            CARD.serialize(rows[news_id], score=round(rank, 4))
+            for news_id, rank in page if news_id in rows
+        ]
+
+        return {
+            "news": news_list,
+            "pagination": {
+                "per_page": per_page,
+                "next_cursor": next_cursor
+            }
+        }
+
+    def _search_page(
+        self,
+        query: str,
+        language: Optional[str],
+        cursor: Optional[str],
+        per_page: int
+    ) -> tuple[list[tuple[int, float]], Optional[str]]:
         """
-        if not custom_topics:
-            return 0
+        Valida a busca e retorna a página de (news_id, rank) e o próximo cursor.
 
-        score = 0
-        # Concatenar título, descrição e conteúdo para busca
-        text_content = f"{news.title or ''} {news.description or ''} {news.content or ''}".lower()
+        Dentro de uma requisição o resultado fica guardado no environ, então o
+        ETag (get_search_etag) e a resposta (search_news) fazem uma única busca.
+
+        Raises:
+            SearchValidationError: Busca, idioma ou cursor inválidos
+            SearchUnavailableError: Banco sem busca textual e sem índice em memória
+        """
+        query = " ".join((query or "").split())
+        memo_key = (query, language, cursor, per_page)
+        memo = request.environ.setdefault('news.search_pages', {}) if has_request_context() else {}
+        if memo_key in memo:
+            return memo[memo_key]
+
+        if not query:
+            raise SearchValidationError("q", "não pode ser vazia.")
+        if len(query) > self.SEARCH_MAX_QUERY_LENGTH:
+            raise SearchValidationError("q", f"tamanho inválido (..{self.SEARCH_MAX_QUERY_LENGTH}).")
+        if language is not None and language not in news_search.TEXT_SEARCH_CONFIGS:
+            raise SearchValidationError("lang", "deve ser 'pt' ou 'en'.")
+        try:
+            after = news_search.decode_cursor(cursor) if cursor else None
+        except ValueError:
+            raise SearchValidationError("cursor", "inválido.")
 
-        for topic in custom_topics:
-            # O tópico é um dicionário, ex: {'id': 1, 'name': 'tecnologia'}
-            topic_name = topic.get('name', '').lower()
-            if topic_name and topic_name in text_content:
-                score += 200 # Adiciona 200 pontos para cada match
+        # Um resultado a mais indica se há próxima página
+        results = self._get_search().search(query, language, limit=per_page + 1, after=after)
+        page, has_more = results[:per_page], len(results) > per_page
 
-        return score
+        next_cursor = None
+        if has_more:
+            last_id, last_rank = page[-1]
+            next_cursor = news_search.encode_cursor(last_rank, last_id)
 
+        memo[memo_key] = (page, next_cursor)
+        return page, next_cursor
 
     def get_news_by_topic(self, topic_id: int, page: int = 1, per_page: int = 10, user_id: Optional[int] = None) -> dict:
         """Busca notícias paginadas por um tópico específico."""
-        paginated_news = self.news_repo.find_by_topic(topic_id, page, per_page, user_id)
+        result = self._cached(
+            f"news:topic:{topic_id}:page={page}:per_page={per_page}",
+            lambda: self._build_topic_page(topic_id, page, per_page)
+        )
+        return {**result, "news": self._overlay_favorites(result["news"], user_id)}
+
+    def _build_topic_page(self, topic_id: int, page: int, per_page: int) -> dict:
+        """Monta a página de notícias do tópico, sem dados do usuário."""
+        rows = self.news_repo.find_cards_by_topic(topic_id, page, per_page, None)
 
         total_count = self.news_repo.count_by_topic(topic_id)
 
-        news_list = []
-        for news in paginated_news:
-            news_dict = {
-                "id": news.id,
-                "title": news.title,
-                "description": news.description,
-                "url": news.url,
-                "image_url": news.image_url,
-                "content": news.content,
-                "html": news.html,
-                "published_at": news.published_at.isoformat() if news.published_at else None,
-                "source_id": news.source_id,
-                "topic_id": news.topic_id,
-                "is_favorited": news.is_favorited,
-            }
-            if news.source_name:
-                news_dict["source_name"] = news.source_name
-            if news.topic_name:
-                news_dict["topic_name"] = news.topic_name
-            news_list.append(news_dict)
+        news_list = CARD.serialize_many(rows)
 
         total_pages = math.ceil(total_count / per_page) if total_count > 0 else 1
 
@@ -277,35 +465,12 @@ class NewsService():
         Returns:
             Dict com notícias favoritas, paginação e metadados
         """
-        paginated_news = self.news_repo.list_favorites_by_user(user_id, page, per_page)
-
-        # Para contar o total, vamos buscar todas as favoritas (sem paginação) e contar
-        all_favorites = self.news_repo.list_favorites_by_user(user_id, page=1, per_page=1000000)
-        total_count = len(all_favorites)
-
-        news_list = []
-        for news in paginated_news:
-            news_dict = {
-                "id": news.id,
-                "title": news.title,
-                "description": news.description,
-                "url": news.url,
-                "image_url": news.image_url,
-                "content": news.content,
-                "html": news.html,
-                "published_at": news.published_at.isoformat() if news.published_at else None,
-                "source_id": news.source_id,
-                "created_at": news.created_at.isoformat() if news.created_at else None,
-                "is_favorited": True,  # Sempre True já que são favoritas
-            }
+        rows = self.news_repo.list_favorite_cards(user_id, page, per_page)
 
-            if news.source_name:
-                news_dict["source_name"] = news.source_name
+        total_count = self.news_repo.count_favorites_by_user(user_id)
 
-            if news.topic_name:
-                news_dict["topic_name"] = news.topic_name
-
-            news_list.append(news_dict)
+        # is_favorited sempre True, já que são favoritas
+        news_list = CARD.serialize_many(rows)
 
         total_pages = math.ceil(total_count / per_page) if total_count > 0 else 1
 
@@ -319,10 +484,17 @@ class NewsService():
             }
         }
     
-    def save_history(self, user_id: int, news_id: int):
+    def save_history(self, user_id: int, news_id: int) -> None:
+        """
+        Registra a leitura da notícia: no buffer write-behind do app, se
+        ativo, ou direto no banco (upsert de uma leitura por dia).
+        """
         try:
-            created_history = self.user_history_repo.create(user_id, news_id)
-            return created_history
+            history_buffer = self._get_history_buffer()
+            if history_buffer is not None:
+                history_buffer.add(user_id, news_id)
+                return
+            self.user_history_repo.create(user_id, news_id)
         except (UserNotFoundError,NewsNotFoundError) as e:
             raise e
         except Exception as e:
@@ -337,40 +509,14 @@ class NewsService():
                 per_page=per_page
             )
             
-            news_list = []
-            for history_entity, news_entity in results:
-                news_model = News.from_entity(news_entity)
-                
-                from app.entities.user_saved_news_entity import UserSavedNewsEntity
-                favorite_check = db.session.query(UserSavedNewsEntity).filter_by(
-                    user_id=user_id,
-                    news_id=news_model.id,
-                    is_favorite=True
-                ).first()
-                
-                news_dict = {
-                    "id": news_model.id,
-                    "title": news_model.title,
-                    "description": news_model.description,
-                    "url": news_model.url,
-                    "image_url": news_model.image_url,
-                    "content": news_model.content,
-                    "html": news_model.html,
-                    "published_at": news_model.published_at.isoformat() if news_model.published_at else None,
-                    "source_id": news_model.source_id,
-                    "topic_id": news_model.topic_id,
-                    "created_at": news_model.created_at.isoformat() if news_model.created_at else None,
-                    "is_favorited": favorite_check is not None,
-                    "read_at": history_entity.read_at.isoformat(),
-                }
-                
-                if news_model.source_name:
-                    news_dict["source_name"] = news_model.source_name
-                
-                if news_model.topic_name:
-                    news_dict["topic_name"] = news_model.topic_name
-                
-                news_list.append(news_dict)
+            news_models = [(history_entity, NewsView.from_entity(news_entity)) for history_entity, news_entity in results]
+            # Favoritos de toda a página em uma única consulta
+            favorited_ids = self.news_repo.find_favorited_ids(user_id, [news.id for _, news in news_models])
+
+            news_list = [
+                CARD.serialize(news, is_favorited=news.id in favorited_ids, read_at=history_entity.read_at)
+                for history_entity, news in news_models
+            ]
             
             total_pages = math.ceil(total_count / per_page) if total_count > 0 else 1
             
@@ -395,46 +541,8 @@ class NewsService():
     # get for you news adaptada para retornar noticias em um formato diferente 
     def get_news_to_email(self, user_id: int, page: int = 1, per_page: int = 10):
         try:
-            preferred_source_ids = self.user_news_source_repo.get_user_preferred_source_ids(user_id)
-            custom_topics = self.user_custom_topic_service.get_user_preferred_topics(user_id)
-
-            recent_news = self.news_repo.get_recent_news_with_base_score(
-                user_id=user_id,
-                preferred_source_ids=preferred_source_ids,
-                days_limit=15
-            )
-
-            for news in recent_news:
-                base_score = (news.time_score or 0) + (news.source_score or 0)
-                topic_score = self._calculate_topic_score(news, custom_topics)
-                setattr(news, 'total_score', base_score + topic_score)
-
-            sorted_news = sorted(
-                recent_news,
-                key=lambda x: (getattr(x, 'total_score', 0), x.published_at),
-                reverse=True
-            )
-
-            total_count = len(sorted_news)
-            start_index = (page - 1) * per_page
-            end_index = start_index + per_page
-            paginated_news = sorted_news[start_index:end_index]
-
-            news_list = []
-            for news in paginated_news:
-                news_dict = {
-                    "category": getattr(news, "topic_name", "Geral"),
-                    "title": news.title,
-                    "img_url": news.image_url or "",
-                    "summary": news.description or "",
-                    "content": news.content or "",  # Campo adicionado para IA gerar resumos ricos
-                    "source": getattr(news, "source_name", "Fonte Desconhecida"),
-                    "date": news.published_at.strftime("%d/%m/%Y") if news.published_at else "",
-                    "url": news.url
-                }
-                news_list.append(news_dict)
-
-            return news_list
+            ranked_news = self._get_ranked_news(user_id, page, per_page)
+            return EMAIL.serialize_many(ranked_news)
 
         except Exception as e:
             print(f"Erro no feed personalizado: {e}")
@@ -1,6 +1,7 @@
 from app.repositories.news_source_repository import NewsSourceRepository
 from app.repositories.user_news_source_repository import UserNewsSourceRepository
 from app.models.exceptions import NewsSourceNotFoundError, NewsSourceAlreadyAttachedError
+from app.utils.events import preferences_changed
 from sqlalchemy.exc import IntegrityError
 
 
@@ -35,6 +36,8 @@ class NewsSourceService():
             self.user_source_repo.attach(user_id, source_id)
         except IntegrityError as e:
             raise e
+        preferences_changed.send(user_id)
 
     def detach_source_from_user(self, user_id: int, source_id: int):
-        self.user_source_repo.detach(user_id, source_id)
\ No newline at end of file
+        self.user_source_repo.detach(user_id, source_id)
+        preferences_changed.send(user_id)
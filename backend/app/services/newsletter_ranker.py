@@ -0,0 +1,142 @@
+import logging
+import numpy as np
+
+from app.repositories.news_repository import NewsRepository
+from app.repositories.user_news_source_repository import UserNewsSourceRepository
+from app.repositories.user_preferred_custom_topic_repository import UserPreferredCustomTopicRepository
+from app.utils import news_ranking
+from app.utils.news_serializer import EMAIL
+
+
+class NewsletterRanker:
+    """
+    Ranking "For You" de vários destinatários da newsletter de uma vez.
+
+    Carrega a janela de notícias recentes uma única vez e monta, por lote de
+    usuários, a matriz usuários x notícias com o mesmo rank do feed
+    (base_score + boosts de fonte preferida e de custom topics, ver
+    app/utils/news_ranking.py). O top-k de cada usuário sai de um
+    argpartition; só as notícias escolhidas são carregadas com o corpo.
+    """
+
+    # Usuários por matriz: limita a memória em USER_CHUNK_SIZE x notícias da janela
+    USER_CHUNK_SIZE = 500
+
+    def __init__(
+        self,
+        news_repo: NewsRepository | None = None,
+        user_news_source_repo: UserNewsSourceRepository | None = None,
+        custom_topic_repo: UserPreferredCustomTopicRepository | None = None,
+        days_limit: int = 15
+    ):
+        self.news_repo = news_repo or NewsRepository()
+        self.user_news_source_repo = user_news_source_repo or UserNewsSourceRepository()
+        self.custom_topic_repo = custom_topic_repo or UserPreferredCustomTopicRepository()
+        self.days_limit = days_limit
+
+    def rank_for_users(self, user_ids: list[int], per_user: int = 5) -> dict[int, list[dict]]:
+        """
+        Retorna as notícias da newsletter de cada usuário.
+
+        Args:
+            user_ids: IDs dos destinatários
+            per_user: Quantidade de notícias por usuário
+
+        Returns:
+            Dicionário {user_id: itens no formato EMAIL}, na ordem do ranking
+        """
+        user_ids = list(dict.fromkeys(user_ids))
+        articles = self.news_repo.list_recent_for_ranking(days_limit=self.days_limit)
+        if not user_ids or not articles:
+            return {user_id: [] for user_id in user_ids}
+
+        top_ids = self.rank_ids(user_ids, articles, per_user)
+
+        chosen = {news_id for ids in top_ids.values() for news_id in ids}
+        views = self.news_repo.find_for_email_by_ids(list(chosen))
+        # Cada notícia é serializada uma vez; os usuários recebem cópias
+        items = {news_id: EMAIL.serialize(view) for news_id, view in views.items()}
+
+        logging.info(
+            f"Newsletter: {len(user_ids)} usuários rankeados sobre {len(articles)} notícias "
+            f"({len(chosen)} notícias distintas selecionadas)."
+        )
+        return {
+            user_id: [dict(items[news_id]) for news_id in ids if news_id in items]
+            for user_id, ids in top_ids.items()
+        }
+
+    def rank_ids(self, user_ids: list[int], articles: list, per_user: int) -> dict[int, list[int]]:
+        """
+        Top-k de IDs de notícias por usuário.
+
+        Args:
+            user_ids: IDs dos usuários
+            articles: Rows (id, title, description, source_id, base_score), na
+                ordem de desempate (published_at e id decrescentes)
+            per_user: Tamanho do top-k
+
+        Returns:
+            Dicionário {user_id: [news_id, ...]}
+        """
+        news_ids = np.array([article.id for article in articles])
+        base_scores = np.array([article.base_score for article in articles], dtype=float)
+
+        source_columns = {}
+        article_sources = np.array(
+            [source_columns.setdefault(article.source_id, len(source_columns)) for article in articles]
+        )
+
+        top_ids = {}
+        for start in range(0, len(user_ids), self.USER_CHUNK_SIZE):
+            chunk = user_ids[start:start + self.USER_CHUNK_SIZE]
+            ranks = base_scores + self._source_boosts(chunk, source_columns, article_sources)
+            ranks += self._topic_boosts(chunk, articles)
+            for user_id, positions in zip(chunk, self._top_k(ranks, per_user)):
+                top_ids[user_id] = news_ids[positions].tolist()
+        return top_ids
+
+    def _source_boosts(self, user_ids: list[int], source_columns: dict, article_sources) -> np.ndarray:
+        """Matriz usuários x notícias com PREFERRED_SOURCE_BOOST onde a fonte é preferida."""
+        preferred = np.zeros((len(user_ids), len(source_columns)), dtype=bool)
+        source_ids_by_user = self.user_news_source_repo.get_preferred_source_ids_by_users(user_ids)
+        for row, user_id in enumerate(user_ids):
+            columns = [source_columns[s] for s in source_ids_by_user.get(user_id, ()) if s in source_columns]
+            preferred[row, columns] = True
+        return preferred[:, article_sources] * news_ranking.PREFERRED_SOURCE_BOOST
+
+    def _topic_boosts(self, user_ids: list[int], articles: list) -> np.ndarray | float:
+        """
+        Matriz usuários x notícias com CUSTOM_TOPIC_BOOST por custom topic no
+        título/descrição: (usuários x tópicos) @ (tópicos x notícias).
+        """
+        names_by_user = self.custom_topic_repo.list_topic_names_by_users(user_ids)
+        if not names_by_user:
+            return 0.0
+
+        topic_rows = {}
+        user_topics = []
+        for user_id in user_ids:
+            names = {name.lower() for name in names_by_user.get(user_id, ()) if name}
+            user_topics.append([topic_rows.setdefault(name, len(topic_rows)) for name in names])
+
+        membership = np.zeros((len(user_ids), len(topic_rows)), dtype=np.float32)
+        for row, columns in enumerate(user_topics):
+            membership[row, columns] = 1.0
+
+        texts = [news_ranking.searchable_text(article.title, article.description) for article in articles]
+        matches = np.zeros((len(topic_rows), len(articles)), dtype=np.float32)
+        for name, row in topic_rows.items():
+            matches[row] = [name in text for text in texts]
+
+        return (membership @ matches) * news_ranking.CUSTOM_TOPIC_BOOST
+
+    @staticmethod
+    def _top_k(ranks: np.ndarray, k: int) -> np.ndarray:
+        """Posições das k maiores notas de cada linha, em ordem decrescente (empate: menor posição)."""
+        k = min(k, ranks.shape[1])
+        if k <= 0:
+            return np.empty((ranks.shape[0], 0), dtype=int)
+        positions = np.sort(np.argpartition(-ranks, k - 1, axis=1)[:, :k], axis=1)
+        order = np.argsort(-np.take_along_axis(ranks, positions, axis=1), axis=1, kind="stable")
+        return np.take_along_axis(positions, order, axis=1)
@@ -4,6 +4,7 @@ import logging
 from typing import Optional, Dict, List
 from app.repositories.user_repository import UserRepository
 from app.services.news_service import NewsService
+from app.services.newsletter_ranker import NewsletterRanker
 from app.services.ai_service import AIService
 from app.services.mail_service import MailService
 
@@ -19,12 +20,16 @@ class NewsletterService:
     - Send individual newsletters
     """
 
+    # News items per newsletter
+    NEWS_PER_NEWSLETTER = 5
+
     def __init__(
         self,
         user_repo: Optional[UserRepository] = None,
         news_service: Optional[NewsService] = None,
         ai_service: Optional[AIService] = None,
-        mail_service: Optional[MailService] = None
+        mail_service: Optional[MailService] = None,
+        newsletter_ranker: Optional[NewsletterRanker] = None
     ):
         """
         Initialize NewsletterService with dependency injection.
@@ -34,25 +39,42 @@ class NewsletterService:
             news_service: Service for news data retrieval
             ai_service: Service for AI content generation
             mail_service: Service for email sending
+            newsletter_ranker: Batch ranker for all recipients' news
         """
         self.user_repo = user_repo or UserRepository()
         self.news_service = news_service or NewsService()
         self.ai_service = ai_service or AIService()
         self.mail_service = mail_service or MailService()
+        self.newsletter_ranker = newsletter_ranker or NewsletterRanker()
+
+    def get_news_for_users(self, user_ids: List[int]) -> Dict[int, List[Dict]]:
+        """
+        Rank the news of all recipients in one batch.
+
+        Args:
+            user_ids: Recipient user IDs
+
+        Returns:
+            dict: {user_id: news items}, same format as get_news_to_email
+        """
+        return self.newsletter_ranker.rank_for_users(user_ids, per_user=self.NEWS_PER_NEWSLETTER)
 
-    def send_newsletter_to_user(self, user) -> Dict[str, any]:
+    def send_newsletter_to_user(self, user, news_data: Optional[List[Dict]] = None) -> Dict[str, any]:
         """
         Main orchestration method for sending newsletter to a single user.
 
         Args:
             user: User object containing user information
+            news_data: News items already ranked by get_news_for_users
+                (fetched for this user alone when omitted)
 
         Returns:
             dict: {'success': bool, 'reason': str | None}
         """
         try:
             # Get personalized news for user
-            news_data = self._get_user_news_data(user.id)
+            if news_data is None:
+                news_data = self._get_user_news_data(user.id)
 
             if not news_data:
                 return {
@@ -324,7 +346,7 @@ class NewsletterService:
             List of news dictionaries
         """
         try:
-            return self.news_service.get_news_to_email(user_id, page=1, per_page=5)
+            return self.news_service.get_news_to_email(user_id, page=1, per_page=self.NEWS_PER_NEWSLETTER)
         except Exception as e:
             logging.error(f"Error fetching news for user {user_id}: {e}")
             raise
@@ -0,0 +1,137 @@
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+from app.entities.user_read_history_entity import read_day_of
+from app.repositories.user_read_history_repository import UserReadHistoryRepository
+
+
+class ReadHistoryBuffer:
+    """
+    Buffer write-behind do histórico de leitura, compartilhado pelas requisições.
+
+    POST /news/<id>/history só enfileira a leitura; o lote é gravado com um
+    único upsert (UserReadHistoryRepository.upsert_many) quando chega a
+    max_size leituras ou quando a mais antiga espera flush_interval segundos
+    (verificado a cada leitura e por uma thread em segundo plano). Leituras
+    repetidas da mesma notícia no mesmo dia viram uma só, com o read_at mais
+    recente.
+
+    Em troca, a leitura só aparece em GET /news/history depois da gravação,
+    notícias ou usuários inexistentes são descartados sem erro e um lote que
+    falha é perdido (só registrado no log).
+
+    Args:
+        max_size: Leituras no buffer até a gravação (0 desativa o buffer)
+        flush_interval: Segundos máximos de espera de uma leitura
+        app: App Flask usado pela thread de gravação (sem ele, não há thread)
+    """
+
+    def __init__(
+        self,
+        repo_factory=UserReadHistoryRepository,
+        max_size: int = 0,
+        flush_interval: float = 5.0,
+        app=None
+    ):
+        self.repo_factory = repo_factory
+        self.max_size = max_size
+        self.flush_interval = flush_interval
+        self.app = app
+        self._reads: dict[tuple[int, int, object], datetime] = {}
+        self._oldest: Optional[float] = None
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    def __len__(self) -> int:
+        return len(self._reads)
+
+    def add(self, user_id: int, news_id: int, read_at: Optional[datetime] = None) -> None:
+        """Enfileira uma leitura; grava o lote se ele encheu ou expirou."""
+        read_at = read_at or datetime.now(timezone.utc)
+        key = (user_id, news_id, read_day_of(read_at))
+        with self._lock:
+            if key not in self._reads or self._reads[key] < read_at:
+                self._reads[key] = read_at
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+            due = len(self._reads) >= self.max_size or self._expired()
+        self._ensure_thread()
+        if due:
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Grava as leituras enfileiradas.
+
+        Returns:
+            Quantidade de leituras gravadas (0 se o buffer estava vazio ou a gravação falhou)
+        """
+        with self._flush_lock:
+            with self._lock:
+                reads, self._reads, self._oldest = self._reads, {}, None
+            if not reads:
+                return 0
+            batch = [(user_id, news_id, read_at) for (user_id, news_id, _), read_at in reads.items()]
+            try:
+                return self.repo_factory().upsert_many(batch)
+            except Exception as e:
+                logging.error(f"Erro ao gravar {len(batch)} leituras do buffer de histórico: {e}", exc_info=True)
+                return 0
+
+    def close(self) -> None:
+        """Para a thread de gravação e grava o que restou."""
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._flush_in_app()
+
+    def _expired(self) -> bool:
+        return self._oldest is not None and time.monotonic() - self._oldest >= self.flush_interval
+
+    def _ensure_thread(self) -> None:
+        # Criada na primeira leitura (depois do fork dos workers do Gunicorn)
+        if self.app is None or self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="read-history-buffer", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while not self._wakeup.wait(self.flush_interval):
+            if self._expired():
+                self._flush_in_app()
+
+    def _flush_in_app(self) -> int:
+        if self.app is None:
+            return self.flush()
+        with self.app.app_context():
+            return self.flush()
+
+
+def create_read_history_buffer(app) -> ReadHistoryBuffer:
+    """
+    Cria o buffer a partir da configuração do app (chaves
+    READ_HISTORY_BUFFER_SIZE e READ_HISTORY_FLUSH_INTERVAL) e o grava na
+    saída do processo.
+    """
+    import atexit
+
+    buffer = ReadHistoryBuffer(
+        max_size=int(app.config.get("READ_HISTORY_BUFFER_SIZE", 0)),
+        flush_interval=float(app.config.get("READ_HISTORY_FLUSH_INTERVAL", 5)),
+        app=app,
+    )
+    if buffer.enabled:
+        atexit.register(buffer.close)
+    return buffer
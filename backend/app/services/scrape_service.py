@@ -1,5 +1,6 @@
 import os
 import json
+import time
 import logging
 from datetime import datetime
 from typing import Dict, Optional
@@ -10,10 +11,16 @@ from bs4 import BeautifulSoup
 import bleach
 from newspaper import Article, Config
 from newspaper.exceptions import ArticleException
+from newspaper import network
 import requests
-import difflib
+from dateutil import parser as date_parser
 import html # Importar para desescapar entidades HTML
 from app.utils.scraping_blacklist import ScrapingBlacklist
+from app.utils.domain_health import DomainHealth
+from app.utils.scrape_cache import ScrapeCache
+from app.utils.domain_profile_store import DomainProfileStore
+from app.utils.collection_metrics import CollectionMetrics
+from app.utils.near_duplicate_index import NearDuplicateIndex
 
 
 class ScrapeService:
@@ -61,6 +68,24 @@ class ScrapeService:
         'nav', 'header', 'footer', 'aside',
     }
     
+    # Identificadores CSS seguros para montar seletores de perfis de domínio
+    CSS_IDENTIFIER_RE = re.compile(r'^-?[A-Za-z_][\w-]*$')
+
+    # Meta tags lidas no caminho rápido (sem newspaper4k), em ordem de preferência
+    AUTHOR_META_TAGS = [
+        {'name': 'author'}, {'property': 'article:author'}, {'name': 'parsely-author'},
+        {'name': 'sailthru.author'}, {'name': 'dc.creator'},
+    ]
+    PUBLISH_DATE_META_TAGS = [
+        {'property': 'article:published_time'}, {'itemprop': 'datePublished'}, {'name': 'pubdate'},
+        {'name': 'publishdate'}, {'name': 'parsely-pub-date'}, {'name': 'dc.date'}, {'name': 'date'},
+    ]
+
+    # Blocos de texto usados para achar onde o conteúdo do newspaper termina
+    TRIM_TEXT_BLOCKS = ['p', 'h1', 'h2', 'h3', 'h4', 'li', 'blockquote']
+    # Blocos mais curtos que isso (sem espaços) não contam: aparecem em qualquer texto
+    TRIM_MIN_BLOCK_CHARS = 20
+
     # Domínios de iframe permitidos (vídeos, social media)
     IFRAME_WHITELIST = {
         'youtube.com',
@@ -83,6 +108,13 @@ class ScrapeService:
     
     def __init__(self):
         self.blacklist: Optional[ScrapingBlacklist] = None
+        self.scrape_cache: Optional[ScrapeCache] = None
+        self.profile_store: Optional[DomainProfileStore] = None
+        self.domain_health: Optional[DomainHealth] = None
+        # Sessão HTTP com pool de conexões (opcional; sem ela usa requests.get)
+        self.http_session: Optional[requests.Session] = None
+        self.metrics: Optional[CollectionMetrics] = None
+        self.near_duplicates: Optional[NearDuplicateIndex] = None
         
         # Configuração do newspaper4k
         self.config = Config()
@@ -102,7 +134,64 @@ class ScrapeService:
         self.blacklist = blacklist
         logging.info("Instância da ScrapingBlacklist foi definida no ScrapeService.")
         
+    def set_scrape_cache(self, scrape_cache: ScrapeCache):
+        """Define o cache de resultados de scraping a ser usado pelo serviço."""
+        self.scrape_cache = scrape_cache
+        logging.info("Instância do ScrapeCache foi definida no ScrapeService.")
+
+    def set_profile_store(self, profile_store: DomainProfileStore):
+        """Define o store de perfis de extração por domínio a ser usado pelo serviço."""
+        self.profile_store = profile_store
+        logging.info("Instância do DomainProfileStore foi definida no ScrapeService.")
+
+    def set_domain_health(self, domain_health: DomainHealth):
+        """Define o modelo de saúde dos domínios a ser usado pelo serviço."""
+        self.domain_health = domain_health
+        logging.info("Instância do DomainHealth foi definida no ScrapeService.")
+
+    def set_http_session(self, http_session: requests.Session):
+        """Define a sessão HTTP (pool de conexões) usada nos downloads."""
+        self.http_session = http_session
+        logging.info("Sessão HTTP com pool de conexões foi definida no ScrapeService.")
+
+    def set_metrics(self, metrics: CollectionMetrics):
+        """Define as métricas da execução (tempo de download/parse, bytes e erros)."""
+        self.metrics = metrics
+
+    def set_near_duplicate_index(self, near_duplicates: NearDuplicateIndex):
+        """Define o índice de artigos quase duplicados (SimHash) consultado após o parse."""
+        self.near_duplicates = near_duplicates
+        logging.info("Instância do NearDuplicateIndex foi definida no ScrapeService.")
+
+    def get_statistics(self) -> Dict:
+        """
+        Retorna estatísticas da blacklist e da saúde dos domínios.
+
+        Returns:
+            Dicionário com as chaves 'blacklist' e 'domain_health'
+        """
+        return {
+            'blacklist': self.blacklist.get_statistics() if self.blacklist else None,
+            'domain_health': self.domain_health.get_statistics() if self.domain_health else None
+        }
+
     def scrape_article_content(self, url: str) -> Optional[Dict[str, str]]:
+        page = self.fetch_page(url)
+        if page is None:
+            return None
+        return self.parse_page(url, page)
+
+    def fetch_page(self, url: str) -> Optional[Dict]:
+        """
+        Etapa de I/O do scraping: verifica blacklist, cache e circuit breaker e baixa a página.
+
+        Args:
+            url: URL do artigo
+
+        Returns:
+            Dicionário da página baixada para parse_page(), ou None se o artigo
+            foi pulado ou o download falhou
+        """
         try:
             if not self.blacklist:
                 raise Exception("ScrapingBlacklist não foi inicializada no ScrapeService.")
@@ -115,109 +204,98 @@ class ScrapeService:
                     f"(motivo: {reason})"
                 )
                 return None
-            
-            logging.info(f"Iniciando scraping para: {url}")
 
-            
-            # Usar newspaper4k para baixar e parsear
-            article = Article(url, config=self.config)
-            article.download()
-            article.parse()
-            
-            article_text = article.text
-            # 1. Checagem de Obfuscação
-            if self._is_content_obfuscated(article_text):
-                logging.warning(f"Conteúdo ofuscado detectado em {url}")
-                return None
-
-            # Extrair texto em linguagem natural
-            article_text = article.text
-            if not article_text or len(article_text.strip()) < 100:
-                logging.warning(f"Texto extraído muito curto ou vazio para {url}")
-                self._add_to_blacklist(
-                    url=url,
-                    error_type='Empty Content',
-                    error_message='Texto extraído muito curto',
-                    reason='Conteúdo vazio ou insuficiente'
+            # Verificar cache de scraping
+            cache_entry = self.scrape_cache.get(url) if self.scrape_cache else None
+            if self.scrape_cache and self.scrape_cache.is_negative_fresh(cache_entry):
+                logging.info(
+                    f"URL rejeitada recentemente, pulando pelo cache: {url} "
+                    f"(motivo: {cache_entry.get('reason') or 'N/A'})"
                 )
                 return None
-            
-            # Extrair HTML do top_node
-            if article.top_node is None:
-                logging.warning(f"newspaper4k não identificou top_node para {url}")
-                self._add_to_blacklist(
-                    url=url,
-                    error_type='No Top Node',
-                    error_message='Top node não identificado',
-                    reason='Estrutura HTML não reconhecida'
-                )
+
+            # Verificar circuit breaker da saúde do domínio
+            if self.domain_health and not self.domain_health.allow_request(url):
+                logging.info(f"Domínio com circuito aberto, pulando: {url}")
                 return None
-                        
-            # Converter top_node para HTML string
-            from lxml.etree import tostring
-            try:
-                raw_html = tostring(article.top_node, encoding='unicode', method='html')
-            except Exception as e:
-                raise ArticleException(f"Falha ao converter top_node para HTML: {e}")
             
-            # 2. Processamento com "Trim" baseado no texto
-            processed_html = self._process_html_aggressive(raw_html, url, reference_text=article_text)
-            
-            # Validar conteúdo extraído
-            # 3. Scoring System
-            quality = self._calculate_quality_score(processed_html, article_text)
+            logging.info(f"Iniciando scraping para: {url}")
 
-            if not quality['is_valid']:
-                logging.warning(f"Baixa qualidade ({quality['score']}) para {url}: {quality['reasons']}")
-                
-                # Opcional: Tentar Fallback IA aqui se score > 20
-                # if quality['score'] > 20: processed_html = self._fallback_ai_extraction(raw_html)
-                
-                return None # ou salvar com flag de 'revisão necessária'
+            page_html, response = self._download_page(url, cache_entry)
 
+            # 304 Not Modified: reaproveitar o resultado anterior sem novo parse
+            if page_html is None:
+                self.scrape_cache.touch(url, cache_entry)
+                logging.info(f"Página não modificada (304), usando cache: {url}")
+                self._record_domain_success(url)
+                if cache_entry.get('outcome') == ScrapeCache.OUTCOME_SUCCESS:
+                    return {'not_modified': True, 'result': cache_entry.get('result')}
+                return None
 
-            # Inserir a galeria de mídia no início do HTML processado
-            
-            logging.info(
-                f"✓ Scraping bem-sucedido: {url} "
-                f"({len(article_text)} chars text, {len(processed_html)} chars HTML)"
-            )
-            
             return {
-                'html': processed_html,
-                'raw_html': raw_html,
-                'text': article_text,
-                'title': article.title or 'Sem título',
-                'authors': article.authors or [],
-                'publish_date': article.publish_date.isoformat() if article.publish_date else None
+                'not_modified': False,
+                'html': page_html,
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified')
             }
-            
-        except requests.exceptions.RequestException as e:
+
+        except Exception as e:
+            return self._handle_scrape_error(url, e)
+
+    def parse_page(self, url: str, page: Dict) -> Optional[Dict[str, str]]:
+        """
+        Etapa de CPU do scraping: extrai e limpa o conteúdo de uma página baixada por fetch_page().
+
+        Args:
+            url: URL do artigo
+            page: Dicionário retornado por fetch_page()
+
+        Returns:
+            Dicionário com 'text' e 'html' do artigo, ou None se rejeitado
+        """
+        if page.get('not_modified'):
+            return page.get('result')
+
+        try:
+            start = time.perf_counter()
+            result, reason = self._parse_article(url, page['html'])
+            if self.metrics:
+                self.metrics.observe('parse', time.perf_counter() - start)
+            if result:
+                self._record_domain_success(url)
+
+            if self.scrape_cache:
+                self.scrape_cache.store(
+                    url=url,
+                    outcome=ScrapeCache.OUTCOME_SUCCESS if result else ScrapeCache.OUTCOME_REJECTED,
+                    raw_html=page['html'],
+                    etag=page.get('etag'),
+                    last_modified=page.get('last_modified'),
+                    result=result,
+                    reason=reason
+                )
+
+            return result
+
+        except Exception as e:
+            return self._handle_scrape_error(url, e)
+
+    def _handle_scrape_error(self, url: str, e: Exception) -> None:
+        """Registra a falha de scraping na blacklist, na saúde do domínio ou no cache, conforme o tipo."""
+        if isinstance(e, requests.exceptions.RequestException):
             error_msg = f"Request error: {str(e)}"
             logging.error(f"Erro de requisição para {url}: {error_msg}")
-            # Evitar blacklist para erros genéricos de rede que podem ser temporários
-            # Apenas erros persistentes ou de acesso devem ir para a blacklist
-            # self._add_to_blacklist(...)
-            self._add_to_blacklist(
-                url=url,
-                error_type='Request Error',
-                error_message=error_msg,
-                reason='Erro ao fazer requisição HTTP'
-            )
+            # Erros de rede podem ser temporários: vão para a saúde do domínio, não para a blacklist
+            self._record_domain_failure(url, 'Request Error')
             return None
         
-        except AttributeError as e:
+        if isinstance(e, AttributeError):
             error_msg = f"Attribute error: {str(e)}"
             logging.error(f"Erro de atributo para {url}: {error_msg}")
-            self._add_to_blacklist(
-                url=url,
-                error_type='Parse Error',
-                error_message=error_msg,
-                reason='Erro ao parsear estrutura do artigo'
-            )
+            self._record_domain_failure(url, 'Parse Error')
             return None
         
-        except ArticleException as e:
+        if isinstance(e, ArticleException):
             error_msg = str(e).lower()
             logging.error(f"Falha de parse/download em {url}: {e}")
 
@@ -230,6 +308,15 @@ class ScrapeService:
                     self._add_to_blacklist(url, f'Access Denied ({status_code})', str(e), 'Bloqueio de permissão')
                 elif status_code == 404:
                     logging.info(f"Página não encontrada (404) para {url}. Ignorando sem blacklist.")
+                elif status_code == 429 or status_code >= 500:
+                    self._record_domain_failure(url, f'HTTP {status_code}')
+
+                if 400 <= status_code < 500 and self.scrape_cache:
+                    self.scrape_cache.store(
+                        url=url,
+                        outcome=ScrapeCache.OUTCOME_FAILED,
+                        reason=f'HTTP {status_code}'
+                    )
             # Adicionar verificação para mensagens de erro de proteção (ex: Cloudflare, PerimeterX)
             elif any(keyword in error_msg for keyword in ['perimeterx', 'cloudflare', 'protected by', 'access to this page has been denied']):
                 logging.warning(f"Proteção anti-scraping detectada em {url}. Adicionando à blacklist.")
@@ -239,24 +326,325 @@ class ScrapeService:
                     error_message=str(e),
                     reason='Site protegido por serviço anti-bot'
                 )
-            elif 'timeout' in error_msg:
-                logging.warning(f"Timeout detectado em {url} via ArticleException. Ignorando sem blacklist.")
+            elif 'timeout' in error_msg or 'timed out' in error_msg:
+                logging.warning(f"Timeout detectado em {url} via ArticleException. Registrando na saúde do domínio.")
+                self._record_domain_failure(url, 'Timeout')
+            else:
+                self._record_domain_failure(url, 'Request Error')
             
             # Retorna None para qualquer ArticleException
             return None
             
+        error_msg = str(e)
+        logging.error(f"Erro no scraping de {url}: {error_msg}", exc_info=e)
+        return None
+
+    def _download_page(self, url: str, cache_entry: Optional[Dict] = None):
+        """
+        Baixa o HTML da página, usando GET condicional quando há entrada em cache.
+
+        Falhas são convertidas em ArticleException com as mesmas mensagens do
+        newspaper4k, para manter o tratamento de erros de scrape_article_content.
+
+        Returns:
+            Tupla (html, response). html é None quando o servidor responde 304.
+        """
+        headers = {'User-Agent': self.config.browser_user_agent}
+        if self.scrape_cache and cache_entry and cache_entry.get('raw_html') is not None:
+            headers.update(self.scrape_cache.get_conditional_headers(cache_entry))
+
+        start = time.perf_counter()
+        try:
+            response = (self.http_session or requests).get(
+                url,
+                headers=headers,
+                timeout=self.config.request_timeout,
+                allow_redirects=True
+            )
+        except requests.exceptions.RequestException as e:
+            raise ArticleException(f"Article `download()` failed with {e} on URL {url}")
+        finally:
+            if self.metrics:
+                self.metrics.observe('download', time.perf_counter() - start)
+
+        if self.metrics:
+            self.metrics.record_download(url, time.perf_counter() - start, len(response.content or b''))
+
+        if response.status_code == 304 and ('If-None-Match' in headers or 'If-Modified-Since' in headers):
+            return None, response
+
+        page_html, status_code, _ = network.get_html_status(url, self.config, response=response)
+        if status_code >= 400:
+            protection = Article(url, config=self.config)._detect_protection(page_html or '')
+            if protection:
+                reason = f"Website protected with {protection}, url: {url}"
+            else:
+                reason = f"Status code {status_code} for url {url}"
+            raise ArticleException(f"Article `download()` failed with {reason} on URL {url}")
+
+        return page_html, response
+
+    def _parse_article(self, url: str, page_html: str):
+        """
+        Extrai texto e HTML limpo de uma página já baixada.
+
+        Returns:
+            Tupla (resultado, motivo). resultado é None quando o artigo é rejeitado.
+        """
+        # Caminho rápido: domínio com perfil de extração já aprendido
+        profile = self.profile_store.get(url) if self.profile_store else None
+        if profile:
+            result = self._parse_with_profile(url, page_html, profile)
+            if result:
+                self.profile_store.record_hit(url)
+                fingerprint, duplicate_reason = self._check_near_duplicate(url, result['text'])
+                if duplicate_reason:
+                    return None, duplicate_reason
+                result['fingerprint'] = fingerprint
+                return result, None
+            logging.info(f"Perfil de extração falhou na validação para {url}. Usando caminho genérico.")
+            self.profile_store.record_miss(url)
+
+        # Usar newspaper4k para parsear o HTML baixado
+        article = Article(url, config=self.config)
+        article.download(input_html=page_html)
+        article.parse()
+
+        article_text = article.text
+        # 1. Checagem de Obfuscação
+        if self._is_content_obfuscated(article_text):
+            logging.warning(f"Conteúdo ofuscado detectado em {url}")
+            return None, 'Conteúdo ofuscado'
+
+        # Extrair texto em linguagem natural
+        article_text = article.text
+        if not article_text or len(article_text.strip()) < 100:
+            logging.warning(f"Texto extraído muito curto ou vazio para {url}")
+            self._record_domain_failure(url, 'Empty Content')
+            return None, 'Conteúdo vazio ou insuficiente'
+
+        # Extrair HTML do top_node
+        if article.top_node is None:
+            logging.warning(f"newspaper4k não identificou top_node para {url}")
+            self._record_domain_failure(url, 'No Top Node')
+            return None, 'Estrutura HTML não reconhecida'
+
+        # Converter top_node para HTML string
+        from lxml.etree import tostring
+        try:
+            raw_html = tostring(article.top_node, encoding='unicode', method='html')
         except Exception as e:
-            error_msg = str(e)
-            logging.error(f"Erro no scraping de {url}: {error_msg}", exc_info=True)
+            raise ArticleException(f"Falha ao converter top_node para HTML: {e}")
+
+        # Quase duplicata de um artigo recente: rejeita antes do processamento do HTML
+        fingerprint, duplicate_reason = self._check_near_duplicate(url, article_text)
+        if duplicate_reason:
+            return None, duplicate_reason
+
+        # 2. Processamento com "Trim" baseado no texto
+        profile_recorder = {} if self.profile_store else None
+        processed_html = self._process_html_aggressive(
+            raw_html, url, reference_text=article_text, profile_recorder=profile_recorder
+        )
+
+        # Validar conteúdo extraído
+        # 3. Scoring System
+        quality = self._calculate_quality_score(processed_html, article_text)
+
+        if not quality['is_valid']:
+            logging.warning(f"Baixa qualidade ({quality['score']}) para {url}: {quality['reasons']}")
+
+            # Opcional: Tentar Fallback IA aqui se score > 20
+            # if quality['score'] > 20: processed_html = self._fallback_ai_extraction(raw_html)
+
+            return None, f"Baixa qualidade ({quality['score']}): {', '.join(quality['reasons'])}"
+
+        if self.profile_store:
+            self._learn_domain_profile(url, page_html, article.top_node, profile_recorder)
+
+        logging.info(
+            f"✓ Scraping bem-sucedido: {url} "
+            f"({len(article_text)} chars text, {len(processed_html)} chars HTML)"
+        )
+
+        return {
+            'html': processed_html,
+            'raw_html': raw_html,
+            'text': article_text,
+            'title': article.title or 'Sem título',
+            'authors': article.authors or [],
+            'publish_date': article.publish_date.isoformat() if article.publish_date else None,
+            'fingerprint': fingerprint
+        }, None
+
+    def _parse_with_profile(self, url: str, page_html: str, profile: Dict) -> Optional[Dict]:
+        """
+        Extrai o artigo usando o perfil aprendido do domínio, sem newspaper4k
+        e sem as heurísticas genéricas de limpeza.
+
+        Returns:
+            Resultado do scraping ou None se o perfil não se aplicar à página
+            ou o conteúdo extraído não passar na validação.
+        """
+        page_soup = BeautifulSoup(page_html, 'html.parser')
+        node = page_soup.select_one(profile['container_selector'])
+        if node is None:
             return None
 
-    def _process_html_aggressive(self, html: str, base_url: str, reference_text: str = "") -> str:
+        raw_html = str(node)
+        soup = BeautifulSoup(raw_html, 'html.parser')
+
+        for tag_name in self.TAGS_PARA_REMOVER:
+            for tag in soup.find_all(tag_name):
+                tag.decompose()
+
+        for selector in profile.get('boilerplate_selectors', []):
+            for element in soup.select(selector):
+                element.decompose()
+
+        trim_selector = profile.get('trim_selector')
+        trim_element = soup.select_one(trim_selector) if trim_selector else None
+        if trim_element:
+            for sibling in list(trim_element.find_next_siblings()):
+                sibling.decompose()
+            trim_element.decompose()
+
+        self._sanitize_generic_social_embeds(soup)
+        self._sanitize_twitter_embeds(soup)
+        self._sanitize_youtube_embeds(soup)
+        self._filter_iframes(soup, url)
+        self._fix_images_and_links(soup, url)
+
+        article_text = '\n\n'.join(
+            text for text in (
+                ' '.join(block.get_text(' ', strip=True).split())
+                for block in soup.find_all(['p', 'h2', 'h3', 'h4', 'li'])
+            ) if text
+        )
+
+        if self._is_content_obfuscated(article_text) or len(article_text.strip()) < 100:
+            return None
+
+        processed_html = bleach.clean(
+            str(soup),
+            tags=self.TAGS_PERMITIDAS,
+            attributes=self.ATRIBUTOS_PERMITIDOS,
+            strip=True,
+            strip_comments=True
+        )
+
+        quality = self._calculate_quality_score(processed_html, article_text)
+        if not quality['is_valid']:
+            return None
+
+        title_meta = page_soup.find('meta', attrs={'property': 'og:title'})
+        if title_meta and title_meta.get('content'):
+            title = title_meta['content'].strip()
+        else:
+            title = page_soup.title.get_text(strip=True) if page_soup.title else ''
+        authors, publish_date = self._extract_page_metadata(page_soup)
+
+        logging.info(
+            f"✓ Scraping bem-sucedido via perfil de domínio: {url} "
+            f"({len(article_text)} chars text, {len(processed_html)} chars HTML)"
+        )
+
+        return {
+            'html': processed_html,
+            'raw_html': raw_html,
+            'text': article_text,
+            'title': title or 'Sem título',
+            'authors': authors,
+            'publish_date': publish_date.isoformat() if publish_date else None
+        }
+
+    def _extract_page_metadata(self, page_soup: BeautifulSoup):
+        """
+        Autores e data de publicação das meta tags da página, para o caminho
+        rápido, que não passa pelo newspaper4k.
+
+        Returns:
+            Tupla (autores, data de publicação ou None)
+        """
+        authors = []
+        for attrs in self.AUTHOR_META_TAGS:
+            for meta in page_soup.find_all('meta', attrs=attrs):
+                # article:author costuma ser a URL do perfil, não o nome
+                author = ' '.join((meta.get('content') or '').split())
+                if author and not author.startswith(('http://', 'https://')) and author not in authors:
+                    authors.append(author)
+
+        publish_date = None
+        for attrs in self.PUBLISH_DATE_META_TAGS:
+            meta = page_soup.find('meta', attrs=attrs)
+            if not meta or not meta.get('content'):
+                continue
+            try:
+                publish_date = date_parser.parse(meta['content'])
+                break
+            except (ValueError, OverflowError):
+                continue
+
+        return authors, publish_date
+
+    def _learn_domain_profile(self, url: str, page_html: str, top_node, profile_recorder: Dict) -> None:
+        """
+        Aprende o perfil de extração do domínio a partir de um scraping genérico
+        bem-sucedido. Só registra o perfil se o container for identificável por
+        um seletor único na página original.
+        """
+        try:
+            container_selector = self._build_css_selector(top_node.tag, top_node.get('id'), top_node.get('class'))
+            if not container_selector:
+                return
+
+            page_soup = BeautifulSoup(page_html, 'html.parser')
+            if len(page_soup.select(container_selector)) != 1:
+                return
+
+            self.profile_store.learn(
+                url=url,
+                container_selector=container_selector,
+                boilerplate_selectors=profile_recorder.get('boilerplate_selectors', []),
+                trim_selector=profile_recorder.get('trim_selector')
+            )
+        except Exception as e:
+            logging.warning(f"Não foi possível aprender perfil de extração para {url}: {e}")
+
+    def _build_css_selector(self, tag_name: str, element_id=None, classes=None) -> Optional[str]:
+        """
+        Monta um seletor CSS simples (tag#id ou tag.classe) para um elemento.
+
+        Returns:
+            Seletor ou None se o elemento não tiver id/classes utilizáveis
+        """
+        if element_id and self.CSS_IDENTIFIER_RE.match(element_id):
+            return f"{tag_name}#{element_id}"
+
+        if isinstance(classes, str):
+            classes = classes.split()
+        valid_classes = [c for c in classes or [] if self.CSS_IDENTIFIER_RE.match(c)]
+        if valid_classes:
+            return tag_name + ''.join(f".{c}" for c in valid_classes)
+
+        return None
+
+    def _process_html_aggressive(
+        self,
+        html: str,
+        base_url: str,
+        reference_text: str = "",
+        profile_recorder: Optional[Dict] = None
+    ) -> str:
         """
         Processa HTML com limpeza agressiva: remove scripts, styles, classes, ids, etc.
         
         Args:
             html: HTML bruto
             base_url: URL base para resolver caminhos relativos
+            reference_text: Texto extraído pelo newspaper, usado para cortar o final
+            profile_recorder: Se informado, recebe os seletores de boilerplate
+                removidos e o ponto de corte, para aprendizado do perfil do domínio
             
         Returns:
             HTML limpo, apenas com conteúdo relevante
@@ -337,95 +725,24 @@ class ScrapeService:
         
         for selector in unwanted_selectors:
             for element in soup.find_all(attrs=selector):
+                if element.decomposed:
+                    continue
+                if profile_recorder is not None:
+                    css_selector = self._build_css_selector(element.name, element.get('id'), element.get('class'))
+                    if css_selector:
+                        profile_recorder.setdefault('boilerplate_selectors', []).append(css_selector)
                 element.decompose()
 
 
-        # 4. LIDAR COM IMAGENS "LAZY-LOADING" E PLACEHOLDERS
-        for img in list(soup.find_all('img')): 
-            
-            # Padrão 1: Promover 'data-' atributos.
-            # Se 'data-src' existir, ele tem prioridade sobre o 'src' (que pode ser 1x1.gif)
-            if img.has_attr('data-src'):
-                img['src'] = img['data-src']
-            if img.has_attr('data-srcset'):
-                img['srcset'] = img['data-srcset']
-            if img.has_attr('data-sizes'):
-                img['sizes'] = img['data-sizes']
+        # 4. LIDAR COM IMAGENS "LAZY-LOADING" E CONSERTAR CAMINHOS RELATIVOS
+        self._fix_images_and_links(soup, base_url)
 
-            # Padrão 2: Se 'src' ainda for placeholder (ou não existir), verificar <noscript>
-            src_lower = img.get('src', '').lower()
-            is_placeholder = not src_lower or any(p in src_lower for p in [
-                '1x1.trans.gif', 'pixel.gif', 'blank.gif', 
-                'spacer.gif', 'data:image/gif;base64'
-            ])
-
-            if is_placeholder:
-                noscript = img.find_next_sibling('noscript')
-                if noscript:
-                    # Parsear o conteúdo do noscript para encontrar a img de fallback
-                    noscript_content = "".join(map(str, noscript.contents))
-                    noscript_soup = BeautifulSoup(noscript_content, 'html.parser')
-                    noscript_img = noscript_soup.find('img')
-                    
-                    if noscript_img:
-                        # Substituir os atributos da img "lazy" pelos do noscript
-                        if noscript_img.has_attr('src'):
-                            img['src'] = noscript_img['src']
-                        if noscript_img.has_attr('srcset'):
-                            img['srcset'] = noscript_img['srcset']
-                        if noscript_img.has_attr('sizes'):
-                            img['sizes'] = noscript_img['sizes']
-                        
-                        # Recalcular is_placeholder, pois podemos ter pego um 'src' válido
-                        src_lower = img.get('src', '').lower()
-                        is_placeholder = not src_lower or any(p in src_lower for p in [
-                            '1x1.trans.gif', 'pixel.gif', 'blank.gif', 
-                            'spacer.gif', 'data:image/gif;base64'
-                        ])
-
-            # Padrão 3: Se, depois de tudo, ainda for placeholder, remover.
-            if is_placeholder:
-                img.decompose()
-                continue
-            
-            # Padrão 4: Otimizar o 'src' principal.
-            # Se tivermos um srcset, vamos usá-lo para encontrar a MELHOR
-            # URL e forçá-la no 'src', sobrescrevendo o 'src' de baixa resolução (ex: 400x0)
-            if img.has_attr('srcset'):
-                srcset = img['srcset']
-                max_width = 0
-                best_url = None
-                
-                # Tentar extrair a largura da 'src' atual para comparação
-                current_src_width = 0
-                src_match = re.search(r'/(\d+)x\d+/', img.get('src', ''))
-                if src_match:
-                    current_src_width = int(src_match.group(1))
+        # Cortar o final do HTML que não corresponde ao texto extraído
+        # (antes de limpar os atributos, que formam o seletor do corte)
+        trim_selector = self._trim_html_tail_by_content(soup, reference_text)
+        if profile_recorder is not None:
+            profile_recorder['trim_selector'] = trim_selector
 
-                # Parsear o srcset
-                sources = srcset.split(',')
-                for source in sources:
-                    parts = source.strip().split()
-                    if len(parts) >= 2:
-                        url = parts[0]
-                        width_str = parts[-1].replace('w', '') # Pega '800' de '800w'
-                        if width_str.isdigit():
-                            width = int(width_str)
-                            if width > max_width:
-                                max_width = width
-                                best_url = url
-                
-                # Se encontramos uma URL no srcset que é melhor que a 'src' atual
-                if best_url and max_width > current_src_width:
-                    img['src'] = best_url
-    
-        # 4. CONSERTAR caminhos relativos em imagens e links restantes
-        for img in soup.find_all('img', src=True):
-            img['src'] = urljoin(base_url, img['src'])
-        
-        for link in soup.find_all('a', href=True):
-            link['href'] = urljoin(base_url, link['href'])
-        
         # 5. LIMPAR atributos de todas as tags, mantendo apenas os essenciais
         for tag in soup.find_all(True):
             # Pular tags inválidas
@@ -546,9 +863,6 @@ class ScrapeService:
                     tag.decompose()
                     changed = True
 
-        # Cortar o final do HTML que não corresponde ao texto extraído
-        self._trim_html_tail_by_content(soup, reference_text)
-
         # 7. Converter de volta para string
         clean_html = str(soup)
         
@@ -563,48 +877,136 @@ class ScrapeService:
         
         return final_html
     
+    def _fix_images_and_links(self, soup: BeautifulSoup, base_url: str) -> None:
+        """
+        Promove atributos de lazy-loading, remove imagens placeholder, escolhe
+        a melhor URL do srcset e converte caminhos relativos em absolutos.
+        """
+        # LIDAR COM IMAGENS "LAZY-LOADING" E PLACEHOLDERS
+        for img in list(soup.find_all('img')): 
+            
+            # Padrão 1: Promover 'data-' atributos.
+            # Se 'data-src' existir, ele tem prioridade sobre o 'src' (que pode ser 1x1.gif)
+            if img.has_attr('data-src'):
+                img['src'] = img['data-src']
+            if img.has_attr('data-srcset'):
+                img['srcset'] = img['data-srcset']
+            if img.has_attr('data-sizes'):
+                img['sizes'] = img['data-sizes']
+
+            # Padrão 2: Se 'src' ainda for placeholder (ou não existir), verificar <noscript>
+            src_lower = img.get('src', '').lower()
+            is_placeholder = not src_lower or any(p in src_lower for p in [
+                '1x1.trans.gif', 'pixel.gif', 'blank.gif', 
+                'spacer.gif', 'data:image/gif;base64'
+            ])
+
+            if is_placeholder:
+                noscript = img.find_next_sibling('noscript')
+                if noscript:
+                    # Parsear o conteúdo do noscript para encontrar a img de fallback
+                    noscript_content = "".join(map(str, noscript.contents))
+                    noscript_soup = BeautifulSoup(noscript_content, 'html.parser')
+                    noscript_img = noscript_soup.find('img')
+                    
+                    if noscript_img:
+                        # Substituir os atributos da img "lazy" pelos do noscript
+                        if noscript_img.has_attr('src'):
+                            img['src'] = noscript_img['src']
+                        if noscript_img.has_attr('srcset'):
+                            img['srcset'] = noscript_img['srcset']
+                        if noscript_img.has_attr('sizes'):
+                            img['sizes'] = noscript_img['sizes']
+                        
+                        # Recalcular is_placeholder, pois podemos ter pego um 'src' válido
+                        src_lower = img.get('src', '').lower()
+                        is_placeholder = not src_lower or any(p in src_lower for p in [
+                            '1x1.trans.gif', 'pixel.gif', 'blank.gif', 
+                            'spacer.gif', 'data:image/gif;base64'
+                        ])
+
+            # Padrão 3: Se, depois de tudo, ainda for placeholder, remover.
+            if is_placeholder:
+                img.decompose()
+                continue
+            
+            # Padrão 4: Otimizar o 'src' principal.
+            # Se tivermos um srcset, vamos usá-lo para encontrar a MELHOR
+            # URL e forçá-la no 'src', sobrescrevendo o 'src' de baixa resolução (ex: 400x0)
+            if img.has_attr('srcset'):
+                srcset = img['srcset']
+                max_width = 0
+                best_url = None
+                
+                # Tentar extrair a largura da 'src' atual para comparação
+                current_src_width = 0
+                src_match = re.search(r'/(\d+)x\d+/', img.get('src', ''))
+                if src_match:
+                    current_src_width = int(src_match.group(1))
+
+                # Parsear o srcset
+                sources = srcset.split(',')
+                for source in sources:
+                    parts = source.strip().split()
+                    if len(parts) >= 2:
+                        url = parts[0]
+                        width_str = parts[-1].replace('w', '') # Pega '800' de '800w'
+                        if width_str.isdigit():
+                            width = int(width_str)
+                            if width > max_width:
+                                max_width = width
+                                best_url = url
+                
+                # Se encontramos uma URL no srcset que é melhor que a 'src' atual
+                if best_url and max_width > current_src_width:
+                    img['src'] = best_url
+    
+        # CONSERTAR caminhos relativos em imagens e links restantes
+        for img in soup.find_all('img', src=True):
+            img['src'] = urljoin(base_url, img['src'])
+        
+        for link in soup.find_all('a', href=True):
+            link['href'] = urljoin(base_url, link['href'])
+
     def _trim_html_tail_by_content(self, soup: BeautifulSoup, reference_text: str):
         """
         Corta o HTML onde o texto do newspaper termina.
         Isso remove seções de 'comentários', 'leia mais' e rodapés que o newspaper ignorou.
-        Usa difflib para uma comparação robusta.
-        """
-        if not reference_text or not soup.body:
-            return
 
-        # Normaliza ambos os textos para uma comparação mais limpa
-        ref_text_norm = ' '.join(reference_text.split())
-        soup_text_norm = ' '.join(soup.get_text().split())
+        Procura o último bloco de texto (parágrafo, título, item de lista) que
+        aparece no texto do newspaper, comparando sem espaços, e remove os
+        elementos irmãos que vêm depois dele. Funciona tanto na página inteira
+        (body) quanto no fragmento do top_node.
 
-        # Usa difflib para encontrar o maior bloco correspondente
-        matcher = difflib.SequenceMatcher(None, soup_text_norm, ref_text_norm)
-        match = matcher.find_longest_match(0, len(soup_text_norm), 0, len(ref_text_norm))
+        Returns:
+            Seletor CSS do primeiro elemento removido, ou None
+        """
+        if not reference_text:
+            return None
 
-        # O ponto de corte é o final do texto correspondente no HTML
-        cutoff_point = match.a + match.size
+        root = soup.body or soup
+        reference = ''.join(reference_text.split())
 
-        # Encontra o elemento onde o corte deve ocorrer
-        char_count = 0
-        last_valid_element = None
+        last_block = None
+        for block in root.find_all(self.TRIM_TEXT_BLOCKS):
+            text = ''.join(block.get_text().split())
+            if len(text) >= self.TRIM_MIN_BLOCK_CHARS and text in reference:
+                last_block = block
+        if last_block is None:
+            return None
 
-        for element in soup.find_all(string=True):
-            if not element.parent or element.parent.name in ['script', 'style']:
-                continue
+        # Item de lista: o corte é depois da lista inteira
+        if last_block.name == 'li':
+            last_block = last_block.find_parent(['ul', 'ol']) or last_block
 
-            text_len = len(' '.join(element.string.split()))
-            if char_count + text_len >= cutoff_point:
-                # Encontramos o elemento onde o texto bom termina
-                last_valid_element = element
-                break
-            char_count += text_len
+        siblings = list(last_block.find_next_siblings())
+        if not siblings:
+            return None
 
-        if last_valid_element:
-            # Sobe na árvore até encontrar um bloco de conteúdo (p, div, figure, etc.)
-            parent_block = last_valid_element.find_parent(['p', 'div', 'figure', 'h1', 'h2', 'h3', 'ul', 'ol'])
-            if parent_block:
-                # Remove todos os elementos irmãos que vêm depois deste bloco
-                for sibling in list(parent_block.find_next_siblings()):
-                    sibling.decompose()
+        trim_selector = self._build_css_selector(siblings[0].name, siblings[0].get('id'), siblings[0].get('class'))
+        for sibling in siblings:
+            sibling.decompose()
+        return trim_selector
 
     def _remove_deeply_nested_empty_tags(self, soup: BeautifulSoup, max_depth=15):
         """Remove estruturas excessivamente profundas que geralmente são wrappers de anúncios"""
@@ -905,6 +1307,39 @@ class ScrapeService:
 
         return False
    
+    def _check_near_duplicate(self, url: str, text: str):
+        """
+        Calcula o SimHash do texto e procura um artigo recente quase idêntico.
+
+        Returns:
+            Tupla (fingerprint, motivo). motivo é None quando o artigo não é duplicata.
+        """
+        if not self.near_duplicates:
+            return None, None
+
+        fingerprint = self.near_duplicates.fingerprint(text)
+        match = self.near_duplicates.find_duplicate(fingerprint)
+        if not match:
+            return fingerprint, None
+
+        original = f"notícia ID={match['news_id']}" if 'news_id' in match else match['url']
+        logging.info(f"Artigo quase duplicado de {original} (distância {match['distance']}): {url}")
+        if self.metrics:
+            self.metrics.increment('near_duplicates')
+        return fingerprint, f"Quase duplicata de {original}"
+
+    def _record_domain_success(self, url: str) -> None:
+        """Helper para registrar sucesso na saúde do domínio"""
+        if self.domain_health:
+            self.domain_health.record_success(url)
+
+    def _record_domain_failure(self, url: str, error_type: str) -> None:
+        """Helper para registrar falha temporária na saúde do domínio"""
+        if self.metrics:
+            self.metrics.increment('scrape_errors', error_type=error_type)
+        if self.domain_health:
+            self.domain_health.record_failure(url, error_type)
+
     def _add_to_blacklist(
         self,
         url: str,
@@ -913,6 +1348,8 @@ class ScrapeService:
         reason: str
     ) -> None:
         """Helper para adicionar à blacklist"""
+        if self.metrics:
+            self.metrics.increment('scrape_errors', error_type=error_type)
         self.blacklist.add_to_blacklist(
             url=url,
             error_type=error_type,
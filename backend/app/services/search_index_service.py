@@ -0,0 +1,84 @@
+import threading
+import time
+from typing import Optional
+
+from app.repositories.news_repository import NewsRepository
+from app.utils.inverted_index import InvertedIndex
+
+
+class SearchIndexService:
+    """
+    Busca textual sem PostgreSQL (SQLite nos testes e no desenvolvimento):
+    índice invertido em memória (app/utils/inverted_index.py) com a mesma
+    interface do NewsSearchRepository.
+
+    O índice é construído incrementalmente: antes de cada busca, só as
+    notícias com ID maior que o último indexado são lidas do banco (inclusive
+    as gravadas por outro processo, como a coleta). Notícias removidas ou
+    editadas só saem do índice quando ele é refeito, a cada rebuild_interval.
+
+    Args:
+        rebuild_interval: Segundos até o índice ser refeito do zero (0 refaz a cada busca)
+        batch_size: Notícias lidas do banco por consulta
+    """
+
+    available = True
+
+    def __init__(
+        self,
+        news_repo: NewsRepository | None = None,
+        rebuild_interval: float = 3600.0,
+        batch_size: int = 500
+    ):
+        self.news_repo = news_repo or NewsRepository()
+        self.rebuild_interval = rebuild_interval
+        self.batch_size = batch_size
+        self._index = InvertedIndex()
+        self._last_news_id = 0
+        self._built_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def search(self, query: str, language: Optional[str] = None, limit: int = 20, after: Optional[tuple[float, int]] = None) -> list[tuple[int, float]]:
+        """
+        IDs das notícias que casam com a busca, da mais relevante para a menos.
+
+        Args:
+            query: Texto da busca ("frase", -excluir, OR)
+            language: 'pt' ou 'en' restringe ao idioma; None busca em todos
+            limit: Quantidade máxima de resultados
+            after: (rank, id) do último resultado da página anterior
+
+        Returns:
+            Lista de (news_id, rank)
+        """
+        with self._lock:
+            self._refresh()
+            return self._index.search(query, language, limit, after)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._reset()
+
+    def _reset(self) -> None:
+        self._index = InvertedIndex()
+        self._last_news_id = 0
+        self._built_at = time.monotonic()
+
+    def _refresh(self) -> None:
+        """Indexa as notícias gravadas desde a última busca (ou refaz o índice, se expirou)."""
+        if time.monotonic() - self._built_at >= self.rebuild_interval:
+            self._reset()
+        while True:
+            rows = self.news_repo.list_for_search_index(self._last_news_id, self.batch_size)
+            for row in rows:
+                self._index.add(row.id, row.title, row.description, row.content, row.language)
+            if len(rows) < self.batch_size:
+                break
+            self._last_news_id = rows[-1].id
+        if rows:
+            self._last_news_id = rows[-1].id
+
+
+def create_search_index(config) -> SearchIndexService:
+    """Cria o índice a partir da configuração do app (chave SEARCH_INDEX_REBUILD_INTERVAL)."""
+    return SearchIndexService(rebuild_interval=float(config.get("SEARCH_INDEX_REBUILD_INTERVAL", 3600)))
@@ -4,6 +4,7 @@ from sqlalchemy.exc import IntegrityError
 from app.repositories.user_preferred_custom_topic_repository import UserPreferredCustomTopicRepository
 from app.repositories.custom_topic_repository import CustomTopicRepository
 from app.models.custom_topic import CustomTopic, CustomTopicValidationError
+from app.utils.events import preferences_changed
 
 
 class UserCustomTopicService:
@@ -37,6 +38,7 @@ class UserCustomTopicService:
 
             if attached:
                 logging.info(f"Tópico customizado '{topic.name}' associado ao usuário {user_id}.")
+                preferences_changed.send(user_id)
             else:
                 logging.info(f"Tópico customizado '{topic.name}' já estava associado ao usuário {user_id}.")
 
@@ -65,6 +67,7 @@ class UserCustomTopicService:
 
             if success:
                 logging.info(f"Tópico customizado {topic_id} desassociado do usuário {user_id}")
+                preferences_changed.send(user_id)
             else:
                 logging.warning(f"Associação do tópico {topic_id} não encontrada para o usuário {user_id}")
 
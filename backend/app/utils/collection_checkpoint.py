@@ -0,0 +1,145 @@
+"""
+Checkpoints do job de coleta de notícias.
+Permitem retomar uma execução interrompida sem repetir chamadas ao GNews nem scraping.
+"""
+
+import logging
+from typing import Dict, List, Optional
+
+from app.repositories.collection_run_repository import CollectionRunRepository
+from app.utils.events import collection_finished
+from app.utils.url_normalizer import normalize_url
+
+
+class CollectionCheckpoint:
+    """
+    Registra o progresso de uma execução do job de coleta:
+
+    - por tópico: os artigos retornados pelo GNews (gravados na hora)
+    - por artigo: o estágio atingido (fetched, scraped, validated, saved ou skipped)
+
+    Os estágios dos artigos ficam em buffer e são gravados em flush(), chamado
+    a cada lote salvo. Ao retomar, tópicos já buscados reaproveitam os artigos
+    gravados e artigos em estágio final (saved/skipped) são pulados.
+    """
+
+    STAGE_FETCHED = 'fetched'
+    STAGE_SCRAPED = 'scraped'
+    STAGE_VALIDATED = 'validated'
+    STAGE_SAVED = 'saved'
+    STAGE_SKIPPED = 'skipped'
+
+    FINAL_STAGES = {STAGE_SAVED, STAGE_SKIPPED}
+
+    def __init__(self, repository: Optional[CollectionRunRepository] = None):
+        """
+        Inicializa o checkpoint.
+
+        Args:
+            repository: Repositório das tabelas de execução do job
+        """
+        self.repository = repository or CollectionRunRepository()
+        self.run_id: Optional[int] = None
+        self.resumed = False
+        self._fetched_topics: Dict[int, List[Dict]] = {}
+        self._stages: Dict[str, str] = {}
+        self._pending: Dict[str, Dict] = {}
+
+    def start(self, resume: bool = False) -> int:
+        """
+        Inicia uma nova execução ou retoma a última execução não concluída.
+
+        Args:
+            resume: Se True, continua a última execução interrompida (se houver)
+
+        Returns:
+            ID da execução
+        """
+        run_id = self.repository.find_latest_unfinished() if resume else None
+
+        if run_id:
+            self.run_id = run_id
+            self.resumed = True
+            self._fetched_topics = self.repository.get_fetched_topics(run_id)
+            self._stages = self.repository.get_article_stages(run_id)
+            finished = sum(1 for stage in self._stages.values() if stage in self.FINAL_STAGES)
+            logging.info(
+                f"Retomando execução de coleta #{run_id}: {len(self._fetched_topics)} tópicos já buscados, "
+                f"{finished} artigos já finalizados."
+            )
+        else:
+            if resume:
+                logging.info("Nenhuma execução interrompida encontrada. Iniciando nova execução.")
+            self.run_id = self.repository.create_run()
+            self.resumed = False
+            self._fetched_topics = {}
+            self._stages = {}
+            logging.info(f"Execução de coleta #{self.run_id} iniciada.")
+
+        self._pending = {}
+        return self.run_id
+
+    def get_fetched_articles(self, topic_id: int) -> Optional[List[Dict]]:
+        """Retorna os artigos já buscados para o tópico nesta execução, ou None."""
+        return self._fetched_topics.get(topic_id)
+
+    def mark_topic_fetched(self, topic_id: int, articles: List[Dict]) -> None:
+        """
+        Grava o checkpoint de um tópico buscado no GNews.
+
+        Args:
+            topic_id: ID do tópico
+            articles: Metadados dos artigos retornados
+        """
+        self.repository.save_fetched_topic(self.run_id, topic_id, articles)
+        self._fetched_topics[topic_id] = articles
+        for article in articles:
+            if article.get('url'):
+                self.mark(article['url'], topic_id, self.STAGE_FETCHED)
+        self.flush()
+
+    def is_finished(self, url: str) -> bool:
+        """Verifica se o artigo já chegou a um estágio final nesta execução."""
+        return self._stages.get(normalize_url(url)) in self.FINAL_STAGES
+
+    def mark(self, url: str, topic_id: int, stage: str, reason: Optional[str] = None) -> None:
+        """
+        Registra (em buffer) o estágio de um artigo.
+
+        Args:
+            url: URL do artigo
+            topic_id: ID do tópico
+            stage: Estágio atingido
+            reason: Motivo (para artigos pulados)
+        """
+        key = normalize_url(url)
+        self._stages[key] = stage
+        self._pending[key] = {'url': key, 'topic_id': topic_id, 'stage': stage, 'reason': reason}
+
+    def flush(self) -> None:
+        """Grava os estágios pendentes dos artigos."""
+        if not self._pending:
+            return
+
+        try:
+            self.repository.upsert_article_stages(self.run_id, list(self._pending.values()))
+            self._pending = {}
+        except Exception as e:
+            logging.error(f"Erro ao gravar checkpoint dos artigos: {e}", exc_info=True)
+
+    def finish(self, new_articles: int, new_sources: int) -> None:
+        """Grava os estágios pendentes e marca a execução como concluída."""
+        self.flush()
+        self.repository.finish_run(
+            self.run_id, CollectionRunRepository.STATUS_COMPLETED, new_articles, new_sources
+        )
+        logging.info(f"Execução de coleta #{self.run_id} concluída.")
+        collection_finished.send(self.run_id)
+
+    def fail(self, error: str) -> None:
+        """Grava os estágios pendentes e marca a execução como falha (pode ser retomada)."""
+        self.flush()
+        try:
+            self.repository.finish_run(self.run_id, CollectionRunRepository.STATUS_FAILED, error=error)
+        except Exception as e:
+            logging.error(f"Erro ao marcar execução de coleta #{self.run_id} como falha: {e}", exc_info=True)
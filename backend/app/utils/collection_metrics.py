@@ -0,0 +1,269 @@
+"""
+Métricas estruturadas do job de coleta de notícias.
+Tempos por etapa, contadores por motivo, bytes baixados e latência por domínio.
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+
+class CollectionMetrics:
+    """
+    Acumula as métricas de uma execução do job de coleta:
+
+    - histogramas de duração por etapa (gnews_request, gnews_sleep, keywords,
+      download, parse, image_validation, db_read, db_write, total)
+    - contadores com rótulos (ex: articles{stage, reason}, scrape_errors{error_type})
+    - bytes baixados e latência de download por domínio
+
+    Ao final da execução, summary() gera o resumo em JSON e write_prometheus()
+    grava um arquivo no formato texto do Prometheus (para o textfile collector
+    do node_exporter). É thread-safe: o motor assíncrono registra métricas a
+    partir dos executores.
+    """
+
+    # Limites (em segundos) dos buckets dos histogramas de duração
+    DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+    PROMETHEUS_PREFIX = 'collection'
+
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS, max_domains: int = 20):
+        """
+        Inicializa as métricas.
+
+        Args:
+            buckets: Limites superiores dos buckets dos histogramas, em segundos
+            max_domains: Número de domínios (os mais lentos) incluídos no resumo
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.max_domains = max_domains
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Descarta as métricas acumuladas (início de uma nova execução)."""
+        with self._lock:
+            self.started_at = datetime.now(timezone.utc)
+            self._histograms: Dict[str, Dict] = {}
+            self._counters: Dict[tuple, int] = {}
+            self._domains: Dict[str, Dict] = {}
+            self.bytes_downloaded = 0
+
+    @contextmanager
+    def timer(self, stage: str):
+        """
+        Mede a duração do bloco e registra no histograma da etapa.
+
+        Examples:
+            >>> with metrics.timer('gnews_request'):
+            ...     response = requests.get(url)
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start)
+
+    def observe(self, stage: str, seconds: float) -> None:
+        """Registra uma duração no histograma da etapa."""
+        with self._lock:
+            histogram = self._histograms.get(stage)
+            if histogram is None:
+                histogram = {
+                    'count': 0,
+                    'sum': 0.0,
+                    'min': seconds,
+                    'max': seconds,
+                    'buckets': [0] * len(self.buckets)
+                }
+                self._histograms[stage] = histogram
+
+            histogram['count'] += 1
+            histogram['sum'] += seconds
+            histogram['min'] = min(histogram['min'], seconds)
+            histogram['max'] = max(histogram['max'], seconds)
+            for i, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    histogram['buckets'][i] += 1
+                    break
+
+    def increment(self, name: str, amount: int = 1, **labels) -> None:
+        """
+        Incrementa um contador com rótulos.
+
+        Args:
+            name: Nome do contador (ex: 'articles')
+            amount: Valor a somar
+            **labels: Rótulos do contador (ex: stage='skipped', reason='URL duplicada')
+        """
+        key = (name, tuple(sorted((k, str(v)) for k, v in labels.items() if v is not None)))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def record_download(self, url: str, seconds: float, size: int) -> None:
+        """
+        Registra um download de página: bytes e latência do domínio.
+
+        Args:
+            url: URL baixada
+            seconds: Duração da requisição
+            size: Tamanho do corpo da resposta em bytes
+        """
+        domain = urlparse(url).netloc.lower()
+        if domain.startswith('www.'):
+            domain = domain[4:]
+
+        with self._lock:
+            self.bytes_downloaded += size
+            stats = self._domains.setdefault(domain, {'count': 0, 'seconds': 0.0, 'max_seconds': 0.0, 'bytes': 0})
+            stats['count'] += 1
+            stats['seconds'] += seconds
+            stats['max_seconds'] = max(stats['max_seconds'], seconds)
+            stats['bytes'] += size
+
+    def summary(self, **extra) -> Dict:
+        """
+        Gera o resumo da execução.
+
+        Args:
+            **extra: Campos adicionais do resumo (ex: run_id, status)
+
+        Returns:
+            Dicionário serializável em JSON
+        """
+        with self._lock:
+            stages = {}
+            for stage, histogram in self._histograms.items():
+                stages[stage] = {
+                    'count': histogram['count'],
+                    'total_seconds': round(histogram['sum'], 3),
+                    'avg_seconds': round(histogram['sum'] / histogram['count'], 3),
+                    'min_seconds': round(histogram['min'], 3),
+                    'max_seconds': round(histogram['max'], 3),
+                    'buckets': {
+                        str(bound): count for bound, count in zip(self.buckets, histogram['buckets'])
+                    }
+                }
+
+            counters: Dict[str, list] = {}
+            for (name, labels), value in sorted(self._counters.items()):
+                counters.setdefault(name, []).append({**dict(labels), 'value': value})
+
+            slowest = sorted(self._domains.items(), key=lambda item: item[1]['seconds'], reverse=True)
+            domains = {
+                domain: {
+                    'count': stats['count'],
+                    'avg_seconds': round(stats['seconds'] / stats['count'], 3),
+                    'max_seconds': round(stats['max_seconds'], 3),
+                    'bytes': stats['bytes']
+                }
+                for domain, stats in slowest[:self.max_domains]
+            }
+
+            return {
+                **extra,
+                'started_at': self.started_at.isoformat(),
+                'finished_at': datetime.now(timezone.utc).isoformat(),
+                'stages': stages,
+                'counters': counters,
+                'bytes_downloaded': self.bytes_downloaded,
+                'domains': domains
+            }
+
+    def write_prometheus(self, path: str) -> None:
+        """
+        Grava as métricas no formato texto do Prometheus.
+
+        A escrita é atômica (arquivo temporário + rename), como exigido pelo
+        textfile collector do node_exporter.
+        """
+        prefix = self.PROMETHEUS_PREFIX
+        lines = []
+
+        with self._lock:
+            name = f'{prefix}_stage_duration_seconds'
+            lines.append(f'# HELP {name} Duração das etapas do job de coleta.')
+            lines.append(f'# TYPE {name} histogram')
+            for stage, histogram in sorted(self._histograms.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets, histogram['buckets']):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+                lines.append(f'{name}_bucket{{stage="{stage}",le="+Inf"}} {histogram["count"]}')
+                lines.append(f'{name}_sum{{stage="{stage}"}} {histogram["sum"]:.6f}')
+                lines.append(f'{name}_count{{stage="{stage}"}} {histogram["count"]}')
+
+            declared = set()
+            for (counter, labels), value in sorted(self._counters.items()):
+                name = f'{prefix}_{counter}_total'
+                if name not in declared:
+                    lines.append(f'# TYPE {name} counter')
+                    declared.add(name)
+                label_str = ','.join(f'{key}="{self._escape_label(val)}"' for key, val in labels)
+                lines.append(f'{name}{{{label_str}}} {value}' if label_str else f'{name} {value}')
+
+            name = f'{prefix}_download_bytes_total'
+            lines.append(f'# TYPE {name} counter')
+            lines.append(f'{name} {self.bytes_downloaded}')
+
+            name = f'{prefix}_domain_download_seconds'
+            lines.append(f'# TYPE {name} summary')
+            slowest = sorted(self._domains.items(), key=lambda item: item[1]['seconds'], reverse=True)
+            for domain, stats in slowest[:self.max_domains]:
+                lines.append(f'{name}_sum{{domain="{self._escape_label(domain)}"}} {stats["seconds"]:.6f}')
+                lines.append(f'{name}_count{{domain="{self._escape_label(domain)}"}} {stats["count"]}')
+
+            name = f'{prefix}_last_run_timestamp_seconds'
+            lines.append(f'# TYPE {name} gauge')
+            lines.append(f'{name} {int(time.time())}')
+
+        self._write_atomic(path, '\n'.join(lines) + '\n')
+
+    def emit(self, json_path: Optional[str] = None, prometheus_path: Optional[str] = None, **extra) -> Dict:
+        """
+        Publica as métricas da execução: loga o resumo em JSON e grava os
+        arquivos configurados. Erros de escrita são logados e ignorados.
+
+        Args:
+            json_path: Arquivo do resumo em JSON (opcional)
+            prometheus_path: Arquivo no formato do Prometheus (opcional)
+            **extra: Campos adicionais do resumo (ex: run_id, status)
+
+        Returns:
+            Resumo da execução
+        """
+        summary = self.summary(**extra)
+        logging.info(f"MÉTRICAS DA COLETA: {json.dumps(summary, ensure_ascii=False)}")
+
+        if json_path:
+            try:
+                self._write_atomic(json_path, json.dumps(summary, ensure_ascii=False, indent=2))
+            except OSError as e:
+                logging.error(f"Erro ao gravar resumo das métricas em '{json_path}': {e}")
+
+        if prometheus_path:
+            try:
+                self.write_prometheus(prometheus_path)
+            except OSError as e:
+                logging.error(f"Erro ao gravar métricas do Prometheus em '{prometheus_path}': {e}")
+
+        return summary
+
+    def _escape_label(self, value: str) -> str:
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+    def _write_atomic(self, path: str, content: str) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
@@ -0,0 +1,68 @@
+"""
+GET condicional (ETag / If-None-Match) para as rotas de notícias.
+"""
+
+import hashlib
+import logging
+from functools import wraps
+from typing import Callable, Optional
+
+from flask import make_response, request
+
+
+def make_etag(*parts) -> str:
+    """
+    Gera um ETag forte a partir das partes que identificam a resposta.
+
+    Args:
+        *parts: Valores que mudam quando o conteúdo muda (IDs, versão, etc.)
+
+    Returns:
+        Hash SHA-1 (hex) das partes, sem aspas
+    """
+    return hashlib.sha1('|'.join(map(str, parts)).encode('utf-8')).hexdigest()
+
+
+def conditional_get(etag_builder: Optional[Callable[..., Optional[str]]] = None):
+    """
+    Decorator que responde 304 Not Modified quando o If-None-Match do cliente
+    corresponde ao ETag atual.
+
+    Com etag_builder, o ETag é calculado antes da view, por consultas baratas,
+    e a resposta só é montada se o cliente não tiver a versão atual. Sem ele
+    (ou se retornar None), o ETag é o hash do corpo da resposta montada: não
+    economiza processamento, mas evita retransmitir o corpo.
+
+    Args:
+        etag_builder: Função com os mesmos argumentos da view que retorna o
+            ETag, ou None para usar o hash do corpo
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            etag = None
+            if etag_builder:
+                try:
+                    etag = etag_builder(*args, **kwargs)
+                except Exception as e:
+                    logging.warning(f"Erro ao calcular ETag de {request.path}: {e}")
+
+            if etag and request.if_none_match.contains_weak(etag):
+                response = make_response('', 304)
+                response.set_etag(etag)
+                response.headers['Cache-Control'] = 'private, no-cache'
+                return response
+
+            response = make_response(f(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+
+            if etag:
+                response.set_etag(etag)
+            else:
+                response.add_etag()
+            # O cliente pode guardar a resposta, mas deve revalidar a cada uso
+            response.headers['Cache-Control'] = 'private, no-cache'
+            return response.make_conditional(request)
+        return decorated_function
+    return decorator
@@ -0,0 +1,23 @@
+"""
+Utilitários dependentes do dialeto do banco de dados.
+"""
+
+from sqlalchemy.dialects import postgresql, sqlite
+
+
+def dialect_insert(session):
+    """
+    Retorna a função insert() com suporte a ON CONFLICT do dialeto da sessão.
+
+    Args:
+        session: Sessão SQLAlchemy
+
+    Returns:
+        insert() do PostgreSQL ou do SQLite, ou None para outros dialetos
+    """
+    dialect_name = session.get_bind().dialect.name
+    if dialect_name == "postgresql":
+        return postgresql.insert
+    if dialect_name == "sqlite":
+        return sqlite.insert
+    return None
@@ -0,0 +1,277 @@
+"""
+Saúde dos domínios de scraping com decaimento exponencial e circuit breaker.
+Substitui o bloqueio permanente para falhas que podem ser temporárias.
+"""
+
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from app.repositories.scraping_domain_health_repository import ScrapingDomainHealthRepository
+
+
+class DomainHealth:
+    """
+    Mantém, por domínio, contadores de sucesso e falha que decaem
+    exponencialmente com o tempo, e um circuit breaker com três estados:
+
+    - closed: requisições liberadas
+    - open: requisições bloqueadas até next_probe_at
+    - half_open: uma requisição de teste liberada; sucesso fecha o circuito,
+      falha reabre com intervalo de teste dobrado (até max_probe_interval)
+
+    O circuito abre quando o score de falhas atinge min_failures e representa
+    pelo menos failure_ratio do total. Os estados ficam em memória e são
+    gravados na tabela 'scraping_domain_health' em flush().
+    """
+
+    STATE_CLOSED = 'closed'
+    STATE_OPEN = 'open'
+    STATE_HALF_OPEN = 'half_open'
+
+    # Tolerância para o decaimento entre falhas registradas quase ao mesmo tempo
+    SCORE_EPSILON = 1e-6
+
+    def __init__(
+        self,
+        repository: Optional[ScrapingDomainHealthRepository] = None,
+        half_life: timedelta = timedelta(hours=12),
+        min_failures: float = 3.0,
+        failure_ratio: float = 0.5,
+        probe_interval: timedelta = timedelta(hours=1),
+        max_probe_interval: timedelta = timedelta(days=2)
+    ):
+        """
+        Inicializa o modelo de saúde.
+
+        Args:
+            repository: Repositório da tabela de saúde dos domínios
+            half_life: Tempo para os contadores caírem pela metade
+            min_failures: Score mínimo de falhas para abrir o circuito
+            failure_ratio: Proporção mínima de falhas para abrir o circuito
+            probe_interval: Intervalo até a primeira requisição de teste
+            max_probe_interval: Intervalo máximo entre requisições de teste
+        """
+        self.repository = repository or ScrapingDomainHealthRepository()
+        self.half_life = half_life
+        self.min_failures = min_failures
+        self.failure_ratio = failure_ratio
+        self.probe_interval = probe_interval
+        self.max_probe_interval = max_probe_interval
+        self.domains: Dict[str, Dict] = {}
+        self._dirty: set[str] = set()
+        # Registros chegam em paralelo dos executores da coleta assíncrona
+        self._lock = threading.RLock()
+
+    def load(self) -> Dict[str, Dict]:
+        """
+        Carrega o estado de saúde dos domínios do banco de dados.
+
+        Returns:
+            Dicionário de estados por domínio
+        """
+        with self._lock:
+            try:
+                self.domains = self.repository.find_all()
+                for record in self.domains.values():
+                    for key in ('opened_at', 'next_probe_at', 'updated_at'):
+                        record[key] = self._as_utc(record[key])
+                logging.info(f"Saúde dos domínios carregada. {len(self.domains)} domínios conhecidos.")
+            except Exception as e:
+                logging.error(f"Erro ao carregar saúde dos domínios: {e}. Iniciando sem histórico.")
+                self.domains = {}
+            return self.domains
+
+    def flush(self) -> None:
+        """Grava no banco os domínios alterados desde a última gravação."""
+        with self._lock:
+            if not self._dirty:
+                return
+
+            entries = [{'domain': domain, **self.domains[domain]} for domain in self._dirty if domain in self.domains]
+            try:
+                self.repository.upsert_many(entries)
+                self._dirty = set()
+                logging.debug(f"Saúde dos domínios gravada: {len(entries)} domínios atualizados.")
+            except Exception as e:
+                logging.error(f"Erro ao salvar saúde dos domínios: {e}", exc_info=True)
+
+    def get_domain(self, url: str) -> Optional[str]:
+        """
+        Extrai o domínio de uma URL (sem 'www.').
+
+        Args:
+            url: URL completa
+
+        Returns:
+            Domínio ou None se inválida
+        """
+        domain = urlparse(url).netloc.lower()
+        if domain.startswith('www.'):
+            domain = domain[4:]
+        return domain or None
+
+    def allow_request(self, url: str) -> bool:
+        """
+        Verifica se uma requisição ao domínio deve ser feita.
+
+        Um circuito aberto cujo next_probe_at já passou vai para half_open e
+        libera uma requisição de teste.
+
+        Args:
+            url: URL a verificar
+
+        Returns:
+            True se a requisição está liberada
+        """
+        with self._lock:
+            domain = self.get_domain(url)
+            record = self.domains.get(domain) if domain else None
+            if not record or record['state'] == self.STATE_CLOSED:
+                return True
+
+            now = self._now()
+            if record['next_probe_at'] and now >= record['next_probe_at']:
+                record['state'] = self.STATE_HALF_OPEN
+                # Se o resultado do teste nunca for registrado, libera outro teste depois
+                record['next_probe_at'] = now + self._probe_delay(record['open_count'])
+                record['updated_at'] = now
+                self._dirty.add(domain)
+                logging.info(f"Circuito de '{domain}' em half-open: liberando requisição de teste.")
+                return True
+
+            return False
+
+    def record_success(self, url: str) -> None:
+        """Registra um scraping bem-sucedido e fecha o circuito do domínio."""
+        with self._lock:
+            domain = self.get_domain(url)
+            if not domain:
+                return
+
+            record = self._get_decayed(domain)
+            record['success_score'] += 1.0
+            if record['state'] != self.STATE_CLOSED:
+                logging.info(f"Circuito de '{domain}' fechado após sucesso.")
+            record['state'] = self.STATE_CLOSED
+            record['open_count'] = 0
+            record['opened_at'] = None
+            record['next_probe_at'] = None
+            self._dirty.add(domain)
+
+    def record_failure(self, url: str, error_type: str) -> None:
+        """
+        Registra uma falha possivelmente temporária do domínio.
+
+        Args:
+            url: URL que falhou
+            error_type: Tipo do erro (ex: 'Request Error', 'Timeout', 'Empty Content')
+        """
+        with self._lock:
+            domain = self.get_domain(url)
+            if not domain:
+                return
+
+            record = self._get_decayed(domain)
+            record['failure_score'] += 1.0
+            record['last_error_type'] = error_type
+            self._dirty.add(domain)
+
+            if record['state'] == self.STATE_HALF_OPEN:
+                self._open(domain, record)
+                return
+
+            total = record['success_score'] + record['failure_score']
+            if (
+                record['state'] == self.STATE_CLOSED
+                and record['failure_score'] + self.SCORE_EPSILON >= self.min_failures
+                and record['failure_score'] / total + self.SCORE_EPSILON >= self.failure_ratio
+            ):
+                self._open(domain, record)
+
+    def get_state(self, url: str) -> str:
+        """Retorna o estado do circuito do domínio de uma URL."""
+        with self._lock:
+            domain = self.get_domain(url)
+            record = self.domains.get(domain) if domain else None
+            return record['state'] if record else self.STATE_CLOSED
+
+    def get_statistics(self) -> Dict:
+        """
+        Retorna estatísticas sobre a saúde dos domínios.
+
+        Returns:
+            Dicionário com totais por estado e os domínios com circuito não fechado
+        """
+        with self._lock:
+            by_state = {self.STATE_CLOSED: 0, self.STATE_OPEN: 0, self.STATE_HALF_OPEN: 0}
+            unhealthy = {}
+            for domain, record in self.domains.items():
+                by_state[record['state']] += 1
+                if record['state'] != self.STATE_CLOSED:
+                    unhealthy[domain] = {
+                        'state': record['state'],
+                        'failure_score': round(record['failure_score'], 2),
+                        'success_score': round(record['success_score'], 2),
+                        'last_error_type': record['last_error_type'],
+                        'next_probe_at': record['next_probe_at'].isoformat() if record['next_probe_at'] else None
+                    }
+
+            return {
+                'total_domains': len(self.domains),
+                'by_state': by_state,
+                'unhealthy_domains': unhealthy
+            }
+
+    def _open(self, domain: str, record: Dict) -> None:
+        now = self._now()
+        record['state'] = self.STATE_OPEN
+        record['open_count'] += 1
+        record['opened_at'] = now
+        record['next_probe_at'] = now + self._probe_delay(record['open_count'])
+        logging.warning(
+            f"Circuito de '{domain}' aberto (falhas: {record['failure_score']:.1f}, "
+            f"último erro: {record['last_error_type']}). Próximo teste em {record['next_probe_at'].isoformat()}."
+        )
+
+    def _probe_delay(self, open_count: int) -> timedelta:
+        """Intervalo até o próximo teste: dobra a cada reabertura, até max_probe_interval."""
+        delay = self.probe_interval * (2 ** max(open_count - 1, 0))
+        return min(delay, self.max_probe_interval)
+
+    def _get_decayed(self, domain: str) -> Dict:
+        """Retorna o registro do domínio com os contadores decaídos até agora."""
+        now = self._now()
+        record = self.domains.get(domain)
+        if record is None:
+            record = {
+                'state': self.STATE_CLOSED,
+                'success_score': 0.0,
+                'failure_score': 0.0,
+                'open_count': 0,
+                'last_error_type': None,
+                'opened_at': None,
+                'next_probe_at': None,
+                'updated_at': now
+            }
+            self.domains[domain] = record
+            return record
+
+        elapsed = (now - record['updated_at']).total_seconds()
+        if elapsed > 0:
+            factor = 0.5 ** (elapsed / self.half_life.total_seconds())
+            record['success_score'] *= factor
+            record['failure_score'] *= factor
+        record['updated_at'] = now
+        return record
+
+    def _now(self) -> datetime:
+        return datetime.now(timezone.utc)
+
+    def _as_utc(self, value: Optional[datetime]) -> Optional[datetime]:
+        # SQLite devolve datetimes sem fuso horário
+        if value is not None and value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value
@@ -0,0 +1,222 @@
+"""
+Perfis de extração por domínio aprendidos em scrapings anteriores.
+Permitem extrair diretamente o nó de conteúdo de publishers já conhecidos.
+"""
+
+import json
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+from app.repositories.scraping_domain_profile_repository import ScrapingDomainProfileRepository
+
+
+class DomainProfileStore:
+    """
+    Guarda, por domínio, o seletor CSS do container de conteúdo, os seletores
+    de boilerplate removidos e o ponto de corte do final do artigo.
+
+    O perfil é descartado após MAX_CONSECUTIVE_MISSES falhas seguidas de
+    validação no caminho rápido, e reaprendido no próximo scraping genérico.
+
+    Os perfis ficam em memória e na tabela 'scraping_domain_profiles'. Perfis
+    aprendidos ou descartados são gravados na hora; os contadores de acertos
+    e falhas, em flush(). O antigo arquivo JSON pode ser importado com
+    import_json.
+    """
+
+    MAX_CONSECUTIVE_MISSES = 3
+
+    def __init__(self, repository: Optional[ScrapingDomainProfileRepository] = None):
+        """
+        Inicializa o store.
+
+        Args:
+            repository: Repositório da tabela de perfis de domínio
+        """
+        self.repository = repository or ScrapingDomainProfileRepository()
+        self.profiles: Dict[str, Dict] = {}
+        self._dirty: set[str] = set()
+        self._removed: set[str] = set()
+        # parse_page roda em paralelo no executor de CPU da coleta assíncrona
+        self._lock = threading.RLock()
+
+    def load(self) -> Dict[str, Dict]:
+        """
+        Carrega os perfis do banco de dados.
+
+        Returns:
+            Dicionário de perfis por domínio
+        """
+        with self._lock:
+            try:
+                self.profiles = self.repository.find_all()
+                logging.info(f"Perfis de domínio carregados. {len(self.profiles)} domínios conhecidos.")
+            except Exception as e:
+                logging.error(f"Erro ao carregar perfis de domínio: {e}. Iniciando sem perfis.")
+                self.profiles = {}
+            return self.profiles
+
+    def flush(self) -> None:
+        """Grava no banco os perfis alterados e remove os descartados desde a última gravação."""
+        with self._lock:
+            if not self._dirty and not self._removed:
+                return
+
+            entries = [{'domain': domain, **self.profiles[domain]} for domain in self._dirty if domain in self.profiles]
+            try:
+                self.repository.upsert_many(entries)
+                self.repository.delete_many(sorted(self._removed))
+                logging.debug(f"Perfis de domínio gravados: {len(entries)} atualizados, {len(self._removed)} removidos.")
+                self._dirty, self._removed = set(), set()
+            except Exception as e:
+                logging.error(f"Erro ao salvar perfis de domínio: {e}", exc_info=True)
+
+    def save(self) -> None:
+        """Mantido por compatibilidade: equivale a flush()."""
+        self.flush()
+
+    def import_json(self, json_file_path: str) -> int:
+        """
+        Importa os perfis do antigo arquivo JSON ({dominio: {...}}), substituindo
+        os dos mesmos domínios.
+
+        Args:
+            json_file_path: Caminho do arquivo JSON
+
+        Returns:
+            Número de perfis importados
+        """
+        with open(json_file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        now = datetime.now(timezone.utc)
+        entries = [
+            {
+                'domain': domain,
+                'container_selector': profile['container_selector'],
+                'boilerplate_selectors': profile.get('boilerplate_selectors') or [],
+                'trim_selector': profile.get('trim_selector'),
+                'hits': profile.get('hits', 0),
+                'consecutive_misses': profile.get('consecutive_misses', 0),
+                'learned_at': self._parse_datetime(profile.get('learned_at')) or now,
+                'updated_at': self._parse_datetime(profile.get('updated_at')) or now,
+            }
+            for domain, profile in data.items()
+        ]
+
+        with self._lock:
+            self.flush()
+            self.repository.upsert_many(entries)
+            self.load()
+        logging.info(f"{len(entries)} perfis de domínio importados de '{json_file_path}'.")
+        return len(entries)
+
+    def _parse_datetime(self, value: Optional[str]) -> Optional[datetime]:
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+
+    def get_domain(self, url: str) -> Optional[str]:
+        """
+        Extrai o domínio de uma URL (sem 'www.').
+
+        Args:
+            url: URL completa
+
+        Returns:
+            Domínio ou None se inválida
+        """
+        domain = urlparse(url).netloc.lower()
+        if domain.startswith('www.'):
+            domain = domain[4:]
+        return domain or None
+
+    def get(self, url: str) -> Optional[Dict]:
+        """
+        Retorna o perfil do domínio de uma URL.
+
+        Args:
+            url: URL do artigo
+
+        Returns:
+            Perfil ou None se o domínio ainda não foi aprendido
+        """
+        with self._lock:
+            domain = self.get_domain(url)
+            return self.profiles.get(domain) if domain else None
+
+    def learn(
+        self,
+        url: str,
+        container_selector: str,
+        boilerplate_selectors: List[str],
+        trim_selector: Optional[str]
+    ) -> None:
+        """
+        Registra (ou substitui) o perfil do domínio de uma URL.
+
+        Args:
+            url: URL do artigo processado com sucesso pelo caminho genérico
+            container_selector: Seletor CSS único do nó de conteúdo
+            boilerplate_selectors: Seletores de elementos removidos como boilerplate
+            trim_selector: Seletor do primeiro elemento cortado no final do artigo
+        """
+        with self._lock:
+            domain = self.get_domain(url)
+            if not domain:
+                return
+
+            now = datetime.now(timezone.utc)
+            self.profiles[domain] = {
+                'container_selector': container_selector,
+                'boilerplate_selectors': sorted(set(boilerplate_selectors)),
+                'trim_selector': trim_selector,
+                'hits': 0,
+                'consecutive_misses': 0,
+                'learned_at': now,
+                'updated_at': now
+            }
+            self._dirty.add(domain)
+            self._removed.discard(domain)
+            logging.info(f"Perfil de extração aprendido para '{domain}': {container_selector}")
+            self.flush()
+
+    def record_hit(self, url: str) -> None:
+        """Registra uma extração bem-sucedida pelo caminho rápido."""
+        with self._lock:
+            domain = self.get_domain(url)
+            profile = self.profiles.get(domain) if domain else None
+            if not profile:
+                return
+            profile['hits'] += 1
+            profile['consecutive_misses'] = 0
+            profile['updated_at'] = datetime.now(timezone.utc)
+            self._dirty.add(domain)
+
+    def record_miss(self, url: str) -> None:
+        """
+        Registra uma falha de validação no caminho rápido.
+        Remove o perfil após MAX_CONSECUTIVE_MISSES falhas seguidas.
+        """
+        with self._lock:
+            domain = self.get_domain(url)
+            profile = self.profiles.get(domain) if domain else None
+            if not profile:
+                return
+
+            profile['consecutive_misses'] += 1
+            profile['updated_at'] = datetime.now(timezone.utc)
+            self._dirty.add(domain)
+
+            if profile['consecutive_misses'] >= self.MAX_CONSECUTIVE_MISSES:
+                del self.profiles[domain]
+                self._dirty.discard(domain)
+                self._removed.add(domain)
+                logging.info(f"Perfil de extração de '{domain}' descartado após falhas consecutivas.")
+                self.flush()
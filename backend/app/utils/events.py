@@ -0,0 +1,17 @@
+"""
+Sinais internos da aplicação (blinker, já instalado com o Flask).
+
+Desacoplam quem altera os dados de quem mantém estado derivado deles (ex:
+o estado do ranking do feed em FeedRankingService). Os receptores são
+chamados na mesma thread de quem envia o sinal.
+"""
+
+from blinker import Namespace
+
+_signals = Namespace()
+
+# Fontes preferidas ou custom topics do usuário mudaram (sender = user_id)
+preferences_changed = _signals.signal("preferences-changed")
+
+# Uma coleta de notícias terminou (sender = ID da execução em collection_runs)
+collection_finished = _signals.signal("collection-finished")
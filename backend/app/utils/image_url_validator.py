@@ -24,13 +24,19 @@ class ImageUrlValidator:
     )
 
     @classmethod
-    def validate_image_url_accessible(cls, url: str, timeout: int = 10) -> bool:
+    def validate_image_url_accessible(
+        cls,
+        url: str,
+        timeout: int = 10,
+        session: Optional[requests.Session] = None
+    ) -> bool:
         """
         Valida se uma URL de imagem é acessível usando HTTP HEAD.
 
         Args:
             url: URL da imagem a ser validada
             timeout: Timeout em segundos (padrão: 10)
+            session: Sessão HTTP com pool de conexões (opcional)
 
         Returns:
             True se acessível (status 200-299), False caso contrário
@@ -59,7 +65,7 @@ class ImageUrlValidator:
             headers = {'User-Agent': cls.USER_AGENT}
 
             # Usar HEAD request para eficiência
-            response = requests.head(
+            response = (session or requests).head(
                 url,
                 timeout=timeout,
                 headers=headers,
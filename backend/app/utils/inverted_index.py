@@ -0,0 +1,181 @@
+"""
+Índice invertido em memória para a busca de notícias sem PostgreSQL.
+
+Cada token aponta para uma posting list compacta (array('I') de IDs em ordem
+crescente, com um array('f') paralelo de pesos). As consultas cruzam
+as listas a partir da menor, com busca binária nas demais, sem percorrer
+todos os documentos.
+
+Os pesos seguem os do tsvector do PostgreSQL (app/utils/news_search.py):
+título 1.0 (A), descrição 0.4 (B) e texto 0.1 (D), somados por ocorrência e
+normalizados como o ts_rank(..., 1), por 1 + log(número de tokens). Não há
+stemming: 'eleição' e 'eleições' são tokens diferentes.
+"""
+
+import heapq
+import math
+import re
+import unicodedata
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Optional
+
+from app.utils.news_search import SEARCH_CONTENT_CHARS, _STOPWORDS
+
+# Pesos do título (A), da descrição (B) e do texto (D), os padrões do ts_rank
+FIELD_WEIGHTS = (1.0, 0.4, 0.1)
+
+_TOKEN_RE = re.compile(r"\w+")
+_QUERY_RE = re.compile(r'(-?)"([^"]*)"|(\S+)')
+_IGNORED = frozenset().union(*_STOPWORDS.values())
+
+
+def tokenize(text: Optional[str]) -> list[str]:
+    """Tokens em minúsculas, sem acentos e sem stopwords (pt/en)."""
+    if not text:
+        return []
+    folded = unicodedata.normalize("NFKD", text.lower())
+    folded = "".join(char for char in folded if not unicodedata.combining(char))
+    return [token for token in _TOKEN_RE.findall(folded) if token not in _IGNORED]
+
+
+def parse_query(query: str) -> list[tuple[list[str], list[str]]]:
+    """
+    Interpreta a busca como o websearch_to_tsquery: termos são combinados com
+    AND, "frases" viram os seus termos, -termo exclui e OR separa alternativas
+    (AND tem precedência sobre OR).
+
+    Returns:
+        Lista de cláusulas (termos obrigatórios, termos excluídos), unidas por OR
+    """
+    clauses = [([], [])]
+    for match in _QUERY_RE.finditer(query):
+        negated, phrase, word = match.group(1), match.group(2), match.group(3)
+        if word is not None and word == "OR":
+            clauses.append(([], []))
+            continue
+        if word is not None and word.startswith("-") and len(word) > 1:
+            negated, word = "-", word[1:]
+        tokens = tokenize(phrase if word is None else word)
+        required, excluded = clauses[-1]
+        (excluded if negated else required).extend(tokens)
+    return [(required, excluded) for required, excluded in clauses if required]
+
+
+class _Postings:
+    __slots__ = ("ids", "weights")
+
+    def __init__(self):
+        self.ids = array("I")
+        self.weights = array("f")
+
+    def find(self, doc_id: int, lo: int = 0) -> int:
+        """Posição do documento na lista, ou -1."""
+        position = bisect_left(self.ids, doc_id, lo)
+        return position if position < len(self.ids) and self.ids[position] == doc_id else -1
+
+
+class InvertedIndex:
+    """Índice invertido de notícias (título, descrição e texto), atualizado incrementalmente."""
+
+    def __init__(self):
+        self._postings: dict[str, _Postings] = {}
+        self._lengths: dict[int, int] = {}
+        self._languages: dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def __contains__(self, doc_id: int) -> bool:
+        return doc_id in self._lengths
+
+    def add(
+        self,
+        doc_id: int,
+        title: Optional[str],
+        description: Optional[str],
+        content: Optional[str],
+        language: Optional[str] = None
+    ) -> None:
+        """Indexa uma notícia; IDs já indexados são ignorados."""
+        if doc_id in self._lengths:
+            return
+
+        terms: dict[str, float] = {}
+        length = 0
+        for field, text in enumerate((title, description, (content or "")[:SEARCH_CONTENT_CHARS])):
+            for token in tokenize(text):
+                terms[token] = terms.get(token, 0.0) + FIELD_WEIGHTS[field]
+                length += 1
+
+        for token, weight in terms.items():
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = _Postings()
+            # IDs chegam em ordem crescente; fora de ordem, a lista continua ordenada
+            position = len(postings.ids)
+            if position and postings.ids[-1] > doc_id:
+                position = bisect_left(postings.ids, doc_id)
+            postings.ids.insert(position, doc_id)
+            postings.weights.insert(position, weight)
+
+        self._lengths[doc_id] = length
+        self._languages[doc_id] = language
+
+    def search(
+        self,
+        query: str,
+        language: Optional[str] = None,
+        limit: int = 20,
+        after: Optional[tuple[float, int]] = None
+    ) -> list[tuple[int, float]]:
+        """
+        Documentos que casam com a busca, do mais relevante para o menos.
+
+        Args:
+            query: Texto da busca (sintaxe de parse_query)
+            language: Restringe ao idioma informado
+            limit: Quantidade máxima de resultados
+            after: (rank, id) do último resultado da página anterior
+
+        Returns:
+            Lista de (doc_id, rank), ordenada por rank e id decrescentes
+        """
+        ranks: dict[int, float] = {}
+        for required, excluded in parse_query(query):
+            for doc_id, rank in self._match_clause(required, excluded):
+                if rank > ranks.get(doc_id, -1.0):
+                    ranks[doc_id] = rank
+
+        candidates = (
+            (rank, doc_id) for doc_id, rank in ranks.items()
+            if (language is None or self._languages.get(doc_id) == language)
+            and (after is None or (rank, doc_id) < after)
+        )
+        return [(doc_id, rank) for rank, doc_id in heapq.nlargest(limit, candidates)]
+
+    def _match_clause(self, required: list[str], excluded: list[str]) -> Iterable[tuple[int, float]]:
+        """Documentos com todos os termos obrigatórios e nenhum excluído, com o rank."""
+        lists = []
+        for token in dict.fromkeys(required):
+            postings = self._postings.get(token)
+            if postings is None:
+                return
+            lists.append(postings)
+        lists.sort(key=lambda postings: len(postings.ids))
+        shortest, others = lists[0], lists[1:]
+        excluded_lists = [self._postings[token] for token in set(excluded) if token in self._postings]
+
+        starts = [0] * len(others)
+        for position, doc_id in enumerate(shortest.ids):
+            weight = shortest.weights[position]
+            for i, postings in enumerate(others):
+                found = postings.find(doc_id, starts[i])
+                if found < 0:
+                    break
+                starts[i] = found + 1
+                weight += postings.weights[found]
+            else:
+                if any(postings.find(doc_id) >= 0 for postings in excluded_lists):
+                    continue
+                yield doc_id, weight / (1 + math.log(max(self._lengths[doc_id], 1)))
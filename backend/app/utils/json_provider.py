@@ -0,0 +1,78 @@
+"""
+Providers de JSON do Flask com serialização nativa de datetime (ISO 8601).
+O orjson é usado quando instalado; sem ele, o provider padrão do Flask.
+"""
+
+import decimal
+import logging
+from datetime import date, datetime
+
+from flask.json.provider import DefaultJSONProvider, JSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depende do ambiente
+    orjson = None
+
+
+def _default(obj):
+    """Tipos que nenhum dos encoders serializa sozinho."""
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    if hasattr(obj, '__html__'):
+        return str(obj.__html__())
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Objeto do tipo {type(obj).__name__} não é serializável em JSON")
+
+
+class IsoJSONProvider(DefaultJSONProvider):
+    """
+    Provider padrão do Flask (json da stdlib), mas com datetime/date em
+    ISO 8601, igual a .isoformat(), em vez do formato HTTP (RFC 822).
+    """
+
+    @staticmethod
+    def default(obj):
+        if isinstance(obj, (datetime, date)):
+            return obj.isoformat()
+        return DefaultJSONProvider.default(obj)
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    Provider baseado em orjson: serializa direto para bytes UTF-8, sem
+    escapar acentos, e datetime/date nativamente em ISO 8601 (mesmo texto de
+    .isoformat()). As chaves não são ordenadas.
+    """
+
+    def _options(self) -> int:
+        options = orjson.OPT_NON_STR_KEYS
+        if self._app.debug:
+            options |= orjson.OPT_INDENT_2
+        return options
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=_default, option=self._options()).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        data = orjson.dumps(obj, default=_default, option=self._options() | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(data, mimetype='application/json')
+
+
+def create_json_provider(app) -> JSONProvider:
+    """
+    Cria o provider conforme JSON_PROVIDER ('orjson', 'default' ou 'auto').
+
+    'auto' (padrão) usa orjson se estiver instalado.
+    """
+    choice = app.config.get('JSON_PROVIDER', 'auto')
+    if choice in ('orjson', 'auto') and orjson is not None:
+        return OrjsonProvider(app)
+    if choice == 'orjson':
+        logging.warning("JSON_PROVIDER=orjson, mas o pacote 'orjson' não está instalado. Usando o provider padrão.")
+    return IsoJSONProvider(app)
@@ -0,0 +1,138 @@
+"""
+Índice de artigos quase duplicados (SimHash + LSH por bandas).
+Evita salvar cópias da mesma matéria de agência publicadas por vários veículos.
+"""
+
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Set
+
+from app.repositories.news_fingerprint_repository import NewsFingerprintRepository
+from app.utils.simhash import simhash, hamming_distance, split_bands
+
+
+class NearDuplicateIndex:
+    """
+    Detecta artigos cujo conteúdo está a até max_distance bits (distância de
+    Hamming) do SimHash de um artigo recente.
+
+    Os candidatos vêm de duas fontes:
+    - tabela 'news_fingerprints': artigos salvos dentro da janela (window),
+      buscados pelas bandas indexadas
+    - memória: artigos validados nesta execução (add())
+
+    Os fingerprints em memória são gravados em flush(), depois que as notícias
+    são salvas e têm ID.
+    """
+
+    def __init__(
+        self,
+        repository: Optional[NewsFingerprintRepository] = None,
+        max_distance: int = 3,
+        window: timedelta = timedelta(days=7)
+    ):
+        """
+        Inicializa o índice.
+
+        Args:
+            repository: Repositório da tabela de fingerprints
+            max_distance: Distância de Hamming máxima para considerar duplicata
+                          (até 3 garante coincidência em uma das 4 bandas)
+            window: Idade máxima dos artigos salvos usados na comparação
+        """
+        self.repository = repository or NewsFingerprintRepository()
+        self.max_distance = max_distance
+        self.window = window
+        self._lock = threading.Lock()
+        # {url: fingerprint} dos artigos validados nesta execução
+        self._pending: Dict[str, int] = {}
+        # {(banda, valor): [url]} para a busca em memória
+        self._pending_bands: Dict[tuple, list] = {}
+        # URLs cujo fingerprint ainda não foi gravado
+        self._unsaved: Set[str] = set()
+
+    def fingerprint(self, text: str) -> int:
+        """Calcula o SimHash do texto do artigo."""
+        return simhash(text)
+
+    def find_duplicate(self, fingerprint: int) -> Optional[Dict]:
+        """
+        Procura um artigo recente quase idêntico.
+
+        Args:
+            fingerprint: SimHash do artigo
+
+        Returns:
+            Dicionário com 'news_id' (artigo salvo) ou 'url' (artigo desta
+            execução) e 'distance', ou None se não houver duplicata
+        """
+        if not fingerprint:
+            return None
+
+        with self._lock:
+            for band in enumerate(split_bands(fingerprint)):
+                for url in self._pending_bands.get(band, []):
+                    distance = hamming_distance(fingerprint, self._pending[url])
+                    if distance <= self.max_distance:
+                        return {'url': url, 'distance': distance}
+
+        since = datetime.now(timezone.utc) - self.window
+        try:
+            candidates = self.repository.find_candidates(fingerprint, since)
+        except Exception as e:
+            logging.error(f"Erro ao buscar artigos quase duplicados: {e}")
+            return None
+
+        best = None
+        for news_id, candidate in candidates:
+            distance = hamming_distance(fingerprint, candidate)
+            if distance <= self.max_distance and (best is None or distance < best['distance']):
+                best = {'news_id': news_id, 'distance': distance}
+        return best
+
+    def add(self, url: str, fingerprint: Optional[int]) -> None:
+        """Registra o fingerprint de um artigo validado nesta execução."""
+        if not fingerprint:
+            return
+
+        with self._lock:
+            if url in self._pending:
+                return
+            self._pending[url] = fingerprint
+            self._unsaved.add(url)
+            for band in enumerate(split_bands(fingerprint)):
+                self._pending_bands.setdefault(band, []).append(url)
+
+    def flush(self, resolve_ids: Callable[[List[str]], Dict[str, int]]) -> None:
+        """
+        Grava os fingerprints dos artigos desta execução que já foram salvos.
+
+        Os fingerprints continuam em memória até o fim da execução, para
+        comparar com os próximos artigos sem consultar o banco.
+
+        Args:
+            resolve_ids: Função que recebe URLs e retorna {url: news_id} das notícias salvas
+        """
+        with self._lock:
+            urls = list(self._unsaved)
+        if not urls:
+            return
+
+        try:
+            ids_by_url = resolve_ids(urls)
+            fingerprints = {news_id: self._pending[url] for url, news_id in ids_by_url.items()}
+            self.repository.bulk_create(fingerprints)
+        except Exception as e:
+            logging.error(f"Erro ao salvar fingerprints de {len(urls)} artigos: {e}", exc_info=True)
+            return
+
+        with self._lock:
+            self._unsaved.difference_update(ids_by_url)
+
+    def reset(self) -> None:
+        """Descarta os fingerprints em memória (início de uma nova execução)."""
+        with self._lock:
+            self._pending = {}
+            self._pending_bands = {}
+            self._unsaved = set()
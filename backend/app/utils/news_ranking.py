@@ -0,0 +1,147 @@
+"""
+Ranking do feed "For You" com decaimento temporal contínuo.
+
+Modelo:
+
+    score = SCORE_SCALE * qualidade_da_fonte * boosts * 2 ** (-idade_em_horas / HALF_LIFE_HOURS)
+
+Em log2, a idade se separa em (published_hours - now_hours) / HALF_LIFE_HOURS,
+e o termo de 'now' é o mesmo para todas as notícias de uma consulta. Por isso:
+
+- base_score (gravado na ingestão) = log2(qualidade) + published_hours / HALF_LIFE_HOURS
+- rank (na consulta) = base_score + boosts do usuário (log2 dos multiplicadores)
+- score exibido = SCORE_SCALE * 2 ** (rank - now_hours / HALF_LIFE_HOURS)
+
+Ordenar por rank dá a mesma ordem do score com decaimento, sem calcular
+potências linha a linha no banco e sem empates em faixas de horário.
+Mudar HALF_LIFE_HOURS exige recalcular base_score das notícias gravadas.
+
+score_batch avalia o mesmo modelo em lote com NumPy (ajuste offline dos
+parâmetros).
+"""
+
+import math
+from datetime import datetime, timezone
+from typing import Optional
+
+import numpy as np
+
+EPOCH = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+# Meia-vida do score: a cada HALF_LIFE_HOURS a notícia vale metade
+HALF_LIFE_HOURS = 24.0
+# Score de uma notícia recém-publicada de fonte com qualidade 1.0, sem boosts
+SCORE_SCALE = 300.0
+
+DEFAULT_SOURCE_QUALITY = 1.0
+MIN_SOURCE_QUALITY = 0.01
+
+# Boosts do usuário em log2: 0.5 = x1.41, 1.0 = x2
+PREFERRED_SOURCE_BOOST = 0.5
+CUSTOM_TOPIC_BOOST = 1.0
+
+
+def hours_since_epoch(moment: datetime) -> float:
+    """Horas desde EPOCH; datetimes sem fuso são tratados como UTC."""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return (moment - EPOCH).total_seconds() / 3600
+
+
+def base_score(
+    published_at: datetime,
+    source_quality: Optional[float] = DEFAULT_SOURCE_QUALITY,
+    half_life_hours: float = HALF_LIFE_HOURS
+) -> float:
+    """
+    Score base da notícia, calculado uma vez na ingestão.
+
+    Args:
+        published_at: Data de publicação
+        source_quality: Qualidade da fonte (1.0 = neutra; None usa o padrão)
+        half_life_hours: Meia-vida do decaimento, em horas
+
+    Returns:
+        log2(qualidade) + horas desde EPOCH / meia-vida
+    """
+    return quality_score(source_quality) + hours_since_epoch(published_at) / half_life_hours
+
+
+def quality_score(source_quality: Optional[float] = DEFAULT_SOURCE_QUALITY) -> float:
+    """Parcela da qualidade da fonte no base_score: log2(qualidade), com o mínimo MIN_SOURCE_QUALITY."""
+    quality = max(source_quality if source_quality is not None else DEFAULT_SOURCE_QUALITY, MIN_SOURCE_QUALITY)
+    return math.log2(quality)
+
+
+def user_boost(preferred_source: bool = False, topic_matches: int = 0) -> float:
+    """Boosts do usuário (log2) somados ao base_score na consulta."""
+    return (PREFERRED_SOURCE_BOOST if preferred_source else 0.0) + CUSTOM_TOPIC_BOOST * topic_matches
+
+
+def searchable_text(title: Optional[str], description: Optional[str]) -> str:
+    """Texto usado no match de custom topics (o mesmo da consulta no banco)."""
+    return f"{title or ''} {description or ''}".lower()
+
+
+def count_topic_matches(text: str, topic_names) -> int:
+    """Quantos custom topics (nomes em minúsculas) aparecem no texto de searchable_text."""
+    return sum(1 for name in topic_names if name and name in text)
+
+
+def decayed_score(
+    rank: float,
+    now: Optional[datetime] = None,
+    half_life_hours: float = HALF_LIFE_HOURS,
+    scale: float = SCORE_SCALE
+) -> float:
+    """
+    Score exibido a partir do rank (base_score + boosts), no instante 'now'.
+
+    Args:
+        rank: base_score + user_boost
+        now: Instante de referência (padrão: agora, UTC)
+        half_life_hours: Meia-vida usada no base_score
+        scale: Score de uma notícia recém-publicada, sem boosts
+
+    Returns:
+        scale * multiplicadores * 2 ** (-idade / meia-vida)
+    """
+    now = now or datetime.now(timezone.utc)
+    return scale * 2 ** (rank - hours_since_epoch(now) / half_life_hours)
+
+
+def score_batch(
+    age_hours,
+    source_quality=DEFAULT_SOURCE_QUALITY,
+    preferred_source=False,
+    topic_matches=0,
+    half_life_hours: float = HALF_LIFE_HOURS,
+    preferred_source_boost: float = PREFERRED_SOURCE_BOOST,
+    custom_topic_boost: float = CUSTOM_TOPIC_BOOST,
+    scale: float = SCORE_SCALE
+):
+    """
+    Avalia o modelo completo em lote, vetorizado com NumPy.
+
+    Todos os argumentos de dados aceitam escalares ou arrays (com broadcast),
+    então é possível avaliar vários conjuntos de parâmetros sobre um
+    histórico de notícias sem passar pelo banco.
+
+    Args:
+        age_hours: Idade das notícias, em horas
+        source_quality: Qualidade das fontes
+        preferred_source: Se a fonte é preferida pelo usuário (bool)
+        topic_matches: Quantidade de custom topics encontrados
+        half_life_hours, preferred_source_boost, custom_topic_boost, scale: Parâmetros do modelo
+
+    Returns:
+        numpy.ndarray com os scores exibidos
+    """
+    quality = np.maximum(np.asarray(source_quality, dtype=float), MIN_SOURCE_QUALITY)
+    log_score = (
+        np.log2(quality)
+        - np.asarray(age_hours, dtype=float) / half_life_hours
+        + np.where(np.asarray(preferred_source, dtype=bool), preferred_source_boost, 0.0)
+        + custom_topic_boost * np.asarray(topic_matches, dtype=float)
+    )
+    return scale * np.exp2(log_score)
@@ -0,0 +1,146 @@
+"""
+Busca textual de notícias: idioma e expressões de full-text do PostgreSQL.
+
+Cada notícia guarda o idioma ('pt' ou 'en', os mesmos do
+KeywordGenerationService) e, no PostgreSQL, um tsvector com título (peso A),
+descrição (B) e o início do texto (D) na configuração do idioma. O corpo é
+gravado comprimido em news_bodies, então o tsvector é montado na escrita a
+partir do texto em claro (NewsRepository), e não como coluna gerada.
+"""
+
+import base64
+import re
+from typing import Optional
+
+from sqlalchemy import bindparam, cast, func, literal, literal_column
+from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION, REGCONFIG, TSQUERY, TSVECTOR
+
+# Configurações de text search do PostgreSQL por idioma
+TEXT_SEARCH_CONFIGS = {"pt": "portuguese", "en": "english"}
+DEFAULT_LANGUAGE = "pt"
+
+# Caracteres do texto indexados (o tsvector do PostgreSQL tem limite de 1 MB)
+SEARCH_CONTENT_CHARS = 20000
+# Caracteres do texto usados na detecção de idioma
+LANGUAGE_SAMPLE_CHARS = 2000
+
+_WORD_RE = re.compile(r"[^\W\d_]+")
+
+_STOPWORDS = {
+    "pt": frozenset(
+        "a o as os de da do das dos em no na nos nas um uma uns umas para por com não que se "
+        "mais como mas ao aos à às é são foi ser está pelo pela pelos pelas sobre entre também "
+        "já quando muito sua seu suas seus ele ela eles elas isso este esta após até".split()
+    ),
+    "en": frozenset(
+        "the a an of and or to in on at for with by from is are was were be been has have had "
+        "this that these those it its not but as into about after over than their they he she "
+        "will would can could more new says said".split()
+    ),
+}
+
+
+def detect_language(*texts: Optional[str]) -> str:
+    """
+    Idioma do texto ('pt' ou 'en') pela contagem de stopwords.
+
+    Args:
+        *texts: Título, descrição, texto... (None é ignorado)
+
+    Returns:
+        'en' se houver mais stopwords em inglês; 'pt' caso contrário
+    """
+    words = _WORD_RE.findall(" ".join(text for text in texts if text).lower())
+    hits = {language: sum(1 for word in words if word in stopwords) for language, stopwords in _STOPWORDS.items()}
+    return "en" if hits["en"] > hits["pt"] else DEFAULT_LANGUAGE
+
+
+def news_language(title: Optional[str], description: Optional[str], content: Optional[str]) -> str:
+    """Idioma da notícia pelo título, descrição e início do texto."""
+    return detect_language(title, description, (content or "")[:LANGUAGE_SAMPLE_CHARS])
+
+
+def text_search_config(language: Optional[str]) -> str:
+    """Configuração de text search do PostgreSQL para o idioma (padrão: português)."""
+    return TEXT_SEARCH_CONFIGS.get(language, TEXT_SEARCH_CONFIGS[DEFAULT_LANGUAGE])
+
+
+def search_document(title: Optional[str], description: Optional[str], content: Optional[str], language: str) -> dict:
+    """Parâmetros de search_vector_expression() para uma notícia."""
+    return {
+        "search_config": text_search_config(language),
+        "search_title": title or "",
+        "search_description": description or "",
+        "search_content": (content or "")[:SEARCH_CONTENT_CHARS],
+    }
+
+
+def search_vector_expression():
+    """
+    tsvector ponderado da notícia, com os parâmetros de search_document().
+
+    Usado em UPDATEs em lote (executemany) do NewsRepository e da migração.
+    """
+    config = cast(bindparam("search_config"), REGCONFIG)
+
+    def weighted(param: str, weight: str):
+        return func.setweight(func.to_tsvector(config, bindparam(param)), literal_column(f"'{weight}'"), type_=TSVECTOR)
+
+    return (
+        weighted("search_title", "A")
+        .op("||", return_type=TSVECTOR)(weighted("search_description", "B"))
+        .op("||", return_type=TSVECTOR)(weighted("search_content", "D"))
+    )
+
+
+def search_query_expression(query: str, language: Optional[str] = None):
+    """
+    tsquery da busca (sintaxe de websearch_to_tsquery: "frase", -termo, OR).
+
+    Sem idioma, a consulta é interpretada nas configurações de todos os
+    idiomas (OR), para casar com notícias indexadas em qualquer um deles.
+    """
+    languages = [language] if language in TEXT_SEARCH_CONFIGS else list(TEXT_SEARCH_CONFIGS)
+    expression = None
+    for code in languages:
+        tsquery = func.websearch_to_tsquery(
+            cast(literal(text_search_config(code)), REGCONFIG), literal(query), type_=TSQUERY
+        )
+        expression = tsquery if expression is None else expression.op("||", return_type=TSQUERY)(tsquery)
+    return expression
+
+
+def search_rank_expression(search_vector, tsquery):
+    """
+    ts_rank normalizado pelo tamanho do documento (1 + log do número de palavras).
+
+    O ts_rank devolve real (float4); o cast para double precision faz o rank
+    enviado no cursor e o comparado no keyset (search_cursor_rank) terem o
+    mesmo tipo, sem repetir nem pular empates entre páginas.
+    """
+    return cast(func.ts_rank(search_vector, tsquery, 1), DOUBLE_PRECISION)
+
+
+def search_cursor_rank(rank: float):
+    """Rank do cursor como double precision, o tipo de search_rank_expression()."""
+    return cast(literal(rank), DOUBLE_PRECISION)
+
+
+def encode_cursor(rank: float, news_id: int) -> str:
+    """Cursor opaco da próxima página: (rank, id) do último resultado."""
+    return base64.urlsafe_b64encode(f"{rank!r}:{news_id}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[float, int]:
+    """
+    Inverso de encode_cursor().
+
+    Raises:
+        ValueError: Cursor malformado
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        rank, news_id = raw.split(":")
+        return float(rank), int(news_id)
+    except ValueError as e:
+        raise ValueError(f"Cursor inválido: {cursor}") from e
@@ -0,0 +1,154 @@
+"""
+Serialização das notícias para as respostas da API e da newsletter.
+
+Os conjuntos de campos (card, detail, email) são declarados uma vez e
+compilados em um operator.attrgetter, que lê todos os atributos simples em
+uma chamada em C. Linhas (Row do SQLAlchemy ou namedtuple) são lidas por
+posição com operator.itemgetter, compilado uma vez por layout de colunas:
+o acesso por atributo em Row é bem mais lento que em objetos comuns.
+"""
+
+from operator import attrgetter, itemgetter
+from collections.abc import Sequence
+from typing import Any, Callable, Iterable, Optional
+
+# Campos do card (listagens); source_name e topic_name só entram se preenchidos
+CARD_FIELDS = (
+    "id", "title", "description", "url", "image_url", "published_at",
+    "source_id", "topic_id", "created_at", "is_favorited",
+)
+OPTIONAL_FIELDS = ("source_name", "topic_name")
+
+
+class NewsSerializer:
+    """
+    Serializador de um conjunto de campos.
+
+    Args:
+        fields: Atributos copiados como estão (chave = nome do atributo)
+        optional: Atributos incluídos apenas quando não vazios
+        computed: Pares (chave, função(obj)) para campos derivados
+    """
+
+    def __init__(
+        self,
+        fields: Sequence[str] = (),
+        optional: Sequence[str] = (),
+        computed: Sequence[tuple[str, Callable[[Any], Any]]] = ()
+    ):
+        self.fields = tuple(fields)
+        self.optional = tuple(optional)
+        self.computed = tuple(computed)
+        # attrgetter com um só atributo não devolve tupla
+        self._getter = attrgetter(*self.fields) if len(self.fields) > 1 else None
+        self._row_plans: dict = {}
+
+    def _row_plan(self, columns: tuple):
+        """Getters por posição para um layout de colunas (compilado uma vez)."""
+        plan = self._row_plans.get(columns)
+        if plan is None:
+            index = {name: i for i, name in enumerate(columns)}
+            missing = [field for field in self.fields if field not in index]
+            if missing:
+                raise KeyError(f"Colunas ausentes na linha: {missing}")
+            positions = [index[field] for field in self.fields]
+            getter = itemgetter(*positions) if len(positions) > 1 else (lambda row, i=positions[0]: (row[i],))
+            optional = tuple((field, index[field]) for field in self.optional if field in index)
+            plan = self._row_plans[columns] = (getter, optional)
+        return plan
+
+    def serialize(self, obj, **extra) -> dict:
+        """
+        Serializa um objeto.
+
+        Args:
+            obj: Row, News ou qualquer objeto com os atributos do conjunto
+            **extra: Campos adicionais ou substituídos (ex: score, read_at)
+
+        Returns:
+            Dicionário pronto para o jsonify
+        """
+        if self._getter is not None:
+            data = dict(zip(self.fields, self._getter(obj)))
+        else:
+            data = {field: getattr(obj, field) for field in self.fields}
+
+        for field in self.optional:
+            value = getattr(obj, field, None)
+            if value:
+                data[field] = value
+        for key, func in self.computed:
+            data[key] = func(obj)
+        if extra:
+            data.update(extra)
+        return data
+
+    def serialize_many(self, objs: Iterable, **extra) -> list[dict]:
+        """Serializa uma sequência de objetos (mesmos campos extras para todos)."""
+        objs = list(objs)
+        first = objs[0] if objs else None
+        columns = getattr(first, '_fields', None) if isinstance(first, Sequence) else None
+        if columns is None or self.computed:
+            serialize = self.serialize
+            return [serialize(obj, **extra) for obj in objs]
+
+        # Linhas de uma mesma consulta: leitura por posição
+        getter, optional = self._row_plan(tuple(columns))
+        fields = self.fields
+        result = []
+        for row in objs:
+            data = dict(zip(fields, getter(row)))
+            for field, i in optional:
+                value = row[i]
+                if value:
+                    data[field] = value
+            if extra:
+                data.update(extra)
+            result.append(data)
+        return result
+
+
+def _email_date(news) -> str:
+    return news.published_at.strftime("%d/%m/%Y") if news.published_at else ""
+
+
+def _default(attr: str, fallback: str) -> Callable[[Any], Any]:
+    return lambda news: getattr(news, attr, None) or fallback
+
+
+CARD = NewsSerializer(CARD_FIELDS, OPTIONAL_FIELDS)
+
+DETAIL = NewsSerializer(CARD_FIELDS + ("content", "html"), OPTIONAL_FIELDS)
+
+EMAIL = NewsSerializer(
+    ("title", "url"),
+    computed=(
+        ("category", _default("topic_name", "Geral")),
+        ("img_url", _default("image_url", "")),
+        ("summary", _default("description", "")),
+        # Conteúdo completo para a IA gerar resumos ricos
+        ("content", _default("content", "")),
+        ("source", _default("source_name", "Fonte Desconhecida")),
+        ("date", _email_date),
+    )
+)
+
+FIELD_SETS = {"card": CARD, "detail": DETAIL, "email": EMAIL}
+
+
+def get_serializer(field_set: str) -> NewsSerializer:
+    """
+    Retorna o serializador de um conjunto de campos.
+
+    Raises:
+        ValueError: Conjunto desconhecido
+    """
+    try:
+        return FIELD_SETS[field_set]
+    except KeyError:
+        raise ValueError(f"Conjunto de campos desconhecido: '{field_set}'. Use um de {sorted(FIELD_SETS)}.")
+
+
+def serialize_news(obj, field_set: str = "card", **extra) -> Optional[dict]:
+    """Atalho para get_serializer(field_set).serialize(obj, **extra)."""
+    return get_serializer(field_set).serialize(obj, **extra) if obj is not None else None
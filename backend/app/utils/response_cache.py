@@ -0,0 +1,183 @@
+"""
+Cache das respostas das rotas públicas de notícias.
+LRU + TTL em memória, com backend compartilhado opcional (Redis).
+"""
+
+import json
+import time
+import logging
+import threading
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Callable, Optional
+
+
+def _isoformat(obj):
+    """Datas viram texto ISO 8601, o mesmo que o provider JSON do app gera."""
+    if isinstance(obj, date):
+        return obj.isoformat()
+    raise TypeError(f"Objeto do tipo {type(obj).__name__} não é serializável em JSON")
+
+
+class RedisCacheBackend:
+    """
+    Backend compartilhado entre processos/instâncias, em Redis.
+
+    O pacote 'redis' é opcional: só é importado quando RESPONSE_CACHE_URL é
+    configurada. Erros do Redis são logados e tratados como cache miss.
+    Datas são gravadas como texto ISO 8601 (o JSON final da resposta é igual).
+    """
+
+    def __init__(self, url: str, prefix: str = 'synapse:response:'):
+        import redis
+
+        self.client = redis.Redis.from_url(url, socket_timeout=0.5)
+        self.prefix = prefix
+
+    def get(self, key: str) -> Any:
+        try:
+            value = self.client.get(self.prefix + key)
+            return json.loads(value) if value is not None else None
+        except Exception as e:
+            logging.warning(f"Erro ao ler cache compartilhado: {e}")
+            return None
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        try:
+            self.client.set(self.prefix + key, json.dumps(value, ensure_ascii=False, default=_isoformat), ex=ttl)
+        except Exception as e:
+            logging.warning(f"Erro ao gravar cache compartilhado: {e}")
+
+
+class ResponseCache:
+    """
+    Cache de respostas chaveado por rota, parâmetros e versão do conteúdo.
+
+    A versão vem de version_loader (horário da última coleta finalizada):
+    quando uma coleta termina, a versão muda e todas as entradas anteriores
+    deixam de ser encontradas. Para não consultar o banco a cada requisição,
+    a versão é reaproveitada por version_ttl segundos.
+
+    Os valores não devem conter dados do usuário (ex: is_favorited); quem
+    usa o cache sobrepõe esses campos depois da leitura.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        ttl: int = 3600,
+        version_loader: Optional[Callable[[], Any]] = None,
+        version_ttl: float = 15.0,
+        backend: Optional[RedisCacheBackend] = None
+    ):
+        """
+        Inicializa o cache.
+
+        Args:
+            max_entries: Número máximo de entradas em memória (LRU)
+            ttl: Validade das entradas em segundos (0 desativa o cache)
+            version_loader: Função que retorna a versão atual do conteúdo
+            version_ttl: Segundos em que a versão lida é reaproveitada
+            backend: Backend compartilhado opcional (consultado após a memória)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.version_loader = version_loader
+        self.version_ttl = version_ttl
+        self.backend = backend
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()
+        self._version = None
+        self._version_checked_at = 0.0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_entries > 0
+
+    def version(self) -> str:
+        """Versão atual do conteúdo (reaproveitada por version_ttl segundos)."""
+        if self.version_loader is None:
+            return '0'
+
+        now = time.monotonic()
+        if self._version is None or now - self._version_checked_at >= self.version_ttl:
+            version = self.version_loader()
+            with self._lock:
+                self._version = str(version.timestamp() if hasattr(version, 'timestamp') else version or 0)
+                self._version_checked_at = now
+        return self._version
+
+    def get_or_set(self, key: str, builder: Callable[[], Any]) -> Any:
+        """
+        Retorna o valor em cache para a chave ou o constrói com builder().
+
+        Args:
+            key: Rota e parâmetros (ex: 'news:topic:3:page=1:per_page=10')
+            builder: Função que monta o valor em caso de miss
+
+        Returns:
+            Valor em cache ou recém-construído. Não deve ser alterado por quem
+            chama: a mesma instância é devolvida às próximas requisições.
+        """
+        if not self.enabled:
+            return builder()
+
+        full_key = f"{key}:v={self.version()}"
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(full_key)
+            if entry and entry[0] > now:
+                self._entries.move_to_end(full_key)
+                self.hits += 1
+                return entry[1]
+
+        value = self.backend.get(full_key) if self.backend else None
+        if value is None:
+            with self._lock:
+                self.misses += 1
+            value = builder()
+            if self.backend:
+                self.backend.set(full_key, value, self.ttl)
+        else:
+            with self._lock:
+                self.hits += 1
+
+        with self._lock:
+            self._entries[full_key] = (now + self.ttl, value)
+            self._entries.move_to_end(full_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Descarta as entradas em memória e força a releitura da versão."""
+        with self._lock:
+            self._entries.clear()
+            self._version = None
+
+
+def create_response_cache(config: dict, version_loader: Optional[Callable[[], Any]] = None) -> ResponseCache:
+    """
+    Cria o cache a partir da configuração do app.
+
+    Chaves usadas: RESPONSE_CACHE_MAX_ENTRIES, RESPONSE_CACHE_TTL,
+    RESPONSE_CACHE_VERSION_TTL e RESPONSE_CACHE_URL (Redis, opcional).
+    """
+    backend = None
+    url = config.get('RESPONSE_CACHE_URL')
+    if url:
+        try:
+            backend = RedisCacheBackend(url)
+        except ImportError:
+            logging.warning("RESPONSE_CACHE_URL configurada, mas o pacote 'redis' não está instalado. Usando apenas memória.")
+
+    return ResponseCache(
+        max_entries=int(config.get('RESPONSE_CACHE_MAX_ENTRIES', 512)),
+        ttl=int(config.get('RESPONSE_CACHE_TTL', 3600)),
+        version_loader=version_loader,
+        version_ttl=float(config.get('RESPONSE_CACHE_VERSION_TTL', 15)),
+        backend=backend
+    )
@@ -0,0 +1,111 @@
+"""
+Compressão das respostas da API (gzip ou brotli), negociada pelo
+cabeçalho Accept-Encoding.
+"""
+
+import gzip
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depende do ambiente
+    brotli = None
+
+from flask import request
+
+# Tipos de conteúdo que valem a pena comprimir
+COMPRESSIBLE_MIMETYPES = {
+    'application/json',
+    'application/javascript',
+    'application/yaml',
+    'application/xml',
+    'image/svg+xml',
+}
+
+
+def _is_compressible(response) -> bool:
+    mimetype = response.mimetype or ''
+    return mimetype.startswith('text/') or mimetype in COMPRESSIBLE_MIMETYPES
+
+
+def _choose_encoding():
+    """Melhor codificação aceita pelo cliente (brotli só se instalado)."""
+    supported = ['br', 'gzip'] if brotli is not None else ['gzip']
+    return request.accept_encodings.best_match(supported)
+
+
+def compress_response(response, min_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 5):
+    """
+    Comprime o corpo da resposta se o cliente aceitar e o tamanho compensar.
+
+    Respostas em streaming/arquivo, já codificadas, sem corpo (204/304) ou
+    menores que min_size são devolvidas como estão. Um ETag forte vira fraco
+    (W/"..."), já que os bytes deixam de ser os da representação original;
+    a comparação do If-None-Match em GET é fraca, então o 304 continua
+    funcionando.
+
+    Args:
+        response: Resposta do Flask
+        min_size: Tamanho mínimo do corpo, em bytes, para comprimir
+        gzip_level: Nível do gzip (1-9)
+        brotli_quality: Qualidade do brotli (0-11)
+
+    Returns:
+        A mesma resposta, possivelmente comprimida
+    """
+    if response.status_code == 304:
+        # Mesmo ETag que a resposta 200 (comprimida) teria
+        etag, weak = response.get_etag()
+        if etag and not weak and _choose_encoding():
+            response.set_etag(etag, weak=True)
+        return response
+
+    if (
+        response.direct_passthrough
+        or response.is_streamed
+        or response.status_code < 200
+        or response.status_code >= 300
+        or response.status_code == 204
+        or 'Content-Encoding' in response.headers
+        or not _is_compressible(response)
+    ):
+        return response
+
+    response.vary.add('Accept-Encoding')
+
+    data = response.get_data()
+    if len(data) < min_size:
+        return response
+
+    encoding = _choose_encoding()
+    if encoding == 'br':
+        compressed = brotli.compress(data, quality=brotli_quality)
+    elif encoding == 'gzip':
+        compressed = gzip.compress(data, compresslevel=gzip_level)
+    else:
+        return response
+
+    response.set_data(compressed)
+    response.headers['Content-Encoding'] = encoding
+
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+
+def init_response_compression(app) -> None:
+    """
+    Registra a compressão das respostas no app.
+
+    Configuração: RESPONSE_COMPRESSION_MIN_SIZE (bytes; 0 desativa),
+    RESPONSE_COMPRESSION_GZIP_LEVEL e RESPONSE_COMPRESSION_BROTLI_QUALITY.
+    """
+    min_size = int(app.config.get('RESPONSE_COMPRESSION_MIN_SIZE', 1024))
+    if min_size <= 0:
+        return
+    gzip_level = int(app.config.get('RESPONSE_COMPRESSION_GZIP_LEVEL', 6))
+    brotli_quality = int(app.config.get('RESPONSE_COMPRESSION_BROTLI_QUALITY', 5))
+
+    @app.after_request
+    def _compress(response):
+        return compress_response(response, min_size, gzip_level, brotli_quality)
@@ -0,0 +1,204 @@
+"""
+Cache em disco dos resultados de scraping.
+Evita baixar e parsear novamente artigos já processados em execuções anteriores.
+"""
+
+import os
+import gzip
+import json
+import hashlib
+import logging
+import tempfile
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from app.utils.url_normalizer import normalize_url
+
+
+class ScrapeCache:
+    """
+    Guarda, por URL normalizada, o HTML bruto da página, os validadores HTTP
+    (ETag/Last-Modified) e o resultado do último scraping.
+
+    Cada entrada é um arquivo JSON comprimido com gzip dentro do diretório
+    do cache. URLs com resultado negativo ('rejected' ou 'failed') são puladas
+    enquanto estiverem dentro do TTL negativo; as demais são revalidadas com
+    GET condicional, de forma que uma página inalterada custe apenas um 304.
+    """
+
+    OUTCOME_SUCCESS = 'success'
+    OUTCOME_REJECTED = 'rejected'
+    OUTCOME_FAILED = 'failed'
+
+    NEGATIVE_OUTCOMES = {OUTCOME_REJECTED, OUTCOME_FAILED}
+
+    def __init__(
+        self,
+        cache_dir: str,
+        negative_ttl: timedelta = timedelta(days=3),
+        max_age: timedelta = timedelta(days=30)
+    ):
+        """
+        Inicializa o cache.
+
+        Args:
+            cache_dir: Diretório onde as entradas são gravadas
+            negative_ttl: Tempo durante o qual URLs ruins não são tentadas novamente
+            max_age: Idade máxima de uma entrada antes de ser removida por prune()
+        """
+        self.cache_dir = cache_dir
+        self.negative_ttl = negative_ttl
+        self.max_age = max_age
+
+    def _entry_path(self, url: str) -> str:
+        key = hashlib.sha1(normalize_url(url).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json.gz")
+
+    def get(self, url: str) -> Optional[Dict]:
+        """
+        Retorna a entrada do cache para uma URL.
+
+        Args:
+            url: URL do artigo
+
+        Returns:
+            Dicionário da entrada ou None se não existir/estiver corrompida
+        """
+        path = self._entry_path(url)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logging.warning(f"Entrada de cache de scraping corrompida para '{url}': {e}. Ignorando.")
+            return None
+
+    def is_negative_fresh(self, entry: Optional[Dict]) -> bool:
+        """
+        Verifica se uma entrada é um resultado negativo ainda dentro do TTL.
+
+        Args:
+            entry: Entrada retornada por get()
+
+        Returns:
+            True se a URL deve ser pulada sem nenhuma requisição
+        """
+        if not entry or entry.get('outcome') not in self.NEGATIVE_OUTCOMES:
+            return False
+
+        checked_at = datetime.fromisoformat(entry['checked_at'])
+        return datetime.now() - checked_at < self.negative_ttl
+
+    def get_conditional_headers(self, entry: Optional[Dict]) -> Dict[str, str]:
+        """
+        Monta os cabeçalhos de GET condicional a partir de uma entrada.
+
+        Args:
+            entry: Entrada retornada por get()
+
+        Returns:
+            Cabeçalhos If-None-Match / If-Modified-Since (pode ser vazio)
+        """
+        headers = {}
+        if not entry:
+            return headers
+
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(
+        self,
+        url: str,
+        outcome: str,
+        raw_html: Optional[str] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        result: Optional[Dict] = None,
+        reason: Optional[str] = None
+    ) -> None:
+        """
+        Grava (ou substitui) a entrada de uma URL.
+
+        Args:
+            url: URL do artigo
+            outcome: 'success', 'rejected' ou 'failed'
+            raw_html: HTML bruto da página baixada
+            etag: Valor do cabeçalho ETag da resposta
+            last_modified: Valor do cabeçalho Last-Modified da resposta
+            result: Resultado do scraping (apenas para 'success')
+            reason: Motivo de rejeição/falha
+        """
+        now = datetime.now().isoformat()
+        entry = {
+            'url': url,
+            'normalized_url': normalize_url(url),
+            'outcome': outcome,
+            'reason': reason,
+            'etag': etag,
+            'last_modified': last_modified,
+            'raw_html': raw_html,
+            'result': result,
+            'fetched_at': now,
+            'checked_at': now
+        }
+        self._write(url, entry)
+
+    def touch(self, url: str, entry: Dict) -> None:
+        """
+        Atualiza o instante de verificação de uma entrada revalidada (HTTP 304).
+
+        Args:
+            url: URL do artigo
+            entry: Entrada retornada por get()
+        """
+        entry['checked_at'] = datetime.now().isoformat()
+        self._write(url, entry)
+
+    def _write(self, url: str, entry: Dict) -> None:
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+            # Escrita atômica: grava em arquivo temporário e renomeia
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with gzip.open(os.fdopen(fd, 'wb'), 'wt', encoding='utf-8') as f:
+                    json.dump(entry, f, ensure_ascii=False)
+                os.replace(tmp_path, self._entry_path(url))
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+
+            logging.debug(f"Cache de scraping atualizado para '{url}' ({entry['outcome']})")
+        except Exception as e:
+            logging.error(f"Erro ao gravar cache de scraping para '{url}': {e}", exc_info=True)
+
+    def prune(self) -> int:
+        """
+        Remove entradas mais antigas que max_age.
+
+        Returns:
+            Número de entradas removidas
+        """
+        if not os.path.isdir(self.cache_dir):
+            return 0
+
+        cutoff = datetime.now() - self.max_age
+        removed = 0
+        for file_name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, file_name)
+            try:
+                if datetime.fromtimestamp(os.path.getmtime(path)) < cutoff:
+                    os.remove(path)
+                    removed += 1
+            except OSError as e:
+                logging.warning(f"Erro ao remover entrada antiga do cache de scraping '{path}': {e}")
+
+        if removed:
+            logging.info(f"Cache de scraping: {removed} entradas antigas removidas.")
+        return removed
@@ -6,67 +6,146 @@ Adiciona sites problemáticos automaticamente e registra informações para aná
 import os
 import json
 import logging
-from datetime import datetime
+import threading
+from datetime import datetime, timezone
 from typing import Dict, Optional
 from urllib.parse import urlparse
 
+from app.repositories.scraping_blacklist_repository import ScrapingBlacklistRepository
+
 
 class ScrapingBlacklist:
     """
     Gerencia uma blacklist de sites que falham consistentemente no scraping.
 
-    A blacklist é persistida em arquivo JSON e contém informações detalhadas
-    sobre cada site bloqueado para análise posterior por humanos.
+    A blacklist é persistida na tabela 'scraping_blacklist' do banco de dados e
+    mantida em memória para consultas rápidas. Os erros registrados ficam em um
+    buffer (write-behind) e são gravados com upserts atômicos por domínio em
+    flush(), chamado automaticamente ao atingir flush_threshold domínios
+    pendentes. O antigo formato JSON continua disponível via import_json/export_json.
     """
 
-    def __init__(self, blacklist_file_path: str):
+    def __init__(
+        self,
+        repository: Optional[ScrapingBlacklistRepository] = None,
+        flush_threshold: int = 10
+    ):
         """
         Inicializa a blacklist.
 
         Args:
-            blacklist_file_path: Caminho do arquivo JSON de blacklist
+            repository: Repositório da tabela de blacklist
+            flush_threshold: Número de domínios pendentes que dispara a gravação
         """
-        self.blacklist_file_path = blacklist_file_path
+        self.repository = repository or ScrapingBlacklistRepository()
+        self.flush_threshold = flush_threshold
         self.blacklist_data: Dict[str, Dict] = {}
+        self._pending: Dict[str, Dict] = {}
+        # Erros chegam em paralelo dos executores da coleta assíncrona; o lock
+        # também cobre o flush, para nada ser adicionado durante a gravação
+        self._lock = threading.RLock()
 
     def load(self) -> Dict[str, Dict]:
         """
-        Carrega a blacklist do disco.
+        Carrega a blacklist do banco de dados.
 
         Returns:
             Dicionário com dados da blacklist
         """
-        if not os.path.exists(self.blacklist_file_path):
-            logging.info(f"Arquivo de blacklist não existe. Criando novo: {self.blacklist_file_path}")
-            self.blacklist_data = {}
+        with self._lock:
+            try:
+                self.blacklist_data = self.repository.find_all()
+                logging.info(f"Blacklist carregada com sucesso. {len(self.blacklist_data)} domínios bloqueados.")
+            except Exception as e:
+                logging.error(f"Erro ao carregar blacklist: {e}. Iniciando com blacklist vazia.")
+                self.blacklist_data = {}
             return self.blacklist_data
 
-        try:
-            with open(self.blacklist_file_path, 'r', encoding='utf-8') as f:
-                self.blacklist_data = json.load(f)
-            logging.info(f"Blacklist carregada com sucesso. {len(self.blacklist_data)} domínios bloqueados.")
-            return self.blacklist_data
-        except json.JSONDecodeError as e:
-            logging.error(f"Erro ao decodificar JSON da blacklist: {e}. Criando nova blacklist vazia.")
-            self.blacklist_data = {}
-            return self.blacklist_data
-        except Exception as e:
-            logging.error(f"Erro ao carregar blacklist: {e}. Criando nova blacklist vazia.")
-            self.blacklist_data = {}
-            return self.blacklist_data
+    def flush(self) -> None:
+        """Grava no banco os erros pendentes no buffer."""
+        with self._lock:
+            if not self._pending:
+                return
+
+            try:
+                self.repository.upsert_many(list(self._pending.values()))
+                logging.debug(f"Blacklist gravada com sucesso: {len(self._pending)} domínios atualizados.")
+                self._pending = {}
+            except Exception as e:
+                logging.error(f"Erro ao salvar blacklist: {e}", exc_info=True)
 
     def save(self) -> None:
+        """Mantido por compatibilidade: equivale a flush()."""
+        self.flush()
 
-        try:
-            # Criar diretório se não existir
-            os.makedirs(os.path.dirname(self.blacklist_file_path), exist_ok=True)
+    def import_json(self, json_file_path: str) -> int:
+        """
+        Importa uma blacklist no formato JSON antigo, substituindo os domínios existentes.
 
-            with open(self.blacklist_file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.blacklist_data, f, indent=2, ensure_ascii=False)
+        Aceita tanto o formato gerado por export_json ({dominio: {...}}) quanto
+        o formato com a chave 'blocked_domains'.
 
-            logging.debug(f"Blacklist salva com sucesso: {self.blacklist_file_path}")
-        except Exception as e:
-            logging.error(f"Erro ao salvar blacklist: {e}", exc_info=True)
+        Args:
+            json_file_path: Caminho do arquivo JSON
+
+        Returns:
+            Número de domínios importados
+        """
+        with open(json_file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        data = data.get('blocked_domains', data)
+
+        entries = []
+        for domain, info in data.items():
+            blocked_at = self._parse_datetime(info.get('blocked_at')) or datetime.now(timezone.utc)
+            error_type = info.get('error_type') or info.get('reason') or 'Unknown'
+            entries.append({
+                'domain': domain,
+                'error_type': error_type,
+                'error_count': info.get('error_count', info.get('attempts', 1)),
+                'reason': info.get('reason'),
+                'last_url': info.get('last_url'),
+                'last_error_type': info.get('last_error_type', error_type),
+                'last_error_message': info.get('last_error_message'),
+                'blocked_at': blocked_at,
+                'updated_at': self._parse_datetime(info.get('updated_at'))
+            })
+
+        self.flush()
+        self.repository.upsert_many(entries, accumulate=False)
+        self.load()
+        logging.info(f"{len(entries)} domínios importados para a blacklist de '{json_file_path}'.")
+        return len(entries)
+
+    def export_json(self, json_file_path: str) -> int:
+        """
+        Exporta a blacklist para um arquivo JSON no formato antigo ({dominio: {...}}).
+
+        Args:
+            json_file_path: Caminho do arquivo JSON
+
+        Returns:
+            Número de domínios exportados
+        """
+        self.flush()
+        self.load()
+
+        directory = os.path.dirname(json_file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(json_file_path, 'w', encoding='utf-8') as f:
+            json.dump(self.blacklist_data, f, indent=2, ensure_ascii=False)
+
+        logging.info(f"{len(self.blacklist_data)} domínios exportados da blacklist para '{json_file_path}'.")
+        return len(self.blacklist_data)
+
+    def _parse_datetime(self, value: Optional[str]) -> Optional[datetime]:
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
 
     def get_domain(self, url: str) -> Optional[str]:
         """
@@ -80,7 +159,7 @@ class ScrapingBlacklist:
         """
         try:
             parsed = urlparse(url)
-            domain = parsed.netloc
+            domain = parsed.netloc.lower()
 
             # Remover 'www.' se presente
             if domain.startswith('www.'):
@@ -91,9 +170,28 @@ class ScrapingBlacklist:
             logging.warning(f"Erro ao extrair domínio de '{url}': {e}")
             return None
 
+    def _find_blocked_domain(self, domain: str) -> Optional[str]:
+        """
+        Procura o domínio ou um de seus domínios pai na blacklist.
+        'sub.example.com' é coberto por 'example.com'.
+
+        Args:
+            domain: Domínio extraído da URL
+
+        Returns:
+            Entrada da blacklist que cobre o domínio ou None
+        """
+        labels = domain.split('.')
+        # Não considera sufixos de um único rótulo (ex.: 'com')
+        for i in range(len(labels) - 1):
+            candidate = '.'.join(labels[i:])
+            if candidate in self.blacklist_data:
+                return candidate
+        return None
+
     def is_blocked(self, url: str) -> bool:
         """
-        Verifica se uma URL está na blacklist.
+        Verifica se uma URL está na blacklist (incluindo subdomínios de domínios bloqueados).
 
         Args:
             url: URL a verificar
@@ -105,7 +203,7 @@ class ScrapingBlacklist:
         if not domain:
             return False
 
-        return domain in self.blacklist_data
+        return self._find_blocked_domain(domain) is not None
 
     def add_to_blacklist(
         self,
@@ -117,6 +215,9 @@ class ScrapingBlacklist:
         """
         Adiciona um domínio à blacklist automaticamente.
 
+        A memória é atualizada na hora; a gravação no banco fica no buffer até
+        o próximo flush().
+
         Args:
             url: URL que causou o erro
             error_type: Tipo do erro (ex: '403 Forbidden', 'SSL Error', 'Timeout')
@@ -126,41 +227,70 @@ class ScrapingBlacklist:
         Returns:
             True se adicionado/atualizado, False se falhou
         """
-        domain = self.get_domain(url)
-        if not domain:
-            logging.warning(f"Não foi possível extrair domínio de '{url}'. Não adicionado à blacklist.")
-            return False
-
-        # Se já existe, incrementar contador
-        if domain in self.blacklist_data:
-            self.blacklist_data[domain]["error_count"] += 1
-            self.blacklist_data[domain]["last_url"] = url
-            self.blacklist_data[domain]["last_error_message"] = error_message
-            self.blacklist_data[domain]["last_error_type"] = error_type
-            self.blacklist_data[domain]["updated_at"] = datetime.now().isoformat()
-
-            logging.info(
-                f"Domínio '{domain}' já na blacklist. Contador atualizado: "
-                f"{self.blacklist_data[domain]['error_count']} erros."
-            )
-        else:
-            # Adicionar novo domínio
-            self.blacklist_data[domain] = {
-                "blocked_at": datetime.now().isoformat(),
-                "error_type": error_type,
-                "error_count": 1,
-                "last_url": url,
-                "last_error_message": error_message[:500],  # Limitar tamanho
-                "reason": reason
-            }
-
-            logging.warning(
-                f"⚠️  DOMÍNIO BLOQUEADO AUTOMATICAMENTE: '{domain}' (erro: {error_type})"
-            )
-
-        # Salvar imediatamente
-        self.save()
-        return True
+        with self._lock:
+            domain = self.get_domain(url)
+            if not domain:
+                logging.warning(f"Não foi possível extrair domínio de '{url}'. Não adicionado à blacklist.")
+                return False
+
+            now = datetime.now(timezone.utc)
+            error_message = error_message[:500]  # Limitar tamanho
+
+            # Se já existe, incrementar contador
+            if domain in self.blacklist_data:
+                self.blacklist_data[domain]["error_count"] += 1
+                self.blacklist_data[domain]["last_url"] = url
+                self.blacklist_data[domain]["last_error_message"] = error_message
+                self.blacklist_data[domain]["last_error_type"] = error_type
+                self.blacklist_data[domain]["updated_at"] = now.isoformat()
+
+                logging.info(
+                    f"Domínio '{domain}' já na blacklist. Contador atualizado: "
+                    f"{self.blacklist_data[domain]['error_count']} erros."
+                )
+            else:
+                # Adicionar novo domínio
+                self.blacklist_data[domain] = {
+                    "blocked_at": now.isoformat(),
+                    "updated_at": now.isoformat(),
+                    "error_type": error_type,
+                    "error_count": 1,
+                    "last_url": url,
+                    "last_error_type": error_type,
+                    "last_error_message": error_message,
+                    "reason": reason
+                }
+
+                logging.warning(
+                    f"⚠️  DOMÍNIO BLOQUEADO AUTOMATICAMENTE: '{domain}' (erro: {error_type})"
+                )
+
+            # Acumular no buffer: o upsert soma error_count ao valor do banco
+            pending = self._pending.get(domain)
+            if pending:
+                pending["error_count"] += 1
+                pending.update(
+                    last_url=url,
+                    last_error_type=error_type,
+                    last_error_message=error_message,
+                    updated_at=now
+                )
+            else:
+                self._pending[domain] = {
+                    "domain": domain,
+                    "error_type": error_type,
+                    "error_count": 1,
+                    "reason": reason,
+                    "last_url": url,
+                    "last_error_type": error_type,
+                    "last_error_message": error_message,
+                    "blocked_at": now,
+                    "updated_at": now
+                }
+
+            if len(self._pending) >= self.flush_threshold:
+                self.flush()
+            return True
 
     def get_blocked_info(self, url: str) -> Optional[Dict]:
         """
@@ -176,7 +306,8 @@ class ScrapingBlacklist:
         if not domain:
             return None
 
-        return self.blacklist_data.get(domain)
+        blocked_domain = self._find_blocked_domain(domain)
+        return self.blacklist_data.get(blocked_domain) if blocked_domain else None
 
     def remove_from_blacklist(self, url: str) -> bool:
         """
@@ -188,17 +319,25 @@ class ScrapingBlacklist:
         Returns:
             True se removido, False se não estava na blacklist
         """
-        domain = self.get_domain(url)
-        if not domain:
-            return False
+        with self._lock:
+            domain = self.get_domain(url)
+            if not domain:
+                return False
 
-        if domain in self.blacklist_data:
-            del self.blacklist_data[domain]
-            self.save()
-            logging.info(f"Domínio '{domain}' removido da blacklist.")
-            return True
+            self._pending.pop(domain, None)
+            removed_from_memory = self.blacklist_data.pop(domain, None) is not None
 
-        return False
+            try:
+                removed_from_db = self.repository.delete(domain)
+            except Exception as e:
+                logging.error(f"Erro ao remover domínio '{domain}' da blacklist: {e}", exc_info=True)
+                removed_from_db = False
+
+            if removed_from_memory or removed_from_db:
+                logging.info(f"Domínio '{domain}' removido da blacklist.")
+                return True
+
+            return False
 
     def get_all_blocked_domains(self) -> list[str]:
         """
@@ -207,7 +346,8 @@ class ScrapingBlacklist:
         Returns:
             Lista de domínios
         """
-        return list(self.blacklist_data.keys())
+        with self._lock:
+            return list(self.blacklist_data.keys())
 
     def get_statistics(self) -> Dict:
         """
@@ -216,19 +356,20 @@ class ScrapingBlacklist:
         Returns:
             Dicionário com estatísticas
         """
-        if not self.blacklist_data:
+        with self._lock:
+            if not self.blacklist_data:
+                return {
+                    "total_blocked": 0,
+                    "by_error_type": {}
+                }
+
+            error_types = {}
+            for domain_data in self.blacklist_data.values():
+                error_type = domain_data.get("error_type", "Unknown")
+                error_types[error_type] = error_types.get(error_type, 0) + 1
+
             return {
-                "total_blocked": 0,
-                "by_error_type": {}
+                "total_blocked": len(self.blacklist_data),
+                "by_error_type": error_types,
+                "domains": self.get_all_blocked_domains()
             }
-
-        error_types = {}
-        for domain_data in self.blacklist_data.values():
-            error_type = domain_data.get("error_type", "Unknown")
-            error_types[error_type] = error_types.get(error_type, 0) + 1
-
-        return {
-            "total_blocked": len(self.blacklist_data),
-            "by_error_type": error_types,
-            "domains": self.get_all_blocked_domains()
-        }
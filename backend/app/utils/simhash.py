@@ -0,0 +1,89 @@
+"""
+SimHash de 64 bits para detecção de artigos quase duplicados.
+Textos parecidos geram fingerprints com poucos bits diferentes (distância de Hamming).
+"""
+
+import re
+import hashlib
+from collections import Counter
+from typing import List
+
+FINGERPRINT_BITS = 64
+SHINGLE_SIZE = 3
+
+_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def simhash(text: str, shingle_size: int = SHINGLE_SIZE) -> int:
+    """
+    Calcula o SimHash de 64 bits de um texto.
+
+    As features são shingles de palavras (sequências de shingle_size palavras em
+    minúsculas), pesadas pela frequência no texto.
+
+    Args:
+        text: Texto do artigo
+        shingle_size: Número de palavras por shingle
+
+    Returns:
+        Fingerprint como inteiro sem sinal de 64 bits (0 para texto vazio)
+    """
+    tokens = _TOKEN_RE.findall((text or '').lower())
+    if not tokens:
+        return 0
+
+    if len(tokens) < shingle_size:
+        shingles = Counter([' '.join(tokens)])
+    else:
+        shingles = Counter(
+            ' '.join(tokens[i:i + shingle_size]) for i in range(len(tokens) - shingle_size + 1)
+        )
+
+    weights = [0] * FINGERPRINT_BITS
+    for shingle, weight in shingles.items():
+        feature = int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big')
+        for bit in range(FINGERPRINT_BITS):
+            if feature >> bit & 1:
+                weights[bit] += weight
+            else:
+                weights[bit] -= weight
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Número de bits diferentes entre dois fingerprints."""
+    return bin(a ^ b).count('1')
+
+
+def split_bands(fingerprint: int, bands: int = 4) -> List[int]:
+    """
+    Divide o fingerprint em bandas para busca por LSH.
+
+    Com 4 bandas de 16 bits, dois fingerprints a até 3 bits de distância
+    coincidem em pelo menos uma banda inteira.
+
+    Args:
+        fingerprint: Fingerprint sem sinal de 64 bits
+        bands: Número de bandas
+
+    Returns:
+        Lista com o valor de cada banda
+    """
+    width = FINGERPRINT_BITS // bands
+    mask = (1 << width) - 1
+    return [(fingerprint >> (i * width)) & mask for i in range(bands)]
+
+
+def to_signed(fingerprint: int) -> int:
+    """Converte o fingerprint para inteiro com sinal (coluna BIGINT)."""
+    return fingerprint - (1 << FINGERPRINT_BITS) if fingerprint >= 1 << (FINGERPRINT_BITS - 1) else fingerprint
+
+
+def to_unsigned(value: int) -> int:
+    """Converte o valor da coluna BIGINT de volta para o fingerprint sem sinal."""
+    return value + (1 << FINGERPRINT_BITS) if value < 0 else value
@@ -0,0 +1,306 @@
+"""
+Compressão transparente do corpo das notícias (texto e HTML).
+zlib com dicionário compartilhado (zdict) treinado sobre o próprio acervo.
+"""
+
+import os
+import re
+import zlib
+import logging
+import threading
+from collections import Counter
+from contextlib import nullcontext
+from typing import Dict, Iterable, Optional, Tuple
+
+import sqlalchemy as sa
+from sqlalchemy import LargeBinary
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.types import TypeDecorator
+
+
+# Janela máxima do zlib: bytes do dicionário além disso não são usados
+MAX_DICTIONARY_SIZE = 32 * 1024
+
+# Tokens usados no treino: palavras, espaços e pontuação/tags isoladas
+_TOKEN_PATTERN = re.compile(r'\w+|\s+|[^\w\s]')
+
+# Tabela dos dicionários (CompressionDictionaryEntity), lida sem o ORM porque
+# os dicionários são usados durante a conversão das colunas CompressedText
+compression_dictionaries = sa.table(
+    'compression_dictionaries',
+    sa.column('id', sa.Integer),
+    sa.column('name', sa.String),
+    sa.column('data', sa.LargeBinary),
+)
+
+# Diretório dos arquivos .zdict usados antes da tabela (migrações 0005 a 0010)
+LEGACY_DICT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'compression')
+
+
+def train_dictionary(
+    samples: Iterable[str],
+    size: int = MAX_DICTIONARY_SIZE,
+    max_ngram: int = 6,
+    max_tokens: int = 2000
+) -> bytes:
+    """
+    Treina um dicionário zlib a partir de uma amostra de documentos.
+
+    Conta sequências de 1 a max_ngram tokens pelo número de documentos em que
+    aparecem (repetições dentro do mesmo documento o zlib já comprime) e
+    seleciona as de maior ganho estimado (documentos * bytes) até o tamanho
+    do dicionário. As mais valiosas ficam no fim, mais perto dos dados.
+
+    Args:
+        samples: Documentos de exemplo (texto ou HTML)
+        size: Tamanho máximo do dicionário em bytes
+        max_ngram: Maior sequência de tokens considerada
+        max_tokens: Tokens lidos de cada documento (início do documento)
+
+    Returns:
+        Dicionário para zlib.compressobj(zdict=...)
+    """
+    document_frequency: Counter = Counter()
+    total = 0
+    for sample in samples:
+        if not sample:
+            continue
+        total += 1
+        tokens = _TOKEN_PATTERN.findall(sample)[:max_tokens]
+        ngrams = set()
+        for n in range(1, max_ngram + 1):
+            for i in range(len(tokens) - n + 1):
+                ngrams.add(''.join(tokens[i:i + n]))
+        document_frequency.update(ngrams)
+
+        # Contagem com perdas: descarta periodicamente o que apareceu uma vez só
+        if total % 100 == 0:
+            document_frequency = Counter({k: v for k, v in document_frequency.items() if v > 1})
+
+    # Só sequências presentes em mais de um documento e com mais de 3 bytes
+    candidates = []
+    for ngram, count in document_frequency.items():
+        encoded = ngram.encode('utf-8')
+        if count > 1 and len(encoded) > 3:
+            candidates.append((count * len(encoded), encoded))
+    candidates.sort(reverse=True)
+
+    selected = []
+    joined = bytearray()
+    for _, encoded in candidates:
+        if len(joined) + len(encoded) > size:
+            continue
+        # Trechos contidos em outro já escolhido não acrescentam nada
+        if encoded in joined:
+            continue
+        selected.append(encoded)
+        joined += encoded
+        if len(joined) >= size - 3:
+            break
+
+    logging.info(f"Dicionário de compressão treinado: {total} documentos, {len(selected)} trechos, {len(joined)} bytes")
+    return b''.join(reversed(selected))
+
+
+def read_dictionary_files(directory: Optional[str] = None) -> Dict[int, Tuple[str, bytes]]:
+    """
+    Lê os dicionários gravados em arquivos '{nome}.{id}.zdict', o formato
+    anterior à tabela compression_dictionaries (usado só pelas migrações).
+
+    Args:
+        directory: Diretório dos arquivos (padrão: COMPRESSION_DICT_DIR ou app/data/compression)
+
+    Returns:
+        {ID: (nome, dicionário)}
+    """
+    directory = directory or os.getenv('COMPRESSION_DICT_DIR', LEGACY_DICT_DIR)
+    dictionaries = {}
+    if os.path.isdir(directory):
+        for filename in os.listdir(directory):
+            match = re.fullmatch(r'(\w+)\.(\d+)\.zdict', filename)
+            if not match:
+                continue
+            with open(os.path.join(directory, filename), 'rb') as f:
+                dictionaries[int(match.group(2))] = (match.group(1), f.read())
+    return dictionaries
+
+
+class TextCompressor:
+    """
+    Comprime e descomprime o corpo das notícias.
+
+    Formato gravado: 0x00 + ID do dicionário (2 bytes, big endian; 0 = sem
+    dicionário) + stream zlib. Valores que não começam com 0x00 são texto
+    UTF-8 sem compressão (linhas anteriores à recompressão); o byte nulo nunca
+    aparece no início de um texto válido.
+
+    Os dicionários ficam na tabela compression_dictionaries, no mesmo banco
+    das notícias: um dicionário treinado pela coleta é lido por todos os
+    processos, sem depender da imagem publicada. O de maior ID de cada nome é
+    usado para comprimir; os anteriores continuam disponíveis para ler as
+    linhas já gravadas. Um ID desconhecido na leitura recarrega a tabela.
+    """
+
+    MARKER = b'\x00'
+    HEADER_SIZE = 3
+
+    def __init__(self, bind=None, level: int = 6):
+        """
+        Inicializa o compressor.
+
+        Args:
+            bind: Engine ou Connection do banco dos dicionários (padrão: db.engine do app atual)
+            level: Nível de compressão do zlib (1-9)
+        """
+        self.bind = bind
+        self.level = level
+        self._lock = threading.Lock()
+        self._dictionaries: Optional[Dict[int, bytes]] = None
+        self._current: Dict[str, int] = {}
+        self._extra: Dict[int, Tuple[str, bytes]] = {}
+
+    def _connection(self, begin: bool = False):
+        """Conexão própria (Engine) ou a conexão recebida, sem commit (Connection)."""
+        bind = self.bind
+        if bind is None:
+            from app.extensions import db
+            bind = db.engine
+        if isinstance(bind, sa.engine.Engine):
+            return bind.begin() if begin else bind.connect()
+        return nullcontext(bind)
+
+    def load(self) -> None:
+        """Carrega os dicionários da tabela (na primeira utilização ou ao achar um ID desconhecido)."""
+        entries = dict(self._extra)
+        with self._connection() as connection:
+            if sa.inspect(connection).has_table('compression_dictionaries'):
+                rows = connection.execute(sa.select(compression_dictionaries)).all()
+                entries.update({row.id: (row.name, bytes(row.data)) for row in rows})
+
+        dictionaries = {}
+        current = {}
+        for dict_id, (name, data) in entries.items():
+            dictionaries[dict_id] = data
+            if dict_id > current.get(name, 0):
+                current[name] = dict_id
+
+        with self._lock:
+            self._dictionaries = dictionaries
+            self._current = current
+
+    def preload(self) -> None:
+        """
+        Carrega os dicionários na inicialização do app, para que a primeira
+        gravação de uma coluna CompressedText não abra outra conexão no meio
+        da transação. Sem banco disponível, a carga fica para o primeiro uso.
+        """
+        try:
+            self.load()
+        except SQLAlchemyError as e:
+            logging.warning(f"Dicionários de compressão não carregados na inicialização: {e}")
+
+    def add_dictionaries(self, dictionaries: Dict[int, Tuple[str, bytes]]) -> None:
+        """Acrescenta dicionários de fora da tabela ({ID: (nome, dicionário)}), como os de read_dictionary_files()."""
+        self._extra.update(dictionaries)
+        self.load()
+
+    def _ensure_loaded(self) -> None:
+        if self._dictionaries is None:
+            self.load()
+
+    def current_dictionary_id(self, name: str) -> int:
+        """ID do dicionário usado para comprimir a coluna (0 se não houver)."""
+        self._ensure_loaded()
+        return self._current.get(name, 0)
+
+    def save_dictionary(self, name: str, data: bytes) -> int:
+        """
+        Grava um novo dicionário para a coluna e passa a usá-lo.
+
+        Returns:
+            ID do novo dicionário
+        """
+        self._ensure_loaded()
+        with self._connection(begin=True) as connection:
+            dict_id = (connection.execute(sa.select(sa.func.max(compression_dictionaries.c.id))).scalar() or 0) + 1
+            connection.execute(compression_dictionaries.insert().values(id=dict_id, name=name, data=data))
+
+        with self._lock:
+            self._dictionaries[dict_id] = data
+            self._current[name] = dict_id
+        logging.info(f"Dicionário de compressão '{name}' salvo com ID {dict_id}")
+        return dict_id
+
+    def compress(self, text: str, name: str) -> bytes:
+        """Comprime o texto com o dicionário atual da coluna."""
+        dict_id = self.current_dictionary_id(name)
+        if dict_id:
+            compressor = zlib.compressobj(self.level, zdict=self._dictionaries[dict_id])
+        else:
+            compressor = zlib.compressobj(self.level)
+        data = compressor.compress(text.encode('utf-8')) + compressor.flush()
+        return self.MARKER + dict_id.to_bytes(2, 'big') + data
+
+    def decompress(self, value: bytes) -> str:
+        """Descomprime um valor gravado (ou decodifica texto não comprimido)."""
+        value = bytes(value)
+        if not value.startswith(self.MARKER):
+            return value.decode('utf-8')
+
+        dict_id = self.header(value)[1]
+        if dict_id:
+            self._ensure_loaded()
+            dictionary = self._dictionaries.get(dict_id)
+            if dictionary is None:
+                # Treinado por outro processo depois da carga
+                self.load()
+                dictionary = self._dictionaries.get(dict_id)
+            if dictionary is None:
+                raise ValueError(f"Dicionário de compressão {dict_id} não encontrado na tabela compression_dictionaries")
+            decompressor = zlib.decompressobj(zdict=dictionary)
+        else:
+            decompressor = zlib.decompressobj()
+        data = decompressor.decompress(value[self.HEADER_SIZE:]) + decompressor.flush()
+        return data.decode('utf-8')
+
+    def header(self, value: bytes) -> Tuple[bool, Optional[int]]:
+        """
+        Lê o cabeçalho de um valor gravado.
+
+        Returns:
+            Tupla (comprimido, ID do dicionário); ID None se não comprimido
+        """
+        value = bytes(value[:self.HEADER_SIZE])
+        if not value.startswith(self.MARKER):
+            return False, None
+        return True, int.from_bytes(value[1:self.HEADER_SIZE], 'big')
+
+
+# Instância usada pelas colunas CompressedText
+text_compressor = TextCompressor()
+
+
+class CompressedText(TypeDecorator):
+    """
+    Coluna de texto gravada comprimida (BLOB/BYTEA) por text_compressor.
+
+    Args:
+        name: Nome do dicionário da coluna (ex: 'content', 'html')
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def __init__(self, name: str, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.name = name
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return text_compressor.compress(value, self.name)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return text_compressor.decompress(value)
@@ -0,0 +1,42 @@
+"""
+Normalização de títulos de notícias.
+Gera a chave usada para detectar títulos repetidos (coluna news.title_key).
+"""
+
+import re
+import unicodedata
+
+# Separadores que viram espaço ("Brasil-Argentina" == "Brasil - Argentina")
+_SEPARATORS = set('-‐‑‒–—―/|·•')
+
+
+def _strip_char(char: str) -> str:
+    if char in _SEPARATORS:
+        return ' '
+    # Remove pontuação e símbolos (categorias Unicode P* e S*), inclusive aspas tipográficas
+    if unicodedata.category(char)[0] in ('P', 'S'):
+        return ''
+    return char
+
+
+def normalize_title(title: str) -> str:
+    """
+    Normaliza um título para comparação e uso como chave.
+
+    Args:
+        title: Título original
+
+    Returns:
+        Título em minúsculas, sem pontuação e com espaços colapsados.
+        Acentos são mantidos (em português eles distinguem palavras).
+
+    Examples:
+        >>> normalize_title('  "Governo anuncia"   novo PLANO! ')
+        'governo anuncia novo plano'
+    """
+    if not title:
+        return ''
+
+    text = unicodedata.normalize('NFC', title).casefold()
+    text = ''.join(_strip_char(char) for char in text)
+    return re.sub(r'\s+', ' ', text).strip()
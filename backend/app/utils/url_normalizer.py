@@ -0,0 +1,39 @@
+"""
+Normalização de URLs de artigos.
+Usada para comparar URLs equivalentes (www, barra final, query string, fragmento).
+"""
+
+import logging
+from urllib.parse import urlparse, urlunparse
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normaliza uma URL para comparação e uso como chave.
+
+    Args:
+        url: URL original
+
+    Returns:
+        URL em minúsculas, sem 'www.', sem barra final, query ou fragmento
+    """
+    if not url:
+        return url
+
+    try:
+        parsed = urlparse(url.lower().strip())
+
+        normalized = urlunparse((
+            parsed.scheme,
+            parsed.netloc.replace('www.', ''),  # Remove www
+            parsed.path.rstrip('/'),            # Remove trailing slash
+            '',  # params
+            '',  # query - remove query parameters
+            ''   # fragment
+        ))
+
+        return normalized
+
+    except Exception as e:
+        logging.warning(f"Erro ao normalizar URL '{url}': {e}")
+        return url.lower().strip()
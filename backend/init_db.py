@@ -1,5 +1,5 @@
 from app import create_app
-from app.extensions import db # Correção aqui
+from flask_migrate import upgrade
 from app.models.topic import Topic
 from app.repositories.topic_repository import TopicRepository
 
@@ -12,8 +12,10 @@ def init_db():
     app = create_app()
     with app.app_context():
         print("--- Iniciando Migração do Banco de Dados ---")
-        db.create_all()
-        print("--- Tabelas Criadas/Verificadas ---")
+        # Aplica as revisões de backend/migrations. A revisão base só cria as
+        # tabelas que ainda não existem (bancos criados com db.create_all()).
+        upgrade()
+        print("--- Tabelas Criadas/Migradas ---")
 
         print("Verificando e inicializando tópicos padrão...")
         topic_repo = TopicRepository()
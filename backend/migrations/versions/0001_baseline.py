@@ -0,0 +1,214 @@
+"""esquema base (tabelas criadas até então por db.create_all)
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19 07:35:36.953970
+
+Bancos criados antes das migrações já têm parte destas tabelas: cada tabela
+só é criada se ainda não existir, então a revisão pode ser aplicada tanto em
+um banco vazio quanto em um banco existente.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _create_table(name, *columns):
+    """Cria a tabela se ela ainda não existir. Retorna True se foi criada."""
+    if sa.inspect(op.get_bind()).has_table(name):
+        return False
+    op.create_table(name, *columns)
+    return True
+
+
+def upgrade():
+    _create_table('collection_runs',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('new_articles_count', sa.Integer(), nullable=False),
+    sa.Column('new_sources_count', sa.Integer(), nullable=False),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    _create_table('custom_topics',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('name')
+    )
+    _create_table('news_sources',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('url', sa.String(length=255), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('name'),
+    sa.UniqueConstraint('url')
+    )
+    _create_table('scraping_blacklist',
+    sa.Column('domain', sa.String(length=255), nullable=False),
+    sa.Column('error_type', sa.String(length=255), nullable=False),
+    sa.Column('error_count', sa.Integer(), nullable=False),
+    sa.Column('reason', sa.Text(), nullable=True),
+    sa.Column('last_url', sa.Text(), nullable=True),
+    sa.Column('last_error_type', sa.String(length=255), nullable=True),
+    sa.Column('last_error_message', sa.Text(), nullable=True),
+    sa.Column('blocked_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('domain')
+    )
+    _create_table('scraping_domain_health',
+    sa.Column('domain', sa.String(length=255), nullable=False),
+    sa.Column('state', sa.String(length=20), nullable=False),
+    sa.Column('success_score', sa.Float(), nullable=False),
+    sa.Column('failure_score', sa.Float(), nullable=False),
+    sa.Column('open_count', sa.Integer(), nullable=False),
+    sa.Column('last_error_type', sa.String(length=255), nullable=True),
+    sa.Column('opened_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('next_probe_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('domain')
+    )
+    _create_table('topics',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('state', sa.SmallInteger(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('name')
+    )
+    _create_table('users',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('full_name', sa.String(length=80), nullable=False),
+    sa.Column('email', sa.String(length=120), nullable=False),
+    sa.Column('birthdate', sa.Date(), nullable=True),
+    sa.Column('password_hash', sa.String(length=200), nullable=True),
+    sa.Column('newsletter', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('email')
+    )
+    _create_table('collection_run_articles',
+    sa.Column('run_id', sa.Integer(), nullable=False),
+    sa.Column('url', sa.String(length=500), nullable=False),
+    sa.Column('topic_id', sa.Integer(), nullable=False),
+    sa.Column('stage', sa.String(length=20), nullable=False),
+    sa.Column('reason', sa.Text(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['run_id'], ['collection_runs.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('run_id', 'url')
+    )
+    _create_table('collection_run_topics',
+    sa.Column('run_id', sa.Integer(), nullable=False),
+    sa.Column('topic_id', sa.Integer(), nullable=False),
+    sa.Column('articles_json', sa.Text(), nullable=False),
+    sa.Column('fetched_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['run_id'], ['collection_runs.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('run_id', 'topic_id')
+    )
+    _create_table('news',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('title', sa.Text(), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('url', sa.String(length=500), nullable=False),
+    sa.Column('image_url', sa.String(length=500), nullable=True),
+    sa.Column('content', sa.Text(), nullable=False),
+    sa.Column('html', sa.Text(), nullable=False),
+    sa.Column('published_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('source_id', sa.Integer(), nullable=False),
+    sa.Column('topic_id', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['source_id'], ['news_sources.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['topic_id'], ['topics.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('url')
+    )
+    _create_table('user_preferred_news_sources',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('source_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.ForeignKeyConstraint(['source_id'], ['news_sources.id'], onupdate='CASCADE', ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], onupdate='CASCADE', ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'source_id'),
+    sa.UniqueConstraint('user_id', 'source_id', name='uq_user_news_sources_user_source')
+    )
+    _create_table('user_providers',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('provider_name', sa.String(length=50), nullable=False),
+    sa.Column('provider_user_id', sa.String(length=255), nullable=False),
+    sa.Column('provider_email', sa.String(length=255), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    _create_table('users_preferred_custom_topics',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('topic_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.ForeignKeyConstraint(['topic_id'], ['custom_topics.id'], onupdate='CASCADE', ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], onupdate='CASCADE', ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'topic_id'),
+    sa.UniqueConstraint('user_id', 'topic_id', name='uq_users_preferred_custom_topics_user_topic')
+    )
+    fingerprints_created = _create_table('news_fingerprints',
+    sa.Column('news_id', sa.Integer(), nullable=False),
+    sa.Column('fingerprint', sa.BigInteger(), nullable=False),
+    sa.Column('band_0', sa.Integer(), nullable=False),
+    sa.Column('band_1', sa.Integer(), nullable=False),
+    sa.Column('band_2', sa.Integer(), nullable=False),
+    sa.Column('band_3', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['news_id'], ['news.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('news_id')
+    )
+    if fingerprints_created:
+        for column in ('band_0', 'band_1', 'band_2', 'band_3', 'created_at'):
+            op.create_index(f'ix_news_fingerprints_{column}', 'news_fingerprints', [column], unique=False)
+
+    _create_table('user_read_history',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('news_id', sa.Integer(), nullable=False),
+    sa.Column('read_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.ForeignKeyConstraint(['news_id'], ['news.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'news_id', 'read_at')
+    )
+    _create_table('user_saved_news',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('news_id', sa.Integer(), nullable=False),
+    sa.Column('is_favorite', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.ForeignKeyConstraint(['news_id'], ['news.id'], onupdate='CASCADE', ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], onupdate='CASCADE', ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'news_id'),
+    sa.UniqueConstraint('user_id', 'news_id', name='uq_user_saved_news_user_news')
+    )
+
+
+def downgrade():
+    op.drop_table('user_saved_news')
+    op.drop_table('user_read_history')
+    op.drop_table('news_fingerprints')
+    op.drop_table('users_preferred_custom_topics')
+    op.drop_table('user_providers')
+    op.drop_table('user_preferred_news_sources')
+    op.drop_table('news')
+    op.drop_table('collection_run_topics')
+    op.drop_table('collection_run_articles')
+    op.drop_table('users')
+    op.drop_table('topics')
+    op.drop_table('scraping_domain_health')
+    op.drop_table('scraping_blacklist')
+    op.drop_table('news_sources')
+    op.drop_table('custom_topics')
+    op.drop_table('collection_runs')
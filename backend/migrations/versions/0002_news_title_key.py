@@ -0,0 +1,66 @@
+"""chave normalizada do título (news.title_key) com índice
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 08:10:00.000000
+
+A deduplicação por título fazia lower(title) em todas as linhas da tabela
+'news' (varredura sequencial a cada consulta). A coluna title_key guarda o
+título normalizado (normalize_title) e é indexada; as linhas existentes são
+preenchidas em lotes antes de a coluna passar a ser obrigatória.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.title_normalizer import normalize_title
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+news = sa.table(
+    'news',
+    sa.column('id', sa.Integer),
+    sa.column('title', sa.Text),
+    sa.column('title_key', sa.Text),
+)
+
+
+def _backfill_title_keys():
+    """Preenche title_key das notícias existentes, em lotes ordenados por ID."""
+    bind = op.get_bind()
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(news.c.id, news.c.title)
+            .where(news.c.id > last_id)
+            .order_by(news.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+
+        bind.execute(
+            news.update().where(news.c.id == sa.bindparam('news_id')).values(title_key=sa.bindparam('key')),
+            [{'news_id': news_id, 'key': normalize_title(title)} for news_id, title in rows]
+        )
+        last_id = rows[-1].id
+
+
+def upgrade():
+    op.add_column('news', sa.Column('title_key', sa.Text(), nullable=True))
+    _backfill_title_keys()
+    with op.batch_alter_table('news', schema=None) as batch_op:
+        batch_op.alter_column('title_key', existing_type=sa.Text(), nullable=False)
+    op.create_index('ix_news_title_key', 'news', ['title_key'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_news_title_key', table_name='news')
+    with op.batch_alter_table('news', schema=None) as batch_op:
+        batch_op.drop_column('title_key')
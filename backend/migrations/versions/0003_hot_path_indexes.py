@@ -0,0 +1,51 @@
+"""índices das consultas mais frequentes (listagens, histórico e favoritos)
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 09:00:00.000000
+
+- news (published_at, id) e (topic_id, published_at, id): paginação ordenada
+  por data, geral e por tópico
+- news (source_id): join com news_sources
+- user_read_history (user_id, read_at): histórico paginado do usuário
+- user_saved_news (user_id, news_id) WHERE is_favorite: subconsulta EXISTS de
+  favoritos executada em toda listagem
+
+No PostgreSQL os índices são criados com CREATE INDEX CONCURRENTLY, fora da
+transação da migração, para não bloquear escritas nas tabelas.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ('ix_news_published_at_id', 'news', ['published_at', 'id'], {}),
+    ('ix_news_topic_published_at', 'news', ['topic_id', 'published_at', 'id'], {}),
+    ('ix_news_source_id', 'news', ['source_id'], {}),
+    ('ix_user_read_history_user_read_at', 'user_read_history', ['user_id', 'read_at'], {}),
+    ('ix_user_saved_news_favorites', 'user_saved_news', ['user_id', 'news_id'], {
+        'postgresql_where': sa.text('is_favorite'),
+        'sqlite_where': sa.text('is_favorite = 1'),
+    }),
+]
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        for name, table, columns, kwargs in INDEXES:
+            op.create_index(
+                name, table, columns, unique=False,
+                postgresql_concurrently=True, if_not_exists=True, **kwargs
+            )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,57 @@
+"""corpo das notícias (content, html) em tabela própria 1:1 (news_bodies)
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 10:00:00.000000
+
+Listagens, contagens e o ranking do feed leem só os metadados da notícia;
+com o texto e o HTML na mesma linha, toda consulta em 'news' carregava (ou
+percorria) linhas largas. O corpo passa para 'news_bodies' e é lido apenas
+pelo detalhe da notícia, pelo match de tópicos e pela newsletter.
+
+O downgrade recria as colunas em 'news' e copia o corpo de volta.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('news_bodies',
+    sa.Column('news_id', sa.Integer(), nullable=False),
+    sa.Column('content', sa.Text(), nullable=False),
+    sa.Column('html', sa.Text(), nullable=False),
+    sa.ForeignKeyConstraint(['news_id'], ['news.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('news_id')
+    )
+    op.execute(
+        "INSERT INTO news_bodies (news_id, content, html) "
+        "SELECT id, content, html FROM news"
+    )
+    with op.batch_alter_table('news', schema=None) as batch_op:
+        batch_op.drop_column('html')
+        batch_op.drop_column('content')
+
+
+def downgrade():
+    with op.batch_alter_table('news', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('content', sa.Text(), nullable=True))
+        batch_op.add_column(sa.Column('html', sa.Text(), nullable=True))
+    op.execute(
+        "UPDATE news SET "
+        "content = (SELECT b.content FROM news_bodies b WHERE b.news_id = news.id), "
+        "html = (SELECT b.html FROM news_bodies b WHERE b.news_id = news.id)"
+    )
+    # Notícias sem corpo (não deveria haver) ficam com texto vazio
+    op.execute("UPDATE news SET content = '' WHERE content IS NULL")
+    op.execute("UPDATE news SET html = '' WHERE html IS NULL")
+    with op.batch_alter_table('news', schema=None) as batch_op:
+        batch_op.alter_column('content', existing_type=sa.Text(), nullable=False)
+        batch_op.alter_column('html', existing_type=sa.Text(), nullable=False)
+    op.drop_table('news_bodies')
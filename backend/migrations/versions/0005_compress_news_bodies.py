@@ -0,0 +1,90 @@
+"""corpo das notícias comprimido (news_bodies.content/html como BYTEA)
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19 11:00:00.000000
+
+As colunas passam a binárias; o texto existente é convertido para UTF-8 sem
+compressão (lido normalmente por CompressedText). A compressão das linhas
+existentes é feita depois, em lotes, com:
+
+    python -m app.scripts.compress_bodies recompress
+
+O downgrade descomprime em Python e volta as colunas para TEXT.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.text_compression import TextCompressor, read_dictionary_files
+
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 500
+
+COLUMNS = ('content', 'html')
+
+
+def upgrade():
+    with op.batch_alter_table('news_bodies', schema=None) as batch_op:
+        for column in COLUMNS:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.Text(),
+                type_=sa.LargeBinary(),
+                existing_nullable=False,
+                postgresql_using=f"convert_to({column}, 'UTF8')"
+            )
+
+    if op.get_bind().dialect.name == 'sqlite':
+        # O SQLite mantém o valor como TEXT ao recriar a tabela
+        op.execute("UPDATE news_bodies SET content = CAST(content AS BLOB), html = CAST(html AS BLOB)")
+
+
+def downgrade():
+    with op.batch_alter_table('news_bodies', schema=None) as batch_op:
+        for column in COLUMNS:
+            batch_op.add_column(sa.Column(f'{column}_text', sa.Text(), nullable=True))
+
+    bind = op.get_bind()
+    # Dicionários nos arquivos .zdict (a 0010 os grava de volta no downgrade)
+    compressor = TextCompressor(bind=bind)
+    compressor.add_dictionaries(read_dictionary_files())
+    bodies = sa.table(
+        'news_bodies',
+        sa.column('news_id', sa.Integer),
+        *(sa.column(column, sa.LargeBinary) for column in COLUMNS),
+        *(sa.column(f'{column}_text', sa.Text) for column in COLUMNS),
+    )
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(bodies.c.news_id, *(bodies.c[column] for column in COLUMNS))
+            .where(bodies.c.news_id > last_id)
+            .order_by(bodies.c.news_id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+
+        bind.execute(
+            bodies.update()
+            .where(bodies.c.news_id == sa.bindparam('id'))
+            .values({f'{column}_text': sa.bindparam(f'{column}_value') for column in COLUMNS}),
+            [
+                {'id': row.news_id, **{f'{column}_value': compressor.decompress(row._mapping[column]) for column in COLUMNS}}
+                for row in rows
+            ]
+        )
+        last_id = rows[-1].news_id
+
+    with op.batch_alter_table('news_bodies', schema=None) as batch_op:
+        for column in COLUMNS:
+            batch_op.drop_column(column)
+    with op.batch_alter_table('news_bodies', schema=None) as batch_op:
+        for column in COLUMNS:
+            batch_op.alter_column(f'{column}_text', new_column_name=column, existing_type=sa.Text(), nullable=False)
@@ -0,0 +1,67 @@
+"""score base do ranking (news.base_score) e qualidade das fontes
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19 13:00:00.000000
+
+O feed "For You" passa a usar decaimento temporal contínuo: cada notícia
+guarda um score base (data de publicação + qualidade da fonte), calculado
+na ingestão por app/utils/news_ranking.py. As notícias existentes são
+preenchidas em lotes com a qualidade neutra (1.0) de todas as fontes.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.news_ranking import base_score
+
+
+# revision identifiers, used by Alembic.
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+news = sa.table(
+    'news',
+    sa.column('id', sa.Integer),
+    sa.column('published_at', sa.DateTime(timezone=True)),
+    sa.column('base_score', sa.Float),
+)
+
+
+def _backfill_base_scores():
+    """Preenche base_score das notícias existentes, em lotes ordenados por ID."""
+    bind = op.get_bind()
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(news.c.id, news.c.published_at)
+            .where(news.c.id > last_id)
+            .order_by(news.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+
+        bind.execute(
+            news.update().where(news.c.id == sa.bindparam('news_id')).values(base_score=sa.bindparam('score')),
+            [{'news_id': news_id, 'score': base_score(published_at)} for news_id, published_at in rows]
+        )
+        last_id = rows[-1].id
+
+
+def upgrade():
+    op.add_column('news_sources', sa.Column('quality', sa.Float(), server_default='1', nullable=False))
+    op.add_column('news', sa.Column('base_score', sa.Float(), nullable=True))
+    _backfill_base_scores()
+    with op.batch_alter_table('news', schema=None) as batch_op:
+        batch_op.alter_column('base_score', existing_type=sa.Float(), nullable=False)
+
+
+def downgrade():
+    with op.batch_alter_table('news', schema=None) as batch_op:
+        batch_op.drop_column('base_score')
+    with op.batch_alter_table('news_sources', schema=None) as batch_op:
+        batch_op.drop_column('quality')
@@ -0,0 +1,108 @@
+"""busca textual: news.language e news.search_vector (tsvector + GIN)
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19 15:00:00.000000
+
+Cada notícia passa a guardar o idioma ('pt'/'en') e, no PostgreSQL, o
+tsvector usado por /news/search (ver app/utils/news_search.py). O corpo é
+gravado comprimido, então o tsvector não pode ser uma coluna gerada: as
+notícias existentes são preenchidas em lotes, descomprimindo o texto em
+Python. Em outros bancos a coluna existe, mas fica vazia.
+
+Nesta revisão os dicionários de compressão ainda são os arquivos .zdict
+(importados para o banco na 0010). Uma notícia gravada com um dicionário que
+não está no diretório é indexada só pelo título e descrição, com um aviso no
+log, em vez de interromper a migração.
+"""
+import logging
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.utils import news_search
+from app.utils.text_compression import TextCompressor, read_dictionary_files
+
+
+# revision identifiers, used by Alembic.
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 500
+
+news = sa.table(
+    'news',
+    sa.column('id', sa.Integer),
+    sa.column('title', sa.Text),
+    sa.column('description', sa.Text),
+    sa.column('language', sa.String),
+    sa.column('search_vector', postgresql.TSVECTOR),
+)
+news_bodies = sa.table(
+    'news_bodies',
+    sa.column('news_id', sa.Integer),
+    sa.column('content', sa.LargeBinary),
+)
+
+
+def _decompress(compressor, news_id, content):
+    if content is None:
+        return None
+    try:
+        return compressor.decompress(content)
+    except ValueError as e:
+        logging.warning(f"Notícia {news_id} indexada sem o texto: {e}")
+        return None
+
+
+def _backfill(with_search_vector: bool):
+    """Preenche idioma (e tsvector, no PostgreSQL) das notícias existentes, em lotes ordenados por ID."""
+    bind = op.get_bind()
+    values = {'language': sa.bindparam('news_language')}
+    if with_search_vector:
+        values['search_vector'] = news_search.search_vector_expression()
+    stmt = news.update().where(news.c.id == sa.bindparam('news_id')).values(values)
+
+    compressor = TextCompressor(bind=bind)
+    compressor.add_dictionaries(read_dictionary_files())
+
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(news.c.id, news.c.title, news.c.description, news_bodies.c.content)
+            .select_from(news.outerjoin(news_bodies, news_bodies.c.news_id == news.c.id))
+            .where(news.c.id > last_id)
+            .order_by(news.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+
+        params = []
+        for row in rows:
+            content = _decompress(compressor, row.id, row.content)
+            language = news_search.news_language(row.title, row.description, content)
+            param = {'news_id': row.id, 'news_language': language}
+            if with_search_vector:
+                param.update(news_search.search_document(row.title, row.description, content, language))
+            params.append(param)
+        bind.execute(stmt, params)
+        last_id = rows[-1].id
+
+
+def upgrade():
+    is_postgresql = op.get_bind().dialect.name == 'postgresql'
+    op.add_column('news', sa.Column('language', sa.String(length=2), server_default='pt', nullable=False))
+    op.add_column('news', sa.Column('search_vector', sa.Text().with_variant(postgresql.TSVECTOR(), 'postgresql'), nullable=True))
+    _backfill(with_search_vector=is_postgresql)
+    op.create_index('ix_news_search_vector', 'news', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade():
+    op.drop_index('ix_news_search_vector', table_name='news', postgresql_using='gin')
+    with op.batch_alter_table('news', schema=None) as batch_op:
+        batch_op.drop_column('search_vector')
+        batch_op.drop_column('language')
@@ -0,0 +1,96 @@
+"""histórico de leitura: user_read_history.read_day e chave única por dia
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-19 17:00:00.000000
+
+O histórico guarda uma leitura por notícia e dia (a mais recente). Antes a
+regra era verificada em Python (SELECT do dia + INSERT ou UPDATE); com
+read_day na chave primária (user_id, news_id, read_day), o repositório grava
+com um único INSERT ... ON CONFLICT DO UPDATE de read_at, que por isso sai da
+chave. read_day é a data de read_at em UTC. Leituras repetidas no mesmo dia
+que já existam são removidas, mantendo a mais recente.
+"""
+from contextlib import contextmanager
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+history = sa.table(
+    'user_read_history',
+    sa.column('user_id', sa.Integer),
+    sa.column('news_id', sa.Integer),
+    sa.column('read_at', sa.DateTime(timezone=True)),
+    sa.column('read_day', sa.Date),
+)
+
+
+def upgrade():
+    op.add_column('user_read_history', sa.Column('read_day', sa.Date(), nullable=True))
+    op.execute(history.update().values(read_day=_utc_date(history.c.read_at)))
+
+    newer = history.alias('newer')
+    op.execute(history.delete().where(
+        sa.exists().where(
+            newer.c.user_id == history.c.user_id,
+            newer.c.news_id == history.c.news_id,
+            newer.c.read_day == history.c.read_day,
+            newer.c.read_at > history.c.read_at,
+        )
+    ))
+
+    with _batch_with_primary_key(['user_id', 'news_id', 'read_day']) as batch_op:
+        batch_op.alter_column('read_day', existing_type=sa.Date(), nullable=False)
+
+
+def downgrade():
+    with _batch_with_primary_key(['user_id', 'news_id', 'read_at']) as batch_op:
+        batch_op.drop_column('read_day')
+
+
+def _utc_date(read_at):
+    """
+    Data de read_at em UTC, como read_day_of() em Python (leituras novas).
+
+    No PostgreSQL, date() de um timestamptz usa o fuso da sessão; no SQLite,
+    read_at é gravado sem fuso, em hora local, e o modificador 'utc' converte.
+    """
+    if op.get_bind().dialect.name == 'postgresql':
+        return sa.func.date(sa.func.timezone('UTC', read_at))
+    return sa.func.date(read_at, 'utc')
+
+
+@contextmanager
+def _batch_with_primary_key(columns):
+    """
+    batch_alter_table de user_read_history com a chave primária trocada.
+
+    No PostgreSQL a chave da baseline (user_read_history_pkey) é removida e
+    recriada. No SQLite ela não tem nome (não dá para removê-la): a tabela é
+    recriada a partir da definição completa, já com a nova chave.
+    """
+    if op.get_bind().dialect.name == 'sqlite':
+        table = sa.Table(
+            'user_read_history', sa.MetaData(),
+            sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False),
+            sa.Column('news_id', sa.Integer(), sa.ForeignKey('news.id', ondelete='CASCADE'), nullable=False),
+            sa.Column('read_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+            sa.Column('read_day', sa.Date(), nullable=True),
+            sa.PrimaryKeyConstraint(*columns),
+            sa.Index('ix_user_read_history_user_read_at', 'user_id', 'read_at'),
+        )
+        with op.batch_alter_table('user_read_history', recreate='always', copy_from=table) as batch_op:
+            yield batch_op
+        return
+
+    with op.batch_alter_table('user_read_history', schema=None) as batch_op:
+        batch_op.drop_constraint('user_read_history_pkey', type_='primary')
+        batch_op.create_primary_key('user_read_history_pkey', columns)
+        yield batch_op
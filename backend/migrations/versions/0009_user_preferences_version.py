@@ -0,0 +1,29 @@
+"""versão das preferências do usuário (users.preferences_version)
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-20 10:00:00.000000
+
+Incrementada na mesma transação de cada mudança de fontes ou custom topics
+preferidos. O estado do ranking "For You" em memória (FeedRankingService)
+compara a versão a cada página e refaz o ranking quando ela muda, inclusive
+nos workers que não atenderam a mudança.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0009'
+down_revision = '0008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('users', sa.Column('preferences_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_column('preferences_version')
@@ -0,0 +1,54 @@
+"""dicionários de compressão no banco (compression_dictionaries)
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-20 14:00:00.000000
+
+Os dicionários do CompressedText deixam os arquivos .zdict de
+app/data/compression (COMPRESSION_DICT_DIR) e passam para uma tabela, lida
+por todos os processos: um dicionário treinado pelo job de coleta não deixa
+ilegíveis as linhas lidas pela API. Os arquivos existentes são importados
+com os mesmos IDs; o downgrade os grava de volta no diretório.
+"""
+import os
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.text_compression import compression_dictionaries, read_dictionary_files, LEGACY_DICT_DIR
+
+
+# revision identifiers, used by Alembic.
+revision = '0010'
+down_revision = '0009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('compression_dictionaries',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('data', sa.LargeBinary(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+    files = read_dictionary_files()
+    if files:
+        op.get_bind().execute(
+            compression_dictionaries.insert(),
+            [{'id': dict_id, 'name': name, 'data': data} for dict_id, (name, data) in sorted(files.items())]
+        )
+
+
+def downgrade():
+    directory = os.getenv('COMPRESSION_DICT_DIR', LEGACY_DICT_DIR)
+    rows = op.get_bind().execute(sa.select(compression_dictionaries)).all()
+    if rows:
+        os.makedirs(directory, exist_ok=True)
+    for row in rows:
+        with open(os.path.join(directory, f'{row.name}.{row.id}.zdict'), 'wb') as f:
+            f.write(row.data)
+
+    op.drop_table('compression_dictionaries')
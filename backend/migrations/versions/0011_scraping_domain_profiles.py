@@ -0,0 +1,38 @@
+"""perfis de extração por domínio no banco (scraping_domain_profiles)
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-21 09:00:00.000000
+
+Os perfis aprendidos pelo scraping saem do arquivo JSON em /tmp
+(DOMAIN_PROFILES_FILE), perdido a cada reinício do container, e passam para
+uma tabela ao lado de scraping_blacklist e scraping_domain_health. O arquivo
+existente é importado pelo NewsCollectService enquanto a tabela estiver vazia.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0011'
+down_revision = '0010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('scraping_domain_profiles',
+    sa.Column('domain', sa.String(length=255), nullable=False),
+    sa.Column('container_selector', sa.Text(), nullable=False),
+    sa.Column('boilerplate_selectors', sa.JSON(), nullable=False),
+    sa.Column('trim_selector', sa.Text(), nullable=True),
+    sa.Column('hits', sa.Integer(), nullable=False),
+    sa.Column('consecutive_misses', sa.Integer(), nullable=False),
+    sa.Column('learned_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('domain')
+    )
+
+
+def downgrade():
+    op.drop_table('scraping_domain_profiles')
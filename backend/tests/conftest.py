@@ -11,6 +11,12 @@ def app():
         "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
         "JWT_SECRET_KEY": "super-secret-test-key",
         "WTF_CSRF_ENABLED": False,
+        # Cache de respostas desativado: cada teste recria o banco
+        "RESPONSE_CACHE_TTL": 0,
+        # Estado do ranking do feed desativado pelo mesmo motivo
+        "FEED_RANKING_STATE_TTL": 0,
+        # Índice de busca refeito a cada busca pelo mesmo motivo
+        "SEARCH_INDEX_REBUILD_INTERVAL": 0,
         
     }
 
@@ -0,0 +1,170 @@
+import pytest
+from unittest.mock import patch, MagicMock, AsyncMock, Mock
+
+from app.models.topic import Topic
+from app.repositories.news_repository import NewsRepository
+from app.repositories.news_source_repository import NewsSourceRepository
+from app.repositories.topic_repository import TopicRepository
+from app.services.async_news_collect_service import AsyncNewsCollectService
+from app.services.scrape_service import ScrapeService
+
+
+SCRAPED = {"text": "Conteúdo do artigo " * 20, "html": "<p>Conteúdo do artigo</p>"}
+
+
+def _article(url, title, source_name="Fonte A", source_url="https://fonte-a.com", image=None):
+    return {
+        "title": title,
+        "url": url,
+        "description": "Descrição",
+        "publishedAt": "2025-10-21T10:00:00Z",
+        "image": image,
+        "source": {"name": source_name, "url": source_url},
+    }
+
+
+@pytest.fixture
+def topic(db):
+    return TopicRepository(db.session).create(Topic(name="Technology", state=1))
+
+
+@pytest.fixture
+def service(db, tmp_path, monkeypatch):
+    monkeypatch.setenv("GNEWS_API_KEY", "test-key")
+    monkeypatch.setenv("SCRAPE_CACHE_DIR", str(tmp_path / "scrape_cache"))
+    monkeypatch.setenv("DOMAIN_PROFILES_FILE", str(tmp_path / "profiles.json"))
+    monkeypatch.setenv("SCRAPING_BLACKLIST_JSON", str(tmp_path / "missing.json"))
+    service = AsyncNewsCollectService(
+        news_repo=NewsRepository(db.session),
+        news_source_repo=NewsSourceRepository(db.session),
+        topic_repo=TopicRepository(db.session),
+    )
+    service.GNEWS_DELAY = 0
+    service.scrape_service = MagicMock()
+    service.scrape_service.fetch_page.return_value = {"not_modified": False, "html": "<html></html>"}
+    service.scrape_service.parse_page.return_value = SCRAPED
+    service.scrape_service.get_statistics.return_value = {
+        "domain_health": {"by_state": {"open": 0, "half_open": 0}}
+    }
+    service.keyword_service = MagicMock()
+    service.keyword_service.generate_keywords_batch.return_value = {"technology": {"keywords": ["ai"]}}
+    return service
+
+
+def _run(service, articles, **kwargs):
+    with patch.object(service, "_search_articles_async", AsyncMock(return_value=articles)):
+        return service.collect_news_simple(**kwargs)
+
+
+class TestAsyncCollectNews:
+    """Testes do motor de coleta com asyncio."""
+
+    def test_saves_articles_and_new_sources(self, service, db, topic):
+        service.SAVE_BATCH_SIZE = 2
+        articles = [
+            _article("https://fonte-a.com/1", "Notícia 1"),
+            _article("https://fonte-a.com/2", "Notícia 2"),
+            _article("https://fonte-b.com/3", "Notícia 3", "Fonte B", "https://fonte-b.com"),
+        ]
+
+        new_articles, new_sources = _run(service, articles)
+
+        assert (new_articles, new_sources) == (3, 2)
+        assert NewsRepository(db.session).count_all() == 3
+        saved = NewsRepository(db.session).find_by_url("https://fonte-b.com/3")
+        assert saved.source_id == NewsSourceRepository(db.session).find_by_name("Fonte B").id
+        assert saved.topic_id == topic.id
+        assert service.checkpoint.repository.find_latest_unfinished() is None
+
+    def test_in_run_duplicates_are_scraped_once(self, service, topic):
+        articles = [
+            _article("https://fonte-a.com/1", "Notícia 1"),
+            _article("https://fonte-a.com/1?utm_medium=y", "Notícia 1 repetida"),
+            _article("https://fonte-a.com/2", "NOTÍCIA 1"),
+        ]
+
+        new_articles, _ = _run(service, articles)
+
+        assert new_articles == 1
+        service.scrape_service.fetch_page.assert_called_once_with("https://fonte-a.com/1")
+
+    def test_scraping_failure_and_inaccessible_image_are_skipped(self, service, db, topic):
+        service.scrape_service.fetch_page.side_effect = lambda url: None if url.endswith("/1") else {"html": "x"}
+        articles = [
+            _article("https://fonte-a.com/1", "Notícia 1"),
+            _article("https://fonte-a.com/2", "Notícia 2", image="https://img.com/quebrada.jpg"),
+            _article("https://fonte-a.com/3", "Notícia 3", image="https://img.com/ok.jpg"),
+        ]
+
+        with patch("app.services.news_collect_service.ImageUrlValidator") as validator:
+            validator.validate_image_url_accessible.side_effect = lambda url, session: url.endswith("ok.jpg")
+            new_articles, _ = _run(service, articles)
+
+        assert new_articles == 1
+        assert NewsRepository(db.session).find_by_url("https://fonte-a.com/3") is not None
+        stages = service.checkpoint.repository.get_article_stages(service.checkpoint.run_id)
+        assert stages == {
+            "https://fonte-a.com/1": "skipped",
+            "https://fonte-a.com/2": "skipped",
+            "https://fonte-a.com/3": "saved",
+        }
+
+    def test_resume_reuses_gnews_results(self, service, db, topic):
+        articles = [_article("https://fonte-a.com/1", "Notícia 1")]
+
+        with patch.object(service.news_repo, "find_existing_titles", side_effect=RuntimeError("db down")), \
+             pytest.raises(RuntimeError):
+            _run(service, articles)
+        run_id = service.checkpoint.run_id
+
+        with patch.object(service, "_search_articles_async", AsyncMock()) as search:
+            new_articles, _ = service.collect_news_simple(resume=True)
+
+        search.assert_not_awaited()
+        service.keyword_service.generate_keywords_batch.assert_called_once()
+        assert new_articles == 1
+        assert service.checkpoint.run_id == run_id
+
+    def test_parse_error_skips_article(self, service, db, topic):
+        service.scrape_service.parse_page.side_effect = RuntimeError("boom")
+
+        new_articles, _ = _run(service, [_article("https://fonte-a.com/1", "Notícia 1")])
+
+        assert new_articles == 0
+        assert service.checkpoint.repository.find_latest_unfinished() is None
+
+    def test_gnews_search_retries_after_429(self, service, topic):
+        service.http_session = MagicMock()
+        service.http_session.get.side_effect = [
+            Mock(status_code=429),
+            Mock(status_code=200, json=Mock(return_value={"articles": [_article("https://fonte-a.com/1", "Notícia 1")]})),
+        ]
+
+        with patch("app.services.async_news_collect_service.asyncio.sleep", AsyncMock()) as sleep:
+            new_articles, _ = service.collect_news_simple()
+
+        assert new_articles == 1
+        assert service.http_session.get.call_count == 2
+        sleep.assert_any_await(5)
+
+
+class TestScrapeServiceStages:
+    """Testes da divisão do scraping em download (fetch_page) e parse (parse_page)."""
+
+    def test_fetch_page_uses_http_session(self):
+        scrape_service = ScrapeService()
+        blacklist = MagicMock()
+        blacklist.is_blocked.return_value = False
+        scrape_service.set_blacklist(blacklist)
+        scrape_service.set_http_session(MagicMock())
+        scrape_service.http_session.get.return_value = Mock(status_code=200, headers={"ETag": '"abc"'})
+
+        with patch("app.services.scrape_service.requests.get") as requests_get, \
+             patch("app.services.scrape_service.network.get_html_status", return_value=("<html></html>", 200, [])), \
+             patch.object(scrape_service, "_parse_article", return_value=({"text": "ok"}, None)):
+            page = scrape_service.fetch_page("https://example.com/a")
+            result = scrape_service.parse_page("https://example.com/a", page)
+
+        requests_get.assert_not_called()
+        assert page["etag"] == '"abc"'
+        assert result == {"text": "ok"}
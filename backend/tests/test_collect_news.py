@@ -53,6 +53,14 @@ def test_main_block_runs_run_collection_job(mock_app_context, mock_news_collect_
 
     mock_news_collect_service.collect_news_simple.assert_called_once()
 
+def test_main_block_passes_resume_flag(mock_app_context, mock_news_collect_service):
+    mock_news_collect_service.collect_news_simple.return_value = (0, 0)
+
+    with patch.object(sys, 'argv', ['collect_news', '--resume']):
+        runpy.run_module('app.jobs.collect_news', run_name='__main__')
+
+    mock_news_collect_service.collect_news_simple.assert_called_once_with(resume=True)
+
 
 # Testes de integração para validação de imagem
 @pytest.fixture
@@ -124,4 +132,16 @@ def test_image_validator_can_be_called_from_news_collect_service():
 
         # Assert
         assert result is True
-        mock_head.assert_called_once()
\ No newline at end of file
+        mock_head.assert_called_once()
+
+def test_async_engine_is_selected_by_env(mock_app_context, monkeypatch):
+    monkeypatch.setenv('COLLECTION_ENGINE', 'async')
+    mock_async_instance = MagicMock(name="AsyncNewsCollectServiceInstance")
+    mock_async_instance.collect_news_simple.return_value = (0, 0)
+    mock_module = MagicMock(name="MockAsyncNewsCollectServiceModule")
+    mock_module.AsyncNewsCollectService.return_value = mock_async_instance
+
+    with patch.dict(sys.modules, {'app.services.async_news_collect_service': mock_module}):
+        app.jobs.collect_news.run_collection_job(resume=True)
+
+    mock_async_instance.collect_news_simple.assert_called_once_with(resume=True)
@@ -0,0 +1,104 @@
+import json
+import pytest
+from unittest.mock import patch
+
+from app.utils.collection_metrics import CollectionMetrics
+
+
+@pytest.fixture
+def metrics():
+    return CollectionMetrics(buckets=(0.1, 1.0, 10.0))
+
+
+class TestCollectionMetrics:
+    """Testes para as métricas do job de coleta."""
+
+    def test_observe_fills_histogram(self, metrics):
+        metrics.observe("download", 0.05)
+        metrics.observe("download", 0.5)
+        metrics.observe("download", 20.0)
+
+        stage = metrics.summary()["stages"]["download"]
+
+        assert stage["count"] == 3
+        assert stage["total_seconds"] == pytest.approx(20.55)
+        assert stage["min_seconds"] == pytest.approx(0.05)
+        assert stage["max_seconds"] == pytest.approx(20.0)
+        # O valor acima do último limite só entra no bucket +Inf (count)
+        assert stage["buckets"] == {"0.1": 1, "1.0": 1, "10.0": 0}
+
+    def test_timer_records_even_on_error(self, metrics):
+        with pytest.raises(ValueError):
+            with metrics.timer("gnews_request"):
+                raise ValueError("boom")
+
+        assert metrics.summary()["stages"]["gnews_request"]["count"] == 1
+
+    def test_counters_with_labels(self, metrics):
+        metrics.increment("articles", stage="skipped", reason="URL duplicada")
+        metrics.increment("articles", stage="skipped", reason="URL duplicada")
+        metrics.increment("articles", stage="saved", reason=None)
+
+        counters = metrics.summary()["counters"]["articles"]
+
+        assert {"stage": "saved", "value": 1} in counters
+        assert {"stage": "skipped", "reason": "URL duplicada", "value": 2} in counters
+
+    def test_record_download_aggregates_by_domain(self, metrics):
+        metrics.record_download("https://www.example.com/a", 0.2, 1000)
+        metrics.record_download("https://example.com/b", 0.4, 500)
+        metrics.record_download("https://other.com/a", 0.1, 100)
+
+        summary = metrics.summary()
+
+        assert summary["bytes_downloaded"] == 1600
+        assert list(summary["domains"]) == ["example.com", "other.com"]
+        assert summary["domains"]["example.com"] == {
+            "count": 2, "avg_seconds": 0.3, "max_seconds": 0.4, "bytes": 1500
+        }
+
+    def test_reset_discards_previous_run(self, metrics):
+        metrics.observe("download", 1.0)
+        metrics.increment("articles", stage="saved")
+
+        metrics.reset()
+
+        summary = metrics.summary()
+        assert summary["stages"] == {}
+        assert summary["counters"] == {}
+
+    def test_write_prometheus(self, metrics, tmp_path):
+        metrics.observe("parse", 0.05)
+        metrics.observe("parse", 5.0)
+        metrics.increment("scrape_errors", error_type="HTTP 503")
+        metrics.record_download("https://example.com/a", 0.2, 1000)
+        path = tmp_path / "collection.prom"
+
+        metrics.write_prometheus(str(path))
+
+        content = path.read_text()
+        assert 'collection_stage_duration_seconds_bucket{stage="parse",le="0.1"} 1' in content
+        assert 'collection_stage_duration_seconds_bucket{stage="parse",le="10.0"} 2' in content
+        assert 'collection_stage_duration_seconds_bucket{stage="parse",le="+Inf"} 2' in content
+        assert 'collection_stage_duration_seconds_count{stage="parse"} 2' in content
+        assert 'collection_scrape_errors_total{error_type="HTTP 503"} 1' in content
+        assert "collection_download_bytes_total 1000" in content
+        assert 'collection_domain_download_seconds_count{domain="example.com"} 1' in content
+        assert not (tmp_path / "collection.prom.tmp").exists()
+
+    def test_emit_writes_configured_files(self, metrics, tmp_path):
+        metrics.increment("articles", stage="saved")
+        json_path = tmp_path / "metrics" / "run.json"
+        prom_path = tmp_path / "run.prom"
+
+        summary = metrics.emit(json_path=str(json_path), prometheus_path=str(prom_path), run_id=7, status="completed")
+
+        assert summary["run_id"] == 7
+        assert json.loads(json_path.read_text())["status"] == "completed"
+        assert prom_path.exists()
+
+    def test_emit_ignores_write_errors(self, metrics, tmp_path):
+        with patch.object(metrics, "_write_atomic", side_effect=OSError("read-only")):
+            summary = metrics.emit(json_path=str(tmp_path / "run.json"))
+
+        assert "stages" in summary
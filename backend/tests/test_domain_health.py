@@ -0,0 +1,176 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch, MagicMock, Mock
+
+from app.repositories.scraping_domain_health_repository import ScrapingDomainHealthRepository
+from app.services.scrape_service import ScrapeService
+from app.utils.domain_health import DomainHealth
+
+
+@pytest.fixture
+def repository(db):
+    return ScrapingDomainHealthRepository(db.session)
+
+
+@pytest.fixture
+def health(repository):
+    health = DomainHealth(repository)
+    health.load()
+    return health
+
+
+def _fail(health, url, times, error_type="Request Error"):
+    for _ in range(times):
+        health.record_failure(url, error_type)
+
+
+class TestDomainHealth:
+    """Testes para o modelo de saúde dos domínios (circuit breaker)."""
+
+    def test_unknown_domain_is_allowed(self, health):
+        assert health.allow_request("https://example.com/a") is True
+        assert health.get_state("https://example.com/a") == DomainHealth.STATE_CLOSED
+
+    def test_opens_after_min_failures(self, health):
+        _fail(health, "https://example.com/a", 2)
+        assert health.get_state("https://example.com/a") == DomainHealth.STATE_CLOSED
+
+        _fail(health, "https://www.example.com/b", 1)
+
+        assert health.get_state("https://example.com/a") == DomainHealth.STATE_OPEN
+        assert health.allow_request("https://example.com/c") is False
+
+    def test_successes_keep_circuit_closed(self, health):
+        for _ in range(5):
+            health.record_success("https://example.com/a")
+        _fail(health, "https://example.com/a", 3)
+
+        assert health.get_state("https://example.com/a") == DomainHealth.STATE_CLOSED
+
+    def test_scores_decay_over_time(self, health):
+        _fail(health, "https://example.com/a", 2)
+        record = health.domains["example.com"]
+        record["updated_at"] -= timedelta(hours=24)
+
+        health.record_failure("https://example.com/a", "Timeout")
+
+        # 2 falhas após duas meias-vidas valem 0.5; somadas à nova, não abrem o circuito
+        assert record["failure_score"] == pytest.approx(1.5)
+        assert record["state"] == DomainHealth.STATE_CLOSED
+
+    def test_half_open_probe_success_closes(self, health):
+        _fail(health, "https://example.com/a", 3)
+        health.domains["example.com"]["next_probe_at"] = datetime.now(timezone.utc) - timedelta(seconds=1)
+
+        assert health.allow_request("https://example.com/a") is True
+        assert health.get_state("https://example.com/a") == DomainHealth.STATE_HALF_OPEN
+        assert health.allow_request("https://example.com/b") is False
+
+        health.record_success("https://example.com/a")
+
+        assert health.get_state("https://example.com/a") == DomainHealth.STATE_CLOSED
+        assert health.domains["example.com"]["open_count"] == 0
+
+    def test_half_open_probe_failure_reopens_with_backoff(self, health):
+        _fail(health, "https://example.com/a", 3)
+        record = health.domains["example.com"]
+        record["next_probe_at"] = datetime.now(timezone.utc) - timedelta(seconds=1)
+        health.allow_request("https://example.com/a")
+
+        health.record_failure("https://example.com/a", "Timeout")
+
+        assert record["state"] == DomainHealth.STATE_OPEN
+        assert record["open_count"] == 2
+        delay = record["next_probe_at"] - record["opened_at"]
+        assert delay == health.probe_interval * 2
+
+    def test_probe_delay_is_capped(self, health):
+        assert health._probe_delay(1) == health.probe_interval
+        assert health._probe_delay(20) == health.max_probe_interval
+
+    def test_flush_and_load_roundtrip(self, health, repository):
+        _fail(health, "https://example.com/a", 3, "Empty Content")
+        health.record_success("https://other.com/a")
+        health.flush()
+
+        reloaded = DomainHealth(repository)
+        reloaded.load()
+
+        assert reloaded.get_state("https://example.com/a") == DomainHealth.STATE_OPEN
+        assert reloaded.allow_request("https://example.com/a") is False
+        assert reloaded.domains["example.com"]["last_error_type"] == "Empty Content"
+        assert reloaded.domains["other.com"]["success_score"] == pytest.approx(1.0)
+
+    def test_load_error_starts_empty(self):
+        repository = MagicMock()
+        repository.find_all.side_effect = Exception("db down")
+
+        assert DomainHealth(repository).load() == {}
+
+    def test_get_statistics(self, health):
+        _fail(health, "https://example.com/a", 3)
+        health.record_success("https://other.com/a")
+
+        stats = health.get_statistics()
+
+        assert stats["total_domains"] == 2
+        assert stats["by_state"] == {"closed": 1, "open": 1, "half_open": 0}
+        assert stats["unhealthy_domains"]["example.com"]["state"] == "open"
+
+
+class TestScrapeServiceWithDomainHealth:
+    """Testes da integração do ScrapeService com a saúde dos domínios."""
+
+    @pytest.fixture
+    def scrape_service(self, health):
+        service = ScrapeService()
+        blacklist = MagicMock()
+        blacklist.is_blocked.return_value = False
+        service.set_blacklist(blacklist)
+        service.set_domain_health(health)
+        return service
+
+    def test_open_circuit_skips_request(self, scrape_service, health):
+        _fail(health, "https://example.com/a", 3)
+
+        with patch("app.services.scrape_service.requests.get") as mock_get:
+            result = scrape_service.scrape_article_content("https://example.com/b")
+
+        assert result is None
+        mock_get.assert_not_called()
+
+    def test_transient_errors_go_to_health_not_blacklist(self, scrape_service, health):
+        with patch("app.services.scrape_service.requests.get", return_value=Mock(status_code=503, headers={})), \
+             patch("app.services.scrape_service.network.get_html_status", return_value=("error", 503, [])):
+            scrape_service.scrape_article_content("https://example.com/a")
+
+        with patch("app.services.scrape_service.requests.get", side_effect=__import__("requests").exceptions.ConnectionError("boom")):
+            scrape_service.scrape_article_content("https://example.com/b")
+
+        scrape_service.blacklist.add_to_blacklist.assert_not_called()
+        assert health.domains["example.com"]["failure_score"] == pytest.approx(2.0, abs=0.01)
+        assert health.domains["example.com"]["last_error_type"] == "Request Error"
+
+    def test_access_denied_still_goes_to_blacklist(self, scrape_service, health):
+        with patch("app.services.scrape_service.requests.get", return_value=Mock(status_code=403, headers={})), \
+             patch("app.services.scrape_service.network.get_html_status", return_value=("forbidden", 403, [])):
+            scrape_service.scrape_article_content("https://example.com/a")
+
+        scrape_service.blacklist.add_to_blacklist.assert_called_once()
+        assert "example.com" not in health.domains
+
+    def test_success_is_recorded(self, scrape_service, health):
+        with patch("app.services.scrape_service.requests.get", return_value=Mock(status_code=200, headers={})), \
+             patch("app.services.scrape_service.network.get_html_status", return_value=("<html></html>", 200, [])), \
+             patch.object(scrape_service, "_parse_article", return_value=({"text": "ok"}, None)):
+            scrape_service.scrape_article_content("https://example.com/a")
+
+        assert health.domains["example.com"]["success_score"] == pytest.approx(1.0)
+
+    def test_get_statistics_includes_health(self, scrape_service, health):
+        _fail(health, "https://example.com/a", 3)
+
+        stats = scrape_service.get_statistics()
+
+        assert stats["domain_health"]["by_state"]["open"] == 1
+        assert "blacklist" in stats
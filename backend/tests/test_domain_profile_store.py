@@ -0,0 +1,203 @@
+import json
+import pytest
+from unittest.mock import MagicMock, patch
+
+from app.repositories.scraping_domain_profile_repository import ScrapingDomainProfileRepository
+from app.utils.domain_profile_store import DomainProfileStore
+from app.services.scrape_service import ScrapeService
+
+
+PARAGRAPH = "<p>" + ("Este é um parágrafo de teste sobre economia brasileira e mercados. " * 8) + "</p>"
+
+PAGE_HTML = (
+    "<html><head><title>Título da página</title>"
+    "<meta property='og:title' content='Título do artigo'></head>"
+    "<body><nav>menu</nav><div class='main'><article class='post-body'>"
+    f"<h1>Título</h1>{PARAGRAPH * 5}<div class='newsletter-box'>Assine a newsletter</div>"
+    "</article></div><footer>rodapé</footer></body></html>"
+)
+
+
+@pytest.fixture
+def repository(db):
+    return ScrapingDomainProfileRepository(db.session)
+
+
+@pytest.fixture
+def profile_store(repository):
+    store = DomainProfileStore(repository)
+    store.load()
+    return store
+
+
+@pytest.fixture
+def scrape_service(profile_store):
+    service = ScrapeService()
+    service.set_blacklist(MagicMock())
+    service.set_profile_store(profile_store)
+    return service
+
+
+class TestDomainProfileStore:
+    """Testes para o store de perfis de extração por domínio."""
+
+    def test_learn_persists_profile(self, profile_store, repository):
+        profile_store.learn(
+            url="https://www.example.com/a",
+            container_selector="article.post-body",
+            boilerplate_selectors=["div.ad-top", "div.ad-top"],
+            trim_selector="div.related"
+        )
+
+        saved = repository.find_all()
+
+        assert saved["example.com"]["container_selector"] == "article.post-body"
+        assert saved["example.com"]["boilerplate_selectors"] == ["div.ad-top"]
+        assert profile_store.get("https://example.com/b")["trim_selector"] == "div.related"
+
+    def test_load_error_starts_empty(self):
+        repository = MagicMock()
+        repository.find_all.side_effect = Exception("DB Error")
+        store = DomainProfileStore(repository)
+
+        assert store.load() == {}
+
+    def test_record_hit_is_buffered_until_flush(self, profile_store, repository):
+        profile_store.learn("https://example.com/a", "article.post-body", [], None)
+
+        profile_store.record_hit("https://example.com/b")
+        assert repository.find_all()["example.com"]["hits"] == 0
+        profile_store.flush()
+
+        reloaded = DomainProfileStore(repository)
+        reloaded.load()
+        assert reloaded.get("https://example.com/c")["hits"] == 1
+
+    def test_profile_dropped_after_consecutive_misses(self, profile_store, repository):
+        profile_store.learn("https://example.com/a", "article.post-body", [], None)
+
+        for _ in range(DomainProfileStore.MAX_CONSECUTIVE_MISSES):
+            profile_store.record_miss("https://example.com/a")
+
+        assert profile_store.get("https://example.com/a") is None
+        assert repository.find_all() == {}
+
+    def test_record_on_unknown_domain_is_noop(self, profile_store):
+        profile_store.record_hit("https://unknown.com/a")
+        profile_store.record_miss("https://unknown.com/a")
+
+        assert profile_store.profiles == {}
+
+    def test_flush_error_keeps_pending(self):
+        repository = MagicMock()
+        repository.find_all.return_value = {}
+        repository.upsert_many.side_effect = Exception("DB Error")
+        store = DomainProfileStore(repository)
+        store.load()
+
+        store.learn("https://example.com/a", "article", [], None)
+        repository.upsert_many.side_effect = None
+        store.flush()
+
+        assert repository.upsert_many.call_args.args[0][0]["domain"] == "example.com"
+
+    def test_import_legacy_json(self, profile_store, tmp_path):
+        path = tmp_path / "domain_profiles.json"
+        path.write_text(json.dumps({
+            "example.com": {
+                "container_selector": "article.post-body", "boilerplate_selectors": ["div.ad"],
+                "trim_selector": None, "hits": 7, "consecutive_misses": 1,
+                "learned_at": "2025-10-21T10:00:00", "updated_at": "2025-10-22T10:00:00"
+            }
+        }), encoding="utf-8")
+
+        assert profile_store.import_json(str(path)) == 1
+        assert profile_store.get("https://example.com/a")["hits"] == 7
+
+    def test_concurrent_learn_and_record(self):
+        from concurrent.futures import ThreadPoolExecutor
+        repository = MagicMock()
+        repository.find_all.return_value = {}
+        store = DomainProfileStore(repository)
+
+        def learn(i):
+            store.learn(f"https://site{i}.com/a", "article", [], None)
+            store.record_hit(f"https://site{i}.com/b")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(learn, range(200)))
+        store.flush()
+
+        assert len(store.profiles) == 200
+        assert {entry["domain"] for call in repository.upsert_many.call_args_list for entry in call.args[0]} == {
+            f"site{i}.com" for i in range(200)
+        }
+
+
+class TestScrapeServiceWithProfiles:
+    """Testes do caminho rápido de extração por perfil de domínio."""
+
+    def test_generic_scrape_learns_profile(self, scrape_service, profile_store):
+        result, reason = scrape_service._parse_article("https://example.com/a", PAGE_HTML)
+
+        profile = profile_store.get("https://example.com/a")
+        assert result is not None
+        assert reason is None
+        assert profile["container_selector"] == "article.post-body"
+        assert "div.newsletter-box" in profile["boilerplate_selectors"]
+
+    def test_known_domain_uses_fast_path(self, scrape_service, profile_store):
+        profile_store.learn("https://example.com/a", "article.post-body", ["div.newsletter-box"], None)
+
+        with patch("app.services.scrape_service.Article") as mock_article:
+            result, reason = scrape_service._parse_article("https://example.com/b", PAGE_HTML)
+
+        mock_article.assert_not_called()
+        assert result["title"] == "Título do artigo"
+        assert "Assine a newsletter" not in result["html"]
+        assert "economia brasileira" in result["text"]
+        assert profile_store.get("https://example.com/b")["hits"] == 1
+
+    def test_fast_path_reads_authors_and_publish_date_from_meta_tags(self, scrape_service, profile_store):
+        profile_store.learn("https://example.com/a", "article.post-body", [], None)
+        page_html = PAGE_HTML.replace("</head>", (
+            "<meta name='author' content='Ana Souza'>"
+            "<meta property='article:author' content='https://facebook.com/ana'>"
+            "<meta property='article:published_time' content='2025-10-21T08:30:00-03:00'></head>"
+        ))
+
+        result, _ = scrape_service._parse_article("https://example.com/b", page_html)
+
+        assert result["authors"] == ["Ana Souza"]
+        assert result["publish_date"] == "2025-10-21T08:30:00-03:00"
+
+    def test_generic_cleanup_trims_tail_and_records_selector(self, scrape_service):
+        fragment = (
+            f"<article class='post-body'><h1>Título</h1>{PARAGRAPH * 3}"
+            "<div class='mais-lidas'><p>Mais lidas: prefeitura anuncia obras no centro da cidade</p></div>"
+            "<p>Outro texto que não faz parte do artigo principal.</p></article>"
+        )
+        reference_text = "Título\n\n" + "\n\n".join([PARAGRAPH[3:-4]] * 3)
+        recorder = {}
+
+        html = scrape_service._process_html_aggressive(
+            fragment, "https://example.com/a", reference_text=reference_text, profile_recorder=recorder
+        )
+
+        assert recorder["trim_selector"] == "div.mais-lidas"
+        assert "economia brasileira" in html
+        assert "Mais lidas" not in html
+        assert "Outro texto" not in html
+
+    def test_fast_path_falls_back_when_container_missing(self, scrape_service, profile_store):
+        profile_store.learn("https://example.com/a", "div#nao-existe", [], None)
+
+        result, reason = scrape_service._parse_article("https://example.com/b", PAGE_HTML)
+
+        assert result is not None
+        assert profile_store.get("https://example.com/b")["container_selector"] == "article.post-body"
+
+    def test_build_css_selector(self, scrape_service):
+        assert scrape_service._build_css_selector("div", "main", ["a"]) == "div#main"
+        assert scrape_service._build_css_selector("div", None, "post body") == "div.post.body"
+        assert scrape_service._build_css_selector("div", "1invalid", ["2x"]) is None
@@ -0,0 +1,53 @@
+from datetime import datetime
+
+import pytest
+
+from app.models.news import News
+from app.models.news_source import NewsSource
+from app.models.topic import Topic
+from app.repositories.news_repository import NewsRepository
+from app.repositories.news_source_repository import NewsSourceRepository
+from app.repositories.topic_repository import TopicRepository
+from app.scripts.explain_queries import explain_repository_queries
+
+
+@pytest.fixture
+def news(db):
+    topic = TopicRepository(db.session).create(Topic(name="Technology", state=1))
+    source = NewsSourceRepository(db.session).create(NewsSource(name="Fonte", url="https://fonte.com"))
+    return NewsRepository(db.session).create(News(
+        title="Notícia", url="https://fonte.com/1", content="c", html="<p>c</p>",
+        published_at=datetime.now(), source_id=source.id, topic_id=topic.id
+    ))
+
+
+class TestExplainQueries:
+    """Testes do script de plano de execução das consultas dos repositórios."""
+
+    def test_explains_every_repository_query(self, news):
+        results = explain_repository_queries(user_id=1)
+
+        names = {result["name"] for result in results}
+        assert "news.list_all_cards" in names
+        assert "read_history.get_user_history" in names
+        assert all(result["sql"].lstrip().upper().startswith("SELECT") for result in results)
+        assert all(result["plan"] for result in results)
+
+    @pytest.mark.parametrize("name, index", [
+        ("news.find_cards_by_topic", "ix_news_topic_published_at"),
+        ("news.find_ids_by_topic", "ix_news_topic_published_at"),
+        ("news.find_by_title", "ix_news_title_key"),
+        ("news.list_favorite_cards", "ix_user_saved_news_favorites"),
+        ("news.count_favorites_by_user", "ix_user_saved_news_favorites"),
+        ("read_history.get_user_history", "ix_user_read_history_user_read_at"),
+    ])
+    def test_hot_queries_use_indexes(self, news, name, index):
+        results = explain_repository_queries(user_id=1, only=name)
+
+        plans = "\n".join(line for result in results for line in result["plan"])
+        assert index in plans
+
+    def test_does_not_persist_changes(self, news, db):
+        explain_repository_queries(user_id=1)
+
+        assert NewsRepository(db.session).count_all() == 1
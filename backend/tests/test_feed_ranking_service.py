@@ -0,0 +1,267 @@
+import pytest
+from collections import namedtuple
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from app.services.feed_ranking_service import FeedRankingService
+from app.utils.events import collection_finished, preferences_changed
+
+RankedRow = namedtuple("RankedRow", "id published_at rank")
+Article = namedtuple("Article", "id title description source_id base_score published_at")
+
+
+@pytest.fixture
+def repos():
+    repos = {"news": MagicMock(), "sources": MagicMock(), "topics": MagicMock(), "users": MagicMock()}
+    repos["users"].get_preferences_version.return_value = 0
+    repos["sources"].get_user_preferred_source_ids.return_value = [2]
+    repos["topics"].list_topic_names_by_users.return_value = {1: ["Python"]}
+    return repos
+
+
+@pytest.fixture
+def service(repos):
+    return FeedRankingService(
+        news_repo=repos["news"],
+        user_news_source_repo=repos["sources"],
+        custom_topic_repo=repos["topics"],
+        user_repo=repos["users"],
+        max_entries=4,
+    )
+
+
+def _ranked(now, *ranks):
+    """Rows do ranking no banco: IDs 1..n, uma hora de diferença entre elas."""
+    return [RankedRow(i + 1, now - timedelta(hours=i), rank) for i, rank in enumerate(ranks)]
+
+
+def test_get_page_builds_state_once(service, repos):
+    now = datetime.now()
+    repos["news"].max_id.return_value = 3
+    repos["news"].rank_ids_for_user.return_value = _ranked(now, 300.0, 300.5, 299.0)
+
+    assert service.get_page(1, page=1, per_page=2) == [(2, 300.5), (1, 300.0)]
+    assert service.get_page(1, page=2, per_page=2) == [(3, 299.0)]
+
+    repos["news"].rank_ids_for_user.assert_called_once_with(1, [2], days_limit=15, limit=5)
+
+
+def test_page_beyond_truncated_state_returns_none(service, repos):
+    now = datetime.now()
+    repos["news"].max_id.return_value = 5
+    repos["news"].rank_ids_for_user.return_value = _ranked(now, 305.0, 304.0, 303.0, 302.0, 301.0)
+
+    assert [news_id for news_id, _ in service.get_page(1, page=1, per_page=4)] == [1, 2, 3, 4]
+    assert service.get_page(1, page=2, per_page=4) is None
+
+
+def test_preferences_changed_rebuilds_only_that_user(service, repos):
+    now = datetime.now()
+    repos["news"].max_id.return_value = 1
+    repos["news"].rank_ids_for_user.return_value = _ranked(now, 300.0)
+    service.get_page(1)
+    service.get_page(2)
+
+    service.on_preferences_changed(1)
+    service.get_page(1)
+    service.get_page(2)
+
+    users = [call.args[0] for call in repos["news"].rank_ids_for_user.call_args_list]
+    assert users == [1, 2, 1]
+
+
+def test_preferences_version_change_rebuilds_without_signal(service, repos):
+    # Mudança atendida por outro worker: só a versão no banco muda
+    now = datetime.now()
+    repos["news"].max_id.return_value = 1
+    repos["news"].rank_ids_for_user.return_value = _ranked(now, 300.0)
+    service.get_page(1)
+    service.get_page(1)
+
+    repos["users"].get_preferences_version.return_value = 1
+    service.get_page(1)
+    service.get_page(1)
+
+    assert repos["news"].rank_ids_for_user.call_count == 2
+
+
+def test_state_ttl_counts_from_build_not_last_access(service, repos, monkeypatch):
+    from app.services import feed_ranking_service
+
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(feed_ranking_service.time, "monotonic", lambda: clock["now"])
+    repos["news"].max_id.return_value = 1
+    repos["news"].rank_ids_for_user.return_value = _ranked(datetime.now(), 300.0)
+
+    for _ in range(3):
+        service.get_page(1)
+        clock["now"] += service.state_ttl / 2 + 1
+
+    assert repos["news"].rank_ids_for_user.call_count == 2
+
+
+def test_merge_into_truncated_state_skips_articles_below_last_entry(service, repos):
+    now = datetime.now()
+    repos["news"].max_id.return_value = 5
+    rows = _ranked(now, 305.0, 304.0, 303.0, 302.0, 301.0)
+    # A notícia 1 já saiu da janela: o estado truncado fica com 3 notícias (2, 3 e 4)
+    rows[0] = RankedRow(1, now - timedelta(days=16), 305.0)
+    repos["news"].rank_ids_for_user.return_value = rows
+    assert [news_id for news_id, _ in service.get_page(1, per_page=3)] == [2, 3, 4]
+
+    repos["news"].list_recent_for_ranking.return_value = [
+        Article(6, "Acima", None, 1, 303.5, now),
+        # Abaixo da última guardada: a notícia 5, nunca carregada, ranqueia acima dela
+        Article(7, "Abaixo", None, 1, 250.0, now),
+    ]
+    service.merge_new_articles()
+
+    assert [news_id for news_id, _ in service.get_page(1, per_page=4)] == [2, 6, 3, 4]
+    # A 7 ficaria depois da 4, no lugar da 5: a página vai ao banco
+    assert service.get_page(1, per_page=5) is None
+
+
+def test_merge_ranks_only_new_articles_with_user_boosts(service, repos):
+    now = datetime.now()
+    repos["news"].max_id.return_value = 2
+    repos["news"].rank_ids_for_user.return_value = _ranked(now, 300.0, 299.0)
+    service.get_page(1)
+
+    repos["news"].list_recent_for_ranking.return_value = [
+        Article(2, "Já no estado", None, 1, 400.0, now),
+        Article(3, "Novidades do Python", None, 1, 298.0, now),
+        Article(4, "Outra fonte", "", 2, 299.7, now),
+        Article(5, "Sem boost", None, 1, 250.0, now),
+    ]
+    assert service.merge_new_articles() == 4
+
+    repos["news"].list_recent_for_ranking.assert_called_once_with(days_limit=15, after_id=2)
+    page = service.get_page(1, page=1, per_page=4)
+    # 298 + 1.0 (custom topic) e 299.7 + 0.5 (fonte preferida); o máximo de 4 notícias corta a 5
+    assert [news_id for news_id, _ in page] == [4, 1, 3, 2]
+    assert [rank for _, rank in page] == pytest.approx([300.2, 300.0, 299.0, 299.0])
+    assert service.get_page(1, page=2, per_page=4) is None
+    repos["news"].rank_ids_for_user.assert_called_once()
+
+
+def test_get_page_merges_when_content_version_changes(repos):
+    version = {"value": "1"}
+    service = FeedRankingService(
+        news_repo=repos["news"], user_news_source_repo=repos["sources"], custom_topic_repo=repos["topics"],
+        user_repo=repos["users"], version_loader=lambda: version["value"],
+    )
+    now = datetime.now()
+    repos["news"].max_id.return_value = 1
+    repos["news"].rank_ids_for_user.return_value = _ranked(now, 300.0)
+    repos["news"].list_recent_for_ranking.return_value = [Article(2, "Nova", None, 1, 301.0, now)]
+
+    service.get_page(1)
+    repos["news"].list_recent_for_ranking.assert_not_called()
+
+    version["value"] = "2"
+    assert [news_id for news_id, _ in service.get_page(1)] == [2, 1]
+    assert service.get_page(1) == [(2, 301.0), (1, 300.0)]
+    repos["news"].list_recent_for_ranking.assert_called_once()
+
+
+def test_articles_outside_window_are_dropped(service, repos):
+    now = datetime.now()
+    repos["news"].max_id.return_value = 2
+    repos["news"].rank_ids_for_user.return_value = [
+        RankedRow(1, now - timedelta(days=16), 400.0),
+        RankedRow(2, now - timedelta(days=1), 300.0),
+    ]
+
+    assert service.get_page(1) == [(2, 300.0)]
+
+
+def test_signals_reach_connected_service(repos):
+    service = FeedRankingService(
+        news_repo=repos["news"], user_news_source_repo=repos["sources"], custom_topic_repo=repos["topics"],
+        user_repo=repos["users"]
+    )
+    now = datetime.now()
+    repos["news"].max_id.return_value = 1
+    repos["news"].rank_ids_for_user.return_value = _ranked(now, 300.0)
+    repos["news"].list_recent_for_ranking.return_value = []
+    service.get_page(1)
+
+    with preferences_changed.connected_to(service.on_preferences_changed), \
+            collection_finished.connected_to(service.on_collection_finished):
+        collection_finished.send(7)
+        repos["news"].list_recent_for_ranking.assert_called_once()
+
+        preferences_changed.send(1)
+        service.get_page(1)
+        assert repos["news"].rank_ids_for_user.call_count == 2
+
+
+def test_collection_checkpoint_finish_sends_signal():
+    from app.utils.collection_checkpoint import CollectionCheckpoint
+
+    received = []
+    checkpoint = CollectionCheckpoint(repository=MagicMock())
+    checkpoint.run_id = 42
+
+    with collection_finished.connected_to(lambda run_id, **kwargs: received.append(run_id)):
+        checkpoint.finish(new_articles=3, new_sources=0)
+
+    assert received == [42]
+
+
+def test_state_matches_sql_feed(db):
+    from app.entities.custom_topic_entity import CustomTopicEntity
+    from app.entities.news_source_entity import NewsSourceEntity
+    from app.entities.topic_entity import TopicEntity
+    from app.entities.user_entity import UserEntity
+    from app.entities.user_preferred_custom_topics import UserPreferredCustomTopicEntity
+    from app.entities.user_preferred_news_sources_entity import UserPreferredNewsSourceEntity
+    from app.models.news import News
+    from app.repositories.news_repository import NewsRepository
+    from app.services.news_service import NewsService
+
+    sources = [NewsSourceEntity(name=f"Fonte {i}", url=f"https://fonte{i}.com") for i in range(3)]
+    user = UserEntity(full_name="Leitor", email="leitor@exemplo.com")
+    topic = CustomTopicEntity(name="Python")
+    news_topic = TopicEntity(name="tecnologia")
+    db.session.add_all(sources + [user, topic, news_topic])
+    db.session.commit()
+    db.session.add_all([
+        UserPreferredNewsSourceEntity(user_id=user.id, source_id=sources[2].id),
+        UserPreferredCustomTopicEntity(user_id=user.id, topic_id=topic.id),
+    ])
+    db.session.commit()
+
+    now = datetime.now()
+    news_repo = NewsRepository(db.session)
+
+    def collect(start, count):
+        news_repo.bulk_create_ignore_conflicts([
+            News(
+                title=f"Notícia {i}" + (" sobre Python" if i % 4 == 0 else ""),
+                url=f"https://fonte.com/{i}", content=f"Texto {i}", html=f"<p>Texto {i}</p>",
+                published_at=now - timedelta(hours=5 * i), source_id=sources[i % 3].id, topic_id=news_topic.id,
+            )
+            for i in range(start, start + count)
+        ])
+
+    collect(10, 20)
+    feed_ranking = FeedRankingService(news_repo=news_repo, max_entries=50, state_ttl=600)
+    with_state = NewsService(news_repo=news_repo, feed_ranking=feed_ranking)
+    sql_only = NewsService(news_repo=news_repo, feed_ranking=FeedRankingService(state_ttl=0))
+
+    def scoreless(result):
+        return [{**news, "score": None} for news in result["news"]]
+
+    assert scoreless(with_state.get_for_you_news(user.id, per_page=8)) == scoreless(sql_only.get_for_you_news(user.id, per_page=8))
+
+    # Coleta nova: só as notícias novas entram no estado
+    collect(0, 10)
+    feed_ranking.merge_new_articles()
+    for page in (1, 2, 3, 4):
+        with_state_page = with_state.get_for_you_news(user.id, page=page, per_page=8)
+        sql_page = sql_only.get_for_you_news(user.id, page=page, per_page=8)
+        assert scoreless(with_state_page) == scoreless(sql_page)
+        assert with_state_page["pagination"] == sql_page["pagination"]
+    assert [news["score"] for news in with_state.get_for_you_news(user.id)["news"]] == \
+        pytest.approx([news["score"] for news in sql_only.get_for_you_news(user.id)["news"]], abs=0.02)
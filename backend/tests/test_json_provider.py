@@ -0,0 +1,65 @@
+import json
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import pytest
+from flask import Flask, jsonify
+
+from app.utils import json_provider
+from app.utils.json_provider import IsoJSONProvider, OrjsonProvider, create_json_provider
+
+PAYLOAD = {
+    "title": "Notícia",
+    "published_at": datetime(2025, 10, 21, 10, 30, 0, 123456),
+    "created_at": datetime(2025, 10, 21, 12, 0, tzinfo=timezone.utc),
+    "day": date(2025, 10, 21),
+    "score": Decimal("1.5"),
+}
+
+
+def _app(provider_class):
+    app = Flask(__name__)
+    app.json = provider_class(app)
+    return app
+
+
+@pytest.mark.parametrize("provider_class", [IsoJSONProvider, OrjsonProvider])
+def test_datetimes_are_serialized_as_isoformat(provider_class):
+    app = _app(provider_class)
+
+    with app.app_context():
+        body = json.loads(jsonify(PAYLOAD).get_data())
+
+    assert body == {
+        "title": "Notícia",
+        "published_at": PAYLOAD["published_at"].isoformat(),
+        "created_at": PAYLOAD["created_at"].isoformat(),
+        "day": "2025-10-21",
+        "score": "1.5",
+    }
+
+
+def test_orjson_provider_does_not_escape_accents():
+    app = _app(OrjsonProvider)
+
+    with app.app_context():
+        response = jsonify({"title": "Notícia"})
+
+    assert response.mimetype == "application/json"
+    assert "Notícia".encode("utf-8") in response.get_data()
+    assert app.json.loads(app.json.dumps({"a": [1, 2]})) == {"a": [1, 2]}
+
+
+def test_create_json_provider_falls_back_without_orjson(monkeypatch):
+    app = Flask(__name__)
+    app.config["JSON_PROVIDER"] = "orjson"
+    monkeypatch.setattr(json_provider, "orjson", None)
+
+    assert isinstance(create_json_provider(app), IsoJSONProvider)
+
+
+def test_create_json_provider_default_choice():
+    app = Flask(__name__)
+    app.config["JSON_PROVIDER"] = "default"
+
+    assert isinstance(create_json_provider(app), IsoJSONProvider)
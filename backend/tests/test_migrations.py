@@ -0,0 +1,147 @@
+from datetime import datetime
+
+import pytest
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from flask_migrate import downgrade, upgrade
+from sqlalchemy import inspect, text
+
+from app import create_app
+from app.extensions import db as _db
+from app.models.news import News
+from app.repositories.news_repository import NewsRepository
+
+
+@pytest.fixture
+def migration_app(tmp_path):
+    """App com um banco SQLite em arquivo, vazio, para aplicar as migrações."""
+    app = create_app(config_overrides={
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'migrations.db'}",
+        "JWT_SECRET_KEY": "super-secret-test-key",
+    })
+    with app.app_context():
+        yield app
+        _db.session.remove()
+        _db.engine.dispose()
+
+
+def _insert_news(title):
+    _db.session.execute(text(
+        "INSERT INTO news (title, url, content, html, published_at, source_id, topic_id, created_at) "
+        "VALUES (:title, :url, 'c', '<p>c</p>', '2025-10-21 10:00:00', 1, 1, '2025-10-21 10:00:00')"
+    ), {"title": title, "url": f"https://fonte.com/{abs(hash(title))}"})
+
+
+class TestMigrations:
+    """Testes das migrações do esquema (backend/migrations)."""
+
+    def test_upgrade_matches_models(self, migration_app):
+        upgrade()
+
+        with _db.engine.connect() as connection:
+            diff = compare_metadata(MigrationContext.configure(connection), _db.metadata)
+
+        assert diff == []
+
+    def test_upgrade_existing_database_backfills_title_key(self, migration_app):
+        # Banco criado antes das migrações: esquema da revisão base, sem alembic_version
+        upgrade(revision="0001")
+        _db.session.execute(text("DROP TABLE alembic_version"))
+        _db.session.execute(text("DROP TABLE news_fingerprints"))
+        _db.session.execute(text("INSERT INTO topics (name, state) VALUES ('technology', 1)"))
+        _db.session.execute(text(
+            "INSERT INTO news_sources (name, url, created_at) VALUES ('Fonte', 'https://fonte.com', '2025-10-21')"
+        ))
+        _insert_news("Governo anuncia  NOVO plano!")
+        _insert_news("“Brasil-Argentina”: 2 a 1")
+        _db.session.commit()
+
+        upgrade()
+
+        keys = _db.session.execute(text("SELECT title_key FROM news ORDER BY id")).scalars().all()
+        assert keys == ["governo anuncia novo plano", "brasil argentina 2 a 1"]
+        bodies = _db.session.execute(text("SELECT content, html FROM news_bodies ORDER BY news_id")).all()
+        assert [tuple(body) for body in bodies] == [(b"c", b"<p>c</p>"), (b"c", b"<p>c</p>")]
+        inspector = inspect(_db.engine)
+        assert inspector.has_table("news_fingerprints")
+        assert "ix_news_title_key" in {index["name"] for index in inspector.get_indexes("news")}
+
+    def test_news_bodies_downgrade_restores_columns(self, migration_app):
+        upgrade(revision="0003")
+        _db.session.execute(text("INSERT INTO topics (name, state) VALUES ('technology', 1)"))
+        _db.session.execute(text(
+            "INSERT INTO news_sources (name, url, created_at) VALUES ('Fonte', 'https://fonte.com', '2025-10-21')"
+        ))
+        _db.session.execute(text(
+            "INSERT INTO news (title, title_key, url, content, html, published_at, source_id, topic_id, created_at) "
+            "VALUES ('T', 't', 'https://fonte.com/1', 'texto', '<p>texto</p>', '2025-10-21', 1, 1, '2025-10-21')"
+        ))
+        _db.session.commit()
+
+        upgrade(revision="0004")
+        assert "content" not in {column["name"] for column in inspect(_db.engine).get_columns("news")}
+
+        downgrade(revision="0003")
+
+        row = _db.session.execute(text("SELECT content, html FROM news")).one()
+        assert tuple(row) == ("texto", "<p>texto</p>")
+        assert not inspect(_db.engine).has_table("news_bodies")
+
+    def test_compressed_bodies_downgrade_restores_text(self, migration_app):
+        upgrade()
+        _db.session.execute(text("INSERT INTO topics (name, state) VALUES ('technology', 1)"))
+        _db.session.execute(text(
+            "INSERT INTO news_sources (name, url, created_at) VALUES ('Fonte', 'https://fonte.com', '2025-10-21')"
+        ))
+        _db.session.commit()
+        NewsRepository(_db.session).create(News(
+            title="T", url="https://fonte.com/1", content="texto " * 100, html="<p>texto</p>",
+            published_at=datetime(2025, 10, 21), source_id=1, topic_id=1
+        ))
+
+        downgrade(revision="0004")
+
+        row = _db.session.execute(text("SELECT content, html FROM news_bodies")).one()
+        assert tuple(row) == ("texto " * 100, "<p>texto</p>")
+
+    def test_read_history_keeps_latest_read_per_day(self, migration_app):
+        upgrade(revision="0007")
+        _db.session.execute(text("INSERT INTO users (full_name, email, newsletter, created_at) VALUES ('U', 'u@x.com', 0, '2025-10-21')"))
+        _db.session.execute(text("INSERT INTO topics (name, state) VALUES ('technology', 1)"))
+        _db.session.execute(text(
+            "INSERT INTO news_sources (name, url, created_at) VALUES ('Fonte', 'https://fonte.com', '2025-10-21')"
+        ))
+        _db.session.execute(text(
+            "INSERT INTO news (title, title_key, url, published_at, source_id, topic_id, created_at, base_score) "
+            "VALUES ('T', 't', 'https://fonte.com/1', '2025-10-21', 1, 1, '2025-10-21', 0)"
+        ))
+        for read_at in ("2025-10-21 08:00:00", "2025-10-21 09:00:00", "2025-10-22 08:00:00"):
+            _db.session.execute(text(
+                "INSERT INTO user_read_history (user_id, news_id, read_at) VALUES (1, 1, :read_at)"
+            ), {"read_at": read_at})
+        _db.session.commit()
+
+        upgrade()
+
+        rows = _db.session.execute(text("SELECT read_day, read_at FROM user_read_history ORDER BY read_at")).all()
+        assert [tuple(row) for row in rows] == [
+            ("2025-10-21", "2025-10-21 09:00:00"), ("2025-10-22", "2025-10-22 08:00:00"),
+        ]
+
+    def test_compression_dictionary_files_are_imported(self, migration_app, tmp_path, monkeypatch):
+        directory = tmp_path / "compression"
+        directory.mkdir()
+        (directory / "content.4.zdict").write_bytes(b"governo anuncia plano")
+        monkeypatch.setenv("COMPRESSION_DICT_DIR", str(directory))
+
+        upgrade()
+
+        rows = _db.session.execute(text("SELECT id, name, data FROM compression_dictionaries")).all()
+        assert [tuple(row) for row in rows] == [(4, "content", b"governo anuncia plano")]
+
+        (directory / "content.4.zdict").unlink()
+        downgrade(revision="0009")
+
+        assert (directory / "content.4.zdict").read_bytes() == b"governo anuncia plano"
+        assert not inspect(_db.engine).has_table("compression_dictionaries")
@@ -0,0 +1,143 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch, MagicMock
+
+from app.models.news import News
+from app.models.news_source import NewsSource
+from app.models.topic import Topic
+from app.repositories.news_fingerprint_repository import NewsFingerprintRepository
+from app.repositories.news_repository import NewsRepository
+from app.repositories.news_source_repository import NewsSourceRepository
+from app.repositories.topic_repository import TopicRepository
+from app.services.scrape_service import ScrapeService
+from app.utils.near_duplicate_index import NearDuplicateIndex
+from app.utils.simhash import simhash, hamming_distance, split_bands, to_signed, to_unsigned
+
+
+WIRE_STORY = " ".join(
+    f"O relatório do Banco Central aponta que o indicador {i} variou {i * 3} pontos no trimestre, "
+    f"segundo analistas da região {i % 7}."
+    for i in range(40)
+)
+# Cópia publicada por outro veículo, com chamada extra no final
+SYNDICATED_COPY = WIRE_STORY + " Leia também: mercado reage à decisão."
+OTHER_STORY = (
+    "A seleção brasileira venceu o Uruguai por 2 a 0 em partida disputada no Maracanã "
+    "pelas eliminatórias. Os gols foram marcados no segundo tempo, depois de uma primeira "
+    "etapa equilibrada, e o time assumiu a vice-liderança da competição sul-americana."
+)
+
+
+@pytest.fixture
+def repository(db):
+    return NewsFingerprintRepository(db.session)
+
+
+@pytest.fixture
+def news_ids(db):
+    topic = TopicRepository(db.session).create(Topic(name="Economia", state=1))
+    source = NewsSourceRepository(db.session).create(NewsSource(name="Fonte", url="https://fonte.com"))
+    repo = NewsRepository(db.session)
+    return [
+        repo.create(News(
+            title=f"Notícia {i}", url=f"https://fonte.com/{i}", published_at=datetime.now(),
+            source_id=source.id, content="c", html="h", topic_id=topic.id
+        )).id
+        for i in range(2)
+    ]
+
+
+class TestSimHash:
+    """Testes do SimHash de 64 bits."""
+
+    def test_similar_texts_have_close_fingerprints(self):
+        assert hamming_distance(simhash(WIRE_STORY), simhash(SYNDICATED_COPY)) <= 3
+        assert hamming_distance(simhash(WIRE_STORY), simhash(OTHER_STORY)) > 10
+
+    def test_fingerprint_ignores_case_and_punctuation(self):
+        assert simhash(WIRE_STORY) == simhash(WIRE_STORY.upper().replace(",", " ").replace(".", "!"))
+
+    def test_empty_text(self):
+        assert simhash("") == 0
+
+    def test_bands_and_signed_roundtrip(self):
+        fingerprint = (0xABCD << 48) | (0x1234 << 32) | (0x5678 << 16) | 0x9ABC
+
+        assert split_bands(fingerprint) == [0x9ABC, 0x5678, 0x1234, 0xABCD]
+        assert to_signed(fingerprint) < 0
+        assert to_unsigned(to_signed(fingerprint)) == fingerprint
+
+
+class TestNearDuplicateIndex:
+    """Testes do índice de quase duplicatas."""
+
+    def test_detects_duplicate_within_run(self, repository):
+        index = NearDuplicateIndex(repository)
+        index.add("https://a.com/1", simhash(WIRE_STORY))
+
+        match = index.find_duplicate(simhash(SYNDICATED_COPY))
+
+        assert match["url"] == "https://a.com/1"
+        assert index.find_duplicate(simhash(OTHER_STORY)) is None
+
+    def test_flush_persists_and_detects_saved_articles(self, repository, news_ids):
+        index = NearDuplicateIndex(repository)
+        index.add("https://fonte.com/0", simhash(WIRE_STORY))
+        index.add("https://fonte.com/nao-salva", simhash(OTHER_STORY))
+
+        index.flush(lambda urls: {"https://fonte.com/0": news_ids[0]})
+
+        fresh = NearDuplicateIndex(repository)
+        assert fresh.find_duplicate(simhash(SYNDICATED_COPY))["news_id"] == news_ids[0]
+        assert fresh.find_duplicate(simhash(OTHER_STORY)) is None
+        # A URL não salva continua pendente para o próximo flush
+        assert index._unsaved == {"https://fonte.com/nao-salva"}
+
+    def test_old_fingerprints_are_ignored(self, repository, news_ids):
+        repository.bulk_create({news_ids[0]: simhash(WIRE_STORY)})
+        index = NearDuplicateIndex(repository, window=timedelta(days=7))
+
+        with patch("app.utils.near_duplicate_index.datetime") as mock_datetime:
+            mock_datetime.now.return_value = datetime.now(timezone.utc) + timedelta(days=8)
+            assert index.find_duplicate(simhash(SYNDICATED_COPY)) is None
+
+    def test_repository_error_is_not_a_duplicate(self):
+        repository = MagicMock()
+        repository.find_candidates.side_effect = Exception("db down")
+
+        assert NearDuplicateIndex(repository).find_duplicate(simhash(WIRE_STORY)) is None
+
+
+class TestScrapeServiceNearDuplicates:
+    """Testes da verificação de quase duplicatas no parse do ScrapeService."""
+
+    def test_duplicate_is_rejected_before_html_processing(self, repository):
+        index = NearDuplicateIndex(repository)
+        index.add("https://agencia.com/1", simhash(WIRE_STORY))
+        scrape_service = ScrapeService()
+        scrape_service.set_near_duplicate_index(index)
+
+        article = MagicMock(text=SYNDICATED_COPY)
+        with patch("app.services.scrape_service.Article", return_value=article), \
+             patch("lxml.etree.tostring", return_value="<div></div>"), \
+             patch.object(scrape_service, "_process_html_aggressive") as process_html:
+            result, reason = scrape_service._parse_article("https://jornal.com/copia", "<html></html>")
+
+        assert result is None
+        assert reason == "Quase duplicata de https://agencia.com/1"
+        process_html.assert_not_called()
+
+    def test_fingerprint_is_returned_with_result(self, repository):
+        scrape_service = ScrapeService()
+        scrape_service.set_near_duplicate_index(NearDuplicateIndex(repository))
+
+        article = MagicMock(text=WIRE_STORY, authors=[], publish_date=None)
+        article.title = "Juros"
+        with patch("app.services.scrape_service.Article", return_value=article), \
+             patch("lxml.etree.tostring", return_value="<div></div>"), \
+             patch.object(scrape_service, "_process_html_aggressive", return_value="<p>ok</p>"), \
+             patch.object(scrape_service, "_calculate_quality_score", return_value={"is_valid": True, "score": 90}):
+            result, reason = scrape_service._parse_article("https://agencia.com/1", "<html></html>")
+
+        assert reason is None
+        assert result["fingerprint"] == simhash(WIRE_STORY)
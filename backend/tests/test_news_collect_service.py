@@ -0,0 +1,220 @@
+import json
+import pytest
+from datetime import datetime
+from unittest.mock import patch, MagicMock
+
+from app.models.news import News
+from app.models.news_source import NewsSource
+from app.models.topic import Topic
+from app.repositories.news_repository import NewsRepository
+from app.repositories.news_source_repository import NewsSourceRepository
+from app.repositories.news_fingerprint_repository import NewsFingerprintRepository
+from app.repositories.topic_repository import TopicRepository
+from app.services.news_collect_service import NewsCollectService
+
+
+SCRAPED = {"text": "Conteúdo do artigo " * 20, "html": "<p>Conteúdo do artigo</p>"}
+
+
+def _article(url, title, source_name="Fonte A", source_url="https://fonte-a.com"):
+    return {
+        "title": title,
+        "url": url,
+        "description": "Descrição",
+        "publishedAt": "2025-10-21T10:00:00Z",
+        "image": None,
+        "source": {"name": source_name, "url": source_url},
+    }
+
+
+@pytest.fixture
+def topic(db):
+    return TopicRepository(db.session).create(Topic(name="Technology", state=1))
+
+
+@pytest.fixture
+def service(db, tmp_path, monkeypatch):
+    monkeypatch.setenv("GNEWS_API_KEY", "test-key")
+    monkeypatch.setenv("SCRAPE_CACHE_DIR", str(tmp_path / "scrape_cache"))
+    monkeypatch.setenv("DOMAIN_PROFILES_FILE", str(tmp_path / "profiles.json"))
+    monkeypatch.setenv("SCRAPING_BLACKLIST_JSON", str(tmp_path / "missing.json"))
+    service = NewsCollectService(
+        news_repo=NewsRepository(db.session),
+        news_source_repo=NewsSourceRepository(db.session),
+        topic_repo=TopicRepository(db.session),
+    )
+    service.scrape_service = MagicMock()
+    service.scrape_service.scrape_article_content.return_value = SCRAPED
+    service.scrape_service.get_statistics.return_value = {
+        "domain_health": {"by_state": {"open": 0, "half_open": 0}}
+    }
+    service.keyword_service = MagicMock()
+    service.keyword_service.generate_keywords_batch.return_value = {"technology": {"keywords": ["ai"]}}
+    return service
+
+
+def _run(service, articles):
+    with patch.object(service, "search_articles_via_gnews", return_value=articles):
+        return service.collect_news_simple()
+
+
+class TestCollectNewsSavePipeline:
+    """Testes da fase de gravação em lote do collect_news_simple."""
+
+    def test_saves_articles_and_new_sources_in_batches(self, service, db, topic):
+        service.SAVE_BATCH_SIZE = 2
+        articles = [
+            _article("https://fonte-a.com/1", "Notícia 1"),
+            _article("https://fonte-a.com/2", "Notícia 2"),
+            _article("https://fonte-b.com/3", "Notícia 3", "Fonte B", "https://fonte-b.com"),
+        ]
+
+        with patch.object(service.news_repo, "bulk_create_ignore_conflicts",
+                          wraps=service.news_repo.bulk_create_ignore_conflicts) as bulk:
+            new_articles, new_sources = _run(service, articles)
+
+        assert (new_articles, new_sources) == (3, 2)
+        assert bulk.call_count == 2
+        assert NewsRepository(db.session).count_all() == 3
+        saved = NewsRepository(db.session).find_by_url("https://fonte-b.com/3")
+        assert saved.source_id == NewsSourceRepository(db.session).find_by_name("Fonte B").id
+        assert saved.topic_id == topic.id
+
+    def test_skips_existing_and_in_run_duplicates(self, service, db, topic):
+        source = NewsSourceRepository(db.session).create(NewsSource(name="Fonte A", url="https://fonte-a.com"))
+        NewsRepository(db.session).create(News(
+            title="Já existe", url="https://fonte-a.com/velha", published_at=datetime.now(),
+            source_id=source.id, content="c", html="h", topic_id=topic.id
+        ))
+        articles = [
+            _article("https://www.fonte-a.com/velha/?utm_source=x", "Outro título"),
+            _article("https://fonte-a.com/nova", "JÁ EXISTE"),
+            _article("https://fonte-a.com/1", "Notícia 1"),
+            _article("https://fonte-a.com/1?utm_medium=y", "Notícia 1 repetida"),
+            _article("https://fonte-a.com/2", "Notícia 1"),
+        ]
+
+        new_articles, new_sources = _run(service, articles)
+
+        assert (new_articles, new_sources) == (1, 0)
+        assert service.scrape_service.scrape_article_content.call_count == 1
+
+    def test_source_matched_by_name_is_reused(self, service, db, topic):
+        source = NewsSourceRepository(db.session).create(NewsSource(name="Fonte A", url="https://fonte-a.com"))
+
+        new_articles, new_sources = _run(service, [
+            _article("https://fonte-a.com/1", "Notícia 1", "fonte a", "https://outra-url.com")
+        ])
+
+        assert (new_articles, new_sources) == (1, 0)
+        assert NewsRepository(db.session).find_by_url("https://fonte-a.com/1").source_id == source.id
+
+    def test_source_conflict_resolves_existing_id(self, service, db, topic):
+        service._load_source_map()
+        model = service._resolve_source("Fonte A", "https://fonte-a.com")
+        # Outro worker cria a fonte antes do flush
+        existing = NewsSourceRepository(db.session).create(NewsSource(name="Fonte A", url="https://fonte-a.com"))
+
+        assert service._flush_pending_sources() == 0
+        assert model.id == existing.id
+
+    def test_failed_batch_is_logged_and_counted_as_zero(self, service, topic):
+        with patch.object(service.news_repo, "bulk_create_ignore_conflicts", side_effect=Exception("db down")):
+            new_articles, _ = _run(service, [_article("https://fonte-a.com/1", "Notícia 1")])
+
+        assert new_articles == 0
+
+
+class TestCollectNewsCheckpoint:
+    """Testes da retomada do job de coleta a partir do checkpoint."""
+
+    def test_completed_run_is_recorded(self, service, db, topic):
+        _run(service, [_article("https://fonte-a.com/1", "Notícia 1")])
+
+        repo = service.checkpoint.repository
+        assert repo.find_latest_unfinished() is None
+        assert repo.get_article_stages(service.checkpoint.run_id) == {"https://fonte-a.com/1": "saved"}
+
+    def test_resume_reuses_gnews_results_and_skips_finished_articles(self, service, db, topic):
+        articles = [
+            _article("https://fonte-a.com/1", "Notícia 1"),
+            _article("https://fonte-a.com/2", "Notícia 2"),
+            _article("https://fonte-a.com/3", "Notícia 3"),
+        ]
+        service.SAVE_BATCH_SIZE = 1
+        # Primeira tentativa: scraping do terceiro artigo derruba o job
+        service.scrape_service.scrape_article_content.side_effect = [None, SCRAPED, RuntimeError("OOM")]
+
+        with pytest.raises(RuntimeError):
+            _run(service, articles)
+
+        run_id = service.checkpoint.run_id
+        assert service.checkpoint.repository.find_latest_unfinished() == run_id
+
+        service.scrape_service.scrape_article_content.side_effect = None
+        service.scrape_service.scrape_article_content.reset_mock()
+        service.keyword_service.generate_keywords_batch.reset_mock()
+
+        with patch.object(service, "search_articles_via_gnews") as search:
+            new_articles, _ = service.collect_news_simple(resume=True)
+
+        search.assert_not_called()
+        service.keyword_service.generate_keywords_batch.assert_not_called()
+        # Apenas o artigo interrompido é reprocessado
+        service.scrape_service.scrape_article_content.assert_called_once_with("https://fonte-a.com/3")
+        assert new_articles == 1
+        assert service.checkpoint.run_id == run_id
+        assert NewsRepository(db.session).count_all() == 2
+
+    def test_resume_without_interrupted_run_starts_new(self, service, db, topic):
+        _run(service, [_article("https://fonte-a.com/1", "Notícia 1")])
+        first_run = service.checkpoint.run_id
+
+        with patch.object(service, "search_articles_via_gnews", return_value=[]) as search:
+            service.collect_news_simple(resume=True)
+
+        search.assert_called_once()
+        assert service.checkpoint.run_id != first_run
+
+
+class TestCollectNewsMetrics:
+    """Testes das métricas publicadas ao final do collect_news_simple."""
+
+    def test_metrics_summary_is_written(self, service, db, topic, tmp_path, monkeypatch):
+        monkeypatch.setenv("COLLECTION_METRICS_FILE", str(tmp_path / "metrics.json"))
+        monkeypatch.setenv("COLLECTION_METRICS_PROM_FILE", str(tmp_path / "metrics.prom"))
+
+        _run(service, [
+            _article("https://fonte-a.com/1", "Notícia 1"),
+            _article("https://fonte-a.com/2", "Notícia 1"),
+        ])
+
+        summary = json.loads((tmp_path / "metrics.json").read_text())
+        assert summary["status"] == "completed"
+        assert summary["run_id"] == service.checkpoint.run_id
+        assert summary["new_articles"] == 1
+        assert {"stage": "saved", "value": 1} in summary["counters"]["articles"]
+        assert {"stage": "skipped", "reason": "Título duplicado", "value": 1} in summary["counters"]["articles"]
+        assert {"total", "keywords", "db_read", "db_write"} <= set(summary["stages"])
+        assert (tmp_path / "metrics.prom").exists()
+
+    def test_failed_run_still_emits_metrics(self, service, topic):
+        service.scrape_service.scrape_article_content.side_effect = RuntimeError("OOM")
+
+        with patch.object(service.metrics, "emit") as emit, pytest.raises(RuntimeError):
+            _run(service, [_article("https://fonte-a.com/1", "Notícia 1")])
+
+        assert emit.call_args.kwargs["status"] == "failed"
+
+
+class TestCollectNewsFingerprints:
+    """Testes da gravação dos fingerprints (SimHash) dos artigos salvos."""
+
+    def test_fingerprints_are_saved_with_news_id(self, service, db, topic):
+        service.scrape_service.scrape_article_content.return_value = {**SCRAPED, "fingerprint": 0xABCDEF}
+
+        _run(service, [_article("https://fonte-a.com/1", "Notícia 1")])
+
+        news_id = NewsRepository(db.session).find_by_url("https://fonte-a.com/1").id
+        candidates = NewsFingerprintRepository(db.session).find_candidates(0xABCDEF)
+        assert candidates == [(news_id, 0xABCDEF)]
@@ -3,6 +3,7 @@ from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 from app.models.news import News
+from app.models.news_view import NewsView
 from app.models.exceptions import NewsValidationError
 
 # Mock da entidade ORM para isolar os testes do modelo
@@ -187,3 +188,56 @@ def test_to_orm(valid_news_data):
 
         # O retorno de to_orm() deve ser a instância criada pelo construtor mockado
         assert orm_entity == MockNewsEntity.return_value
+
+
+def test_news_view_from_entity_with_full_data(mock_news_entity):
+    mock_news_entity.loaded_body_fields.return_value = {"content": "Entity content.", "html": "<p>Entity content.</p>"}
+
+    view = NewsView.from_entity(mock_news_entity, is_favorited=True)
+
+    assert view.id == mock_news_entity.id
+    assert view.title == mock_news_entity.title
+    assert view.content == "Entity content."
+    assert view.html == "<p>Entity content.</p>"
+    assert view.source_name == "Entity Source Name"
+    assert view.topic_name == "Entity Topic Name"
+    assert view.is_favorited is True
+    assert view.total_score is None
+
+
+def test_news_view_from_entity_without_body_or_relations(mock_news_entity):
+    mock_news_entity.loaded_body_fields.return_value = {}
+    mock_news_entity.source = None
+    mock_news_entity.topic = None
+
+    view = NewsView.from_entity(mock_news_entity)
+
+    assert view.content is None
+    assert view.html is None
+    assert view.source_name is None
+    assert view.topic_name is None
+    assert view.is_favorited is False
+
+
+def test_news_view_from_entity_with_none_entity():
+
+    assert NewsView.from_entity(None) is None
+
+
+def test_news_view_does_not_validate(valid_news_data):
+    # Dados do banco já foram validados na gravação; a view não revalida
+    valid_news_data["title"] = "  Título com espaços  "
+    valid_news_data["url"] = "ftp://invalida"
+
+    view = NewsView(**valid_news_data)
+
+    assert view.title == "  Título com espaços  "
+    assert view.url == "ftp://invalida"
+
+
+def test_news_view_uses_slots(valid_news_data):
+    view = NewsView(**valid_news_data)
+
+    assert not hasattr(view, "__dict__")
+    with pytest.raises(AttributeError):
+        view.unknown_field = 1
@@ -0,0 +1,66 @@
+import math
+import pytest
+from datetime import datetime, timedelta, timezone
+
+from app.utils import news_ranking
+from app.utils.news_ranking import base_score, decayed_score, score_batch, user_boost
+
+NOW = datetime(2026, 10, 19, 12, 0, tzinfo=timezone.utc)
+
+
+def test_base_score_is_continuous_in_publish_time():
+    scores = [base_score(NOW - timedelta(minutes=minutes)) for minutes in (0, 10, 60, 600)]
+
+    assert scores == sorted(scores, reverse=True)
+    assert len(set(scores)) == len(scores)
+
+
+def test_base_score_adds_log2_of_source_quality():
+    neutral = base_score(NOW)
+
+    assert base_score(NOW, source_quality=2.0) == pytest.approx(neutral + 1)
+    assert base_score(NOW, source_quality=None) == neutral
+    # Qualidade zero ou negativa não quebra o log
+    assert base_score(NOW, source_quality=0) == pytest.approx(neutral + math.log2(news_ranking.MIN_SOURCE_QUALITY))
+
+
+def test_naive_datetimes_are_treated_as_utc():
+
+    assert base_score(NOW.replace(tzinfo=None)) == base_score(NOW)
+
+
+def test_decayed_score_halves_every_half_life():
+    fresh = decayed_score(base_score(NOW), now=NOW)
+    one_day = decayed_score(base_score(NOW - timedelta(hours=24)), now=NOW)
+    boosted = decayed_score(base_score(NOW - timedelta(hours=24)) + user_boost(topic_matches=1), now=NOW)
+
+    assert fresh == pytest.approx(news_ranking.SCORE_SCALE)
+    assert one_day == pytest.approx(fresh / 2)
+    assert boosted == pytest.approx(fresh)
+
+
+def test_user_boost():
+
+    assert user_boost() == 0
+    assert user_boost(preferred_source=True, topic_matches=2) == news_ranking.PREFERRED_SOURCE_BOOST + 2 * news_ranking.CUSTOM_TOPIC_BOOST
+
+
+def test_score_batch_matches_scalar_model():
+    ages = [0, 6, 30, 72]
+    qualities = [1.0, 0.5, 2.0, 1.0]
+    preferred = [False, True, False, True]
+    matches = [0, 1, 0, 2]
+
+    batch = score_batch(ages, qualities, preferred, matches)
+
+    expected = [
+        decayed_score(base_score(NOW - timedelta(hours=age), quality) + user_boost(pref, match), now=NOW)
+        for age, quality, pref, match in zip(ages, qualities, preferred, matches)
+    ]
+    assert list(batch) == pytest.approx(expected)
+
+
+def test_score_batch_broadcasts_parameters():
+    batch = score_batch([0, 24], half_life_hours=12.0)
+
+    assert list(batch) == pytest.approx([news_ranking.SCORE_SCALE, news_ranking.SCORE_SCALE / 4])
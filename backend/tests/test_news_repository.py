@@ -7,6 +7,8 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from app.repositories.news_repository import NewsRepository
 from app.models.news import News
+from app.models.news_view import NewsView
+from app.utils import news_ranking
 
 try:
     from app.entities.news_entity import NewsEntity
@@ -96,7 +98,7 @@ def test_find_by_id_found(news_repository, mock_session, sample_news_entity, sam
     mock_result.first.return_value = (sample_news_entity, False)
     mock_session.execute.return_value = mock_result
     
-    with patch('app.models.news.News.from_entity', return_value=sample_news_model):
+    with patch('app.models.news_view.NewsView.from_entity', return_value=sample_news_model):
         found_news = news_repository.find_by_id(1, user_id=10)
 
     mock_session.execute.assert_called_once()
@@ -149,7 +151,7 @@ def test_find_by_url_normalized(news_repository, mock_session, sample_news_entit
         MagicMock(scalar_one_or_none=MagicMock(return_value=None)),
         MagicMock(scalar_one_or_none=MagicMock(return_value=sample_news_entity))
     ]
-    with patch('app.models.news.News.from_entity', return_value=sample_news_model):
+    with patch('app.models.news_view.NewsView.from_entity', return_value=sample_news_model):
         found_news = news_repository.find_by_url("http://www.example.com/news/1/")
 
     assert mock_session.execute.call_count == 2
@@ -163,7 +165,7 @@ def test_find_by_url_iterating(news_repository, mock_session, sample_news_entity
         MagicMock(scalar_one_or_none=MagicMock(return_value=None)),
         MagicMock(scalars=MagicMock(return_value=MagicMock(all=MagicMock(return_value=[sample_news_entity]))))
     ]
-    with patch('app.models.news.News.from_entity', return_value=sample_news_model):
+    with patch('app.models.news_view.NewsView.from_entity', return_value=sample_news_model):
         found_news = news_repository.find_by_url("http://example.com/news/1?param=true")
 
     assert mock_session.execute.call_count == 3
@@ -184,7 +186,7 @@ def test_find_by_url_not_found(news_repository, mock_session):
 def test_find_by_url_exact_match(news_repository, mock_session, sample_news_entity, sample_news_model):
     mock_session.execute.return_value.scalar_one_or_none.return_value = sample_news_entity
     
-    with patch('app.models.news.News.from_entity', return_value=sample_news_model):
+    with patch('app.models.news_view.NewsView.from_entity', return_value=sample_news_model):
         found_news = news_repository.find_by_url("http://www.example.com/news/1")
 
     mock_session.execute.assert_called_once()
@@ -192,75 +194,6 @@ def test_find_by_url_exact_match(news_repository, mock_session, sample_news_enti
     assert found_news.id == sample_news_model.id
 
 
-def test_list_all(news_repository, mock_session, sample_news_entity, sample_news_model):
-    mock_result = MagicMock()
-    mock_result.all.return_value = [(sample_news_entity, True)]
-    mock_session.execute.return_value = mock_result
-
-    with patch('app.models.news.News.from_entity', return_value=sample_news_model) as mock_from_entity:
-        news_list = news_repository.list_all(page=1, per_page=10, user_id=10)
-
-    mock_session.execute.assert_called_once()
-    mock_from_entity.assert_called_once_with(sample_news_entity)
-    assert len(news_list) == 1
-    assert news_list[0].id == sample_news_model.id
-    assert news_list[0].is_favorited is True
-
-
-def test_list_all_without_user_id(news_repository, mock_session, sample_news_entity, sample_news_model):
-    mock_result = MagicMock()
-    mock_result.all.return_value = [(sample_news_entity, False)]
-    mock_session.execute.return_value = mock_result
-
-    with patch('app.models.news.News.from_entity', return_value=sample_news_model):
-        news_list = news_repository.list_all(page=1, per_page=10, user_id=None)
-
-    mock_session.execute.assert_called_once()
-    assert len(news_list) == 1
-    assert news_list[0].is_favorited is False
-
-
-def test_list_all_empty(news_repository, mock_session):
-    mock_result = MagicMock()
-    mock_result.all.return_value = []
-    mock_session.execute.return_value = mock_result
-
-    news_list = news_repository.list_all()
-
-    mock_session.execute.assert_called_once()
-    assert news_list == []
-
-
-def test_list_all_sqlalchemy_error(news_repository, mock_session):
-    mock_session.execute.side_effect = SQLAlchemyError("Simulated DB error")
-    with pytest.raises(SQLAlchemyError):
-        news_repository.list_all()
-
-
-def test_find_by_topic(news_repository, mock_session, sample_news_entity, sample_news_model):
-    mock_result = MagicMock()
-    mock_result.all.return_value = [(sample_news_entity, False)]
-    mock_session.execute.return_value = mock_result
-
-    with patch('app.models.news.News.from_entity', return_value=sample_news_model):
-        news_list = news_repository.find_by_topic(topic_id=1, user_id=10)
-
-    mock_session.execute.assert_called_once()
-    assert len(news_list) == 1
-    assert news_list[0].topic_id == sample_news_model.topic_id
-
-
-def test_find_by_topic_empty(news_repository, mock_session):
-    mock_result = MagicMock()
-    mock_result.all.return_value = []
-    mock_session.execute.return_value = mock_result
-
-    news_list = news_repository.find_by_topic(topic_id=99, user_id=10)
-
-    mock_session.execute.assert_called_once()
-    assert news_list == []
-
-
 def test_count_all(news_repository, mock_session):
     mock_session.execute.return_value.scalar.return_value = 150
 
@@ -293,40 +226,17 @@ def test_count_by_topic_sqlalchemy_error(news_repository, mock_session):
         news_repository.count_by_topic(topic_id=1)
 
 
-def test_list_favorites_by_user(news_repository, mock_session, sample_news_entity, sample_news_model):
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [sample_news_entity]
-    mock_session.execute.return_value = mock_result
-
-    with patch('app.models.news.News.from_entity', return_value=sample_news_model):
-        news_list = news_repository.list_favorites_by_user(user_id=10)
-
-    mock_session.execute.assert_called_once()
-    assert len(news_list) == 1
-    assert news_list[0].id == sample_news_model.id
-
-
-def test_list_favorites_by_user_empty(news_repository, mock_session):
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = []
-    mock_session.execute.return_value = mock_result
-
-    news_list = news_repository.list_favorites_by_user(user_id=10)
-
-    mock_session.execute.assert_called_once()
-    assert news_list == []
-
-
 def test_get_recent_news_with_base_score(news_repository, mock_session, sample_news_entity, sample_news_model):
     sample_news_entity.published_at = datetime.now() - timedelta(hours=12)
     
-    result_row = (sample_news_entity, 300, 100, True)
+    rank = news_ranking.base_score(sample_news_entity.published_at) + 0.5 + 1.0
+    result_row = (sample_news_entity, 0.5, 1.0, rank, True)
     
     mock_result = MagicMock()
     mock_result.all.return_value = [result_row]
     mock_session.execute.return_value = mock_result
 
-    with patch('app.models.news.News.from_entity', return_value=sample_news_model):
+    with patch('app.models.news_view.NewsView.from_entity', wraps=NewsView.from_entity):
         news_list = news_repository.get_recent_news_with_base_score(
             user_id=10, 
             preferred_source_ids=[1], 
@@ -339,20 +249,22 @@ def test_get_recent_news_with_base_score(news_repository, mock_session, sample_n
     scored_news = news_list[0]
     assert scored_news.id == sample_news_model.id
     assert scored_news.is_favorited is True
-    assert scored_news.time_score == 300
-    assert scored_news.source_score == 100
+    assert scored_news.source_score == 0.5
+    assert scored_news.topic_score == 1.0
+    # 12h com meia-vida de 24h: 300 * 2**(1.5 - 0.5)
+    assert scored_news.total_score == pytest.approx(600, rel=1e-3)
 
 
 def test_get_recent_news_with_base_score_no_preferred_source(news_repository, mock_session, sample_news_entity, sample_news_model):
     sample_news_entity.published_at = datetime.now() - timedelta(days=3)
     
-    result_row = (sample_news_entity, 75, 0, False)
+    result_row = (sample_news_entity, 0.0, 0, news_ranking.base_score(sample_news_entity.published_at), False)
     
     mock_result = MagicMock()
     mock_result.all.return_value = [result_row]
     mock_session.execute.return_value = mock_result
 
-    with patch('app.models.news.News.from_entity', return_value=sample_news_model):
+    with patch('app.models.news_view.NewsView.from_entity', return_value=sample_news_model):
         news_list = news_repository.get_recent_news_with_base_score(
             user_id=10, 
             preferred_source_ids=[99],
@@ -365,8 +277,9 @@ def test_get_recent_news_with_base_score_no_preferred_source(news_repository, mo
     scored_news = news_list[0]
     assert scored_news.id == sample_news_model.id
     assert scored_news.is_favorited is False
-    assert scored_news.time_score == 75
     assert scored_news.source_score == 0
+    # 3 dias = 3 meias-vidas
+    assert scored_news.total_score == pytest.approx(300 / 8, rel=1e-3)
 
 
 def test_get_recent_news_with_base_score_empty(news_repository, mock_session):
@@ -384,4 +297,200 @@ def test_get_recent_news_with_base_score_sqlalchemy_error(news_repository, mock_
     mock_session.execute.side_effect = SQLAlchemyError("Simulated DB error")
 
     with pytest.raises(SQLAlchemyError):
-        news_repository.get_recent_news_with_base_score(user_id=10, preferred_source_ids=[], days_limit=5)
\ No newline at end of file
+        news_repository.get_recent_news_with_base_score(user_id=10, preferred_source_ids=[], days_limit=5)
+
+@pytest.fixture
+def persisted_source(db):
+    from app.models.news_source import NewsSource
+    from app.models.topic import Topic
+    from app.repositories.news_source_repository import NewsSourceRepository
+    from app.repositories.topic_repository import TopicRepository
+    TopicRepository(db.session).create(Topic(name="Technology", state=1))
+    return NewsSourceRepository(db.session).create(NewsSource(name="Fonte", url="https://fonte.com"))
+
+
+def _news(title, url, source_id):
+    return News(title=title, url=url, content="c", html="<p>c</p>", published_at=datetime.now(),
+                source_id=source_id, topic_id=1)
+
+
+def test_title_key_is_filled_on_create_and_bulk_insert(db, persisted_source):
+    repository = NewsRepository(db.session)
+    repository.create(_news("Governo anuncia  NOVO plano!", "https://fonte.com/1", persisted_source.id))
+    repository.bulk_create_ignore_conflicts([_news("“Brasil-Argentina”: 2 a 1", "https://fonte.com/2", persisted_source.id)])
+
+    keys = db.session.query(NewsEntity.title_key).order_by(NewsEntity.id).all()
+
+    assert [key for (key,) in keys] == ["governo anuncia novo plano", "brasil argentina 2 a 1"]
+
+
+def test_base_score_uses_source_quality_on_create_and_bulk_insert(db, persisted_source):
+    from app.entities.news_source_entity import NewsSourceEntity
+    db.session.get(NewsSourceEntity, persisted_source.id).quality = 2.0
+    db.session.commit()
+    repository = NewsRepository(db.session)
+    created = _news("Notícia 1", "https://fonte.com/1", persisted_source.id)
+    bulk = _news("Notícia 2", "https://fonte.com/2", persisted_source.id)
+    repository.create(created)
+    repository.bulk_create_ignore_conflicts([bulk])
+
+    scores = db.session.query(NewsEntity.base_score).order_by(NewsEntity.id).all()
+
+    assert [score for (score,) in scores] == pytest.approx([
+        news_ranking.base_score(created.published_at, 2.0),
+        news_ranking.base_score(bulk.published_at, 2.0),
+    ])
+
+
+def test_find_by_title_and_existing_titles_use_normalized_key(db, persisted_source):
+    repository = NewsRepository(db.session)
+    repository.create(_news("Governo anuncia novo plano", "https://fonte.com/1", persisted_source.id))
+    repository.create(_news("Governo anuncia novo plano!", "https://fonte.com/2", persisted_source.id))
+
+    found = repository.find_by_title("GOVERNO anuncia: novo plano")
+    existing = repository.find_existing_titles(["governo anuncia novo plano...", "Outro título", None])
+
+    assert found.url == "https://fonte.com/1"
+    assert existing == {"governo anuncia novo plano"}
+    assert repository.find_by_title("Outro título") is None
+
+
+def test_bodies_are_stored_apart_and_loaded_only_on_demand(db, persisted_source):
+    from app.entities.news_body_entity import NewsBodyEntity
+    repository = NewsRepository(db.session)
+    created = repository.create(_news("Notícia 1", "https://fonte.com/1", persisted_source.id))
+    repository.bulk_create_ignore_conflicts([
+        _news("Notícia 2", "https://fonte.com/2", persisted_source.id),
+        _news("Notícia 1 repetida", "https://fonte.com/1", persisted_source.id),
+    ])
+    db.session.expunge_all()
+
+    assert db.session.query(NewsBodyEntity).count() == 2
+    listed = repository.list_all_cards()
+    detail = repository.find_by_id(created.id)
+    scored = repository.get_recent_news_with_base_score(user_id=None, preferred_source_ids=[], days_limit=15)
+
+    assert len(listed) == 2 and "content" not in listed[0]._fields
+    assert (detail.content, detail.html) == ("c", "<p>c</p>")
+    assert {(news.content, news.html) for news in scored} == {("c", None)}
+
+
+def test_get_recent_news_with_base_score_ranks_and_paginates_in_sql(db, persisted_source):
+    from app.entities.custom_topic_entity import CustomTopicEntity
+    from app.entities.user_entity import UserEntity
+    from app.entities.user_preferred_custom_topics import UserPreferredCustomTopicEntity
+    repository = NewsRepository(db.session)
+    now = datetime.now()
+    for i, (title, age) in enumerate([
+        ("Notícia antiga sobre Python", timedelta(days=3)),   # 2**-3 * 2 (custom topic)
+        ("Notícia recente", timedelta(hours=1)),
+        ("Outra notícia recente", timedelta(hours=2)),
+        ("Notícia de ontem", timedelta(hours=30)),           # 2**-1.25
+        ("Notícia velha", timedelta(days=20)),                # fora da janela
+    ]):
+        news = _news(title, f"https://fonte.com/{i}", persisted_source.id)
+        news.published_at = now - age
+        repository.create(news)
+    user = UserEntity(full_name="Leitor", email="leitor@exemplo.com")
+    topic = CustomTopicEntity(name="Python")
+    db.session.add_all([user, topic])
+    db.session.flush()
+    db.session.add(UserPreferredCustomTopicEntity(user_id=user.id, topic_id=topic.id))
+    db.session.commit()
+
+    first_page = repository.get_recent_news_with_base_score(user.id, [], days_limit=15, page=1, per_page=2)
+    second_page = repository.get_recent_news_with_base_score(user.id, [], days_limit=15, page=2, per_page=2)
+    anonymous = repository.get_recent_news_with_base_score(None, [persisted_source.id], days_limit=15)
+
+    # Decaimento contínuo: 1h > 2h > 30h > 3 dias com custom topic (x2 = 1,5 dias)
+    assert [(n.title, n.topic_score) for n in first_page] == [("Notícia recente", 0), ("Outra notícia recente", 0)]
+    assert [(n.title, n.topic_score) for n in second_page] == [("Notícia de ontem", 0), ("Notícia antiga sobre Python", 1.0)]
+    assert first_page[0].total_score > first_page[1].total_score > second_page[0].total_score
+    assert second_page[1].total_score == pytest.approx(300 * 2 ** (1 - 72 / 24), rel=1e-2)
+    assert {n.source_score for n in anonymous} == {0.5}
+    assert repository.count_recent(days_limit=15) == 4
+
+
+def test_custom_topic_match_treats_like_wildcards_literally(db, persisted_source):
+    from app.entities.custom_topic_entity import CustomTopicEntity
+    from app.entities.user_entity import UserEntity
+    from app.entities.user_preferred_custom_topics import UserPreferredCustomTopicEntity
+    repository = NewsRepository(db.session)
+    for i, title in enumerate(["Desconto de 50% no varejo", "Desconto de 500 reais", "Variável max_len", "Variável maxilen"]):
+        repository.create(_news(title, f"https://fonte.com/{i}", persisted_source.id))
+    user = UserEntity(full_name="Leitor", email="leitor@exemplo.com")
+    topics = [CustomTopicEntity(name="50%"), CustomTopicEntity(name="MAX_LEN")]
+    db.session.add_all([user, *topics])
+    db.session.flush()
+    db.session.add_all([UserPreferredCustomTopicEntity(user_id=user.id, topic_id=topic.id) for topic in topics])
+    db.session.commit()
+
+    ranked = repository.get_recent_news_with_base_score(user.id, [], days_limit=15)
+
+    assert {n.title: n.topic_score for n in ranked} == {
+        "Desconto de 50% no varejo": 1.0, "Desconto de 500 reais": 0,
+        "Variável max_len": 1.0, "Variável maxilen": 0,
+    }
+
+
+def test_feed_state_queries(db, persisted_source):
+    repository = NewsRepository(db.session)
+    assert repository.max_id() == 0
+    now = datetime.now()
+    created = []
+    for i in range(3):
+        news = _news(f"Notícia {i}", f"https://fonte.com/{i}", persisted_source.id)
+        news.published_at = now - timedelta(hours=i)
+        created.append(repository.create(news))
+
+    ranked = repository.rank_ids_for_user(None, [persisted_source.id], days_limit=15, limit=2)
+    after_first = repository.list_recent_for_ranking(days_limit=15, after_id=created[0].id)
+    cards = repository.find_cards_by_ids([created[2].id, created[0].id, 999])
+
+    assert [row.id for row in ranked] == [created[0].id, created[1].id]
+    assert [row.id for row in repository.rank_ids_for_user(None, [], limit=2, offset=2)] == [created[2].id]
+    assert ranked[0].rank == pytest.approx(news_ranking.base_score(now) + news_ranking.PREFERRED_SOURCE_BOOST)
+    assert [row.id for row in after_first] == [created[1].id, created[2].id]
+    assert {row.id for row in cards} == {created[0].id, created[2].id}
+    assert repository.max_id() == created[2].id
+    assert repository.find_cards_by_ids([]) == []
+
+def test_find_favorited_ids(db, persisted_source):
+    from app.entities.user_saved_news_entity import UserSavedNewsEntity
+    from app.entities.user_entity import UserEntity
+    repository = NewsRepository(db.session)
+    first = repository.create(_news("Notícia 1", "https://fonte.com/1", persisted_source.id))
+    second = repository.create(_news("Notícia 2", "https://fonte.com/2", persisted_source.id))
+    db.session.add(UserEntity(id=1, full_name="Usuário", email="u@exemplo.com"))
+    db.session.add_all([
+        UserSavedNewsEntity(user_id=1, news_id=first.id, is_favorite=True),
+        UserSavedNewsEntity(user_id=1, news_id=second.id, is_favorite=False),
+    ])
+    db.session.commit()
+
+    assert repository.find_favorited_ids(1, [first.id, second.id]) == {first.id}
+    assert repository.find_favorited_ids(2, [first.id]) == set()
+    assert repository.find_favorited_ids(1, []) == set()
+    assert repository.find_favorite_ids(1) == [first.id]
+    assert repository.find_favorite_ids(1, page=2, per_page=1) == []
+
+
+def test_card_queries_return_rows_with_names_and_favorites(db, persisted_source):
+    from app.entities.user_saved_news_entity import UserSavedNewsEntity
+    from app.entities.user_entity import UserEntity
+    repository = NewsRepository(db.session)
+    first = repository.create(_news("Notícia 1", "https://fonte.com/1", persisted_source.id))
+    second = repository.create(_news("Notícia 2", "https://fonte.com/2", persisted_source.id))
+    db.session.add(UserEntity(id=1, full_name="Usuário", email="u@exemplo.com"))
+    db.session.add(UserSavedNewsEntity(user_id=1, news_id=first.id, is_favorite=True))
+    db.session.commit()
+
+    by_topic = repository.find_cards_by_topic(1, user_id=1)
+    anonymous = repository.list_all_cards()
+    favorites = repository.list_favorite_cards(1)
+
+    assert [(row.id, row.is_favorited) for row in by_topic] == [(second.id, False), (first.id, True)]
+    assert {(row.source_name, row.topic_name) for row in by_topic} == {("Fonte", "technology")}
+    assert [row.is_favorited for row in anonymous] == [False, False]
+    assert [(row.id, row.is_favorited) for row in favorites] == [(first.id, True)]
+    assert repository.count_favorites_by_user(1) == 1
@@ -201,4 +201,100 @@ def test_get_for_you_news(client, news_setup):
     assert data['success'] is True
     assert "Feed personalizado obtido com sucesso" in data['message']
     assert len(data['data']['news']) > 0
-    assert data['data']['news'][0]['id'] == news_setup["news_id"]
\ No newline at end of file
+    assert data['data']['news'][0]['id'] == news_setup["news_id"]
+def test_search_news_validates_query_and_uses_index_on_sqlite(client, news_setup):
+    empty = client.get('/news/search?q=')
+    # SQLite nos testes: busca pelo índice invertido em memória
+    response = client.get('/news/search?q=teste')
+    excluded = client.get('/news/search?q=teste -completo')
+
+    assert empty.status_code == 400
+    assert empty.get_json()['error'] == "Bad Request"
+    assert response.status_code == 200
+    assert [item['id'] for item in response.get_json()['data']['news']] == [news_setup["news_id"]]
+    assert excluded.get_json()['data']['news'] == []
+
+def test_get_news_by_topic_conditional_get(client, news_setup):
+    url = f'/news/topic/{news_setup["topic_id"]}'
+    first = client.get(url)
+    etag = first.headers['ETag']
+
+    not_modified = client.get(url, headers={'If-None-Match': etag})
+    other_page = client.get(f'{url}?page=2', headers={'If-None-Match': etag})
+
+    assert first.status_code == 200
+    assert first.headers['Cache-Control'] == 'private, no-cache'
+    assert not_modified.status_code == 304
+    assert not_modified.data == b''
+    assert not_modified.headers['ETag'] == etag
+    assert other_page.status_code == 200
+
+def test_get_news_by_id_etag_changes_with_favorite(client, news_setup):
+    auth_client, headers = get_auth_client(client, news_setup["user_data"])
+    url = f'/news/{news_setup["news_id"]}'
+    etag = auth_client.get(url).headers['ETag']
+
+    assert auth_client.get(url, headers={'If-None-Match': etag}).status_code == 304
+
+    auth_client.post(f'{url}/favorite', headers=headers)
+    response = auth_client.get(url, headers={'If-None-Match': etag})
+
+    assert response.status_code == 200
+    assert response.get_json()['data']['is_favorited'] is True
+    assert response.headers['ETag'] != etag
+
+def test_get_news_by_id_not_found_has_no_etag(client):
+    response = client.get('/news/9999', headers={'If-None-Match': '*'})
+
+    assert response.status_code == 404
+    assert 'ETag' not in response.headers
+
+def test_get_for_you_news_etag_ignores_score_decay(client, news_setup):
+    from hashlib import sha1
+
+    auth_client, headers = get_auth_client(client, news_setup["user_data"])
+    first = auth_client.get('/news/for-you', headers=headers)
+
+    response = auth_client.get('/news/for-you', headers={**headers, 'If-None-Match': first.headers['ETag']})
+
+    assert response.status_code == 304
+    # ETag dos IDs da página, não do corpo (que traz o score com decaimento)
+    assert first.headers['ETag'].strip('"') != sha1(first.data).hexdigest()
+
+def test_get_saved_news_etag_changes_with_favorites(client, news_setup):
+    auth_client, headers = get_auth_client(client, news_setup["user_data"])
+    etag = auth_client.get('/news/saved', headers=headers).headers['ETag']
+
+    assert auth_client.get('/news/saved', headers={**headers, 'If-None-Match': etag}).status_code == 304
+
+    auth_client.post(f'/news/{news_setup["news_id"]}/favorite', headers=headers)
+    response = auth_client.get('/news/saved', headers={**headers, 'If-None-Match': etag})
+
+    assert response.status_code == 200
+    assert response.get_json()['data']['pagination']['total'] == 1
+    assert response.headers['ETag'] != etag
+
+def test_get_history_news_etag_changes_with_new_read(client, news_setup):
+    auth_client, headers = get_auth_client(client, news_setup["user_data"])
+    etag = auth_client.get('/news/history', headers=headers).headers['ETag']
+
+    assert auth_client.get('/news/history', headers={**headers, 'If-None-Match': etag}).status_code == 304
+
+    auth_client.post(f'/news/{news_setup["news_id"]}/history', headers=headers)
+    response = auth_client.get('/news/history', headers={**headers, 'If-None-Match': etag})
+
+    assert response.status_code == 200
+    assert [news['id'] for news in response.get_json()['data']['news']] == [news_setup["news_id"]]
+    assert response.headers['ETag'] != etag
+
+def test_search_news_conditional_get(client, news_setup):
+    first = client.get('/news/search?q=teste')
+
+    not_modified = client.get('/news/search?q=teste', headers={'If-None-Match': first.headers['ETag']})
+    other_query = client.get('/news/search?q=completo', headers={'If-None-Match': first.headers['ETag']})
+    invalid = client.get('/news/search?q=', headers={'If-None-Match': first.headers['ETag']})
+
+    assert not_modified.status_code == 304
+    assert other_query.status_code == 200
+    assert invalid.status_code == 400
+    assert 'ETag' not in invalid.headers
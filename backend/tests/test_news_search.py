@@ -0,0 +1,208 @@
+import pytest
+from datetime import datetime
+from unittest.mock import MagicMock
+from sqlalchemy.dialects import postgresql
+
+from app.models.exceptions import SearchUnavailableError
+from app.models.news import News
+from app.repositories.news_repository import NewsRepository
+from app.repositories.news_search_repository import NewsSearchRepository
+from app.utils import news_search
+
+
+def _compile(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.parametrize("texts, language", [
+    (("Governo anuncia novo plano para a educação", None), "pt"),
+    (("The government announced a new plan for the economy", "It was approved on Monday"), "en"),
+    (("Python 3.14", None), "pt"),
+    ((None, None), "pt"),
+])
+def test_detect_language(texts, language):
+    assert news_search.detect_language(*texts) == language
+
+
+def test_cursor_round_trip_and_invalid_cursor():
+    cursor = news_search.encode_cursor(0.0607927106320858, 42)
+
+    assert news_search.decode_cursor(cursor) == (0.0607927106320858, 42)
+    for invalid in ("x", "YWJj", "!!"):
+        with pytest.raises(ValueError):
+            news_search.decode_cursor(invalid)
+
+
+def test_search_document_limits_content():
+    document = news_search.search_document("Título", None, "a" * 50000, "en")
+
+    assert document["search_config"] == "english"
+    assert document["search_description"] == ""
+    assert len(document["search_content"]) == news_search.SEARCH_CONTENT_CHARS
+
+
+def test_search_statement_uses_tsquery_rank_and_keyset(app):
+    repository = NewsSearchRepository(MagicMock())
+
+    sql = _compile(repository.search_statement("eleições", limit=21, after=(0.5, 10)))
+    sql_pt = _compile(repository.search_statement("eleições", language="pt"))
+
+    assert "news.search_vector @@" in sql
+    assert sql.count("websearch_to_tsquery") == 6  # pt || en: ts_rank, filtro @@ e keyset
+    assert "ts_rank(news.search_vector" in sql
+    assert "ORDER BY rank DESC, news.id DESC" in sql
+    assert ", news.id) < (" in sql
+    assert sql_pt.count("websearch_to_tsquery") == 2
+    assert "news.language =" in sql_pt
+
+
+def test_search_keyset_compares_rank_as_double_precision(app):
+    # ts_rank devolve real: sem o cast, o cursor (double) não casa com os empates da página anterior
+    sql = _compile(NewsSearchRepository(MagicMock()).search_statement("eleições", after=(0.5, 10)))
+
+    select_rank = sql.split(" AS rank")[0].split("SELECT news.id, ")[1]
+    keyset = sql.split("WHERE ")[1].split(" ORDER BY")[0].split(" AND ")[-1]
+    keyset_rank, cursor_rank = (side.strip()[1:].rsplit(", ", 1)[0] for side in keyset.split(" < "))
+
+    assert select_rank.startswith("CAST(ts_rank(") and select_rank.endswith(" AS DOUBLE PRECISION)")
+    assert keyset_rank == select_rank
+    assert cursor_rank.startswith("CAST(%(") and cursor_rank.endswith(" AS DOUBLE PRECISION)")
+
+
+def test_search_requires_postgresql(db):
+    with pytest.raises(SearchUnavailableError):
+        NewsSearchRepository(db.session).search("eleições")
+
+
+def test_news_language_is_stored_on_create(db):
+    from app.entities.news_entity import NewsEntity
+    from app.entities.news_source_entity import NewsSourceEntity
+    from app.entities.topic_entity import TopicEntity
+
+    source = NewsSourceEntity(name="Fonte", url="https://fonte.com")
+    topic = TopicEntity(name="tecnologia")
+    db.session.add_all([source, topic])
+    db.session.commit()
+
+    def news(title, url):
+        return News(
+            title=title, url=url, content="", html="<p></p>",
+            published_at=datetime.now(), source_id=source.id, topic_id=topic.id
+        )
+
+    repository = NewsRepository(db.session)
+    created = repository.create(news("The new chip is faster than the old one", "https://fonte.com/1"))
+    repository.bulk_create_ignore_conflicts([news("Novo chip é mais rápido que o antigo", "https://fonte.com/2")])
+
+    languages = dict(db.session.query(NewsEntity.url, NewsEntity.language).all())
+    assert languages == {created.url: "en", "https://fonte.com/2": "pt"}
+
+
+def test_search_vectors_are_written_only_on_postgresql():
+    session = MagicMock()
+    repository = NewsRepository(session)
+    model = MagicMock(title="Título", description=None, content="Texto")
+
+    session.get_bind.return_value.dialect.name = "sqlite"
+    repository._update_search_vectors([(1, model, "pt")])
+    session.execute.assert_not_called()
+
+    session.get_bind.return_value.dialect.name = "postgresql"
+    repository._update_search_vectors([(1, model, "pt")])
+
+    stmt, params = session.execute.call_args.args
+    assert "SET search_vector=" in _compile(stmt)
+    assert params == [{
+        "news_id": 1, "search_config": "portuguese", "search_title": "Título",
+        "search_description": "", "search_content": "Texto",
+    }]
+
+
+def _index(*docs):
+    from app.utils.inverted_index import InvertedIndex
+
+    index = InvertedIndex()
+    for doc in docs:
+        index.add(*doc)
+    return index
+
+
+def test_inverted_index_tokenizes_and_parses_websearch_syntax():
+    from app.utils.inverted_index import parse_query, tokenize
+
+    assert tokenize("Eleições em São Paulo, 2026!") == ["eleicoes", "sao", "paulo", "2026"]
+    assert parse_query('"reforma tributária" -imposto OR eleições') == [
+        (["reforma", "tributaria"], ["imposto"]), (["eleicoes"], []),
+    ]
+    assert parse_query("-imposto") == []
+
+
+def test_inverted_index_search_ranks_filters_and_pages():
+    index = _index(
+        (1, "Reforma tributária aprovada", None, "O texto segue para o Senado.", "pt"),
+        (2, "Senado vota hoje", "A reforma tributária entra na pauta.", None, "pt"),
+        (3, "Tax reform passes", None, "Reforma tributária no Brasil", "en"),
+        (4, "Copa do Mundo", None, "Seleção convocada.", "pt"),
+    )
+
+    results = index.search("reforma tributária")
+
+    # Título (A) pesa mais que descrição (B), que pesa mais que o texto (D)
+    assert [doc_id for doc_id, _ in results] == [1, 2, 3]
+    assert [doc_id for doc_id, _ in index.search("reforma tributária", language="en")] == [3]
+    assert [doc_id for doc_id, _ in index.search("reforma -senado")] == [3]
+    assert {doc_id for doc_id, _ in index.search("copa OR senado")} == {1, 2, 4}
+    assert index.search("inexistente") == []
+
+    first = index.search("reforma tributária", limit=2)
+    rest = index.search("reforma tributária", limit=2, after=first[-1][::-1])
+    assert first + rest == results
+
+
+def test_inverted_index_keeps_postings_sorted_and_ignores_duplicates():
+    index = _index((5, "Python", None, None, "pt"), (2, "Python 3", None, None, "pt"))
+    index.add(5, "Python outra vez", None, None, "pt")
+
+    assert len(index) == 2
+    assert list(index._postings["python"].ids) == [2, 5]
+    assert "outra" not in index._postings
+
+
+def test_search_index_service_catches_up_in_batches():
+    from types import SimpleNamespace
+    from app.services.search_index_service import SearchIndexService
+
+    def row(news_id, title):
+        return SimpleNamespace(id=news_id, title=title, description=None, content=None, language="pt")
+
+    news_repo = MagicMock()
+    news_repo.list_for_search_index.side_effect = [[row(1, "Eleições"), row(2, "Eleições no Rio")], [], [row(3, "Eleições em SP")]]
+    service = SearchIndexService(news_repo, batch_size=2)
+
+    assert [news_id for news_id, _ in service.search("eleições")] == [1, 2]
+    assert [news_id for news_id, _ in service.search("eleições")] == [1, 3, 2]
+    assert [call.args for call in news_repo.list_for_search_index.call_args_list] == [(0, 2), (2, 2), (2, 2)]
+
+
+def test_search_index_reads_stored_news(db):
+    from app.entities.news_source_entity import NewsSourceEntity
+    from app.entities.topic_entity import TopicEntity
+    from app.services.search_index_service import SearchIndexService
+
+    source = NewsSourceEntity(name="Fonte", url="https://fonte.com")
+    topic = TopicEntity(name="tecnologia")
+    db.session.add_all([source, topic])
+    db.session.commit()
+
+    repository = NewsRepository(db.session)
+    ids = repository.bulk_create_ignore_conflicts([
+        News(
+            title=title, url=f"https://fonte.com/{i}", content=content, html="<p></p>",
+            published_at=datetime.now(), source_id=source.id, topic_id=topic.id
+        )
+        for i, (title, content) in enumerate([("Chip novo", "Processador mais rápido"), ("New chip", "A faster processor")])
+    ])
+    service = SearchIndexService(repository)
+
+    assert [news_id for news_id, _ in service.search("processador")] == [ids[0]]
+    assert [news_id for news_id, _ in service.search("chip", language="en")] == [ids[1]]
@@ -0,0 +1,96 @@
+from collections import namedtuple
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from app.scripts.benchmark_news_read_path import build_rows, legacy_card, run, _sample_values
+from app.utils.news_serializer import CARD, DETAIL, EMAIL, NewsSerializer, get_serializer, serialize_news
+
+PUBLISHED_AT = datetime(2025, 10, 21, 10, 0)
+
+
+def _news(**overrides):
+    values = dict(
+        id=1, title="Título", description="Descrição", url="https://fonte.com/1",
+        image_url=None, published_at=PUBLISHED_AT, source_id=2, topic_id=3,
+        created_at=PUBLISHED_AT, is_favorited=False, source_name="Fonte", topic_name=None,
+        content="texto", html="<p>texto</p>",
+    )
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+class TestNewsSerializer:
+    """Testes do serializador de notícias (card/detail/email)."""
+
+    def test_card_omits_empty_optional_fields(self):
+        data = CARD.serialize(_news())
+
+        assert data["published_at"] == PUBLISHED_AT
+        assert data["source_name"] == "Fonte"
+        assert "topic_name" not in data
+        assert "content" not in data
+
+    def test_detail_includes_body(self):
+        data = DETAIL.serialize(_news())
+
+        assert (data["content"], data["html"]) == ("texto", "<p>texto</p>")
+
+    def test_email_fields_and_defaults(self):
+        data = EMAIL.serialize(_news(description=None, source_name=None))
+
+        assert data == {
+            "title": "Título", "url": "https://fonte.com/1", "category": "Geral", "img_url": "",
+            "summary": "", "content": "texto", "source": "Fonte Desconhecida", "date": "21/10/2025",
+        }
+
+    def test_extra_fields_override(self):
+        data = CARD.serialize(_news(), is_favorited=True, score=42)
+
+        assert data["is_favorited"] is True
+        assert data["score"] == 42
+
+    def test_rows_match_objects(self):
+        values = _sample_values(3)
+        values[1]["topic_name"] = None
+
+        from_rows = CARD.serialize_many(build_rows(values))
+        from_objects = CARD.serialize_many([SimpleNamespace(**value) for value in values])
+
+        assert from_rows == from_objects
+        assert "topic_name" not in from_rows[1]
+
+    def test_rows_missing_columns(self):
+        Row = namedtuple("Row", ["id", "title"])
+
+        with pytest.raises(KeyError, match="Colunas ausentes"):
+            CARD.serialize_many([Row(1, "Título")])
+
+    def test_single_field_serializer(self):
+        Row = namedtuple("Row", ["id", "title"])
+        serializer = NewsSerializer(("id",))
+
+        assert serializer.serialize_many([Row(1, "Título")]) == [{"id": 1}]
+        assert serializer.serialize(Row(2, "Outro")) == {"id": 2}
+
+    def test_matches_legacy_loop_except_dates(self):
+        news = _news(topic_name="Tecnologia")
+        legacy = legacy_card(news)
+
+        assert CARD.serialize(news).keys() == legacy.keys()
+        assert CARD.serialize(news)["published_at"].isoformat() == legacy["published_at"]
+
+    def test_get_serializer(self):
+        assert get_serializer("detail") is DETAIL
+        assert serialize_news(None) is None
+        with pytest.raises(ValueError, match="Conjunto de campos desconhecido"):
+            get_serializer("full")
+
+    def test_benchmark_runs(self):
+        results = run(rows=10, repeat=1)
+
+        assert set(results) == {
+            "hidratação News.from_entity", "hidratação NewsView.from_entity",
+            "loop campo a campo (News)", "NewsSerializer (News)", "NewsSerializer (Row)",
+        }
@@ -4,7 +4,8 @@ from datetime import datetime
 import math, logging
 
 from app.services.news_service import NewsService
-from app.models.exceptions import NewsNotFoundError
+from app.models.exceptions import NewsNotFoundError, SearchValidationError
+from app.utils.response_cache import ResponseCache
 
 @pytest.fixture
 def mock_news_repo():
@@ -24,15 +25,14 @@ def mock_user_history_repo():
 
 @pytest.fixture
 def news_service(mock_news_repo, mock_topic_repo, mock_user_news_source_repo, mock_user_history_repo):
-    with patch('app.services.news_service.UserCustomTopicService') as mock_custom_topic_service:
-        service = NewsService(
-            news_repo=mock_news_repo,
-            topic_repo=mock_topic_repo,
-            user_news_source_repo=mock_user_news_source_repo,
-            user_history_repo=mock_user_history_repo
-        )
-        service.user_custom_topic_service = mock_custom_topic_service()
-        yield service
+    return NewsService(
+        news_repo=mock_news_repo,
+        topic_repo=mock_topic_repo,
+        user_news_source_repo=mock_user_news_source_repo,
+        user_history_repo=mock_user_history_repo,
+        # Cache desligado e sem versão: não depende de um app context ativo
+        response_cache=ResponseCache(ttl=0)
+    )
 
 @pytest.fixture
 def sample_news():
@@ -54,10 +54,12 @@ def sample_news():
 
 def test_get_news_by_id_found(news_service, mock_news_repo, sample_news):
     mock_news_repo.find_by_id.return_value = sample_news
+    mock_news_repo.find_favorited_ids.return_value = set()
 
     result = news_service.get_news_by_id(user_id=1, news_id=1)
 
-    mock_news_repo.find_by_id.assert_called_once_with(1, user_id=1)
+    mock_news_repo.find_by_id.assert_called_once_with(1)
+    mock_news_repo.find_favorited_ids.assert_called_once_with(1, [1])
     assert result["id"] == sample_news.id
     assert result["title"] == sample_news.title
     assert result["is_favorited"] == sample_news.is_favorited
@@ -74,12 +76,12 @@ def test_get_news_by_id_not_found(news_service, mock_news_repo):
 def test_get_all_news(news_service, mock_news_repo, sample_news):
     paginated_list = [sample_news, sample_news]
     total_count = 20
-    mock_news_repo.list_all.return_value = paginated_list
+    mock_news_repo.list_all_cards.return_value = paginated_list
     mock_news_repo.count_all.return_value = total_count
 
     result = news_service.get_all_news(user_id=1, page=2, per_page=10)
 
-    mock_news_repo.list_all.assert_called_once_with(page=2, per_page=10, user_id=1)
+    mock_news_repo.list_all_cards.assert_called_once_with(page=2, per_page=10, user_id=1)
     mock_news_repo.count_all.assert_called_once()
     assert len(result["news"]) == 2
     assert result["news"][0]["id"] == sample_news.id
@@ -92,12 +94,14 @@ def test_get_all_news(news_service, mock_news_repo, sample_news):
 def test_get_news_by_topic(news_service, mock_news_repo, sample_news):
     paginated_list = [sample_news]
     total_count = 5
-    mock_news_repo.find_by_topic.return_value = paginated_list
+    mock_news_repo.find_cards_by_topic.return_value = paginated_list
     mock_news_repo.count_by_topic.return_value = total_count
 
+    mock_news_repo.find_favorited_ids.return_value = set()
+
     result = news_service.get_news_by_topic(topic_id=1, page=1, per_page=10, user_id=1)
 
-    mock_news_repo.find_by_topic.assert_called_once_with(1, 1, 10, 1)
+    mock_news_repo.find_cards_by_topic.assert_called_once_with(1, 1, 10, None)
     mock_news_repo.count_by_topic.assert_called_once_with(1)
     assert len(result["news"]) == 1
     assert result["news"][0]["id"] == sample_news.id
@@ -105,29 +109,55 @@ def test_get_news_by_topic(news_service, mock_news_repo, sample_news):
 
 
 def test_get_news_by_topic_empty(news_service, mock_news_repo):
-    mock_news_repo.find_by_topic.return_value = []
+    mock_news_repo.find_cards_by_topic.return_value = []
     mock_news_repo.count_by_topic.return_value = 0
 
+    mock_news_repo.find_favorited_ids.return_value = set()
+
     result = news_service.get_news_by_topic(topic_id=99, page=1, per_page=10, user_id=1)
 
-    mock_news_repo.find_by_topic.assert_called_once_with(99, 1, 10, 1)
+    mock_news_repo.find_cards_by_topic.assert_called_once_with(99, 1, 10, None)
     mock_news_repo.count_by_topic.assert_called_once_with(99)
     assert len(result["news"]) == 0
     assert result["pagination"]["total"] == 0
     assert result["pagination"]["pages"] == 1
 
+def test_get_news_by_topic_cached_with_favorites_overlay(news_service, mock_news_repo, sample_news):
+    news_service.response_cache = ResponseCache(max_entries=10, ttl=60)
+    mock_news_repo.find_cards_by_topic.return_value = [sample_news]
+    mock_news_repo.count_by_topic.return_value = 1
+    mock_news_repo.find_favorited_ids.return_value = {sample_news.id}
+
+    favorited = news_service.get_news_by_topic(topic_id=1, page=1, per_page=10, user_id=1)
+    anonymous = news_service.get_news_by_topic(topic_id=1, page=1, per_page=10, user_id=None)
+
+    mock_news_repo.find_cards_by_topic.assert_called_once_with(1, 1, 10, None)
+    mock_news_repo.count_by_topic.assert_called_once_with(1)
+    assert favorited["news"][0]["is_favorited"] is True
+    assert anonymous["news"][0]["is_favorited"] is False
+
+
+def test_get_news_by_id_not_found_is_not_cached(news_service, mock_news_repo, sample_news):
+    news_service.response_cache = ResponseCache(max_entries=10, ttl=60)
+    mock_news_repo.find_by_id.side_effect = [None, sample_news]
+
+    with pytest.raises(NewsNotFoundError):
+        news_service.get_news_by_id(user_id=None, news_id=1)
+
+    assert news_service.get_news_by_id(user_id=None, news_id=1)["id"] == sample_news.id
+    assert news_service.get_news_by_id(user_id=None, news_id=1)["id"] == sample_news.id
+    assert mock_news_repo.find_by_id.call_count == 2
+
 def test_get_favorite_news(news_service, mock_news_repo, sample_news):
-    paginated_favorites = [sample_news]
-    all_favorites = [sample_news, sample_news] 
-    mock_news_repo.list_favorites_by_user.side_effect = [
-        paginated_favorites,
-        all_favorites
-    ]
+    sample_news.is_favorited = True
+    mock_news_repo.list_favorite_cards.return_value = [sample_news]
+    mock_news_repo.count_favorites_by_user.return_value = 2
 
     result = news_service.get_favorite_news(user_id=1, page=1, per_page=10)
 
     # Assert
-    assert mock_news_repo.list_favorites_by_user.call_count == 2
+    mock_news_repo.list_favorite_cards.assert_called_once_with(1, 1, 10)
+    mock_news_repo.count_favorites_by_user.assert_called_once_with(1)
     assert len(result["news"]) == 1
     assert result["news"][0]["is_favorited"] is True
     assert result["pagination"]["total"] == 2
@@ -135,15 +165,11 @@ def test_get_favorite_news(news_service, mock_news_repo, sample_news):
 
 def test_get_favorite_news_empty(news_service, mock_news_repo):
     
-    mock_news_repo.list_favorites_by_user.side_effect = [
-        [], 
-        [] 
-    ]
-    mock_news_repo.list_favorites_by_user.side_effect = [[], []]
+    mock_news_repo.list_favorite_cards.return_value = []
+    mock_news_repo.count_favorites_by_user.return_value = 0
 
     result = news_service.get_favorite_news(user_id=1, page=1, per_page=10)
 
-    assert mock_news_repo.list_favorites_by_user.call_count == 2
     assert len(result["news"]) == 0
     assert result["pagination"]["total"] == 0
     assert result["pagination"]["page"] == 1
@@ -151,88 +177,38 @@ def test_get_favorite_news_empty(news_service, mock_news_repo):
 
 
 
-def test_calculate_topic_score():
-    service = NewsService()
-    news = MagicMock()
-    news.title = "Apple lança novo iPhone"
-    news.description = "O novo aparelho tem IA."
-    news.content = "Mais detalhes sobre tecnologia."
-    custom_topics = [
-        {'name': 'iPhone'},
-        {'name': 'IA'},
-        {'name': 'Samsung'}
-    ]
-
-    score = service._calculate_topic_score(news, custom_topics)
-
-    assert score == 400
-
-
-def test_calculate_topic_score_no_match():
-    service = NewsService()
-    news = MagicMock(title="Notícia genérica", description="Sem palavras-chave", content="")
-    custom_topics = [{'name': 'tecnologia'}, {'name': 'política'}]
-
-    score = service._calculate_topic_score(news, custom_topics)
-
-    assert score == 0
-
-
-def test_get_for_you_news_success(news_service, mock_news_repo, mock_user_news_source_repo, sample_news):
+def test_get_for_you_news_success(news_service, mock_news_repo, mock_user_news_source_repo):
     mock_user_news_source_repo.get_user_preferred_source_ids.return_value = [1, 5]
-    news_service.user_custom_topic_service.get_user_preferred_topics.return_value = [{'name': 'Test'}]
-
-    news1 = MagicMock()
-    news1.id = 1
-    news1.title = "News with Test keyword"
-    news1.description = ""
-    news1.content = ""
-    news1.published_at = datetime.now()
-    news1.time_score = 300
-    news1.source_score = 100
-    news1.is_favorited = False
-
-    news2 = MagicMock()
-    news2.id = 2
-    news2.title = "Another news"
-    news2.description = ""
-    news2.content = ""
-    news2.published_at = datetime.now()
-    news2.time_score = 75
-    news2.source_score = 0
-    news2.is_favorited = True
-
-    mock_news_repo.get_recent_news_with_base_score.return_value = [news2, news1]
+
+    # O repositório já devolve a página ordenada, com os scores calculados no banco
+    news1 = MagicMock(id=1, published_at=datetime.now(), is_favorited=False, total_score=600)
+    news2 = MagicMock(id=2, published_at=datetime.now(), is_favorited=True, total_score=75)
+    mock_news_repo.get_recent_news_with_base_score.return_value = [news1, news2]
+    mock_news_repo.count_recent.return_value = 2
 
     result = news_service.get_for_you_news(user_id=1, page=1, per_page=10)
 
     mock_user_news_source_repo.get_user_preferred_source_ids.assert_called_once_with(1)
-    news_service.user_custom_topic_service.get_user_preferred_topics.assert_called_once_with(1)
-    mock_news_repo.get_recent_news_with_base_score.assert_called_once()
-
-    assert len(result["news"]) == 2
-    assert result["news"][0]["id"] == 1
-    assert result["news"][0]["score"] == 300 + 100 + 200
-
-    assert result["news"][1]["id"] == 2
-    assert result["news"][1]["score"] == 75 + 0 + 0
+    mock_news_repo.get_recent_news_with_base_score.assert_called_once_with(
+        user_id=1, preferred_source_ids=[1, 5], days_limit=15, page=1, per_page=10
+    )
+    mock_news_repo.count_recent.assert_called_once_with(days_limit=15)
 
+    assert [news["id"] for news in result["news"]] == [1, 2]
+    assert [news["score"] for news in result["news"]] == [600, 75]
     assert result["pagination"]["total"] == 2
 
 
 def test_get_for_you_news_pagination(news_service, mock_news_repo, mock_user_news_source_repo):
     mock_user_news_source_repo.get_user_preferred_source_ids.return_value = []
-    news_service.user_custom_topic_service.get_user_preferred_topics.return_value = []
-
-    recent_news_list = []
-    for i in range(15):
-        news = MagicMock(id=i, time_score=100, source_score=0, published_at=datetime.now())
-        recent_news_list.append(news)
-
-    mock_news_repo.get_recent_news_with_base_score.return_value = recent_news_list
+    mock_news_repo.get_recent_news_with_base_score.return_value = [
+        MagicMock(id=i, total_score=100, published_at=datetime.now()) for i in range(5)
+    ]
+    mock_news_repo.count_recent.return_value = 15
 
     result = news_service.get_for_you_news(user_id=1, page=2, per_page=10)
 
+    assert mock_news_repo.get_recent_news_with_base_score.call_args.kwargs["page"] == 2
     assert len(result["news"]) == 5
     assert result["pagination"]["page"] == 2
     assert result["pagination"]["per_page"] == 10
@@ -252,13 +228,20 @@ def test_get_for_you_news_exception_fallback(news_service, mock_news_repo, mock_
 
 
 def test_save_history_success(news_service, mock_user_history_repo):
-    mock_user_history_repo.create.return_value = {"user_id": 1, "news_id": 100}
-    
     with patch.object(news_service, 'user_history_repo', mock_user_history_repo):
-        result = news_service.save_history(user_id=1, news_id=100)
+        news_service.save_history(user_id=1, news_id=100)
 
         mock_user_history_repo.create.assert_called_once_with(1, 100)
-        assert result is not None
+
+
+def test_save_history_uses_buffer_when_enabled(news_service, mock_user_history_repo):
+    history_buffer = MagicMock(enabled=True)
+    news_service.history_buffer = history_buffer
+
+    news_service.save_history(user_id=1, news_id=100)
+
+    history_buffer.add.assert_called_once_with(1, 100)
+    mock_user_history_repo.create.assert_not_called()
 
 
 def test_save_history_raises_not_found(news_service, mock_user_history_repo):
@@ -277,17 +260,15 @@ def test_save_history_generic_exception(news_service, mock_user_history_repo):
             news_service.save_history(user_id=1, news_id=100)
 
 
-def test_get_history_news_success(news_service, mock_user_history_repo, sample_news):
+def test_get_history_news_success(news_service, mock_news_repo, mock_user_history_repo, sample_news):
     history_entity = MagicMock()
     history_entity.read_at = datetime.now()
 
     mock_user_history_repo.get_user_history.return_value = ([(history_entity, sample_news)], 1)
+    mock_news_repo.find_favorited_ids.return_value = set()
 
-    with patch('app.services.news_service.News.from_entity', return_value=sample_news), \
-         patch('app.services.news_service.db.session.query') as mock_query, \
+    with patch('app.services.news_service.NewsView.from_entity', return_value=sample_news), \
          patch.object(news_service, 'user_history_repo', mock_user_history_repo):
-        
-        mock_query.return_value.filter_by.return_value.first.return_value = None
 
         result = news_service.get_history_news(user_id=1, page=1, per_page=10)
 
@@ -301,18 +282,17 @@ def test_get_history_news_success(news_service, mock_user_history_repo, sample_n
     assert result["pagination"]["total"] == 1
 
 
-def test_get_history_news_is_favorited(news_service, mock_user_history_repo, sample_news):
+def test_get_history_news_is_favorited(news_service, mock_news_repo, mock_user_history_repo, sample_news):
     history_entity = MagicMock(read_at=datetime.now())
     mock_user_history_repo.get_user_history.return_value = ([(history_entity, sample_news)], 1)
+    mock_news_repo.find_favorited_ids.return_value = {sample_news.id}
 
-    with patch('app.services.news_service.News.from_entity', return_value=sample_news), \
-         patch('app.services.news_service.db.session.query') as mock_query, \
+    with patch('app.services.news_service.NewsView.from_entity', return_value=sample_news), \
          patch.object(news_service, 'user_history_repo', mock_user_history_repo):
 
-        mock_query.return_value.filter_by.return_value.first.return_value = MagicMock()
-
         result = news_service.get_history_news(user_id=1)
 
+    mock_news_repo.find_favorited_ids.assert_called_once_with(1, [sample_news.id])
     assert len(result["news"]) == 1
     assert result["news"][0]["is_favorited"] is True
 
@@ -326,3 +306,158 @@ def test_get_history_news_exception(news_service, mock_user_history_repo):
         with pytest.raises(Exception, match=f"Erro ao buscar histórico: {db_error}"):
             news_service.get_history_news(user_id=1)
         logging.disable(logging.NOTSET)
+
+
+def test_get_topic_etag_uses_ids_and_favorites(news_service, mock_news_repo):
+    mock_news_repo.find_ids_by_topic.return_value = [3, 2]
+    mock_news_repo.find_favorited_ids.return_value = set()
+
+    anonymous = news_service.get_topic_etag(topic_id=1, page=1, per_page=10, user_id=None)
+    without_favorites = news_service.get_topic_etag(topic_id=1, page=1, per_page=10, user_id=1)
+    mock_news_repo.find_favorited_ids.return_value = {2}
+    with_favorite = news_service.get_topic_etag(topic_id=1, page=1, per_page=10, user_id=1)
+
+    mock_news_repo.find_ids_by_topic.assert_called_with(1, 1, 10)
+    mock_news_repo.find_cards_by_topic.assert_not_called()
+    assert anonymous == without_favorites
+    assert with_favorite != anonymous
+
+
+def test_get_for_you_etag_uses_ranked_ids_not_scores(news_service, mock_news_repo, mock_user_news_source_repo):
+    feed_ranking = MagicMock(enabled=True)
+    feed_ranking.get_page.return_value = [(5, 10.0), (4, 9.5)]
+    news_service.feed_ranking = feed_ranking
+    news_service.user_repo = MagicMock()
+    news_service.user_repo.get_preferences_version.return_value = 3
+    mock_news_repo.find_favorited_ids.return_value = set()
+    mock_news_repo.count_recent.return_value = 2
+
+    etag = news_service.get_for_you_etag(user_id=1, page=1, per_page=2)
+    feed_ranking.get_page.return_value = [(5, 11.0), (4, 10.5)]
+    same_order = news_service.get_for_you_etag(user_id=1, page=1, per_page=2)
+    news_service.user_repo.get_preferences_version.return_value = 4
+    new_preferences = news_service.get_for_you_etag(user_id=1, page=1, per_page=2)
+
+    mock_news_repo.find_cards_by_ids.assert_not_called()
+    mock_news_repo.rank_ids_for_user.assert_not_called()
+    assert etag == same_order
+    assert new_preferences != etag
+
+
+def test_get_for_you_etag_ranks_ids_in_database_without_feed_state(news_service, mock_news_repo, mock_user_news_source_repo):
+    news_service.user_repo = MagicMock()
+    mock_user_news_source_repo.get_user_preferred_source_ids.return_value = [2]
+    mock_news_repo.rank_ids_for_user.return_value = [MagicMock(id=8), MagicMock(id=6)]
+    mock_news_repo.find_favorited_ids.return_value = {6}
+    mock_news_repo.count_recent.return_value = 4
+
+    news_service.get_for_you_etag(user_id=1, page=2, per_page=2)
+
+    mock_news_repo.rank_ids_for_user.assert_called_once_with(1, [2], days_limit=15, limit=2, offset=2)
+    mock_news_repo.find_favorited_ids.assert_called_once_with(1, [8, 6])
+    mock_news_repo.get_recent_news_with_base_score.assert_not_called()
+
+
+def test_get_favorite_etag_uses_ids_and_total(news_service, mock_news_repo):
+    mock_news_repo.find_favorite_ids.return_value = [3, 2]
+    mock_news_repo.count_favorites_by_user.return_value = 2
+
+    etag = news_service.get_favorite_etag(user_id=1)
+    mock_news_repo.find_favorite_ids.return_value = [2]
+    mock_news_repo.count_favorites_by_user.return_value = 1
+
+    mock_news_repo.find_favorite_ids.assert_called_with(1, 1, 20)
+    mock_news_repo.list_favorite_cards.assert_not_called()
+    assert news_service.get_favorite_etag(user_id=1) != etag
+
+
+def test_get_history_etag_changes_with_read_at(news_service, mock_news_repo, mock_user_history_repo):
+    mock_user_history_repo.get_user_history_ids.return_value = [(3, datetime(2026, 1, 2, 10, 0))]
+    mock_user_history_repo.count_user_history.return_value = 1
+    mock_news_repo.find_favorited_ids.return_value = set()
+
+    etag = news_service.get_history_etag(user_id=1, page=1, per_page=10)
+    mock_user_history_repo.get_user_history_ids.return_value = [(3, datetime(2026, 1, 2, 11, 0))]
+
+    mock_user_history_repo.get_user_history_ids.assert_called_with(1, 1, 10)
+    mock_user_history_repo.get_user_history.assert_not_called()
+    assert news_service.get_history_etag(user_id=1, page=1, per_page=10) != etag
+
+
+def test_get_search_etag_reuses_search_in_request(app, news_service, mock_news_repo):
+    search_repo = MagicMock()
+    search_repo.search.return_value = [(7, 0.5)]
+    mock_news_repo.find_cards_by_ids.return_value = [MagicMock(id=7, published_at=None, created_at=None)]
+    mock_news_repo.find_favorited_ids.return_value = set()
+    news_service.search_repo = search_repo
+
+    with app.test_request_context('/news/search?q=eleições'):
+        etag = news_service.get_search_etag("eleições", user_id=1)
+        result = news_service.search_news("eleições", user_id=1)
+
+    search_repo.search.assert_called_once()
+    assert etag is not None
+    assert [news["id"] for news in result["news"]] == [7]
+    assert news_service.get_search_etag("   ") is None
+
+
+def test_get_news_etag_not_found(news_service, mock_news_repo):
+    mock_news_repo.exists.return_value = False
+
+    assert news_service.get_news_etag(user_id=1, news_id=999) is None
+    mock_news_repo.find_by_id.assert_not_called()
+
+
+def test_search_news_pages_by_cursor(news_service, mock_news_repo):
+    from app.utils import news_search
+
+    def card(news_id):
+        return MagicMock(id=news_id, published_at=None, created_at=None)
+
+    search_repo = MagicMock()
+    search_repo.search.return_value = [(7, 0.5), (3, 0.25), (9, 0.25)]
+    mock_news_repo.find_cards_by_ids.return_value = [card(3), card(7)]
+    news_service.search_repo = search_repo
+
+    result = news_service.search_news("  eleições   2026 ", language="pt", per_page=2, user_id=1)
+
+    search_repo.search.assert_called_once_with("eleições 2026", "pt", limit=3, after=None)
+    mock_news_repo.find_cards_by_ids.assert_called_once_with([7, 3], 1)
+    assert [(news["id"], news["score"]) for news in result["news"]] == [(7, 0.5), (3, 0.25)]
+    assert news_search.decode_cursor(result["pagination"]["next_cursor"]) == (0.25, 3)
+
+    search_repo.search.return_value = [(9, 0.25)]
+    mock_news_repo.find_cards_by_ids.return_value = [card(9)]
+    last = news_service.search_news("eleições", cursor=result["pagination"]["next_cursor"], per_page=2)
+
+    assert search_repo.search.call_args.kwargs["after"] == (0.25, 3)
+    assert last["pagination"]["next_cursor"] is None
+
+
+@pytest.mark.parametrize("kwargs, field", [
+    ({"query": "   "}, "q"),
+    ({"query": "x" * 201}, "q"),
+    ({"query": "eleições", "language": "es"}, "lang"),
+    ({"query": "eleições", "cursor": "inválido"}, "cursor"),
+])
+def test_search_news_validates_parameters(news_service, kwargs, field):
+    news_service.search_repo = MagicMock()
+
+    with pytest.raises(SearchValidationError) as error:
+        news_service.search_news(**kwargs)
+
+    assert error.value.field == field
+    news_service.search_repo.search.assert_not_called()
+
+
+def test_search_news_uses_index_without_postgresql(news_service, mock_news_repo):
+    search_repo, search_index = MagicMock(available=False), MagicMock()
+    search_index.search.return_value = []
+    news_service.search_repo, news_service.search_index = search_repo, search_index
+    mock_news_repo.find_cards_by_ids.return_value = []
+
+    result = news_service.search_news("eleições")
+
+    search_index.search.assert_called_once_with("eleições", None, limit=21, after=None)
+    search_repo.search.assert_not_called()
+    assert result["news"] == []
@@ -1,10 +1,13 @@
 import pytest
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from unittest.mock import patch
 from app.repositories.news_source_repository import NewsSourceRepository
 from app.models.news_source import NewsSource
 from app.entities.user_entity import UserEntity
+from app.entities.news_entity import NewsEntity
 from app.entities.news_source_entity import NewsSourceEntity
+from app.models.exceptions import NewsSourceNotFoundError, NewsSourceValidationError
 from app.entities.user_preferred_news_sources_entity import UserPreferredNewsSourceEntity
 
 @pytest.fixture
@@ -145,4 +148,52 @@ def test_sqlalchemy_error_handling_get(news_source_repo):
 
     with patch.object(news_source_repo.session, 'get', side_effect=SQLAlchemyError("DB Error")):
         with pytest.raises(SQLAlchemyError):
-            news_source_repo.find_by_id(1)
\ No newline at end of file
+            news_source_repo.find_by_id(1)
+def test_bulk_create_ignore_conflicts_returns_only_inserted(news_source_repo):
+    news_source_repo.create(NewsSource(name="Existing", url="http://existing.com"))
+
+    created = news_source_repo.bulk_create_ignore_conflicts([
+        NewsSource(name="Existing", url="http://other-url.com"),
+        NewsSource(name="New One", url="http://new-one.com"),
+    ])
+
+    assert [s.name for s in created] == ["New One"]
+    assert created[0].id is not None
+    assert len(news_source_repo.list_all()) == 2
+
+def test_bulk_create_ignore_conflicts_empty(news_source_repo):
+    assert news_source_repo.bulk_create_ignore_conflicts([]) == []
+
+def test_update_quality_shifts_base_score_of_source_news(news_source_repo, db):
+    from datetime import datetime
+    from app.models.news import News
+    from app.models.topic import Topic
+    from app.repositories.news_repository import NewsRepository
+    from app.repositories.topic_repository import TopicRepository
+    from app.utils import news_ranking
+
+    topic = TopicRepository(db.session).create(Topic(name="Technology", state=1))
+    source = news_source_repo.create(NewsSource(name="Fonte", url="http://fonte.com"))
+    other = news_source_repo.create(NewsSource(name="Outra", url="http://outra.com"))
+    published_at = datetime(2025, 10, 21, 10, 0)
+    NewsRepository(db.session).bulk_create_ignore_conflicts([
+        News(title=f"Notícia {i}", url=f"http://fonte.com/{i}", content="texto", html="<p>texto</p>",
+             published_at=published_at, source_id=source_id, topic_id=topic.id)
+        for i, source_id in enumerate([source.id, source.id, other.id])
+    ])
+
+    assert news_source_repo.update_quality(source.id, 2.0) == 2
+
+    scores = dict(db.session.execute(select(NewsEntity.url, NewsEntity.base_score)).all())
+    assert db.session.get(NewsSourceEntity, source.id).quality == 2.0
+    assert scores["http://fonte.com/0"] == pytest.approx(news_ranking.base_score(published_at, 2.0))
+    assert scores["http://fonte.com/2"] == pytest.approx(news_ranking.base_score(published_at, 1.0))
+    assert news_source_repo.update_quality(source.id, 2.0) == 0
+
+def test_update_quality_validates_source_and_value(news_source_repo):
+    source = news_source_repo.create(NewsSource(name="Fonte", url="http://fonte.com"))
+
+    with pytest.raises(NewsSourceValidationError):
+        news_source_repo.update_quality(source.id, 0)
+    with pytest.raises(NewsSourceNotFoundError):
+        news_source_repo.update_quality(999, 1.5)
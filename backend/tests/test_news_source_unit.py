@@ -4,6 +4,7 @@ from app.services.news_source_service import NewsSourceService
 from app.models.news_source import NewsSource
 from app.models.exceptions import NewsSourceValidationError, NewsSourceNotFoundError, NewsSourceAlreadyAttachedError
 from sqlalchemy.exc import IntegrityError
+from app.utils.events import preferences_changed
 
 
 @pytest.fixture
@@ -97,6 +98,19 @@ def test_detach_source_from_user(news_source_service, mock_user_news_source_repo
 
     mock_user_news_source_repository.detach.assert_called_once_with(user_id, source_id)
 
+def test_attach_and_detach_send_preferences_changed(news_source_service, mock_news_source_repository, mock_user_news_source_repository):
+    received = []
+    mock_news_source_repository.find_by_id.return_value = NewsSource(id=10, name="Test", url="http://test.com")
+
+    with preferences_changed.connected_to(lambda user_id, **kwargs: received.append(user_id)):
+        news_source_service.attach_source_to_user(1, 10)
+        news_source_service.detach_source_from_user(1, 10)
+        mock_user_news_source_repository.attach.side_effect = IntegrityError(None, None, None)
+        with pytest.raises(IntegrityError):
+            news_source_service.attach_source_to_user(2, 10)
+
+    assert received == [1, 1]
+
 def test_news_source_model_validation():
     with pytest.raises(NewsSourceValidationError, match="Erro de validação em 'name': não pode ser vazio."):
         NewsSource(name="", url="http://valid.com")
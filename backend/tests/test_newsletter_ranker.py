@@ -0,0 +1,134 @@
+import pytest
+from collections import namedtuple
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from app.services.newsletter_ranker import NewsletterRanker
+
+Article = namedtuple("Article", "id title description source_id base_score")
+
+
+@pytest.fixture
+def repos():
+    return {"news": MagicMock(), "sources": MagicMock(), "topics": MagicMock()}
+
+
+@pytest.fixture
+def ranker(repos):
+    return NewsletterRanker(
+        news_repo=repos["news"],
+        user_news_source_repo=repos["sources"],
+        custom_topic_repo=repos["topics"],
+    )
+
+
+@pytest.fixture
+def articles():
+    # Ordem de desempate do repositório: mais recente primeiro
+    return [
+        Article(10, "Eleições 2026", None, 1, 100.0),
+        Article(11, "Novo chip de IA", "Mercado de Tecnologia", 2, 99.5),
+        Article(12, "Futebol", "Rodada do fim de semana", 1, 99.0),
+        Article(13, "Mesma nota", None, 3, 99.0),
+    ]
+
+
+def test_rank_ids_applies_source_and_topic_boosts(ranker, repos, articles):
+    repos["sources"].get_preferred_source_ids_by_users.return_value = {2: [2]}
+    repos["topics"].list_topic_names_by_users.return_value = {3: ["Tecnologia", "ia"]}
+
+    top = ranker.rank_ids([1, 2, 3], articles, per_user=2)
+
+    assert top[1] == [10, 11]
+    # Fonte preferida: 99.5 + 0.5 empata com 100 e a notícia mais recente vence
+    assert top[2] == [10, 11]
+    # Dois custom topics no título/descrição: 99.5 + 2.0
+    assert top[3] == [11, 10]
+
+
+def test_rank_ids_breaks_ties_by_repository_order(ranker, repos, articles):
+    repos["sources"].get_preferred_source_ids_by_users.return_value = {}
+    repos["topics"].list_topic_names_by_users.return_value = {}
+
+    top = ranker.rank_ids([1], articles, per_user=10)
+
+    assert top[1] == [10, 11, 12, 13]
+
+
+def test_rank_ids_processes_users_in_chunks(ranker, repos, articles):
+    ranker.USER_CHUNK_SIZE = 1
+    repos["sources"].get_preferred_source_ids_by_users.side_effect = lambda ids: {3: [3]} if ids == [3] else {}
+    repos["topics"].list_topic_names_by_users.return_value = {}
+
+    top = ranker.rank_ids([1, 2, 3], articles, per_user=1)
+
+    assert top == {1: [10], 2: [10], 3: [10]}
+    assert repos["sources"].get_preferred_source_ids_by_users.call_count == 3
+
+
+def test_rank_for_users_serializes_each_chosen_article_once(ranker, repos, articles):
+    repos["news"].list_recent_for_ranking.return_value = articles
+    repos["sources"].get_preferred_source_ids_by_users.return_value = {}
+    repos["topics"].list_topic_names_by_users.return_value = {}
+    views = {
+        news_id: MagicMock(title=f"Notícia {news_id}", url=f"https://fonte.com/{news_id}", published_at=None)
+        for news_id in (10, 11)
+    }
+    repos["news"].find_for_email_by_ids.return_value = views
+
+    result = ranker.rank_for_users([1, 2], per_user=2)
+
+    assert sorted(repos["news"].find_for_email_by_ids.call_args.args[0]) == [10, 11]
+    assert [item["title"] for item in result[1]] == ["Notícia 10", "Notícia 11"]
+    assert result[1] == result[2]
+    assert result[1][0] is not result[2][0]
+
+
+def test_rank_for_users_without_articles(ranker, repos):
+    repos["news"].list_recent_for_ranking.return_value = []
+
+    assert ranker.rank_for_users([1, 2]) == {1: [], 2: []}
+    repos["news"].find_for_email_by_ids.assert_not_called()
+
+
+def test_batch_ranking_matches_per_user_feed(db):
+    from app.entities.custom_topic_entity import CustomTopicEntity
+    from app.entities.news_source_entity import NewsSourceEntity
+    from app.entities.topic_entity import TopicEntity
+    from app.entities.user_entity import UserEntity
+    from app.entities.user_preferred_custom_topics import UserPreferredCustomTopicEntity
+    from app.entities.user_preferred_news_sources_entity import UserPreferredNewsSourceEntity
+    from app.models.news import News
+    from app.repositories.news_repository import NewsRepository
+    from app.services.news_service import NewsService
+
+    sources = [NewsSourceEntity(name=f"Fonte {i}", url=f"https://fonte{i}.com") for i in range(3)]
+    users = [UserEntity(full_name=f"Leitor {i}", email=f"leitor{i}@exemplo.com") for i in range(3)]
+    topic = CustomTopicEntity(name="Python")
+    news_topic = TopicEntity(name="tecnologia")
+    db.session.add_all(sources + users + [topic, news_topic])
+    db.session.commit()
+
+    now = datetime.now()
+    news_repo = NewsRepository(db.session)
+    news_repo.bulk_create_ignore_conflicts([
+        News(
+            title=f"Notícia {i}" + (" sobre Python" if i % 4 == 0 else ""),
+            url=f"https://fonte.com/{i}", content=f"Texto {i}", html=f"<p>Texto {i}</p>",
+            published_at=now - timedelta(hours=3 * i), source_id=sources[i % 3].id, topic_id=news_topic.id,
+        )
+        for i in range(30)
+    ])
+    db.session.add_all([
+        UserPreferredNewsSourceEntity(user_id=users[1].id, source_id=sources[2].id),
+        UserPreferredCustomTopicEntity(user_id=users[2].id, topic_id=topic.id),
+    ])
+    db.session.commit()
+
+    batch = NewsletterRanker().rank_for_users([user.id for user in users], per_user=5)
+
+    news_service = NewsService(news_repo=news_repo)
+    for user in users:
+        assert batch[user.id] == news_service.get_news_to_email(user.id, page=1, per_page=5)
+    assert batch[users[0].id] != batch[users[2].id]
+    assert batch[users[2].id][0]["title"].endswith("sobre Python")
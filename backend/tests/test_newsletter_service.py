@@ -105,6 +105,35 @@ def test_send_newsletter_no_news_found(mock_dependencies, mock_user):
     mock_dependencies["news_service"].get_news_to_email.assert_called_once_with(mock_user.id, page=1, per_page=5)
 
 
+def test_send_newsletter_with_pre_ranked_news(mock_dependencies, mock_user, mock_news_data, mock_ai_content):
+    # Arrange
+    mock_dependencies["ai_service"].generate_content.return_value = json.dumps(mock_ai_content)
+    mock_dependencies["mail_service"].sendemail.return_value = True
+    service = NewsletterService(
+        news_service=mock_dependencies["news_service"],
+        ai_service=mock_dependencies["ai_service"],
+        mail_service=mock_dependencies["mail_service"],
+    )
+
+    # Act
+    result = service.send_newsletter_to_user(mock_user, news_data=mock_news_data)
+
+    # Assert
+    assert result["success"] is True
+    mock_dependencies["news_service"].get_news_to_email.assert_not_called()
+
+
+def test_get_news_for_users_uses_batch_ranker(mock_dependencies, mock_news_data):
+    ranker = MagicMock()
+    ranker.rank_for_users.return_value = {1: mock_news_data}
+    service = NewsletterService(news_service=mock_dependencies["news_service"], newsletter_ranker=ranker)
+
+    result = service.get_news_for_users([1, 2])
+
+    ranker.rank_for_users.assert_called_once_with([1, 2], per_user=5)
+    assert result == {1: mock_news_data}
+
+
 def test_send_newsletter_email_sending_fails(mock_dependencies, mock_user, mock_news_data, mock_ai_content):
     # Arrange
     mock_dependencies["news_service"].get_news_to_email.return_value = mock_news_data
@@ -0,0 +1,62 @@
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from app.services.read_history_buffer import ReadHistoryBuffer, create_read_history_buffer
+
+
+def _buffer(**kwargs):
+    repo = MagicMock()
+    repo.upsert_many.side_effect = lambda reads: len(reads)
+    return ReadHistoryBuffer(repo_factory=lambda: repo, **kwargs), repo
+
+
+def test_flushes_on_size_and_merges_reads_of_the_same_day():
+    buffer, repo = _buffer(max_size=3, flush_interval=60)
+    now = datetime(2026, 10, 19, 12, 0)
+
+    buffer.add(1, 10, now)
+    buffer.add(1, 10, now + timedelta(minutes=5))
+    buffer.add(1, 10, now - timedelta(minutes=5))
+    buffer.add(2, 10, now)
+    repo.upsert_many.assert_not_called()
+
+    buffer.add(1, 10, now - timedelta(days=1))
+
+    repo.upsert_many.assert_called_once_with([
+        (1, 10, now + timedelta(minutes=5)), (2, 10, now), (1, 10, now - timedelta(days=1)),
+    ])
+    assert len(buffer) == 0
+
+
+def test_flushes_when_the_oldest_read_expires():
+    buffer, repo = _buffer(max_size=100, flush_interval=0)
+
+    buffer.add(1, 10)
+
+    assert repo.upsert_many.call_count == 1
+    assert buffer.flush() == 0
+
+
+def test_failed_flush_is_logged_and_dropped():
+    buffer, repo = _buffer(max_size=100, flush_interval=60)
+    repo.upsert_many.side_effect = Exception("DB Error")
+    buffer.add(1, 10)
+
+    assert buffer.flush() == 0
+    assert len(buffer) == 0
+
+
+def test_background_thread_flushes_inside_app_context(app):
+    repo = MagicMock()
+    buffer = ReadHistoryBuffer(repo_factory=lambda: repo, max_size=100, flush_interval=0.01, app=app)
+    buffer.add(1, 10)
+    buffer.close()
+
+    assert repo.upsert_many.called
+    assert len(buffer) == 0
+
+
+def test_create_reads_config():
+    app = MagicMock(config={"READ_HISTORY_BUFFER_SIZE": 0})
+
+    assert create_read_history_buffer(app).enabled is False
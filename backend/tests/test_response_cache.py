@@ -0,0 +1,97 @@
+import sys
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from app.utils.response_cache import ResponseCache, create_response_cache
+
+
+class TestResponseCache:
+    """Testes do cache de respostas (LRU + TTL + versão do conteúdo)."""
+
+    def test_returns_cached_value_until_expired(self):
+        cache = ResponseCache(max_entries=10, ttl=60)
+        builder = MagicMock(side_effect=[{"v": 1}, {"v": 2}])
+
+        with patch("app.utils.response_cache.time.monotonic", return_value=100.0):
+            assert cache.get_or_set("k", builder) == {"v": 1}
+            assert cache.get_or_set("k", builder) == {"v": 1}
+        with patch("app.utils.response_cache.time.monotonic", return_value=161.0):
+            assert cache.get_or_set("k", builder) == {"v": 2}
+
+        assert builder.call_count == 2
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_evicts_least_recently_used(self):
+        cache = ResponseCache(max_entries=2, ttl=60)
+        cache.get_or_set("a", lambda: "a")
+        cache.get_or_set("b", lambda: "b")
+        cache.get_or_set("a", lambda: "a2")
+        cache.get_or_set("c", lambda: "c")
+
+        assert cache.get_or_set("a", lambda: "novo") == "a"
+        assert cache.get_or_set("b", lambda: "novo") == "novo"
+
+    def test_version_change_invalidates_entries(self):
+        versions = [datetime(2025, 10, 21, 6), datetime(2025, 10, 21, 12)]
+        cache = ResponseCache(max_entries=10, ttl=3600, version_loader=lambda: versions[0], version_ttl=0)
+
+        assert cache.get_or_set("k", lambda: "antes") == "antes"
+        assert cache.get_or_set("k", lambda: "depois") == "antes"
+        versions.pop(0)
+        assert cache.get_or_set("k", lambda: "depois") == "depois"
+
+    def test_version_is_reused_within_version_ttl(self):
+        loader = MagicMock(return_value=None)
+        cache = ResponseCache(max_entries=10, ttl=60, version_loader=loader, version_ttl=30)
+
+        with patch("app.utils.response_cache.time.monotonic", return_value=100.0):
+            cache.get_or_set("a", lambda: 1)
+            cache.get_or_set("b", lambda: 2)
+
+        loader.assert_called_once()
+
+    def test_disabled_with_zero_ttl(self):
+        cache = ResponseCache(max_entries=10, ttl=0)
+        builder = MagicMock(return_value="x")
+
+        cache.get_or_set("k", builder)
+        cache.get_or_set("k", builder)
+
+        assert builder.call_count == 2
+
+    def test_exceptions_are_not_cached(self):
+        cache = ResponseCache(max_entries=10, ttl=60)
+        builder = MagicMock(side_effect=[ValueError("erro"), "ok"])
+
+        try:
+            cache.get_or_set("k", builder)
+        except ValueError:
+            pass
+
+        assert cache.get_or_set("k", builder) == "ok"
+
+    def test_shared_backend_is_read_before_building(self):
+        backend = MagicMock()
+        backend.get.return_value = {"v": "compartilhado"}
+        cache = ResponseCache(max_entries=10, ttl=60, backend=backend)
+        builder = MagicMock()
+
+        assert cache.get_or_set("k", builder) == {"v": "compartilhado"}
+        builder.assert_not_called()
+        backend.set.assert_not_called()
+
+    def test_shared_backend_receives_built_value(self):
+        backend = MagicMock()
+        backend.get.return_value = None
+        cache = ResponseCache(max_entries=10, ttl=60, backend=backend)
+
+        cache.get_or_set("k", lambda: {"v": 1})
+
+        backend.set.assert_called_once_with("k:v=0", {"v": 1}, 60)
+
+    def test_create_falls_back_to_memory_without_redis(self):
+        with patch.dict(sys.modules, {"redis": None}):
+            cache = create_response_cache({"RESPONSE_CACHE_URL": "redis://localhost:6379/0", "RESPONSE_CACHE_TTL": 10})
+
+        assert cache.backend is None
+        assert cache.ttl == 10
@@ -0,0 +1,89 @@
+import gzip
+
+import pytest
+from flask import Flask, jsonify, make_response
+
+from app.utils import response_compression
+from app.utils.response_compression import init_response_compression
+
+LARGE = {"html": "<p>conteúdo da notícia</p>" * 200}
+
+
+@pytest.fixture
+def compression_client():
+    app = Flask(__name__)
+    app.config["RESPONSE_COMPRESSION_MIN_SIZE"] = 1024
+    init_response_compression(app)
+
+    @app.route("/large")
+    def large():
+        response = jsonify(LARGE)
+        response.set_etag("abc")
+        return response
+
+    @app.route("/small")
+    def small():
+        return jsonify({"ok": True})
+
+    @app.route("/not-modified")
+    def not_modified():
+        response = make_response("", 304)
+        response.set_etag("abc")
+        return response
+
+    return app.test_client()
+
+
+def test_gzip_when_accepted(compression_client):
+    response = compression_client.get("/large", headers={"Accept-Encoding": "gzip, deflate"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert response.headers["ETag"] == 'W/"abc"'
+    assert int(response.headers["Content-Length"]) == len(response.data)
+    assert gzip.decompress(response.data) == jsonify_bytes(compression_client)
+
+
+def test_no_compression_without_accept_encoding(compression_client):
+    response = compression_client.get("/large")
+
+    assert "Content-Encoding" not in response.headers
+    assert response.headers["ETag"] == '"abc"'
+    assert "Accept-Encoding" in response.headers["Vary"]
+
+
+def test_small_responses_are_not_compressed(compression_client):
+    response = compression_client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+    assert "Content-Encoding" not in response.headers
+
+
+def test_brotli_preferred_when_installed(compression_client, monkeypatch):
+    fake_brotli = type("FakeBrotli", (), {"compress": staticmethod(lambda data, quality: b"br:" + data[:10])})
+    monkeypatch.setattr(response_compression, "brotli", fake_brotli)
+
+    response = compression_client.get("/large", headers={"Accept-Encoding": "gzip, br"})
+
+    assert response.headers["Content-Encoding"] == "br"
+    assert response.data.startswith(b"br:")
+
+
+def test_gzip_used_when_brotli_missing(compression_client, monkeypatch):
+    monkeypatch.setattr(response_compression, "brotli", None)
+
+    response = compression_client.get("/large", headers={"Accept-Encoding": "br, gzip;q=0.5"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+
+
+def test_not_modified_gets_weak_etag(compression_client):
+    response = compression_client.get("/not-modified", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == 'W/"abc"'
+    assert "Content-Encoding" not in response.headers
+
+
+def jsonify_bytes(client):
+    with client.application.app_context():
+        return jsonify(LARGE).get_data()
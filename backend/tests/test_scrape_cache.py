@@ -0,0 +1,183 @@
+import os
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import patch, Mock, MagicMock
+
+from app.utils.scrape_cache import ScrapeCache
+from app.services.scrape_service import ScrapeService
+
+
+@pytest.fixture
+def scrape_cache(tmp_path):
+    return ScrapeCache(str(tmp_path / "scrape_cache"))
+
+
+@pytest.fixture
+def scrape_service(scrape_cache):
+    service = ScrapeService()
+    blacklist = MagicMock()
+    blacklist.is_blocked.return_value = False
+    service.set_blacklist(blacklist)
+    service.set_scrape_cache(scrape_cache)
+    return service
+
+
+class TestScrapeCache:
+    """Testes para o cache em disco de resultados de scraping."""
+
+    def test_get_missing_entry_returns_none(self, scrape_cache):
+        assert scrape_cache.get("https://example.com/a") is None
+
+    def test_store_and_get_uses_normalized_url(self, scrape_cache):
+        scrape_cache.store(
+            url="https://www.example.com/a/?utm_source=x",
+            outcome=ScrapeCache.OUTCOME_SUCCESS,
+            raw_html="<html></html>",
+            etag='"abc"',
+            result={"text": "ok"}
+        )
+
+        entry = scrape_cache.get("https://example.com/a")
+
+        assert entry["outcome"] == ScrapeCache.OUTCOME_SUCCESS
+        assert entry["etag"] == '"abc"'
+        assert entry["result"] == {"text": "ok"}
+
+    def test_corrupted_entry_is_ignored(self, scrape_cache):
+        scrape_cache.store(url="https://example.com/a", outcome=ScrapeCache.OUTCOME_REJECTED)
+        path = scrape_cache._entry_path("https://example.com/a")
+        with open(path, "wb") as f:
+            f.write(b"not gzip")
+
+        assert scrape_cache.get("https://example.com/a") is None
+
+    def test_is_negative_fresh(self, scrape_cache):
+        now = datetime.now()
+        fresh = {"outcome": "rejected", "checked_at": now.isoformat()}
+        expired = {"outcome": "failed", "checked_at": (now - timedelta(days=4)).isoformat()}
+        success = {"outcome": "success", "checked_at": now.isoformat()}
+
+        assert scrape_cache.is_negative_fresh(fresh) is True
+        assert scrape_cache.is_negative_fresh(expired) is False
+        assert scrape_cache.is_negative_fresh(success) is False
+        assert scrape_cache.is_negative_fresh(None) is False
+
+    def test_get_conditional_headers(self, scrape_cache):
+        entry = {"etag": '"v1"', "last_modified": "Wed, 21 Oct 2025 07:28:00 GMT"}
+
+        headers = scrape_cache.get_conditional_headers(entry)
+
+        assert headers == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Wed, 21 Oct 2025 07:28:00 GMT"
+        }
+        assert scrape_cache.get_conditional_headers(None) == {}
+
+    def test_touch_updates_checked_at(self, scrape_cache):
+        scrape_cache.store(url="https://example.com/a", outcome=ScrapeCache.OUTCOME_REJECTED)
+        entry = scrape_cache.get("https://example.com/a")
+        entry["checked_at"] = (datetime.now() - timedelta(days=10)).isoformat()
+
+        scrape_cache.touch("https://example.com/a", entry)
+
+        assert scrape_cache.is_negative_fresh(scrape_cache.get("https://example.com/a")) is True
+
+    def test_prune_removes_old_entries(self, scrape_cache):
+        scrape_cache.store(url="https://example.com/old", outcome=ScrapeCache.OUTCOME_REJECTED)
+        scrape_cache.store(url="https://example.com/new", outcome=ScrapeCache.OUTCOME_REJECTED)
+        old_path = scrape_cache._entry_path("https://example.com/old")
+        old_time = (datetime.now() - timedelta(days=31)).timestamp()
+        os.utime(old_path, (old_time, old_time))
+
+        removed = scrape_cache.prune()
+
+        assert removed == 1
+        assert scrape_cache.get("https://example.com/old") is None
+        assert scrape_cache.get("https://example.com/new") is not None
+
+    def test_prune_without_directory(self, scrape_cache):
+        assert scrape_cache.prune() == 0
+
+
+class TestScrapeServiceWithCache:
+    """Testes da integração do ScrapeService com o cache de scraping."""
+
+    def test_negative_entry_skips_request(self, scrape_service, scrape_cache):
+        scrape_cache.store(url="https://example.com/a", outcome=ScrapeCache.OUTCOME_REJECTED, reason="Baixa qualidade")
+
+        with patch("app.services.scrape_service.requests.get") as mock_get:
+            result = scrape_service.scrape_article_content("https://example.com/a")
+
+        assert result is None
+        mock_get.assert_not_called()
+
+    def test_not_modified_returns_cached_result_without_parse(self, scrape_service, scrape_cache):
+        scrape_cache.store(
+            url="https://example.com/a",
+            outcome=ScrapeCache.OUTCOME_SUCCESS,
+            raw_html="<html></html>",
+            etag='"v1"',
+            result={"text": "conteúdo", "html": "<p>conteúdo</p>"}
+        )
+
+        with patch("app.services.scrape_service.requests.get", return_value=Mock(status_code=304, headers={})) as mock_get, \
+             patch.object(scrape_service, "_parse_article") as mock_parse:
+            result = scrape_service.scrape_article_content("https://example.com/a")
+
+        assert result == {"text": "conteúdo", "html": "<p>conteúdo</p>"}
+        assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+        mock_parse.assert_not_called()
+
+    def test_not_modified_rejected_entry_returns_none(self, scrape_service, scrape_cache):
+        scrape_cache.store(
+            url="https://example.com/a",
+            outcome=ScrapeCache.OUTCOME_REJECTED,
+            raw_html="<html></html>",
+            last_modified="Wed, 21 Oct 2025 07:28:00 GMT"
+        )
+        entry = scrape_cache.get("https://example.com/a")
+        entry["checked_at"] = (datetime.now() - timedelta(days=5)).isoformat()
+
+        with patch.object(scrape_cache, "get", return_value=entry), \
+             patch("app.services.scrape_service.requests.get", return_value=Mock(status_code=304, headers={})) as mock_get:
+            result = scrape_service.scrape_article_content("https://example.com/a")
+
+        assert result is None
+        assert "If-Modified-Since" in mock_get.call_args.kwargs["headers"]
+
+    def test_full_fetch_stores_outcome_and_validators(self, scrape_service, scrape_cache):
+        response = Mock(status_code=200, headers={"ETag": '"v2"', "Last-Modified": "Thu, 22 Oct 2025 07:28:00 GMT"})
+        parsed = {"text": "conteúdo", "html": "<p>conteúdo</p>"}
+
+        with patch("app.services.scrape_service.requests.get", return_value=response), \
+             patch("app.services.scrape_service.network.get_html_status", return_value=("<html>page</html>", 200, [])), \
+             patch.object(scrape_service, "_parse_article", return_value=(parsed, None)):
+            result = scrape_service.scrape_article_content("https://example.com/a")
+
+        entry = scrape_cache.get("https://example.com/a")
+        assert result == parsed
+        assert entry["outcome"] == ScrapeCache.OUTCOME_SUCCESS
+        assert entry["raw_html"] == "<html>page</html>"
+        assert entry["etag"] == '"v2"'
+        assert entry["last_modified"] == "Thu, 22 Oct 2025 07:28:00 GMT"
+
+    def test_rejected_article_is_cached_as_negative(self, scrape_service, scrape_cache):
+        with patch("app.services.scrape_service.requests.get", return_value=Mock(status_code=200, headers={})), \
+             patch("app.services.scrape_service.network.get_html_status", return_value=("<html>page</html>", 200, [])), \
+             patch.object(scrape_service, "_parse_article", return_value=(None, "Baixa qualidade (30)")):
+            result = scrape_service.scrape_article_content("https://example.com/a")
+
+        entry = scrape_cache.get("https://example.com/a")
+        assert result is None
+        assert entry["outcome"] == ScrapeCache.OUTCOME_REJECTED
+        assert entry["reason"] == "Baixa qualidade (30)"
+
+    def test_http_404_is_cached_as_failed(self, scrape_service, scrape_cache):
+        with patch("app.services.scrape_service.requests.get", return_value=Mock(status_code=404, headers={})), \
+             patch("app.services.scrape_service.network.get_html_status", return_value=("not found", 404, [])):
+            result = scrape_service.scrape_article_content("https://example.com/a")
+
+        entry = scrape_cache.get("https://example.com/a")
+        assert result is None
+        assert entry["outcome"] == ScrapeCache.OUTCOME_FAILED
+        assert entry["reason"] == "HTTP 404"
@@ -0,0 +1,180 @@
+import json
+import pytest
+from unittest.mock import MagicMock
+
+from app.repositories.scraping_blacklist_repository import ScrapingBlacklistRepository
+from app.utils.scraping_blacklist import ScrapingBlacklist
+
+
+@pytest.fixture
+def repository(db):
+    return ScrapingBlacklistRepository(db.session)
+
+
+@pytest.fixture
+def blacklist(repository):
+    blacklist = ScrapingBlacklist(repository, flush_threshold=10)
+    blacklist.load()
+    return blacklist
+
+
+class TestScrapingBlacklist:
+    """Testes para a blacklist de scraping persistida no banco."""
+
+    def test_add_is_buffered_until_flush(self, blacklist, repository):
+        blacklist.add_to_blacklist("https://www.example.com/a", "403 Forbidden", "Forbidden")
+
+        assert blacklist.is_blocked("https://example.com/b") is True
+        assert repository.find_all() == {}
+
+        blacklist.flush()
+
+        saved = repository.find_all()
+        assert saved["example.com"]["error_count"] == 1
+        assert saved["example.com"]["error_type"] == "403 Forbidden"
+
+    def test_flush_threshold_triggers_write(self, repository):
+        blacklist = ScrapingBlacklist(repository, flush_threshold=2)
+
+        blacklist.add_to_blacklist("https://a.com/x", "SSL Error", "erro")
+        assert repository.find_all() == {}
+        blacklist.add_to_blacklist("https://b.com/x", "SSL Error", "erro")
+
+        assert set(repository.find_all()) == {"a.com", "b.com"}
+
+    def test_upsert_accumulates_error_count_across_instances(self, repository):
+        worker_a = ScrapingBlacklist(repository)
+        worker_b = ScrapingBlacklist(repository)
+
+        worker_a.add_to_blacklist("https://example.com/1", "403 Forbidden", "primeiro")
+        worker_a.add_to_blacklist("https://example.com/2", "403 Forbidden", "segundo")
+        worker_b.add_to_blacklist("https://example.com/3", "Timeout", "terceiro")
+        worker_a.flush()
+        worker_b.flush()
+
+        saved = repository.find_all()["example.com"]
+        assert saved["error_count"] == 3
+        assert saved["error_type"] == "403 Forbidden"
+        assert saved["last_error_type"] == "Timeout"
+        assert saved["last_url"] == "https://example.com/3"
+
+    def test_subdomain_is_covered_by_parent_domain(self, blacklist):
+        blacklist.add_to_blacklist("https://example.com/a", "403 Forbidden", "Forbidden", reason="Bloqueio")
+
+        assert blacklist.is_blocked("https://sub.example.com/a") is True
+        assert blacklist.is_blocked("https://deep.sub.EXAMPLE.com/a") is True
+        assert blacklist.is_blocked("https://notexample.com/a") is False
+        assert blacklist.get_blocked_info("https://sub.example.com/a")["reason"] == "Bloqueio"
+
+    def test_top_level_suffix_does_not_match(self, blacklist):
+        blacklist.blacklist_data["com"] = {"reason": "x"}
+
+        assert blacklist.is_blocked("https://example.com/a") is False
+
+    def test_load_reads_persisted_domains(self, blacklist, repository):
+        blacklist.add_to_blacklist("https://example.com/a", "403 Forbidden", "Forbidden")
+        blacklist.flush()
+
+        reloaded = ScrapingBlacklist(repository)
+        reloaded.load()
+
+        assert reloaded.get_all_blocked_domains() == ["example.com"]
+
+    def test_load_error_starts_empty(self):
+        repository = MagicMock()
+        repository.find_all.side_effect = Exception("db down")
+        blacklist = ScrapingBlacklist(repository)
+
+        assert blacklist.load() == {}
+
+    def test_flush_error_keeps_pending(self):
+        repository = MagicMock()
+        repository.upsert_many.side_effect = Exception("db down")
+        blacklist = ScrapingBlacklist(repository)
+        blacklist.add_to_blacklist("https://example.com/a", "403 Forbidden", "Forbidden")
+
+        blacklist.flush()
+
+        assert "example.com" in blacklist._pending
+
+    def test_remove_from_blacklist(self, blacklist, repository):
+        blacklist.add_to_blacklist("https://example.com/a", "403 Forbidden", "Forbidden")
+        blacklist.flush()
+
+        assert blacklist.remove_from_blacklist("https://example.com/a") is True
+        assert blacklist.is_blocked("https://example.com/a") is False
+        assert repository.find_all() == {}
+        assert blacklist.remove_from_blacklist("https://example.com/a") is False
+
+    def test_import_legacy_json_formats(self, blacklist, tmp_path):
+        flat = tmp_path / "flat.json"
+        flat.write_text(json.dumps({
+            "example.com": {
+                "blocked_at": "2025-10-21T02:34:22.095000",
+                "error_type": "403 Forbidden",
+                "error_count": 4,
+                "last_url": "https://example.com/a",
+                "last_error_message": "Forbidden",
+                "reason": "Bloqueio de permissão"
+            }
+        }), encoding="utf-8")
+        nested = tmp_path / "nested.json"
+        nested.write_text(json.dumps({
+            "blocked_domains": {
+                "nytimes.com": {"reason": "403 Forbidden", "blocked_at": "2025-10-21T02:36:06.607Z", "attempts": 5}
+            }
+        }), encoding="utf-8")
+
+        assert blacklist.import_json(str(flat)) == 1
+        assert blacklist.import_json(str(nested)) == 1
+        assert blacklist.import_json(str(flat)) == 1
+
+        assert blacklist.get_blocked_info("https://example.com/x")["error_count"] == 4
+        assert blacklist.get_blocked_info("https://nytimes.com/x")["error_count"] == 5
+        assert blacklist.get_blocked_info("https://nytimes.com/x")["error_type"] == "403 Forbidden"
+
+    def test_export_json_roundtrip(self, blacklist, repository, tmp_path):
+        blacklist.add_to_blacklist("https://example.com/a", "403 Forbidden", "Forbidden")
+        path = tmp_path / "export" / "blacklist.json"
+
+        assert blacklist.export_json(str(path)) == 1
+
+        exported = json.loads(path.read_text(encoding="utf-8"))
+        assert exported["example.com"]["error_count"] == 1
+
+        repository.delete("example.com")
+        blacklist.load()
+        blacklist.import_json(str(path))
+        assert blacklist.is_blocked("https://example.com/b") is True
+
+    def test_get_statistics(self, blacklist):
+        blacklist.add_to_blacklist("https://a.com/x", "403 Forbidden", "erro")
+        blacklist.add_to_blacklist("https://b.com/x", "403 Forbidden", "erro")
+        blacklist.add_to_blacklist("https://c.com/x", "SSL Error", "erro")
+
+        stats = blacklist.get_statistics()
+
+        assert stats["total_blocked"] == 3
+        assert stats["by_error_type"] == {"403 Forbidden": 2, "SSL Error": 1}
+
+    def test_add_during_flush_is_kept_for_next_flush(self):
+        import threading
+        import time
+
+        repository = MagicMock()
+        blacklist = ScrapingBlacklist(repository, flush_threshold=100)
+        blacklist.add_to_blacklist("https://a.com/x", "403 Forbidden", "erro")
+        writer = threading.Thread(target=blacklist.add_to_blacklist, args=("https://b.com/x", "SSL Error", "erro"))
+
+        def slow_upsert(entries):
+            # Outra thread registra um erro enquanto a gravação está em andamento
+            writer.start()
+            time.sleep(0.05)
+
+        repository.upsert_many.side_effect = slow_upsert
+        blacklist.flush()
+        writer.join()
+
+        repository.upsert_many.side_effect = None
+        blacklist.flush()
+        assert [entry["domain"] for entry in repository.upsert_many.call_args.args[0]] == ["b.com"]
@@ -37,15 +37,17 @@ def test_send_newsletter_job_happy_path(mock_services, caplog):
     caplog.set_level(logging.INFO)
 
     mock_services["user_repo"].get_users_to_newsletter.return_value = [MOCK_USER_1, MOCK_USER_2]
+    mock_services["newsletter_service"].get_news_for_users.return_value = {1: [{"title": "News 1"}]}
     mock_services["newsletter_service"].send_newsletter_to_user.return_value = {'success': True}
 
     send_newsletter_job()
 
     assert mock_services["user_repo"].get_users_to_newsletter.call_count == 1
+    mock_services["newsletter_service"].get_news_for_users.assert_called_once_with([1, 2])
     assert mock_services["newsletter_service"].send_newsletter_to_user.call_count == 2
     mock_services["newsletter_service"].send_newsletter_to_user.assert_has_calls([
-        call(MOCK_USER_1),
-        call(MOCK_USER_2)
+        call(MOCK_USER_1, news_data=[{"title": "News 1"}]),
+        call(MOCK_USER_2, news_data=None)
     ])
 
     assert "JOB DE ENVIO DE NEWSLETTER FINALIZADO" in caplog.text
@@ -85,3 +87,17 @@ def test_send_newsletter_job_exception_during_user_processing(mock_services, cap
     assert f"Falha no envio para {MOCK_USER_1.email}. Razão: Exception: Erro de rede!" in caplog.text
     assert mock_services["newsletter_service"].send_newsletter_to_user.call_count == 2
     assert "RESULTADO: 1 enviados com sucesso, 1 falhas." in caplog.text
+
+
+def test_send_newsletter_job_batch_ranking_fails(mock_services, caplog):
+    caplog.set_level(logging.INFO)
+    mock_services["user_repo"].get_users_to_newsletter.return_value = [MOCK_USER_1]
+    mock_services["newsletter_service"].get_news_for_users.side_effect = Exception("DB Error")
+    mock_services["newsletter_service"].send_newsletter_to_user.return_value = {'success': True}
+
+    send_newsletter_job()
+
+    # Sem o ranking em lote, cada envio busca as próprias notícias
+    mock_services["newsletter_service"].send_newsletter_to_user.assert_called_once_with(MOCK_USER_1, news_data=None)
+    assert "Ranking em lote falhou" in caplog.text
+    assert "RESULTADO: 1 enviados com sucesso, 0 falhas." in caplog.text
@@ -0,0 +1,66 @@
+import pytest
+from datetime import datetime
+from unittest.mock import patch
+from sqlalchemy import select
+
+from app.entities.news_entity import NewsEntity
+from app.entities.news_source_entity import NewsSourceEntity
+from app.models.news import News
+from app.models.news_source import NewsSource
+from app.models.topic import Topic
+from app.repositories.news_repository import NewsRepository
+from app.repositories.news_source_repository import NewsSourceRepository
+from app.repositories.topic_repository import TopicRepository
+from app.scripts import source_quality
+from app.utils import news_ranking
+
+PUBLISHED_AT = datetime(2025, 10, 21, 10, 0)
+
+
+@pytest.fixture
+def run_script(app):
+    """Executa o script com o app de teste no lugar do create_app()."""
+    with patch('app.create_app', return_value=app):
+        yield source_quality.main
+
+
+@pytest.fixture
+def sources(db):
+    """Duas fontes com notícias gravadas (qualidade padrão)."""
+    topic = TopicRepository(db.session).create(Topic(name="Technology", state=1))
+    source_repo = NewsSourceRepository(db.session)
+    source = source_repo.create(NewsSource(name="Fonte", url="http://fonte.com"))
+    other = source_repo.create(NewsSource(name="Outra", url="http://outra.com"))
+    NewsRepository(db.session).bulk_create_ignore_conflicts([
+        News(title=f"Notícia {i}", url=f"http://fonte.com/{i}", content="texto", html="<p>texto</p>",
+             published_at=PUBLISHED_AT, source_id=source_id, topic_id=topic.id)
+        for i, source_id in enumerate([source.id, source.id, other.id])
+    ])
+    return source.id, other.id
+
+
+def test_set_recomputes_base_score_of_source_news(run_script, sources, db, capsys):
+    source_id, other_id = sources
+
+    run_script(['set', str(source_id), '2.0'])
+
+    db.session.expire_all()
+    scores = dict(db.session.execute(select(NewsEntity.url, NewsEntity.base_score)).all())
+    assert db.session.get(NewsSourceEntity, source_id).quality == 2.0
+    assert db.session.get(NewsSourceEntity, other_id).quality == 1.0
+    assert scores["http://fonte.com/0"] == pytest.approx(news_ranking.base_score(PUBLISHED_AT, 2.0))
+    assert scores["http://fonte.com/1"] == pytest.approx(news_ranking.base_score(PUBLISHED_AT, 2.0))
+    assert scores["http://fonte.com/2"] == pytest.approx(news_ranking.base_score(PUBLISHED_AT, 1.0))
+    assert "recalculado em 2 notícias" in capsys.readouterr().out
+
+
+def test_list_shows_sources_by_quality(run_script, sources, db, capsys):
+    source_id, other_id = sources
+    run_script(['set', str(other_id), '0.5'])
+    capsys.readouterr()
+
+    run_script(['list'])
+
+    lines = capsys.readouterr().out.splitlines()
+    assert [line.split()[0] for line in lines] == [str(source_id), str(other_id)]
+    assert source_quality.list_qualities(db.session) == [(source_id, "Fonte", 1.0), (other_id, "Outra", 0.5)]
@@ -0,0 +1,141 @@
+import random
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+
+from app.entities.compression_dictionary_entity import CompressionDictionaryEntity
+from app.entities.news_body_entity import NewsBodyEntity
+from app.models.news import News
+from app.models.news_source import NewsSource
+from app.models.topic import Topic
+from app.repositories.news_repository import NewsRepository
+from app.repositories.news_source_repository import NewsSourceRepository
+from app.repositories.topic_repository import TopicRepository
+from app.scripts import compress_bodies
+from app.utils.text_compression import TextCompressor, read_dictionary_files, train_dictionary
+
+
+WORDS = "governo anuncia plano economia mercado presidente ministro empresa dados segundo afirmou".split()
+
+
+def _html(rng):
+    body = " ".join(rng.choice(WORDS) for _ in range(200))
+    return (
+        f'<div class="article-body"><p class="paragraph">{body}</p>'
+        '<figure class="image"><img src="https://cdn.example.com/img.jpg" loading="lazy"></figure>'
+        '<p>Leia também: <a href="https://example.com/mais">mais notícias</a></p></div>'
+    )
+
+
+@pytest.fixture
+def compressor(db):
+    return TextCompressor(bind=db.engine)
+
+
+class TestTextCompressor:
+    """Testes da compressão do corpo das notícias."""
+
+    def test_roundtrip_without_dictionary(self, compressor):
+        text = "Conteúdo com acentuação: ção, é, ü. " * 50
+
+        stored = compressor.compress(text, "content")
+
+        assert compressor.header(stored) == (True, 0)
+        assert len(stored) < len(text.encode("utf-8"))
+        assert compressor.decompress(stored) == text
+
+    def test_uncompressed_utf8_is_read_as_is(self, compressor):
+        assert compressor.header("Texto antigo".encode("utf-8")) == (False, None)
+        assert compressor.decompress(memoryview("Texto antigo".encode("utf-8"))) == "Texto antigo"
+
+    def test_trained_dictionary_improves_small_documents(self, compressor):
+        rng = random.Random(1)
+        dictionary = train_dictionary([_html(rng) for _ in range(200)])
+        document = _html(rng)
+        without_dictionary = len(compressor.compress(document, "html"))
+
+        dict_id = compressor.save_dictionary("html", dictionary)
+        stored = compressor.compress(document, "html")
+
+        assert len(dictionary) <= 32 * 1024
+        assert compressor.header(stored) == (True, dict_id)
+        assert len(stored) < without_dictionary * 0.8
+        assert compressor.decompress(stored) == document
+
+    def test_old_dictionaries_are_kept_for_reading(self, compressor, db):
+        rng = random.Random(2)
+        compressor.save_dictionary("html", train_dictionary([_html(rng) for _ in range(50)]))
+        stored = compressor.compress("<p>antigo</p>", "html")
+        compressor.save_dictionary("html", train_dictionary([_html(rng) for _ in range(50)]))
+
+        # Nova instância lê os dicionários da tabela
+        reloaded = TextCompressor(bind=db.engine)
+
+        assert db.session.query(CompressionDictionaryEntity).count() == 2
+        assert reloaded.current_dictionary_id("html") == 2
+        assert reloaded.decompress(stored) == "<p>antigo</p>"
+
+    def test_dictionary_trained_by_another_process_is_loaded_on_read(self, compressor, db):
+        reader = TextCompressor(bind=db.engine)
+        assert reader.current_dictionary_id("content") == 0
+
+        compressor.save_dictionary("content", b"governo anuncia plano")
+        stored = compressor.compress("governo anuncia plano de economia", "content")
+
+        assert reader.decompress(stored) == "governo anuncia plano de economia"
+        assert reader.current_dictionary_id("content") == 1
+
+    def test_missing_dictionary_raises(self, compressor):
+        compressor.save_dictionary("content", b"governo anuncia")
+        stored = compressor.compress("governo anuncia plano", "content")
+
+        with pytest.raises(ValueError, match="Dicionário de compressão 1"):
+            TextCompressor(bind=create_engine("sqlite://")).decompress(stored)
+
+    def test_dictionary_files_are_read_by_name_and_id(self, tmp_path):
+        (tmp_path / "html.3.zdict").write_bytes(b"<p class=")
+        (tmp_path / "leia-me.txt").write_text("ignorado")
+
+        assert read_dictionary_files(str(tmp_path)) == {3: ("html", b"<p class=")}
+
+
+@pytest.fixture
+def bodies(db):
+    topic = TopicRepository(db.session).create(Topic(name="Technology", state=1))
+    source = NewsSourceRepository(db.session).create(NewsSource(name="Fonte", url="https://fonte.com"))
+    rng = random.Random(3)
+    NewsRepository(db.session).bulk_create_ignore_conflicts([
+        News(title=f"Notícia {i}", url=f"https://fonte.com/{i}", content=_html(rng), html=_html(rng),
+             published_at=datetime.now(), source_id=source.id, topic_id=topic.id)
+        for i in range(30)
+    ])
+    return db
+
+
+class TestCompressBodiesCommand:
+    """Testes dos comandos train, recompress e report."""
+
+    def test_bodies_are_stored_compressed(self, bodies):
+        raw = bodies.session.execute(compress_bodies.news_bodies.select().limit(1)).one()
+
+        assert raw.content.startswith(b"\x00")
+        assert bodies.session.query(NewsBodyEntity).first().content.startswith("<div")
+
+    def test_train_recompress_and_report(self, bodies, compressor, monkeypatch):
+        monkeypatch.setattr("app.utils.text_compression.text_compressor", compressor)
+        before = compress_bodies.size_report(bodies.session, compressor=compressor)
+
+        trained = compress_bodies.train(bodies.session, sample_size=20, compressor=compressor)
+        updated = compress_bodies.recompress(bodies.session, batch_size=7, compressor=compressor)
+        after = compress_bodies.size_report(bodies.session, compressor=compressor)
+
+        assert set(trained) == {"content", "html"}
+        assert updated == 30
+        assert compress_bodies.recompress(bodies.session, compressor=compressor) == 0
+        assert after["rows"] == 30
+        assert after["columns"]["html"]["by_dictionary"] == {trained["html"]: 30}
+        assert after["columns"]["html"]["original_bytes"] == before["columns"]["html"]["original_bytes"]
+        assert after["columns"]["html"]["stored_bytes"] < before["columns"]["html"]["stored_bytes"]
+        body = bodies.session.query(NewsBodyEntity).first()
+        assert body.html.startswith("<div")
@@ -0,0 +1,21 @@
+import pytest
+
+from app.utils.title_normalizer import normalize_title
+
+
+@pytest.mark.parametrize("title, expected", [
+    ("Governo anuncia novo plano", "governo anuncia novo plano"),
+    ("  GOVERNO   anuncia\tnovo\nplano  ", "governo anuncia novo plano"),
+    ("“Governo” anuncia: novo plano!", "governo anuncia novo plano"),
+    ("Brasil-Argentina — 2 a 1", "brasil argentina 2 a 1"),
+    ("Ação da PETROBRAS sobe", "ação da petrobras sobe"),
+    ("Café", "café"),
+    ("", ""),
+    (None, ""),
+])
+def test_normalize_title(title, expected):
+    assert normalize_title(title) == expected
+
+
+def test_decomposed_accents_match_composed():
+    assert normalize_title("Café") == normalize_title("Café")
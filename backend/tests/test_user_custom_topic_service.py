@@ -3,6 +3,7 @@ from unittest.mock import MagicMock, call
 from app.services.user_custom_topic_service import UserCustomTopicService
 from app.models.custom_topic import CustomTopic, CustomTopicValidationError
 from sqlalchemy.exc import IntegrityError
+from app.utils.events import preferences_changed
 
 @pytest.fixture
 def mock_custom_topic_repository():
@@ -123,4 +124,24 @@ def test_add_preferred_topic_integrity_error_and_fail_to_recover(custom_topic_se
     with pytest.raises(IntegrityError):
         custom_topic_service.add_preferred_topic(user_id=1, name=topic_name)
 
-    assert mock_custom_topic_repository.find_by_name.call_count == 2
\ No newline at end of file
+    assert mock_custom_topic_repository.find_by_name.call_count == 2
+
+
+def test_preference_changes_send_signal_only_when_something_changed(custom_topic_service, mock_custom_topic_repository, mock_users_topics_repository):
+    received = []
+    mock_users_topics_repository.count_by_user.return_value = 0
+    mock_custom_topic_repository.find_by_name.return_value = CustomTopic(id=10, name="python")
+
+    with preferences_changed.connected_to(lambda user_id, **kwargs: received.append(user_id)):
+        mock_users_topics_repository.attach.return_value = False
+        custom_topic_service.add_preferred_topic(1, "Python")
+        mock_users_topics_repository.detach.return_value = False
+        custom_topic_service.remove_preferred_topic(1, 10)
+        assert received == []
+
+        mock_users_topics_repository.attach.return_value = True
+        custom_topic_service.add_preferred_topic(1, "Python")
+        mock_users_topics_repository.detach.return_value = True
+        custom_topic_service.remove_preferred_topic(1, 10)
+
+    assert received == [1, 1]
@@ -59,4 +59,17 @@ def test_attach_logs_and_raises_on_integrity_error(user_news_source_repo):
         with patch.object(user_news_source_repo.session, 'commit', side_effect=IntegrityError(None, None, None)):
             with pytest.raises(IntegrityError):
                 user_news_source_repo.attach(1, 1)
-            mock_logging.warning.assert_called_once()
\ No newline at end of file
+            mock_logging.warning.assert_called_once()
+def test_attach_and_detach_bump_preferences_version(user_news_source_repo, db):
+    from app.entities.user_entity import UserEntity
+    from app.repositories.user_repository import UserRepository
+
+    user = UserEntity(full_name="Leitor", email="leitor@example.com", password_hash="hash")
+    db.session.add(user)
+    db.session.commit()
+    user_repo = UserRepository(db.session)
+
+    user_news_source_repo.attach(user.id, 1)
+    assert user_repo.get_preferences_version(user.id) == 1
+    user_news_source_repo.detach(user.id, 1)
+    assert user_repo.get_preferences_version(user.id) == 2
@@ -1,12 +1,15 @@
 import pytest
 from unittest.mock import MagicMock, patch, ANY
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from app.repositories.user_read_history_repository import UserReadHistoryRepository
-from app.entities.user_read_history_entity import UserReadHistoryEntity
+from app.entities.user_read_history_entity import UserReadHistoryEntity, read_day_of
 from app.models.exceptions import UserNotFoundError, NewsNotFoundError
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 
+# O INSERT ... SELECT do upsert não pode gerar aviso de produto cartesiano
+pytestmark = pytest.mark.filterwarnings("error::sqlalchemy.exc.SAWarning")
+
 
 @pytest.fixture
 def mock_session():
@@ -34,149 +37,135 @@ def mock_history_entity():
     return mock_entity
 
 
-def test_create_new_history_record_success(repository, mock_session):
-    """
-    Testa a criação de um novo registro de histórico quando não há leitura no dia.
-    """
-    user_id, news_id = 1, 100
-
-    with patch.object(repository, 'find_today_read', return_value=None):
-        # Simula que usuário e notícia existem
-        mock_session.query.return_value.scalar.side_effect = [True, True]
-
-        entity, created = repository.create(user_id, news_id)
-
-        assert created is True
-        assert entity.user_id == user_id
-        assert entity.news_id == news_id
-        mock_session.add.assert_called_once()
-        mock_session.commit.assert_called_once()
-        mock_session.refresh.assert_called_once_with(entity)
-
-
-def test_create_updates_existing_record_today(repository, mock_session, mock_history_entity):
-    """
-    Testa a atualização de um registro de histórico se a notícia já foi lida no mesmo dia.
-    """
-    user_id, news_id = 1, 100
-    updated_entity = MagicMock()
-
-    with patch.object(repository, 'find_today_read', return_value=mock_history_entity), \
-         patch.object(repository, 'update_read_at', return_value=updated_entity) as mock_update:
-
-        entity, created = repository.create(user_id, news_id)
-
-        assert created is False
-        assert entity == updated_entity
-        mock_update.assert_called_once_with(mock_history_entity)
-        mock_session.add.assert_not_called() # Não deve adicionar um novo
-
+@pytest.fixture
+def stored(db):
+    """Usuário e notícia gravados no banco de teste."""
+    from app.entities.news_entity import NewsEntity
+    from app.entities.news_source_entity import NewsSourceEntity
+    from app.entities.topic_entity import TopicEntity
+    from app.entities.user_entity import UserEntity
 
-def test_create_user_not_found(repository, mock_session):
-    """
-    Testa se UserNotFoundError é levantada quando o usuário não existe.
-    """
-    with patch.object(repository, 'find_today_read', return_value=None):
-        # Simula que o usuário não existe
-        mock_session.query.return_value.scalar.return_value = False
+    user = UserEntity(full_name="Leitor", email="leitor@example.com", password_hash="hash")
+    source = NewsSourceEntity(name="Fonte", url="https://fonte.com")
+    topic = TopicEntity(name="tecnologia")
+    db.session.add_all([user, source, topic])
+    db.session.commit()
+    news = NewsEntity(
+        title="Notícia", url="https://fonte.com/1", content="Texto", html="<p>Texto</p>",
+        published_at=datetime.now(), source_id=source.id, topic_id=topic.id
+    )
+    db.session.add(news)
+    db.session.commit()
+    return user.id, news.id
 
-        with pytest.raises(UserNotFoundError, match="Usuário com ID 1 não encontrado."):
-            repository.create(user_id=1, news_id=100)
 
-        mock_session.rollback.assert_called_once()
+def _history(db):
+    return db.session.query(
+        UserReadHistoryEntity.user_id, UserReadHistoryEntity.news_id,
+        UserReadHistoryEntity.read_day, UserReadHistoryEntity.read_at
+    ).order_by(UserReadHistoryEntity.read_at).all()
 
 
-def test_create_news_not_found(repository, mock_session):
+def test_read_day_is_the_utc_date_of_read_at():
     """
-    Testa se NewsNotFoundError é levantada quando a notícia não existe.
+    Testa que o dia da leitura é a data em UTC, como no backfill da migração 0008.
     """
-    with patch.object(repository, 'find_today_read', return_value=None):
-        # Simula que o usuário existe, mas a notícia não
-        mock_session.query.return_value.scalar.side_effect = [True, False]
+    sao_paulo = timezone(timedelta(hours=-3))
 
-        with pytest.raises(NewsNotFoundError, match="Notícia com ID 100 não encontrada."):
-            repository.create(user_id=1, news_id=100)
+    assert read_day_of(datetime(2026, 1, 1, 22, 30, tzinfo=sao_paulo)).isoformat() == "2026-01-02"
+    assert read_day_of(datetime(2026, 1, 1, 22, 30, tzinfo=timezone.utc)).isoformat() == "2026-01-01"
 
-        mock_session.rollback.assert_called_once()
 
-
-def test_create_integrity_error(repository, mock_session):
+def test_create_keeps_one_read_per_day(db, stored):
     """
-    Testa o tratamento de IntegrityError durante a criação.
+    Testa que leituras repetidas no mesmo dia atualizam read_at em vez de criar linhas.
     """
-    mock_session.commit.side_effect = IntegrityError("mock", "mock", "mock")
-
-    with patch.object(repository, 'find_today_read', return_value=None):
-        mock_session.query.return_value.scalar.side_effect = [True, True]
+    user_id, news_id = stored
+    repository = UserReadHistoryRepository(db.session)
 
-        with pytest.raises(Exception, match="Erro de integridade ao salvar histórico de leitura."):
-            repository.create(user_id=1, news_id=100)
+    repository.create(user_id, news_id)
+    first_read_at = _history(db)[0].read_at
+    repository.create(user_id, news_id)
 
-        mock_session.rollback.assert_called_once()
+    rows = _history(db)
+    assert len(rows) == 1
+    assert rows[0].read_day == datetime.now(timezone.utc).date()
+    assert rows[0].read_at > first_read_at
 
 
-def test_update_read_at_success(repository, mock_session, mock_history_entity):
+def test_create_raises_for_missing_user_or_news(db, stored):
     """
-    Testa a atualização bem-sucedida do timestamp de leitura.
+    Testa que UserNotFoundError/NewsNotFoundError são levantadas quando nada é gravado.
     """
-    before_update = mock_history_entity.read_at
-    
-    updated_entity = repository.update_read_at(mock_history_entity)
+    user_id, news_id = stored
+    repository = UserReadHistoryRepository(db.session)
 
-    assert updated_entity.read_at > before_update
-    mock_session.commit.assert_called_once()
-    mock_session.refresh.assert_called_once_with(updated_entity)
+    with pytest.raises(NewsNotFoundError, match="Notícia com ID 999 não encontrada."):
+        repository.create(user_id, 999)
+    with pytest.raises(UserNotFoundError, match="Usuário com ID 999 não encontrado."):
+        repository.create(999, news_id)
+    assert _history(db) == []
 
 
-def test_update_read_at_sqlalchemy_error(repository, mock_session, mock_history_entity):
+def test_upsert_many_keeps_latest_read_per_day_and_skips_missing(db, stored):
     """
-    Testa o tratamento de SQLAlchemyError durante a atualização.
+    Testa a gravação em lote: um dia novo insere, uma leitura mais antiga não altera read_at.
     """
-    mock_session.commit.side_effect = SQLAlchemyError("DB Error")
+    user_id, news_id = stored
+    repository = UserReadHistoryRepository(db.session)
+    today = datetime.now().replace(microsecond=0)
+    yesterday = today - timedelta(days=1)
 
-    with pytest.raises(Exception, match="Erro ao atualizar histórico de leitura."):
-        repository.update_read_at(mock_history_entity)
+    written = repository.upsert_many([(user_id, news_id, today), (user_id, news_id, yesterday), (user_id, 999, today)])
+    repository.upsert_many([(user_id, news_id, today - timedelta(seconds=1))])
 
-    mock_session.rollback.assert_called_once()
+    assert written == 2
+    assert [(row.read_day, row.read_at) for row in _history(db)] == [
+        (read_day_of(yesterday), yesterday), (read_day_of(today), today)
+    ]
 
 
-@patch('app.repositories.user_read_history_repository.datetime')
-def test_find_today_read_found(mock_dt, repository, mock_session, mock_history_entity):
+def test_get_user_history_ids_pages_by_read_at(db, stored):
     """
-    Testa a busca por um registro de leitura no dia atual.
+    Testa que a consulta só de IDs segue a ordem e a paginação de get_user_history.
     """
-    # Configura o mock de datetime para ter um valor fixo
-    today = datetime(2024, 1, 1)
-    mock_dt.today.return_value = today
-    mock_dt.combine.side_effect = lambda d, t: datetime.combine(d, t)
-
-    mock_session.execute.return_value.scalar_one_or_none.return_value = mock_history_entity
-
-    result = repository.find_today_read(user_id=1, news_id=100)
+    user_id, news_id = stored
+    repository = UserReadHistoryRepository(db.session)
+    today = datetime.now().replace(microsecond=0)
+    repository.upsert_many([(user_id, news_id, today - timedelta(days=1)), (user_id, news_id, today)])
 
-    assert result == mock_history_entity
-    mock_session.execute.assert_called_once()
+    assert repository.get_user_history_ids(user_id) == [(news_id, today), (news_id, today - timedelta(days=1))]
+    assert repository.get_user_history_ids(user_id, page=2, per_page=1) == [(news_id, today - timedelta(days=1))]
+    assert repository.get_user_history_ids(999) == []
 
 
-def test_find_today_read_not_found(repository, mock_session):
+def test_upsert_many_without_on_conflict_updates_each_read(db, stored):
     """
-    Testa o cenário onde nenhum registro é encontrado para o dia.
+    Testa o fallback para dialetos sem ON CONFLICT (INSERT em savepoint ou UPDATE).
     """
-    mock_session.execute.return_value.scalar_one_or_none.return_value = None
+    user_id, news_id = stored
+    repository = UserReadHistoryRepository(db.session)
+    now = datetime.now().replace(microsecond=0)
 
-    result = repository.find_today_read(user_id=1, news_id=100)
+    with patch('app.repositories.user_read_history_repository.dialect_insert', return_value=None):
+        repository.upsert_many([(user_id, news_id, now - timedelta(seconds=5))])
+        written = repository.upsert_many([(user_id, news_id, now), (user_id, 999, now)])
 
-    assert result is None
+    assert written == 1
+    assert [row.read_at for row in _history(db)] == [now]
 
 
-def test_find_today_read_sqlalchemy_error(repository, mock_session):
+def test_upsert_many_sqlalchemy_error(repository, mock_session):
     """
-    Testa o tratamento de erro na busca de leitura do dia.
+    Testa o tratamento de SQLAlchemyError durante a gravação.
     """
+    mock_session.get_bind.return_value.dialect.name = "postgresql"
     mock_session.execute.side_effect = SQLAlchemyError("DB Error")
 
-    with pytest.raises(Exception, match="Erro ao verificar histórico do dia."):
-        repository.find_today_read(user_id=1, news_id=100)
+    with pytest.raises(Exception, match="Erro ao salvar histórico de leitura no banco de dados."):
+        repository.upsert_many([(1, 100, datetime.now())])
+
+    mock_session.rollback.assert_called_once()
 
 
 def test_get_user_history_success(repository, mock_session, mock_history_entity):